@@ -0,0 +1,66 @@
+"""Compare repeated CsvTools queries with and without the cached DuckDB catalog.
+
+CsvTools used to load the csv file into a new DuckDB table on each query, parsing the whole file every time. Files
+are now loaded once into a connection kept by the toolkit, and only reloaded when their mtime or size changes.
+
+Run with `python cookbook/09_evals/performance/csv_tools_query.py`
+"""
+
+import csv
+import random
+import tempfile
+from pathlib import Path
+
+import duckdb
+from agno.eval.performance import PerformanceEval
+from agno.tools.csv_toolkit import CsvTools
+
+NUM_ROWS = 200_000
+QUERY = "SELECT region, SUM(amount) FROM sales GROUP BY region ORDER BY region"
+
+csv_path = Path(tempfile.mkdtemp()) / "sales.csv"
+with open(csv_path, "w", newline="") as f:
+    writer = csv.writer(f)
+    writer.writerow(["id", "region", "product", "amount"])
+    for i in range(NUM_ROWS):
+        writer.writerow(
+            [i, random.choice(["north", "south", "east", "west"]), f"product_{i % 500}", random.randint(1, 1000)]
+        )
+
+csv_tools = CsvTools(csvs=[csv_path])
+
+
+# Before: each query opens a connection and parses the whole file
+def query_with_new_table():
+    con = duckdb.connect()
+    con.execute(f"CREATE TABLE sales AS SELECT * FROM read_csv('{csv_path}', ignore_errors=false, auto_detect=true)")
+    con.sql(QUERY).fetchall()
+    con.close()
+
+
+# After: the file is loaded once and later queries run against the cached table
+def query_with_cached_catalog():
+    csv_tools.query_csv_file("sales", QUERY)
+
+
+if __name__ == "__main__":
+    print(f"Benchmarking queries against {csv_path} ({csv_path.stat().st_size / 1_000_000:.1f} MB)")
+
+    new_table_eval = PerformanceEval(
+        name="New DuckDB table per query",
+        func=query_with_new_table,
+        measure_memory=False,
+        warmup_runs=2,
+        num_iterations=20,
+    )
+    cached_catalog_eval = PerformanceEval(
+        name="Cached DuckDB catalog",
+        func=query_with_cached_catalog,
+        measure_memory=False,
+        warmup_runs=2,
+        num_iterations=20,
+    )
+
+    new_table_eval.run(print_summary=True)
+    cached_catalog_eval.run(print_summary=True)
+    csv_tools.close()
@@ -0,0 +1,64 @@
+"""Measure the throughput and latency of an agent under concurrent runs.
+
+The agent uses a `MockModel` with a fixed latency and token rate, so the results measure the overhead of the framework:
+building the prompt, calling tools, and reading and writing the session. The sweep varies the concurrency, the number
+of tools and the length of the session history, and saves each result as JSON to compare across versions.
+
+Run with `python cookbook/09_evals/performance/load_test.py`
+"""
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+from agno.eval.load import LoadEval
+from agno.models.mock import MockModel
+from agno.tools import Toolkit
+
+db = SqliteDb(db_file="tmp/load_test.db")
+
+
+def make_toolkit(num_tools: int) -> Toolkit:
+    tools = []
+    for index in range(num_tools):
+
+        def lookup(query: str) -> str:
+            """Look up a record."""
+            return query
+
+        lookup.__name__ = f"lookup_{index}"
+        tools.append(lookup)
+    return Toolkit(name="records", tools=tools)
+
+
+def make_agent(num_tools: int) -> Agent:
+    return Agent(
+        model=MockModel(
+            latency=0.2,
+            latency_jitter=0.05,
+            tokens_per_second=50,
+            tokens_per_chunk=4,
+            response_content="The record you asked for was updated last night. " * 4,
+            tool_calls=[{"name": "lookup_0", "arguments": {"query": "latest"}}],
+        ),
+        tools=[make_toolkit(num_tools)],
+        db=db,
+        add_history_to_context=True,
+        num_history_runs=20,
+        telemetry=False,
+    )
+
+
+if __name__ == "__main__":
+    for concurrency in (1, 10, 50):
+        for num_tools in (1, 50):
+            # Fewer sessions mean a longer history in each session
+            for num_sessions in (None, 5):
+                LoadEval(
+                    name=f"load_c{concurrency}_t{num_tools}_s{num_sessions}",
+                    agent=make_agent(num_tools),
+                    num_runs=100,
+                    concurrency=concurrency,
+                    warmup_runs=5,
+                    num_sessions=num_sessions,
+                    stream=True,
+                    file_path_to_save_results="tmp/load_tests/{name}.json",
+                ).run(print_summary=True)
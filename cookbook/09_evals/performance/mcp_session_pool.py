@@ -0,0 +1,90 @@
+"""Compare the per-run latency of opening a new MCP session for each run against reusing a pooled session.
+
+When `header_provider` is set, MCPTools used to open a new session for each run, paying for the transport connection
+and the `initialize` handshake every time. Sessions are now pooled by the headers they were opened with, so runs
+resolving the same headers reuse the same session.
+
+A local stdio server stands in for a remote one: it has no network latency, so the difference measured here is a
+lower bound of the savings against an HTTP server.
+
+Run with `python cookbook/09_evals/performance/mcp_session_pool.py`
+"""
+
+import asyncio
+import sys
+
+from agno.eval.performance import PerformanceEval
+from agno.tools.mcp.session_pool import MCPSessionPool
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_PARAMS = StdioServerParameters(
+    command=sys.executable, args=[__file__, "--server"]
+)
+HEADERS = {"Authorization": "Bearer tenant-token"}
+
+
+def run_server():
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("benchmark", log_level="WARNING")
+
+    @mcp.tool()
+    def get_weather(city: str) -> str:
+        return f"The weather in {city} is sunny"
+
+    mcp.run(transport="stdio")
+
+
+# Before: each run opens, initializes and closes its own session
+async def run_with_new_session():
+    async with stdio_client(SERVER_PARAMS) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await session.call_tool("get_weather", {"city": "Paris"})
+
+
+# After: runs with the same headers share a pooled session
+pool = MCPSessionPool()
+
+
+async def open_session():
+    transport_context = stdio_client(SERVER_PARAMS)
+    read, write = await transport_context.__aenter__()
+    session_context = ClientSession(read, write)
+    session = await session_context.__aenter__()
+    await session.initialize()
+    return session, transport_context, session_context
+
+
+async def run_with_pooled_session():
+    session = await pool.get_session(MCPSessionPool.get_key(HEADERS), open_session)
+    await session.call_tool("get_weather", {"city": "Paris"})
+
+
+async def main():
+    new_session_eval = PerformanceEval(
+        name="New MCP session per run",
+        func=run_with_new_session,
+        measure_memory=False,
+        warmup_runs=2,
+        num_iterations=20,
+    )
+    pooled_session_eval = PerformanceEval(
+        name="Pooled MCP session",
+        func=run_with_pooled_session,
+        measure_memory=False,
+        warmup_runs=2,
+        num_iterations=20,
+    )
+
+    await new_session_eval.arun(print_summary=True)
+    await pooled_session_eval.arun(print_summary=True)
+    await pool.close()
+
+
+if __name__ == "__main__":
+    if "--server" in sys.argv:
+        run_server()
+    else:
+        asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Measure building the system message of an agent with many instructions and tools, on each run.
+
+The instructions and tool instructions are formatted with the session state variables on each run. The templates
+used to format them are built once, and reused while the sections and the names of the variables don't change.
+
+No model is called: the benchmark only builds the system message, as the agent does before each request.
+
+Run with `python cookbook/09_evals/performance/system_message_cache.py`
+"""
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.run.base import RunContext
+from agno.session import AgentSession
+from agno.tools import Toolkit
+
+NUM_INSTRUCTIONS = 200
+NUM_TOOLKITS = 50
+
+
+def make_toolkit(index: int) -> Toolkit:
+    def lookup(query: str) -> str:
+        """Look up a record."""
+        return query
+
+    lookup.__name__ = f"lookup_{index}"
+    return Toolkit(
+        name=f"toolkit_{index}",
+        tools=[lookup],
+        instructions=f"Use `lookup_{index}` to find records of kind {index} for {{user_name}}.",
+        add_instructions=True,
+    )
+
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o"),
+    description="You are a support agent for {company}.",
+    instructions=[
+        f"Rule {i}: answer questions about topic {i} in {{language}}."
+        for i in range(NUM_INSTRUCTIONS)
+    ],
+    tools=[make_toolkit(i) for i in range(NUM_TOOLKITS)],
+    expected_output="A short answer citing the records used.",
+    additional_context="Records are updated nightly.",
+    add_datetime_to_context=True,
+    markdown=True,
+)
+run_context = RunContext(
+    run_id="run",
+    session_id="session",
+    session_state={"company": "Acme", "language": "English", "user_name": "Ada"},
+)
+session = AgentSession(session_id="session")
+
+# Resolve the tools once, as a run does, so the tool instructions are part of the system message
+agent._parse_tools(
+    tools=agent.tools,  # type: ignore[arg-type]
+    model=agent.model,  # type: ignore[arg-type]
+    run_context=run_context,
+)
+
+
+def build_system_message():
+    return agent.get_system_message(session=session, run_context=run_context)
+
+
+def build_system_message_without_templates():
+    agent.invalidate_system_message_cache()
+    return agent.get_system_message(session=session, run_context=run_context)
+
+
+templates_built_eval = PerformanceEval(
+    name="System message, templates built on each run",
+    func=build_system_message_without_templates,
+    measure_memory=False,
+    warmup_runs=10,
+    num_iterations=500,
+)
+templates_reused_eval = PerformanceEval(
+    name="System message, templates reused",
+    func=build_system_message,
+    measure_memory=False,
+    warmup_runs=10,
+    num_iterations=500,
+)
+
+if __name__ == "__main__":
+    templates_built_eval.run(print_summary=True)
+    templates_reused_eval.run(print_summary=True)
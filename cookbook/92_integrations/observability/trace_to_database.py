@@ -19,6 +19,7 @@ from agno.models.openai import OpenAIChat
 from agno.tools.hackernews import HackerNewsTools
 from agno.tracing import setup_tracing
 from agno.utils.pprint import pprint_run_response
+from opentelemetry import trace as trace_api
 
 # Set up database
 db = SqliteDb(db_file="tmp/traces.db")
@@ -46,8 +47,8 @@ print("\n" + "=" * 60)
 print("Traces and Spans in Database:")
 print("=" * 60)
 
-## If using BatchSpanProcessor, we need to wait for the traces to be flushed to the database before querying
-# time.sleep(5) # Uncomment this if using BatchSpanProcessor
+# Spans are written in batches, so flush them to the database before querying
+trace_api.get_tracer_provider().force_flush()
 
 try:
     # Get the trace for this run
@@ -9,6 +9,7 @@ from concurrent.futures import Future
 from dataclasses import dataclass
 from inspect import iscoroutinefunction
 from os import getenv
+from string import Template
 from typing import (
     Any,
     AsyncIterator,
@@ -35,6 +36,7 @@ from agno.compression.manager import CompressionManager
 from agno.culture.manager import CultureManager
 from agno.db.base import AsyncBaseDb, BaseDb, ComponentType, SessionType, UserMemory
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.schemas.messages import IndexedMessagePair
 from agno.db.utils import db_from_dict
 from agno.eval.base import BaseEval
 from agno.exceptions import (
@@ -53,6 +55,7 @@ from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.models.speculation import aspeculate, aspeculate_stream
 from agno.models.utils import get_model
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.registry.registry import Registry
@@ -84,6 +87,7 @@ from agno.session import AgentSession, SessionSummaryManager, TeamSession, Workf
 from agno.session.summary import SessionSummary
 from agno.skills import Skills
 from agno.tools import Toolkit
+from agno.tools.connection_pool import get_tool_connection_pool, is_connectable_toolkit, is_mcp_toolkit
 from agno.tools.function import Function
 from agno.utils.agent import (
     aexecute_instructions,
@@ -103,6 +107,7 @@ from agno.utils.agent import (
     collect_joint_videos,
     execute_instructions,
     execute_system_message,
+    get_indexed_message_pairs,
     get_last_run_output_util,
     get_run_output_util,
     get_session_metrics_util,
@@ -154,9 +159,11 @@ from agno.utils.events import (
 from agno.utils.hooks import (
     copy_args_for_background,
     filter_hook_args,
+    group_pre_hooks,
     normalize_post_hooks,
     normalize_pre_hooks,
     should_run_hook_in_background,
+    split_speculative_pre_hooks,
 )
 from agno.utils.knowledge import get_agentic_or_user_search_filters
 from agno.utils.log import (
@@ -297,6 +304,10 @@ class Agent:
 
     # A function that acts as middleware and is called around tool calls.
     tool_hooks: Optional[List[Callable]] = None
+    # When to connect tools that require connection management (e.g. database and MCP toolkits).
+    # "run" connects them at the start of each run and closes them at the end.
+    # "process" connects them once and shares the connection across runs, until the process or AgentOS app shuts down.
+    tool_connection_lifecycle: Literal["run", "process"] = "run"
 
     # --- Agent Hooks ---
     # Functions called right after agent-session is loaded, before processing starts
@@ -305,6 +316,9 @@ class Agent:
     post_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None
     # If True, run hooks as FastAPI background tasks (non-blocking). Set by AgentOS.
     _run_hooks_in_background: Optional[bool] = None
+    # If True, the read-only pre-hooks at the end of pre_hooks run alongside the first model request in async runs.
+    # The request, and its streamed output, are cancelled if one of them raises an InputCheckError.
+    speculative_pre_hooks: bool = False
 
     # --- Agent Reasoning ---
     # Enable reasoning by working through the problem step by step.
@@ -515,8 +529,10 @@ class Agent:
         tool_call_limit: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
+        tool_connection_lifecycle: Literal["run", "process"] = "run",
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
         post_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
+        speculative_pre_hooks: bool = False,
         reasoning: bool = False,
         reasoning_model: Optional[Union[Model, str]] = None,
         reasoning_agent: Optional[Agent] = None,
@@ -649,9 +665,11 @@ class Agent:
         self.tool_call_limit = tool_call_limit
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
+        self.tool_connection_lifecycle = tool_connection_lifecycle
 
         self.pre_hooks = pre_hooks
         self.post_hooks = post_hooks
+        self.speculative_pre_hooks = speculative_pre_hooks
 
         self.reasoning = reasoning
         self.reasoning_model = reasoning_model  # type: ignore[assignment]
@@ -730,6 +748,8 @@ class Agent:
         self._cached_session: Optional[AgentSession] = None
 
         self._tool_instructions: Optional[List[str]] = None
+        # Templates of the static sections of the system message, with the section and variable names they were built from
+        self._system_message_templates: Dict[str, Tuple[Any, Template]] = {}
 
         self._formatter: Optional[SafeFormatter] = None
 
@@ -737,6 +757,8 @@ class Agent:
 
         self._mcp_tools_initialized_on_run: List[Any] = []
         self._connectable_tools_initialized_on_run: List[Any] = []
+        # Tools leased from the process-wide connection pool, by run_id
+        self._tool_connection_leases: Dict[str, List[Any]] = {}
 
         # Lazy-initialized shared thread pool executor for background tasks (memory, cultural knowledge, etc.)
         self._background_executor: Optional[Any] = None
@@ -951,16 +973,20 @@ class Agent:
     def set_tools(self, tools: Sequence[Union[Toolkit, Callable, Function, Dict]]):
         self.tools = list(tools) if tools else []
 
-    async def _connect_mcp_tools(self) -> None:
+    async def _connect_mcp_tools(self, run_id: Optional[str] = None) -> None:
         """Connect the MCP tools to the agent."""
         if self.tools:
             for tool in self.tools:
-                # Alternate method of using isinstance(tool, (MCPTools, MultiMCPTools)) to avoid imports
-                if (
-                    hasattr(type(tool), "__mro__")
-                    and any(c.__name__ in ["MCPTools", "MultiMCPTools"] for c in type(tool).__mro__)
-                    and not tool.initialized  # type: ignore
-                ):
+                if not is_mcp_toolkit(tool):
+                    continue
+                if self.tool_connection_lifecycle == "process":
+                    try:
+                        # Lease the shared connection from the process-wide pool
+                        await get_tool_connection_pool().aacquire(tool)
+                        self._tool_connection_leases.setdefault(run_id or "", []).append(tool)
+                    except Exception as e:
+                        log_warning(f"Error connecting tool: {str(e)}")
+                elif not tool.initialized:  # type: ignore
                     try:
                         # Connect the MCP server
                         await tool.connect()  # type: ignore
@@ -968,8 +994,11 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Error connecting tool: {str(e)}")
 
-    async def _disconnect_mcp_tools(self) -> None:
+    async def _disconnect_mcp_tools(self, run_id: Optional[str] = None) -> None:
         """Disconnect the MCP tools from the agent."""
+        if self.tool_connection_lifecycle == "process":
+            self._release_tool_connections(run_id=run_id)
+            return
         for tool in self._mcp_tools_initialized_on_run:
             try:
                 await tool.close()
@@ -977,24 +1006,28 @@ class Agent:
                 log_warning(f"Error disconnecting tool: {str(e)}")
         self._mcp_tools_initialized_on_run = []
 
-    def _connect_connectable_tools(self) -> None:
+    def _connect_connectable_tools(self, run_id: Optional[str] = None) -> None:
         """Connect tools that require connection management (e.g., database connections)."""
         if self.tools:
             for tool in self.tools:
-                if (
-                    hasattr(tool, "requires_connect")
-                    and tool.requires_connect  # type: ignore
-                    and hasattr(tool, "connect")
-                    and tool not in self._connectable_tools_initialized_on_run
-                ):
-                    try:
+                if not is_connectable_toolkit(tool) or tool in self._connectable_tools_initialized_on_run:
+                    continue
+                try:
+                    if self.tool_connection_lifecycle == "process":
+                        # Lease the shared connection from the process-wide pool
+                        get_tool_connection_pool().acquire(tool)
+                        self._tool_connection_leases.setdefault(run_id or "", []).append(tool)
+                    else:
                         tool.connect()  # type: ignore
                         self._connectable_tools_initialized_on_run.append(tool)
-                    except Exception as e:
-                        log_warning(f"Error connecting tool: {str(e)}")
+                except Exception as e:
+                    log_warning(f"Error connecting tool: {str(e)}")
 
-    def _disconnect_connectable_tools(self) -> None:
+    def _disconnect_connectable_tools(self, run_id: Optional[str] = None) -> None:
         """Disconnect tools that require connection management."""
+        if self.tool_connection_lifecycle == "process":
+            self._release_tool_connections(run_id=run_id)
+            return
         for tool in self._connectable_tools_initialized_on_run:
             if hasattr(tool, "close"):
                 try:
@@ -1003,6 +1036,12 @@ class Agent:
                     log_warning(f"Error disconnecting tool: {str(e)}")
         self._connectable_tools_initialized_on_run = []
 
+    def _release_tool_connections(self, run_id: Optional[str] = None) -> None:
+        """Release the pooled tool connections leased by the given run. The tools stay connected for later runs."""
+        pool = get_tool_connection_pool()
+        for tool in self._tool_connection_leases.pop(run_id or "", []):
+            pool.release(tool)
+
     def _initialize_session(
         self,
         session_id: Optional[str] = None,
@@ -1318,7 +1357,7 @@ class Agent:
                 learning_future.cancel()
 
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
 
@@ -1728,7 +1767,7 @@ class Agent:
                 learning_future.cancel()
 
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
 
@@ -2021,6 +2060,7 @@ class Agent:
         memory_task = None
         learning_task = None
         cultural_knowledge_task = None
+        speculative_pre_hooks_task = None
 
         # Set up retry logic
         num_attempts = self.retries + 1
@@ -2050,10 +2090,14 @@ class Agent:
                     # 4. Execute pre-hooks
                     run_input = cast(RunInput, run_response.input)
                     self.model = cast(Model, self.model)
-                    if self.pre_hooks is not None:
+                    # The read-only pre-hooks at the end can run alongside the model request
+                    pre_hooks, speculative_pre_hooks = self.pre_hooks, None
+                    if self._can_speculate_pre_hooks():
+                        pre_hooks, speculative_pre_hooks = split_speculative_pre_hooks(self.pre_hooks)  # type: ignore
+                    if pre_hooks is not None:
                         # Can modify the run input
                         pre_hook_iterator = self._aexecute_pre_hooks(
-                            hooks=self.pre_hooks,  # type: ignore
+                            hooks=pre_hooks,  # type: ignore
                             run_response=run_response,
                             run_context=run_context,
                             run_input=run_input,
@@ -2066,6 +2110,17 @@ class Agent:
                         # Consume the async iterator without yielding
                         async for _ in pre_hook_iterator:
                             pass
+                    speculative_pre_hooks_task = self._start_speculative_pre_hooks(
+                        hooks=speculative_pre_hooks,
+                        start_index=len(pre_hooks or []),
+                        run_input=run_input,
+                        run_context=run_context,
+                        session=agent_session,
+                        user_id=user_id,
+                        debug_mode=debug_mode,
+                        background_tasks=background_tasks,
+                        **kwargs,
+                    )
 
                     # 5. Determine tools for model
                     self.model = cast(Model, self.model)
@@ -2138,7 +2193,7 @@ class Agent:
                     await araise_if_cancelled(run_response.run_id)  # type: ignore
 
                     # 9. Generate a response from the Model (includes running function calls)
-                    model_response: ModelResponse = await self.model.aresponse(
+                    model_request = self.model.aresponse(
                         messages=run_messages.messages,
                         tools=_tools,
                         tool_choice=self.tool_choice,
@@ -2148,6 +2203,11 @@ class Agent:
                         run_response=run_response,
                         compression_manager=self.compression_manager if self.compress_tool_results else None,
                     )
+                    if speculative_pre_hooks_task is not None:
+                        # Cancels the request if a pre-hook raises an InputCheckError
+                        model_response: ModelResponse = await aspeculate(model_request, speculative_pre_hooks_task)
+                    else:
+                        model_response = await model_request
 
                     # Check for cancellation after model call
                     await araise_if_cancelled(run_response.run_id)  # type: ignore
@@ -2308,9 +2368,9 @@ class Agent:
                     return run_response
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always disconnect MCP tools
-            await self._disconnect_mcp_tools()
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Cancel background tasks on error (await_for_open_threads handles waiting on success)
             if memory_task is not None and not memory_task.done():
@@ -2331,6 +2391,12 @@ class Agent:
                     await learning_task
                 except asyncio.CancelledError:
                     pass
+            if speculative_pre_hooks_task is not None and not speculative_pre_hooks_task.done():
+                speculative_pre_hooks_task.cancel()
+                try:
+                    await speculative_pre_hooks_task
+                except (asyncio.CancelledError, InputCheckError, OutputCheckError):
+                    pass
 
             # Always clean up the run tracking
             await acleanup_run(run_response.run_id)  # type: ignore
@@ -2376,6 +2442,7 @@ class Agent:
         memory_task = None
         cultural_knowledge_task = None
         learning_task = None
+        speculative_pre_hooks_task = None
 
         # 1. Read or create session. Reads from the database if provided.
         agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
@@ -2413,9 +2480,13 @@ class Agent:
                     # 4. Execute pre-hooks
                     run_input = cast(RunInput, run_response.input)
                     self.model = cast(Model, self.model)
-                    if self.pre_hooks is not None:
+                    # The read-only pre-hooks at the end can run alongside the model request
+                    pre_hooks, speculative_pre_hooks = self.pre_hooks, None
+                    if self._can_speculate_pre_hooks():
+                        pre_hooks, speculative_pre_hooks = split_speculative_pre_hooks(self.pre_hooks)  # type: ignore
+                    if pre_hooks is not None:
                         pre_hook_iterator = self._aexecute_pre_hooks(
-                            hooks=self.pre_hooks,  # type: ignore
+                            hooks=pre_hooks,  # type: ignore
                             run_response=run_response,
                             run_context=run_context,
                             run_input=run_input,
@@ -2429,6 +2500,17 @@ class Agent:
                         async for event in pre_hook_iterator:
                             await araise_if_cancelled(run_response.run_id)  # type: ignore
                             yield event
+                    speculative_pre_hooks_task = self._start_speculative_pre_hooks(
+                        hooks=speculative_pre_hooks,
+                        start_index=len(pre_hooks or []),
+                        run_input=run_input,
+                        run_context=run_context,
+                        session=agent_session,
+                        user_id=user_id,
+                        debug_mode=debug_mode,
+                        background_tasks=background_tasks,
+                        **kwargs,
+                    )
 
                     # 5. Determine tools for model
                     self.model = cast(Model, self.model)
@@ -2512,6 +2594,7 @@ class Agent:
                             stream_events=stream_events,
                             session_state=run_context.session_state,
                             run_context=run_context,
+                            speculative_pre_hooks_task=speculative_pre_hooks_task,
                         ):
                             await araise_if_cancelled(run_response.run_id)  # type: ignore
                             yield event
@@ -2530,6 +2613,7 @@ class Agent:
                             stream_events=stream_events,
                             session_state=run_context.session_state,
                             run_context=run_context,
+                            speculative_pre_hooks_task=speculative_pre_hooks_task,
                         ):
                             await araise_if_cancelled(run_response.run_id)  # type: ignore
                             if isinstance(event, RunContentEvent):
@@ -2788,9 +2872,9 @@ class Agent:
                     yield run_error
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always disconnect MCP tools
-            await self._disconnect_mcp_tools()
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Cancel background tasks on error (await_for_thread_tasks_stream handles waiting on success)
             if memory_task is not None and not memory_task.done():
@@ -2814,6 +2898,13 @@ class Agent:
                 except asyncio.CancelledError:
                     pass
 
+            if speculative_pre_hooks_task is not None and not speculative_pre_hooks_task.done():
+                speculative_pre_hooks_task.cancel()
+                try:
+                    await speculative_pre_hooks_task
+                except (asyncio.CancelledError, InputCheckError, OutputCheckError):
+                    pass
+
             # Always clean up the run tracking
             await acleanup_run(run_response.run_id)  # type: ignore
 
@@ -3472,7 +3563,7 @@ class Agent:
                     return run_response
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
         return run_response
@@ -3726,7 +3817,7 @@ class Agent:
                     yield run_error
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
 
@@ -4210,9 +4301,9 @@ class Agent:
 
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always disconnect MCP tools
-            await self._disconnect_mcp_tools()
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
@@ -4618,9 +4709,9 @@ class Agent:
                     yield run_error
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always disconnect MCP tools
-            await self._disconnect_mcp_tools()
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Always clean up the run tracking
             await acleanup_run(run_response.run_id)  # type: ignore
@@ -4638,7 +4729,10 @@ class Agent:
         background_tasks: Optional[Any] = None,
         **kwargs: Any,
     ) -> Iterator[RunOutputEvent]:
-        """Execute multiple pre-hook functions in succession."""
+        """Execute multiple pre-hook functions in succession.
+
+        Consecutive read-only pre-hooks run concurrently, in threads.
+        """
         if hooks is None:
             return
         # Prepare arguments for this hook
@@ -4667,36 +4761,20 @@ class Agent:
 
         all_args.update(kwargs)
 
-        for i, hook in enumerate(hooks):
-            # Check if this specific hook should run in background (via @hook decorator)
-            if should_run_hook_in_background(hook) and background_tasks is not None:
-                # Copy args to prevent race conditions
-                bg_args = copy_args_for_background(all_args)
-                filtered_args = filter_hook_args(hook, bg_args)
-                background_tasks.add_task(hook, **filtered_args)
+        start_index = 0
+        for group in group_pre_hooks(hooks):
+            group_hooks = self._schedule_background_pre_hooks(
+                hooks=group, start_index=start_index, args=all_args, background_tasks=background_tasks
+            )
+            start_index += len(group)
+            if not group_hooks:
                 continue
 
             if stream_events:
-                yield handle_event(  # type: ignore
-                    run_response=run_response,
-                    event=create_pre_hook_started_event(
-                        from_run_response=run_response,
-                        run_input=run_input,
-                        pre_hook_name=hook.__name__,
-                    ),
-                    events_to_skip=self.events_to_skip,  # type: ignore
-                    store_events=self.store_events,
-                )
-            try:
-                # Filter arguments to only include those that the hook accepts
-                filtered_args = filter_hook_args(hook, all_args)
-
-                hook(**filtered_args)
-
-                if stream_events:
+                for _, hook in group_hooks:
                     yield handle_event(  # type: ignore
                         run_response=run_response,
-                        event=create_pre_hook_completed_event(
+                        event=create_pre_hook_started_event(
                             from_run_response=run_response,
                             run_input=run_input,
                             pre_hook_name=hook.__name__,
@@ -4704,19 +4782,88 @@ class Agent:
                         events_to_skip=self.events_to_skip,  # type: ignore
                         store_events=self.store_events,
                     )
-
-            except (InputCheckError, OutputCheckError) as e:
-                raise e
-            except Exception as e:
-                log_error(f"Pre-hook #{i + 1} execution failed: {str(e)}")
-                log_exception(e)
+            try:
+                if len(group_hooks) == 1:
+                    completed = [self._run_pre_hook(*group_hooks[0], args=all_args)]
+                else:
+                    completed = self._run_pre_hooks_concurrently(hooks=group_hooks, args=all_args)
             finally:
                 # Reset global log mode incase an agent in the pre-hook changed it
                 self._set_debug(debug_mode=debug_mode)
 
+            if stream_events:
+                for (_, hook), hook_completed in zip(group_hooks, completed):
+                    if hook_completed:
+                        yield handle_event(  # type: ignore
+                            run_response=run_response,
+                            event=create_pre_hook_completed_event(
+                                from_run_response=run_response,
+                                run_input=run_input,
+                                pre_hook_name=hook.__name__,
+                            ),
+                            events_to_skip=self.events_to_skip,  # type: ignore
+                            store_events=self.store_events,
+                        )
+
         # Update the input on the run_response
         run_response.input = run_input
 
+    def _schedule_background_pre_hooks(
+        self,
+        hooks: List[Callable[..., Any]],
+        start_index: int,
+        args: Dict[str, Any],
+        background_tasks: Optional[Any] = None,
+    ) -> List[Tuple[int, Callable[..., Any]]]:
+        """Schedule the pre-hooks that should run in background, and return the others with their index."""
+        hooks_to_run = []
+        for i, hook in enumerate(hooks, start=start_index):
+            # Check if this specific hook should run in background (via @hook decorator)
+            if should_run_hook_in_background(hook) and background_tasks is not None:
+                # Copy args to prevent race conditions
+                bg_args = copy_args_for_background(args)
+                filtered_args = filter_hook_args(hook, bg_args)
+                background_tasks.add_task(hook, **filtered_args)
+                continue
+            hooks_to_run.append((i, hook))
+        return hooks_to_run
+
+    def _run_pre_hook(self, index: int, hook: Callable[..., Any], args: Dict[str, Any]) -> bool:
+        """Run a pre-hook. Returns False on errors other than check errors."""
+        try:
+            # Filter arguments to only include those that the hook accepts
+            filtered_args = filter_hook_args(hook, args)
+
+            hook(**filtered_args)
+            return True
+        except (InputCheckError, OutputCheckError) as e:
+            raise e
+        except Exception as e:
+            log_error(f"Pre-hook #{index + 1} execution failed: {str(e)}")
+            log_exception(e)
+            return False
+
+    def _run_pre_hooks_concurrently(
+        self, hooks: List[Tuple[int, Callable[..., Any]]], args: Dict[str, Any]
+    ) -> List[bool]:
+        """Run read-only pre-hooks in threads, and raise the first check error without waiting for the others."""
+        from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor
+        from concurrent.futures import wait as wait_futures
+        from contextvars import copy_context
+
+        executor = ThreadPoolExecutor(max_workers=len(hooks), thread_name_prefix="agno-pre-hook")
+        try:
+            futures = [
+                executor.submit(copy_context().run, self._run_pre_hook, index, hook, args) for index, hook in hooks
+            ]
+            wait_futures(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                if future.done() and future.exception() is not None:
+                    raise future.exception()  # type: ignore
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     async def _aexecute_pre_hooks(
         self,
         hooks: Optional[List[Callable[..., Any]]],
@@ -4730,7 +4877,10 @@ class Agent:
         background_tasks: Optional[Any] = None,
         **kwargs: Any,
     ) -> AsyncIterator[RunOutputEvent]:
-        """Execute multiple pre-hook functions in succession (async version)."""
+        """Execute multiple pre-hook functions in succession (async version).
+
+        Consecutive read-only pre-hooks run concurrently. Sync pre-hooks run in a thread, off the event loop.
+        """
         if hooks is None:
             return
         # Prepare arguments for this hook
@@ -4759,40 +4909,20 @@ class Agent:
 
         all_args.update(kwargs)
 
-        for i, hook in enumerate(hooks):
-            # Check if this specific hook should run in background (via @hook decorator)
-            if should_run_hook_in_background(hook) and background_tasks is not None:
-                # Copy args to prevent race conditions
-                bg_args = copy_args_for_background(all_args)
-                filtered_args = filter_hook_args(hook, bg_args)
-                background_tasks.add_task(hook, **filtered_args)
+        start_index = 0
+        for group in group_pre_hooks(hooks):
+            group_hooks = self._schedule_background_pre_hooks(
+                hooks=group, start_index=start_index, args=all_args, background_tasks=background_tasks
+            )
+            start_index += len(group)
+            if not group_hooks:
                 continue
 
             if stream_events:
-                yield handle_event(  # type: ignore
-                    run_response=run_response,
-                    event=create_pre_hook_started_event(
-                        from_run_response=run_response,
-                        run_input=run_input,
-                        pre_hook_name=hook.__name__,
-                    ),
-                    events_to_skip=self.events_to_skip,  # type: ignore
-                    store_events=self.store_events,
-                )
-            try:
-                # Filter arguments to only include those that the hook accepts
-                filtered_args = filter_hook_args(hook, all_args)
-
-                if iscoroutinefunction(hook):
-                    await hook(**filtered_args)
-                else:
-                    # Synchronous function
-                    hook(**filtered_args)
-
-                if stream_events:
+                for _, hook in group_hooks:
                     yield handle_event(  # type: ignore
                         run_response=run_response,
-                        event=create_pre_hook_completed_event(
+                        event=create_pre_hook_started_event(
                             from_run_response=run_response,
                             run_input=run_input,
                             pre_hook_name=hook.__name__,
@@ -4800,19 +4930,131 @@ class Agent:
                         events_to_skip=self.events_to_skip,  # type: ignore
                         store_events=self.store_events,
                     )
-
-            except (InputCheckError, OutputCheckError) as e:
-                raise e
-            except Exception as e:
-                log_error(f"Pre-hook #{i + 1} execution failed: {str(e)}")
-                log_exception(e)
+            try:
+                completed = await self._arun_pre_hooks_concurrently(hooks=group_hooks, args=all_args)
             finally:
                 # Reset global log mode incase an agent in the pre-hook changed it
                 self._set_debug(debug_mode=debug_mode)
 
+            if stream_events:
+                for (_, hook), hook_completed in zip(group_hooks, completed):
+                    if hook_completed:
+                        yield handle_event(  # type: ignore
+                            run_response=run_response,
+                            event=create_pre_hook_completed_event(
+                                from_run_response=run_response,
+                                run_input=run_input,
+                                pre_hook_name=hook.__name__,
+                            ),
+                            events_to_skip=self.events_to_skip,  # type: ignore
+                            store_events=self.store_events,
+                        )
+
         # Update the input on the run_response
         run_response.input = run_input
 
+    async def _arun_pre_hook(self, index: int, hook: Callable[..., Any], args: Dict[str, Any]) -> bool:
+        """Run a pre-hook, offloading sync hooks to a thread. Returns False on errors other than check errors."""
+        try:
+            # Filter arguments to only include those that the hook accepts
+            filtered_args = filter_hook_args(hook, args)
+
+            if iscoroutinefunction(hook):
+                await hook(**filtered_args)
+            else:
+                # Synchronous function, run in a thread so it doesn't block the event loop
+                await asyncio.to_thread(hook, **filtered_args)
+            return True
+        except (InputCheckError, OutputCheckError) as e:
+            raise e
+        except Exception as e:
+            log_error(f"Pre-hook #{index + 1} execution failed: {str(e)}")
+            log_exception(e)
+            return False
+
+    async def _arun_pre_hooks_concurrently(
+        self, hooks: List[Tuple[int, Callable[..., Any]]], args: Dict[str, Any]
+    ) -> List[bool]:
+        """Run pre-hooks concurrently, and cancel the others on the first check error."""
+        if len(hooks) == 1:
+            return [await self._arun_pre_hook(*hooks[0], args=args)]
+
+        tasks = [create_task(self._arun_pre_hook(index, hook, args)) for index, hook in hooks]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done() and task.exception() is not None:
+                    raise task.exception()  # type: ignore
+            return [task.result() for task in tasks]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _can_speculate_pre_hooks(self) -> bool:
+        """Check if the model request can start before the read-only pre-hooks complete.
+
+        It can't when memories, cultural knowledge, learnings or reasoning would be generated from the unchecked input.
+        """
+        if not self.speculative_pre_hooks:
+            return False
+        if self.memory_manager is not None and self.update_memory_on_run and not self.enable_agentic_memory:
+            return False
+        if self.culture_manager is not None and self.update_cultural_knowledge:
+            return False
+        if self._learning is not None:
+            return False
+        return not (self.reasoning or self.reasoning_model is not None)
+
+    def _start_speculative_pre_hooks(
+        self,
+        hooks: Optional[List[Callable[..., Any]]],
+        start_index: int,
+        run_input: RunInput,
+        run_context: RunContext,
+        session: AgentSession,
+        user_id: Optional[str] = None,
+        debug_mode: Optional[bool] = None,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Optional[Task[List[bool]]]:
+        """Start the read-only pre-hooks as a task, to run alongside the model request.
+
+        Args:
+            hooks: The read-only pre-hooks at the end of pre_hooks.
+            start_index: The index of the first of these hooks in pre_hooks.
+
+        Returns:
+            The task running the hooks, or None if there are none to run.
+        """
+        if hooks is None:
+            return None
+        all_args = {
+            "run_input": run_input,
+            "agent": self,
+            "session": session,
+            "run_context": run_context,
+            "user_id": user_id,
+            "debug_mode": debug_mode or self.debug_mode,
+        }
+        all_args.update(kwargs)
+
+        hooks_to_run = self._schedule_background_pre_hooks(
+            hooks=hooks, start_index=start_index, args=all_args, background_tasks=background_tasks
+        )
+        if not hooks_to_run:
+            return None
+
+        async def run_hooks() -> List[bool]:
+            try:
+                return await self._arun_pre_hooks_concurrently(hooks=hooks_to_run, args=all_args)
+            finally:
+                # Reset global log mode incase an agent in the pre-hook changed it
+                self._set_debug(debug_mode=debug_mode)
+
+        log_debug(f"Running {len(hooks_to_run)} read-only pre-hooks alongside the model request.")
+        return create_task(run_hooks())
+
     def _execute_post_hooks(
         self,
         hooks: Optional[List[Callable[..., Any]]],
@@ -5712,6 +5954,7 @@ class Agent:
         stream_events: bool = False,
         session_state: Optional[Dict[str, Any]] = None,
         run_context: Optional[RunContext] = None,
+        speculative_pre_hooks_task: Optional[Task[List[bool]]] = None,
     ) -> AsyncIterator[RunOutputEvent]:
         self.model = cast(Model, self.model)
 
@@ -5741,6 +5984,9 @@ class Agent:
             send_media_to_model=self.send_media_to_model,
             compression_manager=self.compression_manager if self.compress_tool_results else None,
         )  # type: ignore
+        if speculative_pre_hooks_task is not None:
+            # Holds back the output until the pre-hooks pass, and closes the stream if one raises an InputCheckError
+            model_response_stream = aspeculate_stream(model_response_stream, speculative_pre_hooks_task)
 
         async for model_response_event in model_response_stream:  # type: ignore
             # Handle LLM request events and compression events from ModelResponse
@@ -6614,7 +6860,7 @@ class Agent:
         agent_tools: List[Union[Toolkit, Callable, Function, Dict]] = []
 
         # Connect tools that require connection management
-        self._connect_connectable_tools()
+        self._connect_connectable_tools(run_id=run_response.run_id)
 
         # Add provided tools
         if self.tools is not None:
@@ -6696,10 +6942,10 @@ class Agent:
         agent_tools: List[Union[Toolkit, Callable, Function, Dict]] = []
 
         # Connect tools that require connection management
-        self._connect_connectable_tools()
+        self._connect_connectable_tools(run_id=run_response.run_id)
 
         # Connect MCP tools
-        await self._connect_mcp_tools()
+        await self._connect_mcp_tools(run_id=run_response.run_id)
 
         # Add provided tools
         if self.tools is not None:
@@ -7451,6 +7697,10 @@ class Agent:
         if self.tool_choice is not None:
             config["tool_choice"] = self.tool_choice
 
+        # --- Hook settings ---
+        if self.speculative_pre_hooks:
+            config["speculative_pre_hooks"] = self.speculative_pre_hooks
+
         # --- Reasoning settings ---
         if self.reasoning:
             config["reasoning"] = self.reasoning
@@ -7785,6 +8035,8 @@ class Agent:
             tools=config.get("tools"),
             tool_call_limit=config.get("tool_call_limit"),
             tool_choice=config.get("tool_choice"),
+            # --- Hook settings ---
+            speculative_pre_hooks=config.get("speculative_pre_hooks", False),
             # --- Reasoning settings ---
             reasoning=config.get("reasoning", False),
             # reasoning_model=config.get("reasoning_model"),  # TODO
@@ -8691,13 +8943,22 @@ class Agent:
         run_context: Optional[RunContext] = None,
     ) -> Any:
         """Format a message with the session state variables from run_context."""
-        import re
-        import string
-        from copy import deepcopy
-
         if not isinstance(message, str):
             return message
+        # Nothing to substitute without a {var_name} or $var_name placeholder
+        if "{" not in message and "$" not in message:
+            return message
+
+        format_variables = self._get_state_format_variables(run_context)
+        template = self._get_state_template(message, format_variables)
+        try:
+            return template.safe_substitute(format_variables)
+        except Exception as e:
+            log_warning(f"Template substitution failed: {e}")
+            return message
 
+    def _get_state_format_variables(self, run_context: Optional[RunContext] = None) -> ChainMap:
+        """Get the variables available to format a message, from run_context."""
         # Extract values from run_context
         session_state = run_context.session_state if run_context else None
         dependencies = run_context.dependencies if run_context else None
@@ -8705,28 +8966,86 @@ class Agent:
         user_id = run_context.user_id if run_context else None
 
         # Should already be resolved and passed from run() method
-        format_variables = ChainMap(
+        return ChainMap(
             session_state if session_state is not None else {},
             dependencies or {},
             metadata or {},
             {"user_id": user_id} if user_id is not None else {},
         )
 
-        converted_msg = deepcopy(message)
+    def _get_state_template(self, message: str, format_variables: ChainMap) -> Template:
+        """Convert the {var_name} placeholders of a message to a Template substituting the given variables."""
+        import re
+
+        converted_msg = message
         for var_name in format_variables.keys():
             # Only convert standalone {var_name} patterns, not nested ones
             pattern = r"\{" + re.escape(var_name) + r"\}"
             replacement = "${" + var_name + "}"
             converted_msg = re.sub(pattern, replacement, converted_msg)
+        return Template(converted_msg)
 
-        # Use Template to safely substitute variables
-        template = string.Template(converted_msg)
+    def _format_system_message_section(self, name: str, section: str, run_context: Optional[RunContext] = None) -> str:
+        """Format a static section of the system message with the session state variables.
+
+        The section is converted to a template once, and the template is reused while the names of the variables
+        don't change.
+        """
+        if "{" not in section and "$" not in section:
+            return section
+
+        format_variables = self._get_state_format_variables(run_context)
+        key = (section, tuple(format_variables.keys()))
+        cached = self._system_message_templates.get(name)
+        if cached is not None and cached[0] == key:
+            template = cached[1]
+        else:
+            template = self._get_state_template(section, format_variables)
+            self._system_message_templates[name] = (key, template)
         try:
-            result = template.safe_substitute(format_variables)
-            return result
+            return template.safe_substitute(format_variables)
         except Exception as e:
             log_warning(f"Template substitution failed: {e}")
-            return message
+            return section
+
+    def _render_instructions_section(self, instructions: List[str]) -> str:
+        """Render the description, role and instructions of the system message."""
+        section = ""
+        if self.description is not None:
+            section += f"{self.description}\n"
+        if self.role is not None:
+            section += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
+        if len(instructions) > 0:
+            if self.use_instruction_tags:
+                section += "<instructions>"
+                if len(instructions) > 1:
+                    section += "".join(f"\n- {_upi}" for _upi in instructions)
+                else:
+                    section += "\n" + instructions[0]
+                section += "\n</instructions>\n\n"
+            else:
+                if len(instructions) > 1:
+                    section += "".join(f"- {_upi}\n" for _upi in instructions)
+                else:
+                    section += instructions[0] + "\n\n"
+        return section
+
+    def _render_expected_output_section(self) -> str:
+        """Render the expected output and additional context of the system message."""
+        section = ""
+        if self.expected_output is not None:
+            section += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
+        if self.additional_context is not None:
+            section += f"{self.additional_context}\n"
+        return section
+
+    def invalidate_system_message_cache(self) -> None:
+        """Drop the templates of the system message sections built by previous runs.
+
+        Templates are built again when their section or the names of the session state variables change, so this is
+        only needed to free them.
+        """
+        self._system_message_templates = {}
 
     def get_system_message(
         self,
@@ -8857,53 +9176,34 @@ class Agent:
                     additional_information.append(knowledge_context)
 
         # 3.3 Build the default system message for the Agent.
-        system_message_content: str = ""
-        # 3.3.1 First add the Agent description if provided
-        if self.description is not None:
-            system_message_content += f"{self.description}\n"
-        # 3.3.2 Then add the Agent role if provided
-        if self.role is not None:
-            system_message_content += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
-        # 3.3.3 Then add instructions for the Agent
-        if len(instructions) > 0:
-            if self.use_instruction_tags:
-                system_message_content += "<instructions>"
-                if len(instructions) > 1:
-                    for _upi in instructions:
-                        system_message_content += f"\n- {_upi}"
-                else:
-                    system_message_content += "\n" + instructions[0]
-                system_message_content += "\n</instructions>\n\n"
-            else:
-                if len(instructions) > 1:
-                    for _upi in instructions:
-                        system_message_content += f"- {_upi}\n"
-                else:
-                    system_message_content += instructions[0] + "\n\n"
+        # 3.3.1 First add the Agent description, 3.3.2 then the Agent role and 3.3.3 the instructions for the Agent
+        instructions_section = self._render_instructions_section(instructions)
         # 3.3.4 Add additional information
+        additional_information_section = ""
         if len(additional_information) > 0:
-            system_message_content += "<additional_information>"
+            additional_information_section += "<additional_information>"
             for _ai in additional_information:
-                system_message_content += f"\n- {_ai}"
-            system_message_content += "\n</additional_information>\n\n"
+                additional_information_section += f"\n- {_ai}"
+            additional_information_section += "\n</additional_information>\n\n"
         # 3.3.5 Then add instructions for the tools
-        if self._tool_instructions is not None:
-            for _ti in self._tool_instructions:
-                system_message_content += f"{_ti}\n"
+        tool_instructions_section = "".join(f"{_ti}\n" for _ti in self._tool_instructions or ())
 
         # Format the system message with the session state variables
         if self.resolve_in_context:
-            system_message_content = self._format_message_with_state_variables(
-                system_message_content,
+            instructions_section = self._format_system_message_section(
+                "instructions", instructions_section, run_context=run_context
+            )
+            additional_information_section = self._format_message_with_state_variables(
+                additional_information_section,
                 run_context=run_context,
             )
+            tool_instructions_section = self._format_system_message_section(
+                "tool_instructions", tool_instructions_section, run_context=run_context
+            )
+        system_message_content: str = instructions_section + additional_information_section + tool_instructions_section
 
-        # 3.3.7 Then add the expected output
-        if self.expected_output is not None:
-            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
-        # 3.3.8 Then add additional context
-        if self.additional_context is not None:
-            system_message_content += f"{self.additional_context}\n"
+        # 3.3.7 Then add the expected output and 3.3.8 the additional context
+        system_message_content += self._render_expected_output_section()
         # 3.3.8.1 Then add skills to the system prompt
         if self.skills is not None:
             skills_snippet = self.skills.get_system_prompt_snippet()
@@ -9202,53 +9502,34 @@ class Agent:
                     additional_information.append(knowledge_context)
 
         # 3.3 Build the default system message for the Agent.
-        system_message_content: str = ""
-        # 3.3.1 First add the Agent description if provided
-        if self.description is not None:
-            system_message_content += f"{self.description}\n"
-        # 3.3.2 Then add the Agent role if provided
-        if self.role is not None:
-            system_message_content += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
-        # 3.3.3 Then add instructions for the Agent
-        if len(instructions) > 0:
-            if self.use_instruction_tags:
-                system_message_content += "<instructions>"
-                if len(instructions) > 1:
-                    for _upi in instructions:
-                        system_message_content += f"\n- {_upi}"
-                else:
-                    system_message_content += "\n" + instructions[0]
-                system_message_content += "\n</instructions>\n\n"
-            else:
-                if len(instructions) > 1:
-                    for _upi in instructions:
-                        system_message_content += f"- {_upi}\n"
-                else:
-                    system_message_content += instructions[0] + "\n\n"
+        # 3.3.1 First add the Agent description, 3.3.2 then the Agent role and 3.3.3 the instructions for the Agent
+        instructions_section = self._render_instructions_section(instructions)
         # 3.3.4 Add additional information
+        additional_information_section = ""
         if len(additional_information) > 0:
-            system_message_content += "<additional_information>"
+            additional_information_section += "<additional_information>"
             for _ai in additional_information:
-                system_message_content += f"\n- {_ai}"
-            system_message_content += "\n</additional_information>\n\n"
+                additional_information_section += f"\n- {_ai}"
+            additional_information_section += "\n</additional_information>\n\n"
         # 3.3.5 Then add instructions for the tools
-        if self._tool_instructions is not None:
-            for _ti in self._tool_instructions:
-                system_message_content += f"{_ti}\n"
+        tool_instructions_section = "".join(f"{_ti}\n" for _ti in self._tool_instructions or ())
 
         # Format the system message with the session state variables
         if self.resolve_in_context:
-            system_message_content = self._format_message_with_state_variables(
-                system_message_content,
+            instructions_section = self._format_system_message_section(
+                "instructions", instructions_section, run_context=run_context
+            )
+            additional_information_section = self._format_message_with_state_variables(
+                additional_information_section,
                 run_context=run_context,
             )
+            tool_instructions_section = self._format_system_message_section(
+                "tool_instructions", tool_instructions_section, run_context=run_context
+            )
+        system_message_content: str = instructions_section + additional_information_section + tool_instructions_section
 
-        # 3.3.7 Then add the expected output
-        if self.expected_output is not None:
-            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
-        # 3.3.8 Then add additional context
-        if self.additional_context is not None:
-            system_message_content += f"{self.additional_context}\n"
+        # 3.3.7 Then add the expected output and 3.3.8 the additional context
+        system_message_content += self._render_expected_output_section()
         # 3.3.8.1 Then add skills to the system prompt
         if self.skills is not None:
             skills_snippet = self.skills.get_system_prompt_snippet()
@@ -11685,27 +11966,109 @@ class Agent:
         insert_fn(name=document_name, text_content=document_content, reader=TextReader())
         return "Successfully added to knowledge base"
 
+    def _index_run_messages(self, run_response: RunOutput) -> None:
+        """Add the messages of the run to the index searched by the previous sessions tool."""
+        if self.db is None:
+            return
+        message_pairs = get_indexed_message_pairs(run_response)
+        if not message_pairs:
+            return
+        try:
+            cast(BaseDb, self.db).upsert_indexed_messages(message_pairs)
+        except NotImplementedError:
+            # The previous sessions tool reads the sessions instead
+            pass
+        except Exception as e:
+            log_warning(f"Error indexing the run messages: {e}")
+
+    async def _aindex_run_messages(self, run_response: RunOutput) -> None:
+        """Add the messages of the run to the index searched by the previous sessions tool."""
+        if self.db is None:
+            return
+        message_pairs = get_indexed_message_pairs(run_response)
+        if not message_pairs:
+            return
+        try:
+            if self._has_async_db():
+                await cast(AsyncBaseDb, self.db).upsert_indexed_messages(message_pairs)
+            else:
+                cast(BaseDb, self.db).upsert_indexed_messages(message_pairs)
+        except NotImplementedError:
+            # The previous sessions tool reads the sessions instead
+            pass
+        except Exception as e:
+            log_warning(f"Error indexing the run messages: {e}")
+
+    def _get_indexed_pairs_messages(self, message_pairs: List[IndexedMessagePair]) -> List[Dict[str, Any]]:
+        """Get the messages of the given indexed message pairs, skipping pairs repeated across sessions."""
+        all_messages: List[Dict[str, Any]] = []
+        seen_message_pairs = set()
+        for message_pair in message_pairs:
+            if message_pair.content not in seen_message_pairs:
+                seen_message_pairs.add(message_pair.content)
+                all_messages.append(message_pair.user_message)
+                all_messages.append(message_pair.assistant_message)
+        return all_messages
+
+    def _get_sessions_messages(self, sessions: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Get the message pairs of the given sessions, for databases without a message index."""
+        all_messages: List[Dict[str, Any]] = []
+        seen_message_pairs = set()
+
+        for session in sessions:
+            if isinstance(session, AgentSession) and session.runs:
+                for run in session.runs:
+                    messages = run.messages
+                    if messages is not None:
+                        for i in range(0, len(messages) - 1, 2):
+                            if i + 1 < len(messages):
+                                try:
+                                    user_msg = messages[i]
+                                    assistant_msg = messages[i + 1]
+                                    user_content = user_msg.content
+                                    assistant_content = assistant_msg.content
+                                    if user_content is None or assistant_content is None:
+                                        continue  # Skip this pair if either message has no content
+
+                                    msg_pair_id = f"{user_content}:{assistant_content}"
+                                    if msg_pair_id not in seen_message_pairs:
+                                        seen_message_pairs.add(msg_pair_id)
+                                        all_messages.append(Message.model_validate(user_msg).to_dict())
+                                        all_messages.append(Message.model_validate(assistant_msg).to_dict())
+                                except Exception as e:
+                                    log_warning(f"Error processing message pair: {e}")
+                                    continue
+
+        return all_messages
+
     def _get_previous_sessions_messages_function(
-        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None
+        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None, num_message_pairs: int = 10
     ) -> Callable:
         """Factory function to create a get_previous_session_messages function.
 
+        Messages are searched in the message index of the database, filled when runs complete. Databases without a
+        message index fall back to reading the last sessions.
+
         Args:
-            num_history_sessions: The last n sessions to be taken from db
+            num_history_sessions: The last n sessions to be read from db, if it has no message index
             user_id: The user ID to filter sessions by
+            num_message_pairs: The maximum number of message pairs returned by a search of the message index
 
         Returns:
             Callable: A function that retrieves messages from previous sessions
         """
 
-        def get_previous_session_messages() -> str:
+        def get_previous_session_messages(query: Optional[str] = None) -> str:
             """Use this function to retrieve messages from previous chat sessions.
-            USE THIS TOOL ONLY WHEN THE QUESTION IS EITHER "What was my last conversation?" or "What was my last question?" and similar to it.
+            Call it without a query to get the most recent messages, when the question is "What was my last conversation?", "What was my last question?" or similar to it.
+            Call it with a query to find the messages about a topic from previous sessions.
+
+            Args:
+                query: Optional text to search for in the messages of previous sessions.
 
             Returns:
                 str: JSON formatted list of message pairs from previous sessions
             """
-            # TODO: Review and Test this function
             import json
 
             if self.db is None:
@@ -11713,119 +12076,98 @@ class Agent:
 
             self.db = cast(BaseDb, self.db)
 
-            selected_sessions = self.db.get_sessions(
-                session_type=SessionType.AGENT,
-                limit=num_history_sessions,
-                user_id=user_id,
-                sort_by="created_at",
-                sort_order="desc",
-            )
+            all_messages: List[Dict[str, Any]] = []
+            try:
+                message_pairs = self.db.search_indexed_messages(query=query, user_id=user_id, limit=num_message_pairs)
+                all_messages = self._get_indexed_pairs_messages(message_pairs)
+                # Sessions from before the index was filled are only read for the most recent messages
+                read_sessions = not all_messages and query is None
+            except NotImplementedError:
+                read_sessions = True
+
+            if read_sessions:
+                selected_sessions = self.db.get_sessions(
+                    session_type=SessionType.AGENT,
+                    limit=num_history_sessions,
+                    user_id=user_id,
+                    sort_by="created_at",
+                    sort_order="desc",
+                )
+                all_messages = self._get_sessions_messages(selected_sessions)
 
-            all_messages = []
-            seen_message_pairs = set()
-
-            for session in selected_sessions:
-                if isinstance(session, AgentSession) and session.runs:
-                    message_count = 0
-                    for run in session.runs:
-                        messages = run.messages
-                        if messages is not None:
-                            for i in range(0, len(messages) - 1, 2):
-                                if i + 1 < len(messages):
-                                    try:
-                                        user_msg = messages[i]
-                                        assistant_msg = messages[i + 1]
-                                        user_content = user_msg.content
-                                        assistant_content = assistant_msg.content
-                                        if user_content is None or assistant_content is None:
-                                            continue  # Skip this pair if either message has no content
-
-                                        msg_pair_id = f"{user_content}:{assistant_content}"
-                                        if msg_pair_id not in seen_message_pairs:
-                                            seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
-                                            message_count += 1
-                                    except Exception as e:
-                                        log_warning(f"Error processing message pair: {e}")
-                                        continue
-
-            return json.dumps([msg.to_dict() for msg in all_messages]) if all_messages else "No history found"
+            return json.dumps(all_messages) if all_messages else "No history found"
 
         return get_previous_session_messages
 
     async def _aget_previous_sessions_messages_function(
-        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None
+        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None, num_message_pairs: int = 10
     ) -> Function:
         """Factory function to create a get_previous_session_messages function.
 
+        Messages are searched in the message index of the database, filled when runs complete. Databases without a
+        message index fall back to reading the last sessions.
+
         Args:
-            num_history_sessions: The last n sessions to be taken from db
+            num_history_sessions: The last n sessions to be read from db, if it has no message index
             user_id: The user ID to filter sessions by
+            num_message_pairs: The maximum number of message pairs returned by a search of the message index
+
         Returns:
             Callable: A function that retrieves messages from previous sessions
         """
 
-        async def aget_previous_session_messages() -> str:
+        async def aget_previous_session_messages(query: Optional[str] = None) -> str:
             """Use this function to retrieve messages from previous chat sessions.
-            USE THIS TOOL ONLY WHEN THE QUESTION IS EITHER "What was my last conversation?" or "What was my last question?" and similar to it.
+            Call it without a query to get the most recent messages, when the question is "What was my last conversation?", "What was my last question?" or similar to it.
+            Call it with a query to find the messages about a topic from previous sessions.
+
+            Args:
+                query: Optional text to search for in the messages of previous sessions.
 
             Returns:
                 str: JSON formatted list of message pairs from previous sessions
             """
-            # TODO: Review and Test this function
             import json
 
             if self.db is None:
                 return "Previous session messages not available"
 
-            if self._has_async_db():
-                selected_sessions = await self.db.get_sessions(  # type: ignore
-                    session_type=SessionType.AGENT,
-                    limit=num_history_sessions,
-                    user_id=user_id,
-                    sort_by="created_at",
-                    sort_order="desc",
-                )
-            else:
-                selected_sessions = self.db.get_sessions(
-                    session_type=SessionType.AGENT,
-                    limit=num_history_sessions,
-                    user_id=user_id,
-                    sort_by="created_at",
-                    sort_order="desc",
-                )
+            all_messages: List[Dict[str, Any]] = []
+            try:
+                if self._has_async_db():
+                    message_pairs = await self.db.search_indexed_messages(  # type: ignore
+                        query=query, user_id=user_id, limit=num_message_pairs
+                    )
+                else:
+                    message_pairs = self.db.search_indexed_messages(  # type: ignore
+                        query=query, user_id=user_id, limit=num_message_pairs
+                    )
+                all_messages = self._get_indexed_pairs_messages(message_pairs)
+                # Sessions from before the index was filled are only read for the most recent messages
+                read_sessions = not all_messages and query is None
+            except NotImplementedError:
+                read_sessions = True
+
+            if read_sessions:
+                if self._has_async_db():
+                    selected_sessions = await self.db.get_sessions(  # type: ignore
+                        session_type=SessionType.AGENT,
+                        limit=num_history_sessions,
+                        user_id=user_id,
+                        sort_by="created_at",
+                        sort_order="desc",
+                    )
+                else:
+                    selected_sessions = self.db.get_sessions(
+                        session_type=SessionType.AGENT,
+                        limit=num_history_sessions,
+                        user_id=user_id,
+                        sort_by="created_at",
+                        sort_order="desc",
+                    )
+                all_messages = self._get_sessions_messages(selected_sessions)
 
-            all_messages = []
-            seen_message_pairs = set()
-
-            for session in selected_sessions:  # type: ignore
-                if isinstance(session, AgentSession) and session.runs:
-                    message_count = 0
-                    for run in session.runs:
-                        messages = run.messages
-                        if messages is not None:
-                            for i in range(0, len(messages) - 1, 2):
-                                if i + 1 < len(messages):
-                                    try:
-                                        user_msg = messages[i]
-                                        assistant_msg = messages[i + 1]
-                                        user_content = user_msg.content
-                                        assistant_content = assistant_msg.content
-                                        if user_content is None or assistant_content is None:
-                                            continue  # Skip this pair if either message has no content
-
-                                        msg_pair_id = f"{user_content}:{assistant_content}"
-                                        if msg_pair_id not in seen_message_pairs:
-                                            seen_message_pairs.add(msg_pair_id)
-                                            all_messages.append(Message.model_validate(user_msg))
-                                            all_messages.append(Message.model_validate(assistant_msg))
-                                            message_count += 1
-                                    except Exception as e:
-                                        log_warning(f"Error processing message pair: {e}")
-                                        continue
-
-            return json.dumps([msg.to_dict() for msg in all_messages]) if all_messages else "No history found"
+            return json.dumps(all_messages) if all_messages else "No history found"
 
         return Function.from_callable(aget_previous_session_messages, name="get_previous_session_messages")
 
@@ -12203,6 +12545,10 @@ class Agent:
         # Save session to memory
         self.save_session(session=session)
 
+        # Index the messages of the run, to search them from other sessions
+        if self.search_session_history:
+            self._index_run_messages(run_response=run_response)
+
     async def _acleanup_and_store(
         self,
         run_response: RunOutput,
@@ -12246,6 +12592,10 @@ class Agent:
         # Save session to memory
         await self.asave_session(session=session)
 
+        # Index the messages of the run, to search them from other sessions
+        if self.search_session_history:
+            await self._aindex_run_messages(run_response=run_response)
+
     def _scrub_run_output_for_storage(self, run_response: RunOutput) -> None:
         """
         Scrub run output based on storage flags before persisting to database.
@@ -11,6 +11,7 @@ from agno.db.schemas import UserMemory
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
+from agno.db.schemas.messages import IndexedMessagePair
 from agno.session import Session
 
 
@@ -47,6 +48,7 @@ class BaseDb(ABC):
         component_configs_table: Optional[str] = None,
         component_links_table: Optional[str] = None,
         learnings_table: Optional[str] = None,
+        message_index_table: Optional[str] = None,
         id: Optional[str] = None,
     ):
         self.id = id or str(uuid4())
@@ -63,6 +65,7 @@ class BaseDb(ABC):
         self.component_configs_table_name = component_configs_table or "agno_component_configs"
         self.component_links_table_name = component_links_table or "agno_component_links"
         self.learnings_table_name = learnings_table or "agno_learnings"
+        self.message_index_table_name = message_index_table or "agno_message_index"
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -82,6 +85,7 @@ class BaseDb(ABC):
             "components_table": self.components_table_name,
             "component_configs_table": self.component_configs_table_name,
             "component_links_table": self.component_links_table_name,
+            "message_index_table": self.message_index_table_name,
         }
 
     @classmethod
@@ -102,6 +106,7 @@ class BaseDb(ABC):
             components_table=data.get("components_table"),
             component_configs_table=data.get("component_configs_table"),
             component_links_table=data.get("component_links_table"),
+            message_index_table=data.get("message_index_table"),
             id=data.get("id"),
         )
 
@@ -379,6 +384,21 @@ class BaseDb(ABC):
         """
         raise NotImplementedError
 
+    def upsert_traces(self, traces: List["Trace"], spans: Optional[List["Span"]] = None) -> None:
+        """Create or update multiple traces, and create their spans, as a batch.
+
+        Dbs that support it should override this to write the whole batch in a single transaction, raising if the
+        batch could not be written.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of the traces to store.
+        """
+        for trace in traces:
+            self.upsert_trace(trace)
+        if spans:
+            self.create_spans(spans)
+
     @abstractmethod
     def get_trace(
         self,
@@ -943,6 +963,44 @@ class BaseDb(ABC):
         """
         raise NotImplementedError
 
+    # --- Message index ---
+    def upsert_indexed_messages(self, message_pairs: List[IndexedMessagePair]) -> None:
+        """Add message pairs to the index used to search messages across sessions, replacing those with the same id.
+
+        Dbs that support searching messages override this and search_indexed_messages.
+
+        Args:
+            message_pairs: The message pairs to index.
+
+        Raises:
+            NotImplementedError: If the database does not support searching messages.
+        """
+        raise NotImplementedError
+
+    def search_indexed_messages(
+        self,
+        query: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[IndexedMessagePair]:
+        """Search the indexed message pairs.
+
+        Args:
+            query: Text to search for. Pairs are ranked by relevance to it, then by recency.
+                If not provided, the most recent pairs are returned.
+            user_id: Filter by user ID.
+            agent_id: Filter by agent ID.
+            limit: Maximum number of pairs to return.
+
+        Returns:
+            List of message pairs, best match first.
+
+        Raises:
+            NotImplementedError: If the database does not support searching messages.
+        """
+        raise NotImplementedError
+
 
 class AsyncBaseDb(ABC):
     """Base abstract class for all our async database implementations."""
@@ -960,6 +1018,7 @@ class AsyncBaseDb(ABC):
         culture_table: Optional[str] = None,
         versions_table: Optional[str] = None,
         learnings_table: Optional[str] = None,
+        message_index_table: Optional[str] = None,
     ):
         self.id = id or str(uuid4())
         self.session_table_name = session_table or "agno_sessions"
@@ -972,6 +1031,7 @@ class AsyncBaseDb(ABC):
         self.culture_table_name = culture_table or "agno_culture"
         self.versions_table_name = versions_table or "agno_schema_versions"
         self.learnings_table_name = learnings_table or "agno_learnings"
+        self.message_index_table_name = message_index_table or "agno_message_index"
 
     async def _create_all_tables(self) -> None:
         """Create all tables for this database. Override in subclasses."""
@@ -1235,6 +1295,21 @@ class AsyncBaseDb(ABC):
         """
         raise NotImplementedError
 
+    async def upsert_traces(self, traces: List, spans: Optional[List] = None) -> None:
+        """Create or update multiple traces, and create their spans, as a batch.
+
+        Dbs that support it should override this to write the whole batch in a single transaction, raising if the
+        batch could not be written.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of the traces to store.
+        """
+        for trace in traces:
+            await self.upsert_trace(trace)
+        if spans:
+            await self.create_spans(spans)
+
     @abstractmethod
     async def get_trace(
         self,
@@ -1517,3 +1592,41 @@ class AsyncBaseDb(ABC):
             List of learning records.
         """
         raise NotImplementedError
+
+    # --- Message index ---
+    async def upsert_indexed_messages(self, message_pairs: List[IndexedMessagePair]) -> None:
+        """Add message pairs to the index used to search messages across sessions, replacing those with the same id.
+
+        Dbs that support searching messages override this and search_indexed_messages.
+
+        Args:
+            message_pairs: The message pairs to index.
+
+        Raises:
+            NotImplementedError: If the database does not support searching messages.
+        """
+        raise NotImplementedError
+
+    async def search_indexed_messages(
+        self,
+        query: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[IndexedMessagePair]:
+        """Search the indexed message pairs.
+
+        Args:
+            query: Text to search for. Pairs are ranked by relevance to it, then by recency.
+                If not provided, the most recent pairs are returned.
+            user_id: Filter by user ID.
+            agent_id: Filter by agent ID.
+            limit: Maximum number of pairs to return.
+
+        Returns:
+            List of message pairs, best match first.
+
+        Raises:
+            NotImplementedError: If the database does not support searching messages.
+        """
+        raise NotImplementedError
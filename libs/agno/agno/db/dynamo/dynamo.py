@@ -2,19 +2,31 @@ import json
 import time
 from datetime import date, datetime, timedelta, timezone
 from os import getenv
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.base import BaseDb, SessionType
-from agno.db.dynamo.schemas import get_table_schema_definition
+from agno.db.dynamo.schemas import (
+    KNOWLEDGE_PARTITION_INDEX,
+    MEMORY_PARTITION_INDEX,
+    METRICS_PARTITION_INDEX,
+    TABLE_KEY_ATTRIBUTES,
+    TABLE_PARTITION_ATTRIBUTE,
+    TABLE_PARTITION_VALUES,
+    get_table_schema_definition,
+)
 from agno.db.dynamo.utils import (
     apply_pagination,
     apply_sorting,
+    backfill_table_partition,
+    batch_get_items,
     build_query_filter_expression,
     build_topic_filter_expression,
     calculate_date_metrics,
+    count_query_items,
+    create_missing_indexes,
     create_table_if_not_exists,
     deserialize_cultural_knowledge_from_db,
     deserialize_eval_record,
@@ -22,11 +34,12 @@ from agno.db.dynamo.utils import (
     deserialize_knowledge_row,
     deserialize_session,
     deserialize_session_result,
-    execute_query_with_pagination,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
     merge_with_existing_session,
     prepare_session_data,
+    query_items,
+    scan_items,
     serialize_cultural_knowledge_for_db,
     serialize_eval_record,
     serialize_knowledge_row,
@@ -37,7 +50,7 @@ from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
-from agno.utils.log import log_debug, log_error, log_info
+from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
@@ -57,6 +70,7 @@ class DynamoDb(BaseDb):
         region_name: Optional[str] = None,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
         session_table: Optional[str] = None,
         culture_table: Optional[str] = None,
         memory_table: Optional[str] = None,
@@ -75,6 +89,7 @@ class DynamoDb(BaseDb):
             region_name: AWS region name.
             aws_access_key_id: AWS access key ID.
             aws_secret_access_key: AWS secret access key.
+            endpoint_url: Custom DynamoDB endpoint, e.g. to use DynamoDB Local during development.
             session_table: The name of the session table.
             culture_table: The name of the culture table.
             memory_table: The name of the memory table.
@@ -119,7 +134,11 @@ class DynamoDb(BaseDb):
             session_kwargs["aws_secret_access_key"] = aws_secret_access_key or getenv("AWS_SECRET_ACCESS_KEY")
 
             session = boto3.Session(**session_kwargs)
-            self.client = session.client("dynamodb")
+            self.client = session.client("dynamodb", endpoint_url=endpoint_url)
+
+        # Active indexes of each table, and the missing indexes already reported
+        self._active_indexes: Dict[str, Set[str]] = {}
+        self._reported_missing_indexes: Set[Tuple[str, str]] = set()
 
     def table_exists(self, table_name: str) -> bool:
         """Check if a DynamoDB table exists.
@@ -136,6 +155,95 @@ class DynamoDb(BaseDb):
         except self.client.exceptions.ResourceNotFoundException:
             return False
 
+    def _has_index(self, table_name: str, index_name: str) -> bool:
+        """Check if a global secondary index of a table is active.
+
+        Tables created before the table-wide indexes were added don't have them until migrate_indexes() is run.
+        A warning is logged the first time a missing index is found.
+
+        Args:
+            table_name: The name of the table.
+            index_name: The name of the index.
+
+        Returns:
+            bool: True if the index exists and is active, False otherwise.
+        """
+        if index_name in self._active_indexes.get(table_name, set()):
+            return True
+
+        # Only active indexes are cached, so indexes created later by another process are picked up
+        table = self.client.describe_table(TableName=table_name)["Table"]
+        self._active_indexes[table_name] = {
+            index["IndexName"]
+            for index in table.get("GlobalSecondaryIndexes", [])
+            if index.get("IndexStatus", "ACTIVE") == "ACTIVE"
+        }
+        if index_name in self._active_indexes[table_name]:
+            return True
+
+        if (table_name, index_name) not in self._reported_missing_indexes:
+            self._reported_missing_indexes.add((table_name, index_name))
+            log_warning(
+                f"Index {index_name} is missing from table {table_name}, so the table is scanned instead. "
+                "Run DynamoDb.migrate_indexes() to create it."
+            )
+        return False
+
+    def _read_table_partition(
+        self,
+        table_name: str,
+        table_type: str,
+        index_name: str,
+        range_condition: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Read the items of a table through its table-wide index, falling back to a scan when the index is missing.
+
+        Args:
+            table_name: The name of the table.
+            table_type: The type of the table, giving the value of its partition attribute.
+            index_name: The name of the table-wide index.
+            range_condition: Optional condition on the sort key of the index.
+            **kwargs: Other arguments of the query, like ProjectionExpression, FilterExpression,
+                ExpressionAttributeNames, ExpressionAttributeValues or ScanIndexForward.
+
+        Returns:
+            List[Dict[str, Any]]: The DynamoDB items read.
+        """
+        expression_attribute_names = dict(kwargs.pop("ExpressionAttributeNames", {}))
+        expression_attribute_values = dict(kwargs.pop("ExpressionAttributeValues", {}))
+        filter_expression = kwargs.pop("FilterExpression", None)
+
+        if self._has_index(table_name, index_name):
+            key_condition_expression = "#partition = :partition"
+            if range_condition:
+                key_condition_expression += f" AND {range_condition}"
+            expression_attribute_names["#partition"] = TABLE_PARTITION_ATTRIBUTE
+            expression_attribute_values[":partition"] = {"S": TABLE_PARTITION_VALUES[table_type]}
+            query_kwargs: Dict[str, Any] = {
+                "TableName": table_name,
+                "IndexName": index_name,
+                "KeyConditionExpression": key_condition_expression,
+                "ExpressionAttributeNames": expression_attribute_names,
+                "ExpressionAttributeValues": expression_attribute_values,
+                **kwargs,
+            }
+            if filter_expression:
+                query_kwargs["FilterExpression"] = filter_expression
+            return query_items(self.client, query_kwargs)
+
+        # Scans don't return items in any order
+        kwargs.pop("ScanIndexForward", None)
+        scan_kwargs: Dict[str, Any] = {"TableName": table_name, **kwargs}
+        conditions = [condition for condition in (range_condition, filter_expression) if condition]
+        if conditions:
+            scan_kwargs["FilterExpression"] = " AND ".join(conditions)
+        if expression_attribute_names:
+            scan_kwargs["ExpressionAttributeNames"] = expression_attribute_names
+        if expression_attribute_values:
+            scan_kwargs["ExpressionAttributeValues"] = expression_attribute_values
+        return scan_items(self.client, scan_kwargs)
+
     def _create_all_tables(self):
         """Create all configured DynamoDB tables if they don't exist."""
         tables_to_create = [
@@ -205,6 +313,73 @@ class DynamoDb(BaseDb):
         """Upsert the schema version into the database."""
         pass
 
+    def migrate_indexes(
+        self,
+        table_types: Optional[List[str]] = None,
+        wait: bool = True,
+        poll_interval: float = 5.0,
+    ) -> Dict[str, List[str]]:
+        """Bring existing tables up to date with the indexes of the current schemas.
+
+        Creates the missing global secondary indexes, and sets the table partition attribute on the items written
+        before it existed so that they are returned by the queries on the table-wide indexes.
+
+        Args:
+            table_types (Optional[List[str]]): The types of the tables to migrate. Defaults to all existing tables.
+            wait (bool): Whether to wait for each created index to be active. DynamoDB only creates one index at a
+                time, so migrating tables missing several indexes requires waiting.
+            poll_interval (float): Seconds between checks of the index status when waiting.
+
+        Returns:
+            Dict[str, List[str]]: The names of the created indexes, by table type.
+
+        Raises:
+            Exception: If an error occurs during the migration.
+        """
+        table_names = {
+            "sessions": self.session_table_name,
+            "memories": self.memory_table_name,
+            "metrics": self.metrics_table_name,
+            "evals": self.eval_table_name,
+            "knowledge": self.knowledge_table_name,
+            "culture": self.culture_table_name,
+            "traces": self.trace_table_name,
+            "spans": self.span_table_name,
+        }
+        if table_types is None:
+            table_types = list(table_names)
+
+        created_indexes: Dict[str, List[str]] = {}
+        for table_type in table_types:
+            if table_type not in table_names:
+                raise ValueError(f"Unknown table type: {table_type}")
+
+            try:
+                table_name = table_names[table_type]
+                if not self.table_exists(table_name):
+                    continue
+
+                schema = get_table_schema_definition(table_type)
+                created_indexes[table_type] = create_missing_indexes(
+                    self.client, table_name, schema, wait=wait, poll_interval=poll_interval
+                )
+                self._active_indexes.pop(table_name, None)
+
+                if table_type in TABLE_PARTITION_VALUES:
+                    updated = backfill_table_partition(
+                        self.client,
+                        table_name,
+                        key_attribute=TABLE_KEY_ATTRIBUTES[table_type],
+                        partition_value=TABLE_PARTITION_VALUES[table_type],
+                    )
+                    log_debug(f"Backfilled the partition attribute of {updated} items in table {table_name}")
+
+            except Exception as e:
+                log_error(f"Failed to migrate the indexes of the {table_type} table: {e}")
+                raise e
+
+        return created_indexes
+
     # --- Sessions ---
 
     def delete_session(self, session_id: Optional[str] = None) -> bool:
@@ -665,9 +840,6 @@ class DynamoDb(BaseDb):
     def get_all_memory_topics(self) -> List[str]:
         """Get all memory topics from the database.
 
-        Args:
-            user_id: The ID of the user (optional, for filtering).
-
         Returns:
             List[str]: List of unique memory topics.
         """
@@ -676,25 +848,16 @@ class DynamoDb(BaseDb):
             if table_name is None:
                 return []
 
-            # Build filter expression for user_id if provided
-            scan_kwargs = {"TableName": table_name}
-
-            # Scan the table to get memories
-            response = self.client.scan(**scan_kwargs)
-            items = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = self.client.scan(**scan_kwargs)
-                items.extend(response.get("Items", []))
+            # The table-wide index projects the topics, so full memories are not read
+            items = self._read_table_partition(
+                table_name, "memories", MEMORY_PARTITION_INDEX, ProjectionExpression="topics"
+            )
 
             # Extract topics from all memories
-            all_topics = set()
+            all_topics: set = set()
             for item in items:
                 memory_data = deserialize_from_dynamodb_item(item)
-                topics = memory_data.get("memory", {}).get("topics", [])
-                all_topics.update(topics)
+                all_topics.update(memory_data.get("topics") or [])
 
             return list(all_topics)
 
@@ -761,16 +924,20 @@ class DynamoDb(BaseDb):
         """
         Get user memories from the database as a list of UserMemory objects.
 
+        Memories are read with a query on the most selective index available. When no user, agent or team is given,
+        the table-wide index is queried for the keys of the matching memories, and only the memories of the requested
+        page are fetched with BatchGetItem. Tables without the table-wide index are scanned until migrate_indexes() is
+        run.
+
         Args:
             user_id: The ID of the user to get the memories for.
             agent_id: The ID of the agent to get the memories for.
             team_id: The ID of the team to get the memories for.
-            workflow_id: The ID of the workflow to get the memories for.
             topics: The topics to filter the memories by.
             search_content: The content to search for in the memories.
             limit: The maximum number of memories to return.
             page: The page number to return.
-            sort_by: The field to sort the memories by.
+            sort_by: The field to sort the memories by. Defaults to created_at.
             sort_order: The order to sort the memories by.
             deserialize: Whether to deserialize the memories.
 
@@ -785,79 +952,100 @@ class DynamoDb(BaseDb):
             if table_name is None:
                 return [] if deserialize else ([], 0)
 
-            # Build filter expressions for component filters
+            # Pick the most selective index. All of them are sorted by updated_at.
+            if user_id:
+                index_name, partition_field, partition_value = "user_id-updated_at-index", "user_id", user_id
+            elif agent_id:
+                index_name, partition_field, partition_value = "agent_id-updated_at-index", "agent_id", agent_id
+            elif team_id:
+                index_name, partition_field, partition_value = "team_id-updated_at-index", "team_id", team_id
+            else:
+                index_name = MEMORY_PARTITION_INDEX
+                partition_field, partition_value = TABLE_PARTITION_ATTRIBUTE, TABLE_PARTITION_VALUES["memories"]
+            table_wide = index_name == MEMORY_PARTITION_INDEX
+            # Tables created before the table-wide index was added are scanned, which returns full memories
+            keys_only = table_wide and self._has_index(table_name, MEMORY_PARTITION_INDEX)
+
+            # Build filter expressions for the component filters not used as the partition key
             (
                 filter_expression,
                 expression_attribute_names,
                 expression_attribute_values,
-            ) = build_query_filter_expression(filters={"agent_id": agent_id, "team_id": team_id})
+            ) = build_query_filter_expression(
+                filters={
+                    field: value
+                    for field, value in {"agent_id": agent_id, "team_id": team_id}.items()
+                    if field != partition_field
+                }
+            )
 
-            # Build topic filter expression if topics provided
+            # Build topic filter expression if topics provided. Topics are projected by all indexes.
             if topics:
                 topic_filter, topic_values = build_topic_filter_expression(topics)
                 expression_attribute_values.update(topic_values)
                 filter_expression = f"{filter_expression} AND {topic_filter}" if filter_expression else topic_filter
 
-            # Add search content filter if provided
-            if search_content:
+            # Add search content filter if provided. The table-wide index doesn't project the memory content.
+            if search_content and not keys_only:
                 search_filter = "contains(memory, :search_content)"
                 expression_attribute_values[":search_content"] = {"S": search_content}
                 filter_expression = f"{filter_expression} AND {search_filter}" if filter_expression else search_filter
 
-            # Determine whether to use GSI query or table scan
-            if user_id:
-                # Use GSI query when user_id is provided
-                key_condition_expression = "#user_id = :user_id"
-
-                # Set up expression attributes for GSI key condition
-                expression_attribute_names["#user_id"] = "user_id"
-                expression_attribute_values[":user_id"] = {"S": user_id}
+            # The indexes are sorted by updated_at, and only the table scan needs sorting when sorted by it
+            sorted_by_index = sort_by == "updated_at" and (keys_only or not table_wide)
+            query_kwargs: Dict[str, Any] = {
+                "ExpressionAttributeNames": expression_attribute_names,
+                "ExpressionAttributeValues": expression_attribute_values,
+                "ScanIndexForward": sort_order != "desc",
+            }
+            if filter_expression:
+                query_kwargs["FilterExpression"] = filter_expression
 
-                # Execute query with pagination
-                items = execute_query_with_pagination(
+            if table_wide:
+                raw_items = self._read_table_partition(table_name, "memories", MEMORY_PARTITION_INDEX, **query_kwargs)
+            else:
+                expression_attribute_names["#partition"] = partition_field
+                expression_attribute_values[":partition"] = {"S": partition_value}
+                raw_items = query_items(
                     self.client,
-                    table_name,
-                    "user_id-updated_at-index",
-                    key_condition_expression,
-                    expression_attribute_names,
-                    expression_attribute_values,
-                    filter_expression,
-                    sort_by,
-                    sort_order,
-                    limit,
-                    page,
+                    {
+                        "TableName": table_name,
+                        "IndexName": index_name,
+                        "KeyConditionExpression": "#partition = :partition",
+                        **query_kwargs,
+                    },
                 )
-            else:
-                # Use table scan when user_id is None
-                scan_kwargs = {"TableName": table_name}
-
-                if filter_expression:
-                    scan_kwargs["FilterExpression"] = filter_expression
-                if expression_attribute_names:
-                    scan_kwargs["ExpressionAttributeNames"] = expression_attribute_names  # type: ignore
-                if expression_attribute_values:
-                    scan_kwargs["ExpressionAttributeValues"] = expression_attribute_values  # type: ignore
-
-                # Execute scan
-                response = self.client.scan(**scan_kwargs)
-                items = response.get("Items", [])
-
-                # Handle pagination for scan
-                while "LastEvaluatedKey" in response:
-                    scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                    response = self.client.scan(**scan_kwargs)
-                    items.extend(response.get("Items", []))
-
-            items = [deserialize_from_dynamodb_item(item) for item in items]
+            items = [deserialize_from_dynamodb_item(item) for item in raw_items]
+
+            # The table-wide index also projects created_at, the default sort field
+            if keys_only and (search_content or sort_by not in (None, "created_at", "updated_at")):
+                # Filtering by content or sorting by other fields requires the full memories
+                memory_ids = [item["memory_id"] for item in items]
+                items = [
+                    deserialize_from_dynamodb_item(item)
+                    for item in batch_get_items(self.client, table_name, "memory_id", memory_ids)
+                ]
+                if search_content:
+                    items = [item for item in items if search_content in str(item.get("memory", ""))]
+                keys_only = False
 
-            if sort_by and sort_by != "updated_at":
+            if not sorted_by_index:
+                # Without a sort field, memories are sorted by created_at
                 items = apply_sorting(items, sort_by, sort_order)
 
-            if page:
-                paginated_items = apply_pagination(items, limit, page)
+            total_count = len(items)
+            items = apply_pagination(items, limit, page)
+
+            if keys_only:
+                # Only fetch the full memories of the requested page
+                memory_ids = [item["memory_id"] for item in items]
+                items = [
+                    deserialize_from_dynamodb_item(item)
+                    for item in batch_get_items(self.client, table_name, "memory_id", memory_ids)
+                ]
 
             if not deserialize:
-                return paginated_items, len(items)
+                return items, total_count
 
             return [UserMemory.from_dict(item) for item in items]
 
@@ -895,28 +1083,44 @@ class DynamoDb(BaseDb):
         """
         try:
             table_name = self._get_table("memories")
+            if table_name is None:
+                return [], 0
 
-            # Build filter expression for user_id if provided
-            filter_expression = None
-            expression_attribute_values = {}
             if user_id:
-                filter_expression = "user_id = :user_id"
-                expression_attribute_values[":user_id"] = {"S": user_id}
-
-            scan_kwargs = {"TableName": table_name}
-            if filter_expression:
-                scan_kwargs["FilterExpression"] = filter_expression
-            if expression_attribute_values:
-                scan_kwargs["ExpressionAttributeValues"] = expression_attribute_values  # type: ignore
+                # Count the memories of the user, and get the latest one, from the user_id index
+                query_kwargs: Dict[str, Any] = {
+                    "TableName": table_name,
+                    "IndexName": "user_id-updated_at-index",
+                    "KeyConditionExpression": "user_id = :user_id",
+                    "ExpressionAttributeValues": {":user_id": {"S": user_id}},
+                }
+                total_memories = count_query_items(self.client, query_kwargs)
+                if total_memories == 0:
+                    return [], 0
 
-            response = self.client.scan(**scan_kwargs)
-            items = response.get("Items", [])
+                response = self.client.query(
+                    **query_kwargs, ProjectionExpression="user_id, updated_at", ScanIndexForward=False, Limit=1
+                )
+                items = response.get("Items", [])
+                last_memory_updated_at = None
+                if items:
+                    updated_at = deserialize_from_dynamodb_item(items[0]).get("updated_at")
+                    if updated_at:
+                        last_memory_updated_at = int(
+                            datetime.fromisoformat(updated_at.replace("Z", "+00:00")).timestamp()
+                        )
+
+                user_stats_record = {
+                    "user_id": user_id,
+                    "total_memories": total_memories,
+                    "last_memory_updated_at": last_memory_updated_at,
+                }
+                return [user_stats_record], 1
 
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = self.client.scan(**scan_kwargs)
-                items.extend(response.get("Items", []))
+            # The table-wide index projects user_id and updated_at, so full memories are not read
+            items = self._read_table_partition(
+                table_name, "memories", MEMORY_PARTITION_INDEX, ProjectionExpression="user_id, updated_at"
+            )
 
             # Aggregate stats by user_id
             user_stats = {}
@@ -984,6 +1188,7 @@ class DynamoDb(BaseDb):
             memory_dict = memory.to_dict()
             memory_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
             item = serialize_to_dynamo_item(memory_dict)
+            item[TABLE_PARTITION_ATTRIBUTE] = {"S": TABLE_PARTITION_VALUES["memories"]}
 
             self.client.put_item(TableName=table_name, Item=item)
 
@@ -1163,28 +1368,18 @@ class DynamoDb(BaseDb):
         """
         try:
             metrics_table_name = self._get_table("metrics")
+            if metrics_table_name is None:
+                return None
 
             # 1. Check for existing metrics records
-            response = self.client.scan(
-                TableName=metrics_table_name,
+            metrics_items = self._read_table_partition(
+                metrics_table_name,
+                "metrics",
+                METRICS_PARTITION_INDEX,
                 ProjectionExpression="#date, completed",
                 ExpressionAttributeNames={"#date": "date"},
-                Limit=1000,  # Get reasonable number of records to find incomplete ones
             )
 
-            metrics_items = response.get("Items", [])
-
-            # Handle pagination to get all metrics records
-            while "LastEvaluatedKey" in response:
-                response = self.client.scan(
-                    TableName=metrics_table_name,
-                    ProjectionExpression="#date, completed",
-                    ExpressionAttributeNames={"#date": "date"},
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                    Limit=1000,
-                )
-                metrics_items.extend(response.get("Items", []))
-
             if metrics_items:
                 # Find the latest date with metrics
                 latest_complete_date = None
@@ -1502,6 +1697,7 @@ class DynamoDb(BaseDb):
                     item[key] = {"S": json.dumps(value)}
                 else:
                     item[key] = {"S": str(value)}
+        item[TABLE_PARTITION_ATTRIBUTE] = {"S": TABLE_PARTITION_VALUES["metrics"]}
         return item
 
     def get_metrics(
@@ -1528,34 +1724,29 @@ class DynamoDb(BaseDb):
             if table_name is None:
                 return ([], None)
 
-            # Build query parameters
-            scan_kwargs: Dict[str, Any] = {"TableName": table_name}
-
-            if starting_date or ending_date:
-                filter_expressions = []
-                expression_values = {}
-
-                if starting_date:
-                    filter_expressions.append("#date >= :start_date")
-                    expression_values[":start_date"] = {"S": starting_date.isoformat()}
-
-                if ending_date:
-                    filter_expressions.append("#date <= :end_date")
-                    expression_values[":end_date"] = {"S": ending_date.isoformat()}
-
-                scan_kwargs["FilterExpression"] = " AND ".join(filter_expressions)
-                scan_kwargs["ExpressionAttributeNames"] = {"#date": "date"}
-                scan_kwargs["ExpressionAttributeValues"] = expression_values
-
-            # Execute scan
-            response = self.client.scan(**scan_kwargs)
-            items = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = self.client.scan(**scan_kwargs)
-                items.extend(response.get("Items", []))
+            # Query the table-wide index, sorted by date
+            date_condition = None
+            expression_values: Dict[str, Any] = {}
+
+            if starting_date and ending_date:
+                date_condition = "#date BETWEEN :start_date AND :end_date"
+                expression_values[":start_date"] = {"S": starting_date.isoformat()}
+                expression_values[":end_date"] = {"S": ending_date.isoformat()}
+            elif starting_date:
+                date_condition = "#date >= :start_date"
+                expression_values[":start_date"] = {"S": starting_date.isoformat()}
+            elif ending_date:
+                date_condition = "#date <= :end_date"
+                expression_values[":end_date"] = {"S": ending_date.isoformat()}
+
+            items = self._read_table_partition(
+                table_name,
+                "metrics",
+                METRICS_PARTITION_INDEX,
+                range_condition=date_condition,
+                ExpressionAttributeNames={"#date": "date"} if date_condition else {},
+                ExpressionAttributeValues=expression_values,
+            )
 
             # Convert to metrics data
             metrics_data = []
@@ -1642,45 +1833,38 @@ class DynamoDb(BaseDb):
             if table_name is None:
                 return [], 0
 
-            response = self.client.scan(TableName=table_name)
-            items = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.client.scan(
-                    TableName=table_name,
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
+            # The table-wide index projects the fields contents are usually sorted by, so only the contents of the
+            # requested page are fetched
+            items = [
+                deserialize_from_dynamodb_item(item)
+                for item in self._read_table_partition(
+                    table_name,
+                    "knowledge",
+                    KNOWLEDGE_PARTITION_INDEX,
+                    ProjectionExpression="id, #name, created_at, updated_at",
+                    ExpressionAttributeNames={"#name": "name"},
                 )
-                items.extend(response.get("Items", []))
+            ]
+            total_count = len(items)
+
+            if sort_by is not None and sort_by not in ("name", "created_at", "updated_at"):
+                # Sorting by other fields requires the full contents
+                items = [
+                    deserialize_from_dynamodb_item(item)
+                    for item in batch_get_items(self.client, table_name, "id", [item["id"] for item in items])
+                ]
+            if sort_by:
+                items = apply_sorting(items, sort_by, sort_order)
+            items = apply_pagination(items, limit, page)
 
             # Convert to knowledge rows
             knowledge_rows = []
-            for item in items:
+            for item in batch_get_items(self.client, table_name, "id", [item["id"] for item in items]):
                 try:
-                    knowledge_row = deserialize_knowledge_row(item)
-                    knowledge_rows.append(knowledge_row)
+                    knowledge_rows.append(deserialize_knowledge_row(item))
                 except Exception as e:
                     log_error(f"Failed to deserialize knowledge row: {e}")
 
-            # Apply sorting
-            if sort_by:
-                reverse = sort_order == "desc"
-                knowledge_rows = sorted(
-                    knowledge_rows,
-                    key=lambda x: getattr(x, sort_by, ""),
-                    reverse=reverse,
-                )
-
-            # Get total count before pagination
-            total_count = len(knowledge_rows)
-
-            # Apply pagination
-            if limit:
-                start_index = 0
-                if page and page > 1:
-                    start_index = (page - 1) * limit
-                knowledge_rows = knowledge_rows[start_index : start_index + limit]
-
             return knowledge_rows, total_count
 
         except Exception as e:
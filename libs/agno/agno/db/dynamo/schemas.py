@@ -2,6 +2,28 @@
 
 from typing import Any, Dict
 
+# Attribute holding the same value on every item of a table, used as the partition key of the table-wide indexes.
+# Querying these indexes replaces full table scans when listing records without a more selective key.
+TABLE_PARTITION_ATTRIBUTE = "table_partition"
+
+# Value of the partition attribute for each table type using table-wide indexes
+TABLE_PARTITION_VALUES = {
+    "memories": "memories",
+    "metrics": "metrics",
+    "knowledge": "knowledge",
+}
+
+# Key attribute of each table type using table-wide indexes
+TABLE_KEY_ATTRIBUTES = {
+    "memories": "memory_id",
+    "metrics": "id",
+    "knowledge": "id",
+}
+
+MEMORY_PARTITION_INDEX = "table_partition-updated_at-index"
+METRICS_PARTITION_INDEX = "table_partition-date-index"
+KNOWLEDGE_PARTITION_INDEX = "table_partition-index"
+
 SESSION_TABLE_SCHEMA = {
     "TableName": "agno_sessions",
     "KeySchema": [{"AttributeName": "session_id", "KeyType": "HASH"}],
@@ -76,8 +98,23 @@ USER_MEMORY_TABLE_SCHEMA = {
         {"AttributeName": "workflow_id", "AttributeType": "S"},
         {"AttributeName": "created_at", "AttributeType": "S"},
         {"AttributeName": "updated_at", "AttributeType": "S"},
+        {"AttributeName": TABLE_PARTITION_ATTRIBUTE, "AttributeType": "S"},
     ],
     "GlobalSecondaryIndexes": [
+        {
+            # Only projects the attributes needed to filter, count, sort and page through memories.
+            # Full items are then fetched with BatchGetItem.
+            "IndexName": MEMORY_PARTITION_INDEX,
+            "KeySchema": [
+                {"AttributeName": TABLE_PARTITION_ATTRIBUTE, "KeyType": "HASH"},
+                {"AttributeName": "updated_at", "KeyType": "RANGE"},
+            ],
+            "Projection": {
+                "ProjectionType": "INCLUDE",
+                "NonKeyAttributes": ["user_id", "agent_id", "team_id", "topics", "created_at"],
+            },
+            "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+        },
         {
             "IndexName": "user_id-updated_at-index",
             "KeySchema": [
@@ -190,8 +227,16 @@ KNOWLEDGE_TABLE_SCHEMA = {
         {"AttributeName": "type", "AttributeType": "S"},
         {"AttributeName": "status", "AttributeType": "S"},
         {"AttributeName": "created_at", "AttributeType": "N"},
+        {"AttributeName": TABLE_PARTITION_ATTRIBUTE, "AttributeType": "S"},
     ],
     "GlobalSecondaryIndexes": [
+        {
+            # Only projects the attributes used to sort contents. Full items are then fetched with BatchGetItem.
+            "IndexName": KNOWLEDGE_PARTITION_INDEX,
+            "KeySchema": [{"AttributeName": TABLE_PARTITION_ATTRIBUTE, "KeyType": "HASH"}],
+            "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["name", "created_at", "updated_at"]},
+            "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+        },
         {
             "IndexName": "user_id-created_at-index",
             "KeySchema": [
@@ -232,8 +277,18 @@ METRICS_TABLE_SCHEMA = {
         {"AttributeName": "date", "AttributeType": "S"},
         {"AttributeName": "aggregation_period", "AttributeType": "S"},
         {"AttributeName": "created_at", "AttributeType": "N"},
+        {"AttributeName": TABLE_PARTITION_ATTRIBUTE, "AttributeType": "S"},
     ],
     "GlobalSecondaryIndexes": [
+        {
+            "IndexName": METRICS_PARTITION_INDEX,
+            "KeySchema": [
+                {"AttributeName": TABLE_PARTITION_ATTRIBUTE, "KeyType": "HASH"},
+                {"AttributeName": "date", "KeyType": "RANGE"},
+            ],
+            "Projection": {"ProjectionType": "ALL"},
+            "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+        },
         {
             "IndexName": "date-aggregation_period-index",
             "KeySchema": [
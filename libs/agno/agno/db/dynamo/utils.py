@@ -5,6 +5,7 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from uuid import uuid4
 
 from agno.db.base import SessionType
+from agno.db.dynamo.schemas import TABLE_PARTITION_ATTRIBUTE, TABLE_PARTITION_VALUES
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalRunRecord
 from agno.db.schemas.knowledge import KnowledgeRow
@@ -12,6 +13,9 @@ from agno.db.utils import get_sort_value
 from agno.session import Session
 from agno.utils.log import log_debug, log_error, log_info
 
+# BatchGetItem has a hard limit of 100 keys per request
+DYNAMO_BATCH_GET_SIZE_LIMIT = 100
+
 # -- Serialization utils --
 
 
@@ -44,6 +48,8 @@ def serialize_to_dynamo_item(data: Dict[str, Any]) -> Dict[str, Any]:
 def deserialize_from_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
     data = {}
     for key, value in item.items():
+        if key == TABLE_PARTITION_ATTRIBUTE:
+            continue
         if "S" in value:
             try:
                 data[key] = json.loads(value["S"])
@@ -80,6 +86,7 @@ def serialize_knowledge_row(knowledge: KnowledgeRow) -> Dict[str, Any]:
             "access_count": getattr(knowledge, "access_count", None),
             "created_at": int(knowledge.created_at) if knowledge.created_at else None,
             "updated_at": int(knowledge.updated_at) if knowledge.updated_at else None,
+            TABLE_PARTITION_ATTRIBUTE: TABLE_PARTITION_VALUES["knowledge"],
         }
     )
 
@@ -158,6 +165,117 @@ def create_table_if_not_exists(dynamodb_client, table_name: str, schema: Dict[st
             return False
 
 
+def wait_for_indexes(dynamodb_client, table_name: str, poll_interval: float = 5.0, timeout: float = 3600.0) -> None:
+    """Wait until the table and all its global secondary indexes are active."""
+    deadline = time.time() + timeout
+    while True:
+        table = dynamodb_client.describe_table(TableName=table_name)["Table"]
+        statuses = [table.get("TableStatus")] + [
+            index.get("IndexStatus") for index in table.get("GlobalSecondaryIndexes", [])
+        ]
+        if all(status == "ACTIVE" for status in statuses):
+            return
+        if time.time() > deadline:
+            raise TimeoutError(f"Timed out waiting for the indexes of table {table_name} to become active")
+        time.sleep(poll_interval)
+
+
+def create_missing_indexes(
+    dynamodb_client,
+    table_name: str,
+    schema: Dict[str, Any],
+    wait: bool = True,
+    poll_interval: float = 5.0,
+) -> List[str]:
+    """Create the global secondary indexes of the given schema missing from an existing table.
+
+    DynamoDB only allows creating one index per UpdateTable call, so indexes are created one at a time. When waiting,
+    each index is backfilled before creating the next one.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        table_name: Name of the existing table
+        schema: The expected table schema
+        wait: Whether to wait for the indexes to be active before returning
+        poll_interval: Seconds between checks of the index status
+
+    Returns:
+        The names of the created indexes
+    """
+    table = dynamodb_client.describe_table(TableName=table_name)["Table"]
+    existing_indexes = {index["IndexName"] for index in table.get("GlobalSecondaryIndexes", [])}
+    on_demand = table.get("BillingModeSummary", {}).get("BillingMode") == "PAY_PER_REQUEST"
+    attribute_definitions = {attr["AttributeName"]: attr for attr in schema.get("AttributeDefinitions", [])}
+
+    created_indexes = []
+    for index in schema.get("GlobalSecondaryIndexes", []):
+        if index["IndexName"] in existing_indexes:
+            continue
+
+        index_definition = dict(index)
+        if on_demand:
+            index_definition.pop("ProvisionedThroughput", None)
+        key_attributes = [key["AttributeName"] for key in index["KeySchema"]]
+
+        log_info(f"Creating index {index['IndexName']} on table {table_name}")
+        dynamodb_client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=[attribute_definitions[attr] for attr in key_attributes],
+            GlobalSecondaryIndexUpdates=[{"Create": index_definition}],
+        )
+        created_indexes.append(index["IndexName"])
+
+        if wait:
+            wait_for_indexes(dynamodb_client, table_name, poll_interval=poll_interval)
+
+    return created_indexes
+
+
+def backfill_table_partition(dynamodb_client, table_name: str, key_attribute: str, partition_value: str) -> int:
+    """Set the table partition attribute on the items written before it existed, so they appear in the table-wide
+    indexes.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        table_name: Table name
+        key_attribute: Name of the (string) hash key of the table
+        partition_value: Value of the partition attribute for this table
+
+    Returns:
+        The number of updated items
+    """
+    scan_kwargs: Dict[str, Any] = {
+        "TableName": table_name,
+        "ProjectionExpression": "#key",
+        "FilterExpression": "attribute_not_exists(#partition)",
+        "ExpressionAttributeNames": {"#key": key_attribute, "#partition": TABLE_PARTITION_ATTRIBUTE},
+    }
+
+    updated = 0
+    while True:
+        response = dynamodb_client.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            try:
+                dynamodb_client.update_item(
+                    TableName=table_name,
+                    Key={key_attribute: item[key_attribute]},
+                    UpdateExpression="SET #partition = :partition",
+                    # Skip items deleted since the scan
+                    ConditionExpression="attribute_exists(#key)",
+                    ExpressionAttributeNames={"#key": key_attribute, "#partition": TABLE_PARTITION_ATTRIBUTE},
+                    ExpressionAttributeValues={":partition": {"S": partition_value}},
+                )
+                updated += 1
+            except dynamodb_client.exceptions.ConditionalCheckFailedException:
+                continue
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    return updated
+
+
 def apply_pagination(
     items: List[Dict[str, Any]], limit: Optional[int] = None, page: Optional[int] = None
 ) -> List[Dict[str, Any]]:
@@ -651,6 +769,117 @@ def execute_query_with_pagination(
     return items
 
 
+def query_items(dynamodb_client, query_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a DynamoDB query, following its pagination until all matching items are read.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        query_kwargs: Arguments of the query
+
+    Returns:
+        List of DynamoDB items
+    """
+    query_kwargs = dict(query_kwargs)
+    response = dynamodb_client.query(**query_kwargs)
+    items = response.get("Items", [])
+
+    while "LastEvaluatedKey" in response:
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = dynamodb_client.query(**query_kwargs)
+        items.extend(response.get("Items", []))
+
+    return items
+
+
+def scan_items(dynamodb_client, scan_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a DynamoDB scan, following its pagination until all matching items are read.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        scan_kwargs: Arguments of the scan
+
+    Returns:
+        List of DynamoDB items
+    """
+    scan_kwargs = dict(scan_kwargs)
+    response = dynamodb_client.scan(**scan_kwargs)
+    items = response.get("Items", [])
+
+    while "LastEvaluatedKey" in response:
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = dynamodb_client.scan(**scan_kwargs)
+        items.extend(response.get("Items", []))
+
+    return items
+
+
+def count_query_items(dynamodb_client, query_kwargs: Dict[str, Any]) -> int:
+    """Count the items matching a DynamoDB query, without returning them.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        query_kwargs: Arguments of the query
+
+    Returns:
+        The number of matching items
+    """
+    query_kwargs = {**query_kwargs, "Select": "COUNT"}
+    response = dynamodb_client.query(**query_kwargs)
+    count = response.get("Count", 0)
+
+    while "LastEvaluatedKey" in response:
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = dynamodb_client.query(**query_kwargs)
+        count += response.get("Count", 0)
+
+    return count
+
+
+def batch_get_items(
+    dynamodb_client,
+    table_name: str,
+    key_attribute: str,
+    keys: List[str],
+    max_retries: int = 5,
+) -> List[Dict[str, Any]]:
+    """Get the items with the given keys using BatchGetItem.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        table_name: Table name
+        key_attribute: Name of the (string) hash key of the table
+        keys: Keys of the items to get
+        max_retries: Number of times to retry getting unprocessed keys
+
+    Returns:
+        The DynamoDB items found, in the order of the given keys
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    unique_keys = list(dict.fromkeys(keys))
+
+    for i in range(0, len(unique_keys), DYNAMO_BATCH_GET_SIZE_LIMIT):
+        request_items: Dict[str, Any] = {
+            table_name: {
+                "Keys": [{key_attribute: {"S": key}} for key in unique_keys[i : i + DYNAMO_BATCH_GET_SIZE_LIMIT]]
+            }
+        }
+        retries = 0
+        while request_items:
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(table_name, []):
+                found[item[key_attribute]["S"]] = item
+
+            request_items = response.get("UnprocessedKeys") or {}
+            if request_items:
+                if retries >= max_retries:
+                    raise RuntimeError(f"Failed to get all items from table {table_name}: keys left unprocessed")
+                # Back off exponentially before retrying throttled keys
+                time.sleep(0.05 * 2**retries)
+                retries += 1
+
+    return [found[key] for key in unique_keys if key in found]
+
+
 def process_query_results(
     items: List[Dict[str, Any]],
     sort_by: Optional[str] = None,
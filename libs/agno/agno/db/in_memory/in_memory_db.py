@@ -6,6 +6,7 @@ from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
 from agno.db.in_memory.utils import (
+    InMemoryTable,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
@@ -29,9 +30,17 @@ class InMemoryDb(BaseDb):
         """Interface for in-memory storage."""
         super().__init__()
 
-        # Initialize in-memory storage dictionaries
-        self._sessions: List[Dict[str, Any]] = []
-        self._memories: List[Dict[str, Any]] = []
+        # Initialize in-memory storage. Sessions and memories are indexed, as they are the most read and written
+        self._sessions = InMemoryTable(
+            hash_fields=["user_id", "session_type", "agent_id", "team_id", "workflow_id"],
+            sorted_fields=["created_at", "updated_at"],
+            get_fields=_get_session_fields,
+        )
+        self._memories = InMemoryTable(
+            hash_fields=["user_id", "agent_id", "team_id"],
+            sorted_fields=["created_at", "updated_at"],
+            get_fields=_get_memory_fields,
+        )
         self._metrics: List[Dict[str, Any]] = []
         self._eval_runs: List[Dict[str, Any]] = []
         self._knowledge: List[Dict[str, Any]] = []
@@ -63,10 +72,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._sessions)
-            self._sessions = [s for s in self._sessions if s.get("session_id") != session_id]
-
-            if len(self._sessions) < original_count:
+            if self._sessions.remove(session_id) is not None:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
             else:
@@ -87,7 +93,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._sessions = [s for s in self._sessions if s.get("session_id") not in session_ids]
+            for session_id in session_ids:
+                self._sessions.remove(session_id)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -118,24 +125,23 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            for session_data in self._sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
-
-                    session_data_copy = deepcopy(session_data)
+            stored_session = self._sessions.get(session_id)
+            if stored_session is None:
+                return None
+            if user_id is not None and stored_session.fields.get("user_id") != user_id:
+                return None
 
-                    if not deserialize:
-                        return session_data_copy
+            session_data_copy = stored_session.thaw()
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_data_copy)
+            if not deserialize:
+                return session_data_copy
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session_data_copy)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session_data_copy)
+            else:
+                return WorkflowSession.from_dict(session_data_copy)
 
         except Exception as e:
             import traceback
@@ -182,43 +188,33 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
-            # Apply filters
-            filtered_sessions = []
-            for session_data in self._sessions:
-                if user_id is not None and session_data.get("user_id") != user_id:
-                    continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
-                if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
-                    continue
-                if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
-                    continue
-                if session_name is not None:
-                    stored_name = session_data.get("session_data", {}).get("session_name", "")
-                    if session_name.lower() not in stored_name.lower():
-                        continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                if session_data.get("session_type") != session_type_value:
-                    continue
-
-                filtered_sessions.append(deepcopy(session_data))
-
-            total_count = len(filtered_sessions)
-
-            # Apply sorting
-            filtered_sessions = apply_sorting(filtered_sessions, sort_by, sort_order)
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            conditions: Dict[str, Any] = {"session_type": session_type_value, "user_id": user_id}
+            if component_id is not None:
+                if session_type == SessionType.AGENT:
+                    conditions["agent_id"] = component_id
+                elif session_type == SessionType.TEAM:
+                    conditions["team_id"] = component_id
+                elif session_type == SessionType.WORKFLOW:
+                    conditions["workflow_id"] = component_id
+
+            def session_filter(fields: Dict[str, Any]) -> bool:
+                if start_timestamp is not None and (fields.get("created_at") or 0) < start_timestamp:
+                    return False
+                if end_timestamp is not None and (fields.get("created_at") or 0) > end_timestamp:
+                    return False
+                if session_name is not None and session_name.lower() not in fields["session_name"].lower():
+                    return False
+                return True
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
+            filtered_sessions, total_count = self._sessions.query(
+                conditions=conditions,
+                record_filter=session_filter,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+            )
 
             if not deserialize:
                 return filtered_sessions, total_count
@@ -240,29 +236,29 @@ class InMemoryDb(BaseDb):
         self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         try:
-            for i, session in enumerate(self._sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
+            stored_session = self._sessions.get(session_id)
+            if stored_session is None or stored_session.fields.get("session_type") != session_type.value:
+                return None
 
-                    self._sessions[i] = session
+            # Update session name in session_data
+            session = stored_session.thaw()
+            if "session_data" not in session:
+                session["session_data"] = {}
+            session["session_data"]["session_name"] = session_name
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+            self._sessions.put(session_id, session)
 
-                    session_copy = deepcopy(session)
-                    if not deserialize:
-                        return session_copy
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_copy)
+            if not deserialize:
+                return session
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session)
+            else:
+                return WorkflowSession.from_dict(session)
 
         except Exception as e:
             log_error(f"Exception renaming session: {e}")
@@ -282,32 +278,26 @@ class InMemoryDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(self._sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    session_dict["updated_at"] = int(time.time())
-                    self._sessions[i] = deepcopy(session_dict)
-                    session_updated = True
-                    break
-
-            if not session_updated:
+            # Update the existing session, if it belongs to the same component
+            existing_session = self._sessions.get(session.session_id)
+            if existing_session is not None and self._matches_session_key(existing_session.fields, session):
+                session_dict["updated_at"] = int(time.time())
+            else:
                 session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
                 session_dict["updated_at"] = session_dict.get("created_at")
-                self._sessions.append(deepcopy(session_dict))
 
-            session_dict_copy = deepcopy(session_dict)
+            # The stored snapshot is independent of session_dict, which can be handed out as is
+            self._sessions.put(session.session_id, session_dict)
+
             if not deserialize:
-                return session_dict_copy
+                return session_dict
 
-            if session_dict_copy["session_type"] == SessionType.AGENT:
-                return AgentSession.from_dict(session_dict_copy)
-            elif session_dict_copy["session_type"] == SessionType.TEAM:
-                return TeamSession.from_dict(session_dict_copy)
+            if session_dict["session_type"] == SessionType.AGENT:
+                return AgentSession.from_dict(session_dict)
+            elif session_dict["session_type"] == SessionType.TEAM:
+                return TeamSession.from_dict(session_dict)
             else:
-                return WorkflowSession.from_dict(session_dict_copy)
+                return WorkflowSession.from_dict(session_dict)
 
         except Exception as e:
             log_error(f"Exception upserting session: {e}")
@@ -369,17 +359,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._memories)
-
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") == memory_id and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") != memory_id]
-
-            if len(self._memories) < original_count:
+            if self._delete_memory(memory_id, user_id=user_id):
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -399,19 +379,23 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") in memory_ids and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") not in memory_ids]
+            for memory_id in memory_ids:
+                self._delete_memory(memory_id, user_id=user_id)
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
         except Exception as e:
             log_error(f"Error deleting memories: {e}")
             raise e
 
+    def _delete_memory(self, memory_id: str, user_id: Optional[str] = None) -> bool:
+        """Delete a memory, verifying it belongs to the given user if provided. Returns True if it was deleted."""
+        stored_memory = self._memories.get(memory_id)
+        if stored_memory is None:
+            return False
+        if user_id is not None and stored_memory.fields.get("user_id") != user_id:
+            return False
+        return self._memories.remove(memory_id) is not None
+
     def get_all_memory_topics(self) -> List[str]:
         """Get all memory topics from in-memory storage.
 
@@ -423,8 +407,8 @@ class InMemoryDb(BaseDb):
         """
         try:
             topics = set()
-            for memory in self._memories:
-                memory_topics = memory.get("topics", [])
+            for stored_memory in self._memories.values():
+                memory_topics = stored_memory.fields.get("topics", [])
                 if isinstance(memory_topics, list):
                     topics.update(memory_topics)
             return list(topics)
@@ -450,18 +434,18 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the memory.
         """
         try:
-            for memory_data in self._memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id is not None and memory_data.get("user_id") != user_id:
-                        continue
+            stored_memory = self._memories.get(memory_id)
+            if stored_memory is None:
+                return None
 
-                    memory_data_copy = deepcopy(memory_data)
-                    if not deserialize:
-                        return memory_data_copy
-                    return UserMemory.from_dict(memory_data_copy)
+            # Filter by user_id if provided
+            if user_id is not None and stored_memory.fields.get("user_id") != user_id:
+                return None
 
-            return None
+            memory_data_copy = stored_memory.thaw()
+            if not deserialize:
+                return memory_data_copy
+            return UserMemory.from_dict(memory_data_copy)
 
         except Exception as e:
             log_error(f"Exception reading from memory storage: {e}")
@@ -481,37 +465,26 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         try:
-            # Apply filters
-            filtered_memories = []
-            for memory_data in self._memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
-                    continue
-                if agent_id is not None and memory_data.get("agent_id") != agent_id:
-                    continue
-                if team_id is not None and memory_data.get("team_id") != team_id:
-                    continue
+
+            def memory_filter(fields: Dict[str, Any]) -> bool:
                 if topics is not None:
-                    memory_topics = memory_data.get("topics", [])
+                    memory_topics = fields.get("topics") or []
                     if not any(topic in memory_topics for topic in topics):
-                        continue
+                        return False
                 if search_content is not None:
-                    memory_content = str(memory_data.get("memory", ""))
+                    memory_content = str(fields.get("memory", ""))
                     if search_content.lower() not in memory_content.lower():
-                        continue
-
-                filtered_memories.append(deepcopy(memory_data))
-
-            total_count = len(filtered_memories)
-
-            # Apply sorting
-            filtered_memories = apply_sorting(filtered_memories, sort_by, sort_order)
+                        return False
+                return True
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_memories = filtered_memories[start_idx : start_idx + limit]
+            filtered_memories, total_count = self._memories.query(
+                conditions={"user_id": user_id, "agent_id": agent_id, "team_id": team_id},
+                record_filter=memory_filter if topics is not None or search_content is not None else None,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+            )
 
             if not deserialize:
                 return filtered_memories, total_count
@@ -541,7 +514,8 @@ class InMemoryDb(BaseDb):
         try:
             user_stats = {}
 
-            for memory in self._memories:
+            for stored_memory in self._memories.values():
+                memory = stored_memory.fields
                 memory_user_id = memory.get("user_id")
                 # filter by user_id if provided
                 if user_id is not None and memory_user_id != user_id:
@@ -586,22 +560,13 @@ class InMemoryDb(BaseDb):
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(self._memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    self._memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                self._memories.append(memory_dict)
+            # The stored snapshot is independent of memory_dict, which can be handed out as is
+            self._memories.put(memory.memory_id, memory_dict)
 
-            memory_dict_copy = deepcopy(memory_dict)
             if not deserialize:
-                return memory_dict_copy
+                return memory_dict
 
-            return UserMemory.from_dict(memory_dict_copy)
+            return UserMemory.from_dict(memory_dict)
 
         except Exception as e:
             log_warning(f"Exception upserting user memory: {e}")
@@ -733,10 +698,9 @@ class InMemoryDb(BaseDb):
                 return datetime.strptime(latest_metric["date"], "%Y-%m-%d").date()
 
         # No metrics records. Return the date of the first recorded session.
-        if self._sessions:
-            # Sort by created_at
-            sorted_sessions = sorted(self._sessions, key=lambda x: x.get("created_at", 0))
-            first_session_date = sorted_sessions[0]["created_at"]
+        first_session = self._sessions.first_by("created_at")
+        if first_session is not None:
+            first_session_date = first_session.fields["created_at"]
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -747,18 +711,19 @@ class InMemoryDb(BaseDb):
         """Get all sessions for metrics calculation."""
         try:
             filtered_sessions = []
-            for session in self._sessions:
-                created_at = session.get("created_at", 0)
+            for stored_session in self._sessions.values():
+                created_at = stored_session.fields.get("created_at") or 0
                 if start_timestamp is not None and created_at < start_timestamp:
                     continue
                 if end_timestamp is not None and created_at >= end_timestamp:
                     continue
 
                 # Only include necessary fields for metrics
+                session = stored_session.thaw()
                 filtered_session = {
                     "user_id": session.get("user_id"),
-                    "session_data": deepcopy(session.get("session_data")),
-                    "runs": deepcopy(session.get("runs")),
+                    "session_data": session.get("session_data"),
+                    "runs": session.get("runs"),
                     "created_at": session.get("created_at"),
                     "session_type": session.get("session_type"),
                 }
@@ -1357,3 +1322,32 @@ class InMemoryDb(BaseDb):
         limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         raise NotImplementedError("Learning methods not yet implemented for InMemoryDb")
+
+
+def _get_session_fields(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the session fields queries filter and sort on."""
+    return {
+        "session_id": session.get("session_id"),
+        "session_type": session.get("session_type"),
+        "user_id": session.get("user_id"),
+        "agent_id": session.get("agent_id"),
+        "team_id": session.get("team_id"),
+        "workflow_id": session.get("workflow_id"),
+        "session_name": (session.get("session_data") or {}).get("session_name") or "",
+        "created_at": session.get("created_at"),
+        "updated_at": session.get("updated_at"),
+    }
+
+
+def _get_memory_fields(memory: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the memory fields queries filter and sort on."""
+    return {
+        "memory_id": memory.get("memory_id"),
+        "user_id": memory.get("user_id"),
+        "agent_id": memory.get("agent_id"),
+        "team_id": memory.get("team_id"),
+        "topics": list(memory.get("topics") or []),
+        "memory": memory.get("memory"),
+        "created_at": memory.get("created_at"),
+        "updated_at": memory.get("updated_at"),
+    }
@@ -1,8 +1,13 @@
 """Utility functions for the in-memory database class."""
 
+import itertools
+import pickle
 import time
+from bisect import bisect_left, insort
+from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 
 from agno.db.schemas.culture import CulturalKnowledge
@@ -50,6 +55,233 @@ def apply_sorting(
         return data
 
 
+class FrozenRecord:
+    """Immutable snapshot of a stored record.
+
+    The record is pickled once when stored, and each read unpickles a fresh copy. This is much cheaper than a deepcopy
+    on every access, and callers mutating what they read can't affect the stored snapshot.
+    The fields used to filter and sort records are kept in plain form, so queries only thaw the records they return.
+    """
+
+    __slots__ = ("fields", "_payload", "_fallback")
+
+    def __init__(self, record: Dict[str, Any], fields: Dict[str, Any]):
+        self.fields = fields
+        self._payload: Optional[bytes] = None
+        self._fallback: Optional[Dict[str, Any]] = None
+        try:
+            self._payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Records holding objects that can't be pickled fall back to deep copies
+            self._fallback = deepcopy(record)
+
+    def thaw(self) -> Dict[str, Any]:
+        """Return a fresh, mutable copy of the record."""
+        if self._payload is not None:
+            return pickle.loads(self._payload)
+        return deepcopy(self._fallback)  # type: ignore
+
+
+class InMemoryTable:
+    """Records keyed by ID, with hash indexes on equality-filtered fields and sorted indexes on timestamp fields.
+
+    Args:
+        hash_fields (List[str]): Fields with a hash index, used to narrow down queries filtering on them.
+        sorted_fields (List[str]): Fields with a sorted index, used to sort queries without sorting the records.
+        get_fields (Callable): Extracts the fields queries can filter and sort on from a record.
+    """
+
+    def __init__(
+        self,
+        hash_fields: List[str],
+        sorted_fields: List[str],
+        get_fields: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ):
+        self._hash_fields = hash_fields
+        self._sorted_fields = sorted_fields
+        self._get_fields = get_fields
+
+        self._records: Dict[str, FrozenRecord] = {}
+        self._hash_indexes: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in hash_fields}
+        self._sorted_indexes: Dict[str, List[Tuple[bool, Any, int, str]]] = {field: [] for field in sorted_fields}
+        # Insertion sequence of each record, breaking ties in sorted indexes like a stable sort would
+        self._sequence: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _sorted_entry(self, record_id: str, field: str, fields: Dict[str, Any]) -> Tuple[bool, Any, int, str]:
+        value = get_sort_value(fields, field)
+        return (value is None, value if value is not None else 0, self._sequence[record_id], record_id)
+
+    def _index(self, record_id: str, frozen: FrozenRecord) -> None:
+        for field in self._hash_fields:
+            self._hash_indexes[field].setdefault(frozen.fields.get(field), set()).add(record_id)
+        for field in self._sorted_fields:
+            insort(self._sorted_indexes[field], self._sorted_entry(record_id, field, frozen.fields))
+
+    def _unindex(self, record_id: str, frozen: FrozenRecord) -> None:
+        for field in self._hash_fields:
+            value = frozen.fields.get(field)
+            record_ids = self._hash_indexes[field].get(value)
+            if record_ids is not None:
+                record_ids.discard(record_id)
+                if not record_ids:
+                    del self._hash_indexes[field][value]
+        for field in self._sorted_fields:
+            entries = self._sorted_indexes[field]
+            entry = self._sorted_entry(record_id, field, frozen.fields)
+            position = bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+
+    def get(self, record_id: str) -> Optional[FrozenRecord]:
+        """Get the snapshot of the record with the given ID."""
+        return self._records.get(record_id)
+
+    def put(self, record_id: str, record: Dict[str, Any]) -> None:
+        """Insert or replace the record with the given ID, storing a snapshot of it."""
+        frozen = FrozenRecord(record, self._get_fields(record))
+        with self._lock:
+            existing = self._records.get(record_id)
+            if existing is not None:
+                self._unindex(record_id, existing)
+            else:
+                self._sequence[record_id] = next(self._counter)
+            self._records[record_id] = frozen
+            self._index(record_id, frozen)
+
+    def remove(self, record_id: str) -> Optional[FrozenRecord]:
+        """Remove the record with the given ID, returning its snapshot if it existed."""
+        with self._lock:
+            frozen = self._records.pop(record_id, None)
+            if frozen is not None:
+                self._unindex(record_id, frozen)
+                del self._sequence[record_id]
+            return frozen
+
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock:
+            self._records.clear()
+            self._sequence.clear()
+            for hash_index in self._hash_indexes.values():
+                hash_index.clear()
+            for sorted_index in self._sorted_indexes.values():
+                sorted_index.clear()
+
+    def values(self) -> List[FrozenRecord]:
+        """Get the snapshots of all records, in insertion order."""
+        with self._lock:
+            return list(self._records.values())
+
+    def first_by(self, field: str) -> Optional[FrozenRecord]:
+        """Get the snapshot of the record with the lowest value of the given sorted field."""
+        with self._lock:
+            entries = self._sorted_indexes[field]
+            return self._records[entries[0][-1]] if entries else None
+
+    def _iter_sorted_ids(self, field: str, descending: bool) -> Iterator[str]:
+        entries = self._sorted_indexes[field]
+        if not descending:
+            for entry in entries:
+                yield entry[-1]
+            return
+
+        # Walk backwards, keeping records with equal values in insertion order
+        end = len(entries)
+        while end > 0:
+            start = end - 1
+            while start > 0 and entries[start - 1][:2] == entries[end - 1][:2]:
+                start -= 1
+            for entry in entries[start:end]:
+                yield entry[-1]
+            end = start
+
+    def query(
+        self,
+        conditions: Optional[Dict[str, Any]] = None,
+        record_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get the records matching the given filters, sorted and paginated.
+
+        Args:
+            conditions (Optional[Dict[str, Any]]): Field values the records must match. None values are ignored.
+            record_filter (Optional[Callable]): Additional filter, applied to the queryable fields of the records.
+            sort_by (Optional[str]): The field to sort by.
+            sort_order (Optional[str]): The sort order ('asc' or 'desc'). Defaults to 'desc' when sorting.
+            limit (Optional[int]): The maximum number of records to return.
+            page (Optional[int]): The page number to return.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Fresh copies of the matching records in the page, and the total count.
+        """
+        conditions = {field: value for field, value in (conditions or {}).items() if value is not None}
+
+        with self._lock:
+            # Start from the smallest hash index matching a condition
+            candidate_ids: Optional[Set[str]] = None
+            for field, value in conditions.items():
+                if field in self._hash_indexes:
+                    record_ids = self._hash_indexes[field].get(value, set())
+                    if candidate_ids is None or len(record_ids) < len(candidate_ids):
+                        candidate_ids = record_ids
+
+            def matches(record_id: str) -> bool:
+                fields = self._records[record_id].fields
+                if any(fields.get(field) != value for field, value in conditions.items()):
+                    return False
+                return record_filter is None or record_filter(fields)
+
+            descending = sort_order != "asc" if sort_order else True
+            if candidate_ids is not None:
+                # Narrowed down by a hash index: only the candidates need ordering
+                matching_ids = sorted(
+                    (record_id for record_id in candidate_ids if matches(record_id)), key=self._sequence.__getitem__
+                )
+                if sort_by in self._sorted_indexes:
+                    matching_ids.sort(
+                        key=lambda record_id: self._sorted_entry(record_id, sort_by, self._records[record_id].fields)[
+                            :2
+                        ],  # type: ignore
+                        reverse=descending,
+                    )
+            elif sort_by in self._sorted_indexes:
+                matching_ids = [
+                    record_id
+                    for record_id in self._iter_sorted_ids(sort_by, descending)
+                    if matches(record_id)  # type: ignore
+                ]
+            else:
+                matching_ids = [record_id for record_id in self._records if matches(record_id)]
+
+            total_count = len(matching_ids)
+
+            if sort_by is not None and sort_by not in self._sorted_indexes:
+                # Unindexed sort fields need the full records
+                records = apply_sorting([self._records[i].thaw() for i in matching_ids], sort_by, sort_order)
+                return _paginate(records, limit, page), total_count
+
+            frozen_records = [self._records[record_id] for record_id in _paginate(matching_ids, limit, page)]
+
+        return [frozen.thaw() for frozen in frozen_records], total_count
+
+
+def _paginate(items: List[Any], limit: Optional[int] = None, page: Optional[int] = None) -> List[Any]:
+    if limit is None:
+        return items
+    start_idx = 0
+    if page is not None:
+        start_idx = (page - 1) * limit
+    return items[start_idx : start_idx + limit]
+
+
 def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
     """Calculate metrics for the given single date.
 
@@ -0,0 +1,271 @@
+"""JSON-lines append log used by JsonDb to store tables."""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from threading import RLock
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore
+
+
+class AppendLogTable:
+    """A table stored as a JSON-lines append log.
+
+    Each line of the log is an operation on a record: {"op": "put", "key": ..., "record": {...}} or
+    {"op": "delete", "key": ...}. Writes append to the log and an in-memory index maps each live key to the offset of
+    its latest "put" line, so reading or writing a record costs the same regardless of the size of the table.
+
+    Writers hold an advisory lock on a sibling ".lock" file, so several processes can share the same log. Before each
+    operation the index catches up with the entries other processes appended, or is rebuilt if the log was compacted.
+
+    Args:
+        path (Path): Path to the log file.
+        key_field (str): Field of the records holding their key.
+        compaction_ratio (float): Compact the log once it holds this many entries per live record.
+        min_compaction_entries (int): Never compact logs holding fewer entries than this.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key_field: str,
+        compaction_ratio: float = 2.0,
+        min_compaction_entries: int = 1000,
+    ):
+        self.path = path
+        self.lock_path = path.with_name(f"{path.name}.lock")
+        self.key_field = key_field
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_entries = min_compaction_entries
+
+        # Offset of the latest "put" line of each live key, in insertion order
+        self._offsets: Dict[str, int] = {}
+        # Number of lines and bytes of the log covered by the index, and the inode they belong to
+        self._entries = 0
+        self._size = 0
+        self._inode: Optional[int] = None
+        self._lock = RLock()
+
+    # -- Index methods --
+
+    def _reset_index(self, inode: Optional[int] = None) -> None:
+        self._offsets = {}
+        self._entries = 0
+        self._size = 0
+        self._inode = inode
+
+    def _sync_index(self, f: IO[bytes]) -> None:
+        """Bring the index up to date with the given open log file."""
+        stat = os.fstat(f.fileno())
+        if stat.st_ino != self._inode or stat.st_size < self._size:
+            # The log was replaced by a compaction, or is being read for the first time
+            self._reset_index(inode=stat.st_ino)
+        if stat.st_size == self._size:
+            return
+
+        f.seek(self._size)
+        offset = self._size
+        for line in f:
+            # Stop at a partially written line, it will be read once complete
+            if not line.endswith(b"\n"):
+                break
+            self._index_line(line, offset)
+            offset += len(line)
+        self._size = offset
+
+    def _index_line(self, line: bytes, offset: int) -> None:
+        entry = json.loads(line)
+        if entry["op"] == "put":
+            self._offsets[entry["key"]] = offset
+        else:
+            self._offsets.pop(entry["key"], None)
+        self._entries += 1
+
+    @contextmanager
+    def _read_log(self) -> Iterator[Optional[IO[bytes]]]:
+        """Open the log for reading with an up to date index. Yields None if the log doesn't exist."""
+        with self._lock:
+            try:
+                f = open(self.path, "rb")
+            except FileNotFoundError:
+                self._reset_index()
+                yield None
+                return
+            with f:
+                self._sync_index(f)
+                yield f
+
+    @contextmanager
+    def _hold_write_lock(self) -> Iterator[None]:
+        """Hold the write lock of the log, shared by the threads and processes writing to it."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _write_log(self) -> Iterator[IO[bytes]]:
+        """Open the log for appending with an up to date index, holding the write lock."""
+        with self._hold_write_lock():
+            with open(self.path, "ab+") as f:
+                self._sync_index(f)
+                # Drop any partial line left by a writer that crashed mid-append
+                if os.fstat(f.fileno()).st_size > self._size:
+                    f.truncate(self._size)
+                yield f
+
+    def _append(self, f: IO[bytes], entries: List[Dict[str, Any]]) -> None:
+        offset = self._size
+        lines = []
+        for entry in entries:
+            line = (json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+            self._index_line(line, offset)
+            offset += len(line)
+            lines.append(line)
+        f.write(b"".join(lines))
+        f.flush()
+        self._size = offset
+
+        if self._entries >= self.min_compaction_entries and self._entries > self.compaction_ratio * len(self._offsets):
+            self._compact(f)
+
+    def _read_line(self, f: IO[bytes], offset: int) -> bytes:
+        f.seek(offset)
+        return f.readline()
+
+    def _get_put_lines(self, records: List[Dict[str, Any]]) -> List[bytes]:
+        entries = {self._get_key(record): record for record in records}
+        return [
+            (json.dumps({"op": "put", "key": key, "record": record}, ensure_ascii=False, default=str) + "\n").encode(
+                "utf-8"
+            )
+            for key, record in entries.items()
+        ]
+
+    def _get_key(self, record: Dict[str, Any]) -> str:
+        key = record.get(self.key_field)
+        if key is None:
+            key = str(uuid4())
+            record[self.key_field] = key
+        return str(key)
+
+    # -- Compaction methods --
+
+    def _replace_log(self, lines: List[bytes]) -> None:
+        """Atomically replace the log with the given "put" lines, and index them."""
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "wb") as tmp:
+            tmp.write(b"".join(lines))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, self.path)
+
+        self._reset_index(inode=os.stat(self.path).st_ino)
+        offset = 0
+        for line in lines:
+            self._index_line(line, offset)
+            offset += len(line)
+        self._size = offset
+
+    def _compact(self, f: IO[bytes]) -> None:
+        f.seek(0)
+        data = f.read(self._size)
+        lines = [data[offset : data.index(b"\n", offset) + 1] for offset in self._offsets.values()]
+        self._replace_log(lines)
+
+    def compact(self) -> None:
+        """Rewrite the log keeping only the latest version of the live records."""
+        with self._write_log() as f:
+            self._compact(f)
+
+    # -- Record methods --
+
+    def __len__(self) -> int:
+        with self._read_log():
+            return len(self._offsets)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the record with the given key, or None if it doesn't exist."""
+        with self._read_log() as f:
+            if f is None or key not in self._offsets:
+                return None
+            return json.loads(self._read_line(f, self._offsets[key]))["record"]
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Get all live records, in insertion order."""
+        with self._read_log() as f:
+            if f is None or not self._offsets:
+                return []
+            f.seek(0)
+            data = f.read(self._size)
+            return [json.loads(data[offset : data.index(b"\n", offset)])["record"] for offset in self._offsets.values()]
+
+    def put(self, records: List[Dict[str, Any]]) -> None:
+        """Insert or replace the given records, appending them to the log."""
+        if not records:
+            return
+        with self._write_log() as f:
+            self._append(f, [{"op": "put", "key": self._get_key(record), "record": record} for record in records])
+
+    def update(
+        self, key: str, update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Read, modify and write a record while holding the write lock, so concurrent writers don't lose updates.
+
+        Args:
+            key (str): The key of the record.
+            update (Callable): Gets the current record, or None if it doesn't exist, and returns the record to write,
+                or None to leave the table unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record written, or None if the table was left unchanged.
+        """
+        with self._write_log() as f:
+            current = json.loads(self._read_line(f, self._offsets[key]))["record"] if key in self._offsets else None
+            record = update(current)
+            if record is None:
+                return None
+            record[self.key_field] = key
+            self._append(f, [{"op": "put", "key": key, "record": record}])
+            return record
+
+    def delete(self, keys: List[str]) -> int:
+        """Delete the records with the given keys. Returns the number of records deleted."""
+        with self._write_log() as f:
+            existing_keys = [key for key in dict.fromkeys(keys) if key in self._offsets]
+            if existing_keys:
+                self._append(f, [{"op": "delete", "key": key} for key in existing_keys])
+            return len(existing_keys)
+
+    def replace_all(self, records: List[Dict[str, Any]]) -> None:
+        """Atomically replace the whole table with the given records."""
+        lines = self._get_put_lines(records)
+        with self._write_log():
+            self._replace_log(lines)
+
+    def import_records(self, load: Callable[[], List[Dict[str, Any]]]) -> bool:
+        """Create the log from the records returned by load, unless the log already exists.
+
+        The check and the import happen under the write lock, so an import never overwrites the entries another
+        process appended after creating the log.
+
+        Returns:
+            bool: True if the records were imported.
+        """
+        with self._hold_write_lock():
+            if self.path.exists():
+                return False
+            self._replace_log(self._get_put_lines(load()))
+            return True
@@ -3,13 +3,14 @@ import os
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.json.append_log import AppendLogTable
 from agno.db.json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -40,6 +41,8 @@ class JsonDb(BaseDb):
         traces_table: Optional[str] = None,
         spans_table: Optional[str] = None,
         id: Optional[str] = None,
+        append_log: bool = False,
+        compaction_ratio: float = 2.0,
     ):
         """
         Interface for interacting with JSON files as database.
@@ -55,6 +58,11 @@ class JsonDb(BaseDb):
             traces_table (Optional[str]): Name of the JSON file to store run traces.
             spans_table (Optional[str]): Name of the JSON file to store span events.
             id (Optional[str]): ID of the database.
+            append_log (bool): Store each table as a JSON-lines append log (<table>.jsonl) instead of a JSON file.
+                Operations on a single record then cost the same regardless of the table size, and several processes
+                can safely write to the same tables. Existing JSON files are imported on first use. Records are keyed by
+                their ID, so a session or eval run replaces any record with the same ID, even of another component.
+            compaction_ratio (float): When using an append log, compact it once it holds this many entries per record.
         """
         if id is None:
             seed = db_path or "agno_json_db"
@@ -75,6 +83,10 @@ class JsonDb(BaseDb):
         # Create the directory where the JSON files will be stored, if it doesn't exist
         self.db_path = Path(db_path or os.path.join(os.getcwd(), "agno_json_db"))
 
+        self.append_log = append_log
+        self.compaction_ratio = compaction_ratio
+        self._table_logs: Dict[str, AppendLogTable] = {}
+
     def table_exists(self, table_name: str) -> bool:
         """JSON implementation, always returns True."""
         return True
@@ -91,6 +103,9 @@ class JsonDb(BaseDb):
         Raises:
             json.JSONDecodeError: If the JSON file is not valid.
         """
+        if self.append_log:
+            return self._get_table_log(filename).read_all()
+
         file_path = self.db_path / f"{filename}.json"
 
         # Create directory if it doesn't exist
@@ -120,6 +135,10 @@ class JsonDb(BaseDb):
         Raises:
             Exception: If an error occurs while writing to the JSON file.
         """
+        if self.append_log:
+            self._get_table_log(filename).replace_all(data)
+            return
+
         file_path = self.db_path / f"{filename}.json"
 
         # Create directory if it doesn't exist
@@ -133,6 +152,147 @@ class JsonDb(BaseDb):
             log_error(f"Error writing to the {file_path} JSON file: {e}")
             raise e
 
+    def _get_table_key_field(self, filename: str) -> str:
+        """Get the field holding the ID of the records of the given table."""
+        if filename == self.session_table_name:
+            return "session_id"
+        elif filename == self.memory_table_name:
+            return "memory_id"
+        elif filename == self.eval_table_name:
+            return "run_id"
+        elif filename == self.trace_table_name:
+            return "trace_id"
+        elif filename == self.span_table_name:
+            return "span_id"
+        return "id"
+
+    def _get_table_log(self, filename: str) -> AppendLogTable:
+        """Get the append log storing the given table, importing the table JSON file if the log doesn't exist yet.
+
+        Args:
+            filename (str): The name of the table.
+
+        Returns:
+            AppendLogTable: The append log of the table.
+        """
+        table_log = self._table_logs.get(filename)
+        if table_log is None:
+            table_log = AppendLogTable(
+                path=self.db_path / f"{filename}.jsonl",
+                key_field=self._get_table_key_field(filename),
+                compaction_ratio=self.compaction_ratio,
+            )
+            json_file_path = self.db_path / f"{filename}.json"
+            if not table_log.path.exists() and json_file_path.exists():
+
+                def load_json_file() -> List[Dict[str, Any]]:
+                    with open(json_file_path, "r") as f:
+                        return json.load(f)
+
+                if table_log.import_records(load_json_file):
+                    log_info(f"Imported {json_file_path} into {table_log.path}")
+            self._table_logs[filename] = table_log
+        return table_log
+
+    def _get_table_record(self, filename: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """Get the record with the given ID from a table.
+
+        Args:
+            filename (str): The name of the table.
+            record_id (str): The ID of the record.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record, or None if it doesn't exist.
+        """
+        if self.append_log:
+            return self._get_table_log(filename).get(record_id)
+
+        key_field = self._get_table_key_field(filename)
+        for record in self._read_json_file(filename):
+            if record.get(key_field) == record_id:
+                return record
+        return None
+
+    def _upsert_table_records(self, filename: str, records: List[Dict[str, Any]]) -> None:
+        """Insert or replace records in a table, matching existing records by ID.
+
+        Args:
+            filename (str): The name of the table.
+            records (List[Dict[str, Any]]): The records to upsert.
+        """
+        if self.append_log:
+            self._get_table_log(filename).put(records)
+            return
+
+        key_field = self._get_table_key_field(filename)
+        existing_records = self._read_json_file(filename, create_table_if_not_found=True)
+        positions = {record.get(key_field): i for i, record in enumerate(existing_records)}
+        for record in records:
+            position = positions.get(record.get(key_field))
+            if position is not None:
+                existing_records[position] = record
+            else:
+                positions[record.get(key_field)] = len(existing_records)
+                existing_records.append(record)
+        self._write_json_file(filename, existing_records)
+
+    def _update_table_record(
+        self,
+        filename: str,
+        record_id: str,
+        update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Read, modify and write a record of a table.
+
+        With an append log, this holds the write lock of the table, so concurrent processes don't lose updates.
+
+        Args:
+            filename (str): The name of the table.
+            record_id (str): The ID of the record.
+            update (Callable): Gets the current record, or None if it doesn't exist, and returns the record to write,
+                or None to leave the table unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record written, or None if the table was left unchanged.
+        """
+        if self.append_log:
+            return self._get_table_log(filename).update(record_id, update)
+
+        key_field = self._get_table_key_field(filename)
+        records = self._read_json_file(filename, create_table_if_not_found=True)
+        position = next((i for i, record in enumerate(records) if record.get(key_field) == record_id), None)
+        updated_record = update(records[position] if position is not None else None)
+        if updated_record is None:
+            return None
+        if position is not None:
+            records[position] = updated_record
+        else:
+            records.append(updated_record)
+        self._write_json_file(filename, records)
+        return updated_record
+
+    def _delete_table_records(self, filename: str, record_ids: List[str]) -> int:
+        """Delete the records with the given IDs from a table.
+
+        Args:
+            filename (str): The name of the table.
+            record_ids (List[str]): The IDs of the records to delete.
+
+        Returns:
+            int: The number of records deleted.
+        """
+        if self.append_log:
+            return self._get_table_log(filename).delete(record_ids)
+
+        key_field = self._get_table_key_field(filename)
+        ids_to_delete = set(record_ids)
+        records = self._read_json_file(filename)
+        remaining_records = [record for record in records if record.get(key_field) not in ids_to_delete]
+        deleted_count = len(records) - len(remaining_records)
+        if deleted_count > 0:
+            self._write_json_file(filename, remaining_records)
+        return deleted_count
+
     def get_latest_schema_version(self):
         """Get the latest version of the database schema."""
         pass
@@ -156,12 +316,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            original_count = len(sessions)
-            sessions = [s for s in sessions if s.get("session_id") != session_id]
-
-            if len(sessions) < original_count:
-                self._write_json_file(self.session_table_name, sessions)
+            if self._delete_table_records(self.session_table_name, [session_id]) > 0:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
 
@@ -183,9 +338,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            sessions = [s for s in sessions if s.get("session_id") not in session_ids]
-            self._write_json_file(self.session_table_name, sessions)
+            self._delete_table_records(self.session_table_name, session_ids)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -216,26 +369,23 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-
-            for session_data in sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
+            session_data = self._get_table_record(self.session_table_name, session_id)
+            if session_data is None:
+                return None
+            if user_id is not None and session_data.get("user_id") != user_id:
+                return None
 
-                    if not deserialize:
-                        return session_data
-
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session_data)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+            if not deserialize:
+                return session_data
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session_data)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session_data)
+            elif session_type == SessionType.WORKFLOW:
+                return WorkflowSession.from_dict(session_data)
+            else:
+                raise ValueError(f"Invalid session type: {session_type}")
 
         except Exception as e:
             log_error(f"Exception reading from session file: {e}")
@@ -341,33 +491,33 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Rename a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name)
-
-            for i, session in enumerate(sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
 
-                    sessions[i] = session
-                    self._write_json_file(self.session_table_name, sessions)
+            def rename(session: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+                if session is None or session.get("session_type") != session_type.value:
+                    return None
+                # Update session name in session_data
+                if "session_data" not in session:
+                    session["session_data"] = {}
+                session["session_data"]["session_name"] = session_name
+                return session
+
+            session = self._update_table_record(self.session_table_name, session_id, rename)
+            if session is None:
+                return None
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    if not deserialize:
-                        return session
-
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+            if not deserialize:
+                return session
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session)
+            elif session_type == SessionType.WORKFLOW:
+                return WorkflowSession.from_dict(session)
+            else:
+                raise ValueError(f"Invalid session type: {session_type}")
 
         except Exception as e:
             log_error(f"Exception renaming session: {e}")
@@ -378,7 +528,6 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Insert or update a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name, create_table_if_not_found=True)
             session_dict = session.to_dict()
 
             # Add session_type based on session instance type
@@ -389,25 +538,41 @@ class JsonDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    # Update existing session
-                    session_dict["updated_at"] = int(time.time())
-                    sessions[i] = session_dict
-                    session_updated = True
-                    break
+            if self.append_log:
+                # The log holds one record per session ID, so a session replaces any session with the same ID
+
+                def upsert(existing_session: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                    if existing_session is not None and self._matches_session_key(existing_session, session):
+                        # Update existing session
+                        session_dict["updated_at"] = int(time.time())
+                    else:
+                        # Add new session
+                        session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                        session_dict["updated_at"] = session_dict.get("created_at")
+                    return session_dict
 
-            if not session_updated:
-                # Add new session
-                session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
-                session_dict["updated_at"] = session_dict.get("created_at")
-                sessions.append(session_dict)
+                self._update_table_record(self.session_table_name, session.session_id, upsert)
+            else:
+                # The JSON file can hold sessions of different components with the same ID
+                sessions = self._read_json_file(self.session_table_name, create_table_if_not_found=True)
+                session_updated = False
+                for i, existing_session in enumerate(sessions):
+                    if existing_session.get("session_id") == session_dict.get(
+                        "session_id"
+                    ) and self._matches_session_key(existing_session, session):
+                        # Update existing session
+                        session_dict["updated_at"] = int(time.time())
+                        sessions[i] = session_dict
+                        session_updated = True
+                        break
 
-            self._write_json_file(self.session_table_name, sessions)
+                if not session_updated:
+                    # Add new session
+                    session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                    session_dict["updated_at"] = session_dict.get("created_at")
+                    sessions.append(session_dict)
+
+                self._write_json_file(self.session_table_name, sessions)
 
             if not deserialize:
                 return session_dict
@@ -474,25 +639,14 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-            original_count = len(memories)
-
             # If user_id is provided, verify the memory belongs to the user before deleting
             if user_id:
-                memory_to_delete = None
-                for m in memories:
-                    if m.get("memory_id") == memory_id:
-                        memory_to_delete = m
-                        break
-
+                memory_to_delete = self._get_table_record(self.memory_table_name, memory_id)
                 if memory_to_delete and memory_to_delete.get("user_id") != user_id:
                     log_debug(f"Memory {memory_id} does not belong to user {user_id}")
                     return
 
-            memories = [m for m in memories if m.get("memory_id") != memory_id]
-
-            if len(memories) < original_count:
-                self._write_json_file(self.memory_table_name, memories)
+            if self._delete_table_records(self.memory_table_name, [memory_id]) > 0:
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -509,18 +663,16 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-
             # If user_id is provided, filter memory_ids to only those belonging to the user
             if user_id:
                 filtered_memory_ids: List[str] = []
-                for memory in memories:
-                    if memory.get("memory_id") in memory_ids and memory.get("user_id") == user_id:
-                        filtered_memory_ids.append(memory.get("memory_id"))  # type: ignore
+                for memory_id in memory_ids:
+                    memory = self._get_table_record(self.memory_table_name, memory_id)
+                    if memory is not None and memory.get("user_id") == user_id:
+                        filtered_memory_ids.append(memory_id)
                 memory_ids = filtered_memory_ids
 
-            memories = [m for m in memories if m.get("memory_id") not in memory_ids]
-            self._write_json_file(self.memory_table_name, memories)
+            self._delete_table_records(self.memory_table_name, memory_ids)
 
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
@@ -565,19 +717,17 @@ class JsonDb(BaseDb):
             Optional[Union[UserMemory, Dict[str, Any]]]: The user memory data if found, None otherwise.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-
-            for memory_data in memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id and memory_data.get("user_id") != user_id:
-                        return None
+            memory_data = self._get_table_record(self.memory_table_name, memory_id)
+            if memory_data is None:
+                return None
 
-                    if not deserialize:
-                        return memory_data
-                    return UserMemory.from_dict(memory_data)
+            # Filter by user_id if provided
+            if user_id and memory_data.get("user_id") != user_id:
+                return None
 
-            return None
+            if not deserialize:
+                return memory_data
+            return UserMemory.from_dict(memory_data)
 
         except Exception as e:
             log_error(f"Exception reading from memory file: {e}")
@@ -698,26 +848,13 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
         """Upsert a user memory in the JSON file."""
         try:
-            memories = self._read_json_file(self.memory_table_name, create_table_if_not_found=True)
-
             if memory.memory_id is None:
                 memory.memory_id = str(uuid4())
 
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                memories.append(memory_dict)
-
-            self._write_json_file(self.memory_table_name, memories)
+            self._upsert_table_records(self.memory_table_name, [memory_dict])
 
             if not deserialize:
                 return memory_dict
@@ -1060,15 +1197,18 @@ class JsonDb(BaseDb):
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
         """Create an EvalRunRecord in the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name, create_table_if_not_found=True)
-
             current_time = int(time.time())
             eval_dict = eval_run.model_dump()
             eval_dict["created_at"] = current_time
             eval_dict["updated_at"] = current_time
 
-            eval_runs.append(eval_dict)
-            self._write_json_file(self.eval_table_name, eval_runs)
+            if self.append_log:
+                # The log holds one record per run ID, so an eval run replaces any eval run with the same ID
+                self._upsert_table_records(self.eval_table_name, [eval_dict])
+            else:
+                eval_runs = self._read_json_file(self.eval_table_name, create_table_if_not_found=True)
+                eval_runs.append(eval_dict)
+                self._write_json_file(self.eval_table_name, eval_runs)
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -1356,80 +1496,71 @@ class JsonDb(BaseDb):
             trace: The Trace object to store (one per trace_id).
         """
         try:
-            traces = self._read_json_file(self.trace_table_name, create_table_if_not_found=True)
 
-            # Check if trace exists
-            existing_idx = None
-            for i, existing in enumerate(traces):
-                if existing.get("trace_id") == trace.trace_id:
-                    existing_idx = i
-                    break
-
-            if existing_idx is not None:
-                existing = traces[existing_idx]
-
-                # workflow (level 3) > team (level 2) > agent (level 1) > child/unknown (level 0)
-                def get_component_level(workflow_id, team_id, agent_id, name):
-                    is_root_name = ".run" in name or ".arun" in name
-                    if not is_root_name:
-                        return 0
-                    elif workflow_id:
-                        return 3
-                    elif team_id:
-                        return 2
-                    elif agent_id:
-                        return 1
+            def upsert(existing: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                if existing is not None:
+                    # workflow (level 3) > team (level 2) > agent (level 1) > child/unknown (level 0)
+                    def get_component_level(workflow_id, team_id, agent_id, name):
+                        is_root_name = ".run" in name or ".arun" in name
+                        if not is_root_name:
+                            return 0
+                        elif workflow_id:
+                            return 3
+                        elif team_id:
+                            return 2
+                        elif agent_id:
+                            return 1
+                        else:
+                            return 0
+
+                    existing_level = get_component_level(
+                        existing.get("workflow_id"),
+                        existing.get("team_id"),
+                        existing.get("agent_id"),
+                        existing.get("name", ""),
+                    )
+                    new_level = get_component_level(trace.workflow_id, trace.team_id, trace.agent_id, trace.name)
+                    should_update_name = new_level > existing_level
+
+                    # Parse existing start_time to calculate correct duration
+                    existing_start_time_str = existing.get("start_time")
+                    if isinstance(existing_start_time_str, str):
+                        existing_start_time = datetime.fromisoformat(existing_start_time_str.replace("Z", "+00:00"))
                     else:
-                        return 0
-
-                existing_level = get_component_level(
-                    existing.get("workflow_id"),
-                    existing.get("team_id"),
-                    existing.get("agent_id"),
-                    existing.get("name", ""),
-                )
-                new_level = get_component_level(trace.workflow_id, trace.team_id, trace.agent_id, trace.name)
-                should_update_name = new_level > existing_level
-
-                # Parse existing start_time to calculate correct duration
-                existing_start_time_str = existing.get("start_time")
-                if isinstance(existing_start_time_str, str):
-                    existing_start_time = datetime.fromisoformat(existing_start_time_str.replace("Z", "+00:00"))
+                        existing_start_time = trace.start_time
+
+                    recalculated_duration_ms = int((trace.end_time - existing_start_time).total_seconds() * 1000)
+
+                    # Update existing trace
+                    existing["end_time"] = trace.end_time.isoformat()
+                    existing["duration_ms"] = recalculated_duration_ms
+                    existing["status"] = trace.status
+                    if should_update_name:
+                        existing["name"] = trace.name
+
+                    # Update context fields only if new value is not None
+                    if trace.run_id is not None:
+                        existing["run_id"] = trace.run_id
+                    if trace.session_id is not None:
+                        existing["session_id"] = trace.session_id
+                    if trace.user_id is not None:
+                        existing["user_id"] = trace.user_id
+                    if trace.agent_id is not None:
+                        existing["agent_id"] = trace.agent_id
+                    if trace.team_id is not None:
+                        existing["team_id"] = trace.team_id
+                    if trace.workflow_id is not None:
+                        existing["workflow_id"] = trace.workflow_id
+
+                    return existing
                 else:
-                    existing_start_time = trace.start_time
-
-                recalculated_duration_ms = int((trace.end_time - existing_start_time).total_seconds() * 1000)
-
-                # Update existing trace
-                existing["end_time"] = trace.end_time.isoformat()
-                existing["duration_ms"] = recalculated_duration_ms
-                existing["status"] = trace.status
-                if should_update_name:
-                    existing["name"] = trace.name
-
-                # Update context fields only if new value is not None
-                if trace.run_id is not None:
-                    existing["run_id"] = trace.run_id
-                if trace.session_id is not None:
-                    existing["session_id"] = trace.session_id
-                if trace.user_id is not None:
-                    existing["user_id"] = trace.user_id
-                if trace.agent_id is not None:
-                    existing["agent_id"] = trace.agent_id
-                if trace.team_id is not None:
-                    existing["team_id"] = trace.team_id
-                if trace.workflow_id is not None:
-                    existing["workflow_id"] = trace.workflow_id
-
-                traces[existing_idx] = existing
-            else:
-                # Add new trace
-                trace_dict = trace.to_dict()
-                trace_dict.pop("total_spans", None)
-                trace_dict.pop("error_count", None)
-                traces.append(trace_dict)
+                    # Add new trace
+                    trace_dict = trace.to_dict()
+                    trace_dict.pop("total_spans", None)
+                    trace_dict.pop("error_count", None)
+                    return trace_dict
 
-            self._write_json_file(self.trace_table_name, traces)
+            self._update_table_record(self.trace_table_name, trace.trace_id, upsert)
 
         except Exception as e:
             log_error(f"Error creating trace: {e}")
@@ -1685,9 +1816,7 @@ class JsonDb(BaseDb):
             span: The Span object to store.
         """
         try:
-            spans = self._read_json_file(self.span_table_name, create_table_if_not_found=True)
-            spans.append(span.to_dict())
-            self._write_json_file(self.span_table_name, spans)
+            self._upsert_table_records(self.span_table_name, [span.to_dict()])
 
         except Exception as e:
             log_error(f"Error creating span: {e}")
@@ -1702,10 +1831,7 @@ class JsonDb(BaseDb):
             return
 
         try:
-            existing_spans = self._read_json_file(self.span_table_name, create_table_if_not_found=True)
-            for span in spans:
-                existing_spans.append(span.to_dict())
-            self._write_json_file(self.span_table_name, existing_spans)
+            self._upsert_table_records(self.span_table_name, [span.to_dict() for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {e}")
@@ -25,6 +25,8 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.schemas.messages import IndexedMessagePair
+from agno.db.utils import get_search_terms
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id, sanitize_postgres_string, sanitize_postgres_strings
@@ -74,6 +76,7 @@ class PostgresDb(BaseDb):
         component_configs_table: Optional[str] = None,
         component_links_table: Optional[str] = None,
         learnings_table: Optional[str] = None,
+        message_index_table: Optional[str] = None,
         id: Optional[str] = None,
         create_schema: bool = True,
     ):
@@ -102,6 +105,7 @@ class PostgresDb(BaseDb):
             component_configs_table (Optional[str]): Name of the table to store component configurations.
             component_links_table (Optional[str]): Name of the table to store component references.
             learnings_table (Optional[str]): Name of the table to store learnings.
+            message_index_table (Optional[str]): Name of the table indexing messages to search them across sessions.
             id (Optional[str]): ID of the database.
             create_schema (bool): Whether to automatically create the database schema if it doesn't exist.
                 Set to False if schema is managed externally (e.g., via migrations). Defaults to True.
@@ -144,11 +148,14 @@ class PostgresDb(BaseDb):
             component_configs_table=component_configs_table,
             component_links_table=component_links_table,
             learnings_table=learnings_table,
+            message_index_table=message_index_table,
         )
 
         self.db_schema: str = db_schema if db_schema is not None else "ai"
         self.metadata: MetaData = MetaData(schema=self.db_schema)
         self.create_schema: bool = create_schema
+        # Whether the full-text search index of the message index has been created
+        self._message_index_search_index_created: bool = False
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine, expire_on_commit=False))
@@ -182,6 +189,7 @@ class PostgresDb(BaseDb):
             components_table=data.get("components_table"),
             component_configs_table=data.get("component_configs_table"),
             component_links_table=data.get("component_links_table"),
+            message_index_table=data.get("message_index_table"),
             id=data.get("id"),
         )
 
@@ -526,6 +534,16 @@ class PostgresDb(BaseDb):
             )
             return self.learnings_table
 
+        if table_type == "message_index":
+            self.message_index_table = self._get_or_create_table(
+                table_name=self.message_index_table_name,
+                table_type="message_index",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            if self.message_index_table is not None and create_table_if_not_found:
+                self._create_message_index_search_index()
+            return self.message_index_table
+
         raise ValueError(f"Unknown table type: {table_type}")
 
     def _get_or_create_table(
@@ -624,14 +642,15 @@ class PostgresDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+            self._delete_indexed_messages(session_ids=[session_id])
 
-                if result.rowcount == 0:
-                    log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
-                    return False
+            if result.rowcount == 0:
+                log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
+                return False
 
-                else:
-                    log_debug(f"Successfully deleted session with session_id: {session_id} in table {table.name}")
-                    return True
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id} in table {table.name}")
+                return True
 
         except Exception as e:
             log_error(f"Error deleting session: {e}")
@@ -655,6 +674,7 @@ class PostgresDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+            self._delete_indexed_messages(session_ids=session_ids)
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
@@ -2748,6 +2768,75 @@ class PostgresDb(BaseDb):
             else_=0,
         )
 
+    def _get_trace_dict(self, trace: "Trace") -> Dict[str, Any]:
+        """Get the column values of a trace record, sanitized for Postgres."""
+        trace_dict = trace.to_dict()
+        trace_dict.pop("total_spans", None)
+        trace_dict.pop("error_count", None)
+        # Sanitize string fields and nested JSON structures
+        if trace_dict.get("name"):
+            trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
+        if trace_dict.get("status"):
+            trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
+        # Sanitize any nested dict/JSON fields
+        trace_dict = cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
+        return trace_dict
+
+    def _get_trace_upsert_stmt(self, table: Table, values: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """Build the upsert statement for one or more trace records."""
+        insert_stmt = postgresql.insert(table).values(values)
+
+        # Build component level expressions for comparing trace priority
+        new_level = self._get_trace_component_level_expr(
+            insert_stmt.excluded.workflow_id,
+            insert_stmt.excluded.team_id,
+            insert_stmt.excluded.agent_id,
+            insert_stmt.excluded.name,
+        )
+        existing_level = self._get_trace_component_level_expr(
+            table.c.workflow_id,
+            table.c.team_id,
+            table.c.agent_id,
+            table.c.name,
+        )
+
+        # Build the ON CONFLICT DO UPDATE clause
+        # Use LEAST for start_time, GREATEST for end_time to capture full trace duration
+        # Use COALESCE to preserve existing non-null context values
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["trace_id"],
+            set_={
+                "end_time": func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
+                "start_time": func.least(table.c.start_time, insert_stmt.excluded.start_time),
+                "duration_ms": func.extract(
+                    "epoch",
+                    func.cast(
+                        func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
+                        TIMESTAMP(timezone=True),
+                    )
+                    - func.cast(
+                        func.least(table.c.start_time, insert_stmt.excluded.start_time),
+                        TIMESTAMP(timezone=True),
+                    ),
+                )
+                * 1000,
+                "status": insert_stmt.excluded.status,
+                # Update name only if new trace is from a higher-level component
+                # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
+                "name": case(
+                    (new_level > existing_level, insert_stmt.excluded.name),
+                    else_=table.c.name,
+                ),
+                # Preserve existing non-null context values using COALESCE
+                "run_id": func.coalesce(insert_stmt.excluded.run_id, table.c.run_id),
+                "session_id": func.coalesce(insert_stmt.excluded.session_id, table.c.session_id),
+                "user_id": func.coalesce(insert_stmt.excluded.user_id, table.c.user_id),
+                "agent_id": func.coalesce(insert_stmt.excluded.agent_id, table.c.agent_id),
+                "team_id": func.coalesce(insert_stmt.excluded.team_id, table.c.team_id),
+                "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
+            },
+        )
+
     def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
@@ -2762,79 +2851,49 @@ class PostgresDb(BaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
-            # Sanitize string fields and nested JSON structures
-            if trace_dict.get("name"):
-                trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
-            if trace_dict.get("status"):
-                trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
-            # Sanitize any nested dict/JSON fields
-            trace_dict = cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
+            trace_dict = self._get_trace_dict(trace)
 
             with self.Session() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = postgresql.insert(table).values(trace_dict)
-
-                # Build component level expressions for comparing trace priority
-                new_level = self._get_trace_component_level_expr(
-                    insert_stmt.excluded.workflow_id,
-                    insert_stmt.excluded.team_id,
-                    insert_stmt.excluded.agent_id,
-                    insert_stmt.excluded.name,
-                )
-                existing_level = self._get_trace_component_level_expr(
-                    table.c.workflow_id,
-                    table.c.team_id,
-                    table.c.agent_id,
-                    table.c.name,
-                )
-
-                # Build the ON CONFLICT DO UPDATE clause
-                # Use LEAST for start_time, GREATEST for end_time to capture full trace duration
-                # Use COALESCE to preserve existing non-null context values
-                upsert_stmt = insert_stmt.on_conflict_do_update(
-                    index_elements=["trace_id"],
-                    set_={
-                        "end_time": func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
-                        "start_time": func.least(table.c.start_time, insert_stmt.excluded.start_time),
-                        "duration_ms": func.extract(
-                            "epoch",
-                            func.cast(
-                                func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
-                                TIMESTAMP(timezone=True),
-                            )
-                            - func.cast(
-                                func.least(table.c.start_time, insert_stmt.excluded.start_time),
-                                TIMESTAMP(timezone=True),
-                            ),
-                        )
-                        * 1000,
-                        "status": insert_stmt.excluded.status,
-                        # Update name only if new trace is from a higher-level component
-                        # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
-                        "name": case(
-                            (new_level > existing_level, insert_stmt.excluded.name),
-                            else_=table.c.name,
-                        ),
-                        # Preserve existing non-null context values using COALESCE
-                        "run_id": func.coalesce(insert_stmt.excluded.run_id, table.c.run_id),
-                        "session_id": func.coalesce(insert_stmt.excluded.session_id, table.c.session_id),
-                        "user_id": func.coalesce(insert_stmt.excluded.user_id, table.c.user_id),
-                        "agent_id": func.coalesce(insert_stmt.excluded.agent_id, table.c.agent_id),
-                        "team_id": func.coalesce(insert_stmt.excluded.team_id, table.c.team_id),
-                        "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
-                    },
-                )
+                upsert_stmt = self._get_trace_upsert_stmt(table=table, values=trace_dict)
                 sess.execute(upsert_stmt)
 
         except Exception as e:
             log_error(f"Error creating trace: {e}")
             # Don't raise - tracing should not break the main application flow
 
+    def upsert_traces(self, traces: List["Trace"], spans: Optional[List["Span"]] = None) -> None:
+        """Create or update multiple traces, and create their spans, in a single transaction.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of the traces to store.
+
+        Raises:
+            Exception: If the batch could not be written, so the caller can count the lost spans.
+        """
+        if not traces and not spans:
+            return
+
+        try:
+            traces_table = self._get_table(table_type="traces", create_table_if_not_found=True)
+            spans_table = self._get_table(table_type="spans", create_table_if_not_found=True) if spans else None
+            if traces_table is None:
+                return
+
+            with self.Session() as sess, sess.begin():
+                if traces:
+                    trace_dicts = [self._get_trace_dict(trace) for trace in traces]
+                    sess.execute(self._get_trace_upsert_stmt(table=traces_table, values=trace_dicts))
+                if spans and spans_table is not None:
+                    sess.execute(postgresql.insert(spans_table), [self._get_span_dict(span) for span in spans])
+
+        except Exception as e:
+            log_error(f"Error creating traces batch: {e}")
+            raise e
+
     def get_trace(
         self,
         trace_id: Optional[str] = None,
@@ -3083,6 +3142,17 @@ class PostgresDb(BaseDb):
             return [], 0
 
     # --- Spans ---
+    def _get_span_dict(self, span: "Span") -> Dict[str, Any]:
+        """Get the column values of a span record, sanitized for Postgres."""
+        span_dict = span.to_dict()
+        # Sanitize string fields and nested JSON structures
+        if span_dict.get("name"):
+            span_dict["name"] = sanitize_postgres_string(span_dict["name"])
+        if span_dict.get("status_code"):
+            span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
+        # Sanitize any nested dict/JSON fields
+        return cast(Dict[str, Any], sanitize_postgres_strings(span_dict))
+
     def create_span(self, span: "Span") -> None:
         """Create a single span in the database.
 
@@ -3095,15 +3165,7 @@ class PostgresDb(BaseDb):
                 return
 
             with self.Session() as sess, sess.begin():
-                span_dict = span.to_dict()
-                # Sanitize string fields and nested JSON structures
-                if span_dict.get("name"):
-                    span_dict["name"] = sanitize_postgres_string(span_dict["name"])
-                if span_dict.get("status_code"):
-                    span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
-                # Sanitize any nested dict/JSON fields
-                span_dict = cast(Dict[str, Any], sanitize_postgres_strings(span_dict))
-                stmt = postgresql.insert(table).values(span_dict)
+                stmt = postgresql.insert(table).values(self._get_span_dict(span))
                 sess.execute(stmt)
 
         except Exception as e:
@@ -3125,15 +3187,7 @@ class PostgresDb(BaseDb):
 
             with self.Session() as sess, sess.begin():
                 for span in spans:
-                    span_dict = span.to_dict()
-                    # Sanitize string fields and nested JSON structures
-                    if span_dict.get("name"):
-                        span_dict["name"] = sanitize_postgres_string(span_dict["name"])
-                    if span_dict.get("status_code"):
-                        span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
-                    # Sanitize any nested dict/JSON fields
-                    span_dict = sanitize_postgres_strings(span_dict)
-                    stmt = postgresql.insert(table).values(span_dict)
+                    stmt = postgresql.insert(table).values(self._get_span_dict(span))
                     sess.execute(stmt)
 
         except Exception as e:
@@ -4477,3 +4531,135 @@ class PostgresDb(BaseDb):
         except Exception as e:
             log_debug(f"Error getting learnings: {e}")
             return []
+
+    # -- Message index methods --
+
+    def _create_message_index_search_index(self) -> None:
+        """Create the GIN index used to search the content of the message index."""
+        if self._message_index_search_index_created:
+            return
+        try:
+            with self.Session() as sess, sess.begin():
+                sess.execute(
+                    text(
+                        f'CREATE INDEX IF NOT EXISTS "idx_{self.message_index_table_name}_content_search" '
+                        f'ON "{self.db_schema}"."{self.message_index_table_name}" '
+                        "USING GIN (to_tsvector('english', content))"
+                    )
+                )
+            self._message_index_search_index_created = True
+        except Exception as e:
+            log_error(f"Error creating the search index of {self.db_schema}.{self.message_index_table_name}: {e}")
+
+    def _delete_indexed_messages(self, session_ids: List[str]) -> None:
+        """Remove the indexed messages of the given sessions."""
+        table = self._get_table(table_type="message_index")
+        if table is None:
+            return
+
+        with self.Session() as sess, sess.begin():
+            sess.execute(table.delete().where(table.c.session_id.in_(session_ids)))
+
+    def upsert_indexed_messages(self, message_pairs: List[IndexedMessagePair]) -> None:
+        """Add message pairs to the index used to search messages across sessions, replacing those with the same id.
+
+        Args:
+            message_pairs (List[IndexedMessagePair]): The message pairs to index.
+
+        Raises:
+            Exception: If an error occurs during upsert.
+        """
+        if not message_pairs:
+            return
+
+        try:
+            table = self._get_table(table_type="message_index", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            rows = [
+                {
+                    "id": pair.id,
+                    "session_id": pair.session_id,
+                    "run_id": pair.run_id,
+                    "user_id": pair.user_id,
+                    "agent_id": pair.agent_id,
+                    "team_id": pair.team_id,
+                    "user_message": sanitize_postgres_strings(pair.user_message),
+                    "assistant_message": sanitize_postgres_strings(pair.assistant_message),
+                    "content": sanitize_postgres_string(pair.content),
+                    "created_at": pair.created_at,
+                }
+                for pair in message_pairs
+            ]
+
+            with self.Session() as sess, sess.begin():
+                stmt = postgresql.insert(table).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_=dict(
+                        user_message=stmt.excluded.user_message,
+                        assistant_message=stmt.excluded.assistant_message,
+                        content=stmt.excluded.content,
+                    ),
+                )
+                sess.execute(stmt)
+
+            log_debug(f"Indexed {len(rows)} message pairs")
+
+        except Exception as e:
+            log_error(f"Error upserting indexed messages: {e}")
+            raise e
+
+    def search_indexed_messages(
+        self,
+        query: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[IndexedMessagePair]:
+        """Search the indexed message pairs, using the full-text search of Postgres.
+
+        Args:
+            query (Optional[str]): Text to search for. Pairs are ranked by relevance to it, then by recency.
+                If not provided, the most recent pairs are returned.
+            user_id (Optional[str]): Filter by user ID.
+            agent_id (Optional[str]): Filter by agent ID.
+            limit (int): Maximum number of pairs to return.
+
+        Returns:
+            List[IndexedMessagePair]: The message pairs, best match first.
+
+        Raises:
+            Exception: If an error occurs during search.
+        """
+        try:
+            table = self._get_table(table_type="message_index")
+            if table is None:
+                return []
+
+            stmt = select(table)
+            if user_id is not None:
+                stmt = stmt.where(table.c.user_id == user_id)
+            if agent_id is not None:
+                stmt = stmt.where(table.c.agent_id == agent_id)
+
+            terms = get_search_terms(query) if query else []
+            if terms:
+                # Same expression as the GIN index, so the index is used
+                search_config = text("'english'::regconfig")
+                ts_vector = func.to_tsvector(search_config, table.c.content)
+                ts_query = func.to_tsquery(search_config, " | ".join(terms))
+                stmt = stmt.where(ts_vector.op("@@")(ts_query)).order_by(
+                    func.ts_rank(ts_vector, ts_query).desc(), table.c.created_at.desc()
+                )
+            else:
+                stmt = stmt.order_by(table.c.created_at.desc())
+
+            with self.Session() as sess:
+                results = sess.execute(stmt.limit(limit)).fetchall()
+            return [IndexedMessagePair.from_dict(dict(row._mapping)) for row in results]
+
+        except Exception as e:
+            log_error(f"Error searching indexed messages: {e}")
+            raise e
@@ -230,6 +230,19 @@ LEARNINGS_TABLE_SCHEMA = {
     "updated_at": {"type": BigInteger, "nullable": True},
 }
 
+MESSAGE_INDEX_TABLE_SCHEMA = {
+    "id": {"type": String, "primary_key": True, "nullable": False},
+    "session_id": {"type": String, "nullable": False, "index": True},
+    "run_id": {"type": String, "nullable": True},
+    "user_id": {"type": String, "nullable": True, "index": True},
+    "agent_id": {"type": String, "nullable": True, "index": True},
+    "team_id": {"type": String, "nullable": True},
+    "user_message": {"type": JSONB, "nullable": False},
+    "assistant_message": {"type": JSONB, "nullable": False},
+    "content": {"type": Text, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False, "index": True},
+}
+
 
 def get_table_schema_definition(
     table_type: str, traces_table_name: str = "agno_traces", db_schema: str = "agno"
@@ -262,6 +275,7 @@ def get_table_schema_definition(
         "component_configs": COMPONENT_CONFIGS_TABLE_SCHEMA,
         "component_links": COMPONENT_LINKS_TABLE_SCHEMA,
         "learnings": LEARNINGS_TABLE_SCHEMA,
+        "message_index": MESSAGE_INDEX_TABLE_SCHEMA,
     }
 
     schema = schemas.get(table_type, {})
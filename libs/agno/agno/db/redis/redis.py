@@ -1,12 +1,13 @@
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.redis.schemas import SORTED_INDEX_FIELDS, SORTED_INDEX_SCORE_FIELDS
 from agno.db.redis.utils import (
     apply_filters,
     apply_pagination,
@@ -16,9 +17,14 @@ from agno.db.redis.utils import (
     deserialize_cultural_knowledge_from_db,
     deserialize_data,
     fetch_all_sessions_data,
+    generate_index_marker_key,
     generate_redis_key,
+    generate_sorted_index_key,
     get_all_keys_for_table,
     get_dates_to_calculate_metrics_for,
+    get_index_value,
+    get_records_by_keys,
+    get_sorted_index_entries,
     remove_index_entries,
     serialize_cultural_knowledge_for_db,
     serialize_data,
@@ -102,6 +108,9 @@ class RedisDb(BaseDb):
         self.db_prefix = db_prefix
         self.expire = expire
 
+        # Table types whose sorted set indexes are known to be built
+        self._indexed_tables: set = set()
+
         if redis_client is not None:
             self.redis_client = redis_client
         elif db_url is not None:
@@ -162,7 +171,10 @@ class RedisDb(BaseDb):
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
             serialized_data = serialize_data(data)
 
-            self.redis_client.set(key, serialized_data, ex=self.expire)
+            if table_type in SORTED_INDEX_FIELDS:
+                self._store_record_with_sorted_indexes(table_type, record_id, key, serialized_data, data)
+            else:
+                self.redis_client.set(key, serialized_data, ex=self.expire)
 
             if index_fields:
                 create_index_entries(
@@ -219,9 +231,9 @@ class RedisDb(BaseDb):
         """
         try:
             # Handle index deletion first
-            if index_fields:
+            if index_fields or table_type in SORTED_INDEX_FIELDS:
                 record_data = self._get_record(table_type, record_id)
-                if record_data:
+                if record_data and index_fields:
                     remove_index_entries(
                         redis_client=self.redis_client,
                         prefix=self.db_prefix,
@@ -230,6 +242,11 @@ class RedisDb(BaseDb):
                         record_data=record_data,
                         index_fields=index_fields,
                     )
+                if record_data and table_type in SORTED_INDEX_FIELDS:
+                    pipeline = self.redis_client.pipeline(transaction=False)
+                    for index_key in self._get_sorted_index_entries(table_type, record_data):
+                        pipeline.zrem(index_key, record_id)
+                    pipeline.execute()
 
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
             result = self.redis_client.delete(key)
@@ -255,6 +272,10 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the records.
         """
         try:
+            if table_type in SORTED_INDEX_FIELDS:
+                records, _ = self._get_indexed_records(table_type)
+                return records
+
             keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type=table_type)
 
             records = []
@@ -269,6 +290,231 @@ class RedisDb(BaseDb):
             log_error(f"Error getting all records for {table_type}: {e}")
             return []
 
+    # -- Sorted set index methods --
+
+    def _get_sorted_index_entries(self, table_type: str, record: Dict[str, Any]) -> Dict[str, float]:
+        """Get the sorted set index keys the given record belongs to, mapped to the record score in each of them."""
+        return get_sorted_index_entries(
+            prefix=self.db_prefix,
+            table_type=table_type,
+            record=record,
+            index_fields=SORTED_INDEX_FIELDS[table_type],
+            score_fields=SORTED_INDEX_SCORE_FIELDS,
+        )
+
+    def _store_record_with_sorted_indexes(
+        self, table_type: str, record_id: str, key: str, serialized_data: str, data: Dict[str, Any]
+    ) -> None:
+        """Store a record and update its sorted set index entries in a single round trip.
+
+        Args:
+            table_type (str): The type of table to store the record in.
+            record_id (str): The ID of the record to store.
+            key (str): The Redis key of the record.
+            serialized_data (str): The serialized record data.
+            data (Dict[str, Any]): The record data.
+        """
+        index_entries = self._get_sorted_index_entries(table_type, data)
+
+        # Entries of the previous version of the record may not apply anymore, e.g. if its user_id changed
+        stale_index_keys: List[str] = []
+        previous_data = self._get_record(table_type, record_id)
+        if previous_data is not None:
+            stale_index_keys = [
+                index_key
+                for index_key in self._get_sorted_index_entries(table_type, previous_data)
+                if index_key not in index_entries
+            ]
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.set(key, serialized_data, ex=self.expire)
+        for index_key in stale_index_keys:
+            pipeline.zrem(index_key, record_id)
+        for index_key, score in index_entries.items():
+            pipeline.zadd(index_key, {record_id: score})
+        pipeline.execute()
+
+    def _ensure_sorted_indexes(self, table_type: str) -> None:
+        """Build the sorted set indexes of the given table if they were never built, e.g. for data stored before they existed."""
+        if table_type in self._indexed_tables:
+            return
+
+        if not self.redis_client.exists(generate_index_marker_key(prefix=self.db_prefix, table_type=table_type)):
+            self.rebuild_indexes(table_types=[table_type])
+
+        self._indexed_tables.add(table_type)
+
+    def rebuild_indexes(self, table_types: Optional[List[str]] = None, batch_size: int = 500) -> None:
+        """Rebuild the sorted set indexes used to list sessions and memories from the stored records.
+
+        This scans the keyspace once per table. It runs automatically the first time a table is read, and can be
+        run manually to repair indexes after records were written or deleted outside of RedisDb.
+
+        Args:
+            table_types (Optional[List[str]]): The table types to rebuild the indexes for. Defaults to all indexed tables.
+            batch_size (int): The number of records to read and index per round trip.
+
+        Raises:
+            ValueError: If a table type has no sorted set indexes.
+        """
+        for table_type in table_types or list(SORTED_INDEX_FIELDS.keys()):
+            if table_type not in SORTED_INDEX_FIELDS:
+                raise ValueError(f"Table type {table_type} has no sorted set indexes")
+
+            # Drop the existing index keys, so entries of records deleted since then don't survive the rebuild
+            index_pattern = generate_sorted_index_key(prefix=self.db_prefix, table_type=table_type, score_field="*")
+            index_keys = list(self.redis_client.scan_iter(match=index_pattern))
+            for start in range(0, len(index_keys), batch_size):
+                self.redis_client.delete(*index_keys[start : start + batch_size])
+
+            keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type=table_type)
+            key_prefix = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id="")
+            indexed_count = 0
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start : start + batch_size]
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for key, record in zip(batch, get_records_by_keys(self.redis_client, batch)):
+                    if record is None:
+                        continue
+                    record_id = key[len(key_prefix) :]
+                    for index_key, score in self._get_sorted_index_entries(table_type, record).items():
+                        pipeline.zadd(index_key, {record_id: score})
+                    indexed_count += 1
+                pipeline.execute()
+
+            self.redis_client.set(
+                generate_index_marker_key(prefix=self.db_prefix, table_type=table_type), int(time.time())
+            )
+            self._indexed_tables.add(table_type)
+            log_debug(f"Rebuilt {table_type} indexes for {indexed_count} records")
+
+    def _get_records_by_ids(self, table_type: str, record_ids: List[Any], index_key: str) -> List[Dict[str, Any]]:
+        """Fetch the records with the given IDs, dropping index entries of records that don't exist anymore.
+
+        Args:
+            table_type (str): The type of table to get the records from.
+            record_ids (List[Any]): The IDs of the records, as read from the index.
+            index_key (str): The index the IDs were read from.
+
+        Returns:
+            List[Dict[str, Any]]: The records, in the order of the given IDs.
+        """
+        record_ids = [
+            record_id.decode("utf-8") if isinstance(record_id, bytes) else record_id for record_id in record_ids
+        ]
+        keys = [
+            generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
+            for record_id in record_ids
+        ]
+
+        records = []
+        missing_ids = []
+        for record_id, record in zip(record_ids, get_records_by_keys(self.redis_client, keys)):
+            if record is None:
+                missing_ids.append(record_id)
+            else:
+                records.append(record)
+
+        # Records can expire or be deleted outside of RedisDb, their remaining entries are cleaned up lazily
+        if missing_ids:
+            self.redis_client.zrem(index_key, *missing_ids)
+
+        return records
+
+    def _get_indexed_records(
+        self,
+        table_type: str,
+        conditions: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        record_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Read records of an indexed table using its sorted set indexes.
+
+        The read is scoped to the index of the first indexed field with a condition. When the index alone answers the
+        query, only the requested page of records is fetched. Otherwise the records in the scoped index are fetched and
+        the remaining filters, sorting and pagination are applied to them.
+
+        Args:
+            table_type (str): The type of table to get the records from.
+            conditions (Optional[Dict[str, Any]]): Field values the records must match. None values are ignored.
+            sort_by (Optional[str]): The field to sort by. When None, records are returned in insertion order
+                (created_at ascending), like the SQL backends return unsorted rows, and sort_order is ignored.
+            sort_order (Optional[str]): The order to sort by.
+            limit (Optional[int]): The maximum number of records to return.
+            page (Optional[int]): The page number to return.
+            start_timestamp (Optional[int]): The minimum created_at of the records.
+            end_timestamp (Optional[int]): The maximum created_at of the records.
+            record_filter (Optional[Callable]): Additional filter records must pass.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The records and the total number of records matching the filters.
+        """
+        self._ensure_sorted_indexes(table_type)
+
+        conditions = {field: value for field, value in (conditions or {}).items() if value is not None}
+        scope_field = next((field for field in SORTED_INDEX_FIELDS[table_type] if field in conditions), None)
+        remaining_conditions = {field: value for field, value in conditions.items() if field != scope_field}
+
+        score_field = sort_by if sort_by in SORTED_INDEX_SCORE_FIELDS else "created_at"
+        index_key = generate_sorted_index_key(
+            prefix=self.db_prefix,
+            table_type=table_type,
+            score_field=score_field,
+            index_field=scope_field,
+            index_value=get_index_value(conditions[scope_field]) if scope_field is not None else None,
+        )
+
+        # Timestamp filters can be applied by the index only if it is scored by created_at
+        filter_by_score = score_field == "created_at"
+        min_score: Any = start_timestamp if start_timestamp is not None and filter_by_score else "-inf"
+        max_score: Any = end_timestamp if end_timestamp is not None and filter_by_score else "+inf"
+        # Without a sort field, sort_order is ignored, as in the other backends
+        is_descending = sort_by is not None and sort_order == "desc"
+
+        needs_record_filtering = (
+            bool(remaining_conditions)
+            or record_filter is not None
+            or (sort_by is not None and sort_by not in SORTED_INDEX_SCORE_FIELDS)
+            or (not filter_by_score and (start_timestamp is not None or end_timestamp is not None))
+        )
+
+        if not needs_record_filtering:
+            total_count = self.redis_client.zcount(index_key, min_score, max_score)
+            range_kwargs: Dict[str, Any] = {}
+            if limit is not None:
+                range_kwargs["start"] = (page - 1) * limit if page is not None and page > 0 else 0
+                range_kwargs["num"] = limit
+            if is_descending:
+                record_ids = self.redis_client.zrevrangebyscore(index_key, max_score, min_score, **range_kwargs)
+            else:
+                record_ids = self.redis_client.zrangebyscore(index_key, min_score, max_score, **range_kwargs)
+            records = self._get_records_by_ids(table_type, record_ids, index_key)  # type: ignore
+            return records, total_count  # type: ignore
+
+        if is_descending:
+            record_ids = self.redis_client.zrevrangebyscore(index_key, max_score, min_score)
+        else:
+            record_ids = self.redis_client.zrangebyscore(index_key, min_score, max_score)
+        records = self._get_records_by_ids(table_type, record_ids, index_key)  # type: ignore
+
+        records = apply_filters(records=records, conditions=remaining_conditions)
+        if not filter_by_score:
+            if start_timestamp is not None:
+                records = [r for r in records if r.get("created_at", 0) >= start_timestamp]
+            if end_timestamp is not None:
+                records = [r for r in records if r.get("created_at", 0) <= end_timestamp]
+        if record_filter is not None:
+            records = [r for r in records if record_filter(r)]
+        if sort_by is not None and sort_by not in SORTED_INDEX_SCORE_FIELDS:
+            records = apply_sorting(records=records, sort_by=sort_by, sort_order=sort_order)
+
+        return apply_pagination(records=records, limit=limit, page=page), len(records)
+
     def get_latest_schema_version(self):
         """Get the latest version of the database schema."""
         pass
@@ -373,7 +619,6 @@ class RedisDb(BaseDb):
             log_error(f"Exception reading session: {e}")
             raise e
 
-    # TODO: optimizable
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -405,41 +650,37 @@ class RedisDb(BaseDb):
             List[Union[AgentSession, TeamSession, WorkflowSession]]: The list of sessions.
         """
         try:
-            all_sessions = self._get_all_records("sessions")
-
-            conditions: Dict[str, Any] = {}
-            if session_type is not None:
-                conditions["session_type"] = session_type
-            if user_id is not None:
-                conditions["user_id"] = user_id
-
-            filtered_sessions = apply_filters(records=all_sessions, conditions=conditions)
-
+            conditions: Dict[str, Any] = {"session_type": session_type, "user_id": user_id}
             if component_id is not None:
                 if session_type == SessionType.AGENT:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("agent_id") == component_id]
+                    conditions["agent_id"] = component_id
                 elif session_type == SessionType.TEAM:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("team_id") == component_id]
+                    conditions["team_id"] = component_id
                 elif session_type == SessionType.WORKFLOW:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("workflow_id") == component_id]
-            if start_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) >= start_timestamp]
-            if end_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) <= end_timestamp]
+                    conditions["workflow_id"] = component_id
 
+            session_filter = None
             if session_name is not None:
-                filtered_sessions = [
-                    s
-                    for s in filtered_sessions
-                    if session_name.lower() in s.get("session_data", {}).get("session_name", "").lower()
-                ]
 
-            sorted_sessions = apply_sorting(records=filtered_sessions, sort_by=sort_by, sort_order=sort_order)
-            sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page)
-            sessions = [record for record in sessions]
+                def session_filter(session: Dict[str, Any]) -> bool:
+                    return (
+                        session_name.lower() in ((session.get("session_data") or {}).get("session_name") or "").lower()
+                    )
+
+            sessions, total_count = self._get_indexed_records(
+                table_type="sessions",
+                conditions=conditions,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                record_filter=session_filter,
+            )
 
             if not deserialize:
-                return sessions, len(filtered_sessions)
+                return sessions, total_count
 
             if session_type == SessionType.AGENT:
                 return [AgentSession.from_dict(record) for record in sessions]  # type: ignore
@@ -815,36 +1056,31 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while reading the memories.
         """
         try:
-            all_memories = self._get_all_records("memories")
-
-            # Apply filters
-            conditions = {}
-            if user_id is not None:
-                conditions["user_id"] = user_id
-            if agent_id is not None:
-                conditions["agent_id"] = agent_id
-            if team_id is not None:
-                conditions["team_id"] = team_id
-
-            filtered_memories = apply_filters(records=all_memories, conditions=conditions)
-
-            # Apply topic filter
-            if topics is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if any(topic in m.get("topics", []) for topic in topics)
-                ]
-
-            # Apply content search
-            if search_content is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if search_content.lower() in str(m.get("memory", "")).lower()
-                ]
-
-            sorted_memories = apply_sorting(records=filtered_memories, sort_by=sort_by, sort_order=sort_order)
-            paginated_memories = apply_pagination(records=sorted_memories, limit=limit, page=page)
+            memory_filter = None
+            if topics is not None or search_content is not None:
+
+                def memory_filter(memory: Dict[str, Any]) -> bool:
+                    if topics is not None and not any(topic in memory.get("topics", []) for topic in topics):
+                        return False
+                    if (
+                        search_content is not None
+                        and search_content.lower() not in str(memory.get("memory", "")).lower()
+                    ):
+                        return False
+                    return True
+
+            paginated_memories, total_count = self._get_indexed_records(
+                table_type="memories",
+                conditions={"user_id": user_id, "agent_id": agent_id, "team_id": team_id},
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                record_filter=memory_filter,
+            )
 
             if not deserialize:
-                return paginated_memories, len(filtered_memories)
+                return paginated_memories, total_count
 
             return [UserMemory.from_dict(record) for record in paginated_memories]
 
@@ -872,6 +1108,27 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the user memory stats.
         """
         try:
+            if user_id is not None:
+                # A single user's stats can be read from its index alone
+                self._ensure_sorted_indexes("memories")
+                index_key = generate_sorted_index_key(
+                    prefix=self.db_prefix,
+                    table_type="memories",
+                    score_field="updated_at",
+                    index_field="user_id",
+                    index_value=user_id,
+                )
+                total_memories = self.redis_client.zcard(index_key)
+                if not total_memories:
+                    return [], 0
+                last_updated = self.redis_client.zrevrange(index_key, 0, 0, withscores=True)
+                user_stat = {
+                    "user_id": user_id,
+                    "total_memories": total_memories,
+                    "last_memory_updated_at": int(last_updated[0][1]) if last_updated else 0,  # type: ignore
+                }
+                return apply_pagination(records=[user_stat], limit=limit, page=page), 1
+
             all_memories = self._get_all_records("memories")
 
             # Group by user_id
@@ -1006,6 +1263,11 @@ class RedisDb(BaseDb):
                 # Delete all memory keys in a single batch operation
                 self.redis_client.delete(*keys)
 
+            index_pattern = generate_sorted_index_key(prefix=self.db_prefix, table_type="memories", score_field="*")
+            index_keys = list(self.redis_client.scan_iter(match=index_pattern))
+            if index_keys:
+                self.redis_client.delete(*index_keys)
+
         except Exception as e:
             log_error(f"Exception deleting all memories: {e}")
             raise e
@@ -1028,21 +1290,10 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the sessions.
         """
         try:
-            all_sessions = self._get_all_records("sessions")
-
-            # Filter by timestamp if provided
-            if start_timestamp is not None or end_timestamp is not None:
-                filtered_sessions = []
-                for session in all_sessions:
-                    created_at = session.get("created_at", 0)
-                    if start_timestamp is not None and created_at < start_timestamp:
-                        continue
-                    if end_timestamp is not None and created_at > end_timestamp:
-                        continue
-                    filtered_sessions.append(session)
-                return filtered_sessions
-
-            return all_sessions
+            sessions, _ = self._get_indexed_records(
+                table_type="sessions", start_timestamp=start_timestamp, end_timestamp=end_timestamp
+            )
+            return sessions
 
         except Exception as e:
             log_error(f"Error reading sessions for metrics: {e}")
@@ -128,6 +128,16 @@ SPAN_SCHEMA = {
 }
 
 
+# Fields each table keeps sorted set indexes for, so records can be listed and paginated without scanning the keyspace
+SORTED_INDEX_FIELDS = {
+    "sessions": ["user_id", "agent_id", "team_id", "workflow_id", "session_type"],
+    "memories": ["user_id", "agent_id", "team_id"],
+}
+
+# Fields used as scores for the sorted set indexes
+SORTED_INDEX_SCORE_FIELDS = ["created_at", "updated_at"]
+
+
 def get_table_schema_definition(table_type: str) -> dict[str, Any]:
     """
     Get the expected schema definition for the given table.
@@ -3,6 +3,7 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
+from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
@@ -75,6 +76,104 @@ def get_all_keys_for_table(redis_client: Union[Redis, RedisCluster], prefix: str
     return relevant_keys
 
 
+def get_records_by_keys(
+    redis_client: Union[Redis, RedisCluster], keys: List[str], batch_size: int = 500
+) -> List[Optional[Dict[str, Any]]]:
+    """Fetch the given keys with batched MGET calls, preserving the order of the keys.
+
+    Args:
+        redis_client (Redis): The Redis client.
+        keys (List[str]): The keys to fetch.
+        batch_size (int): The maximum number of keys to fetch per MGET call.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: The deserialized records, None for keys that don't exist.
+    """
+    records: List[Optional[Dict[str, Any]]] = []
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start : start + batch_size]
+        # Keys of a cluster can live in different slots, which a plain MGET does not allow
+        if isinstance(redis_client, RedisCluster):
+            values = redis_client.mget_nonatomic(batch)
+        else:
+            values = redis_client.mget(batch)
+        records.extend(deserialize_data(value) if value else None for value in values)  # type: ignore
+
+    return records
+
+
+# -- Sorted set index utils --
+
+
+def generate_sorted_index_key(
+    prefix: str,
+    table_type: str,
+    score_field: str,
+    index_field: Optional[str] = None,
+    index_value: Optional[str] = None,
+) -> str:
+    """Generate Redis key for a sorted set index, scored by the given field.
+
+    Without an index field the key holds every record of the table, otherwise only the records matching the value.
+    """
+    if index_field is None:
+        return f"{prefix}:{table_type}:index:sorted:{score_field}"
+    return f"{prefix}:{table_type}:index:sorted:{score_field}:{index_field}:{index_value}"
+
+
+def generate_index_marker_key(prefix: str, table_type: str) -> str:
+    """Generate Redis key flagging that the sorted set indexes of a table have been built."""
+    return f"{prefix}:{table_type}:index:built"
+
+
+def get_index_value(value: Any) -> str:
+    """Return the string used to represent the given value in an index key."""
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value)
+
+
+def get_index_score(record: Dict[str, Any], score_field: str) -> float:
+    """Return the score of the record in the sorted set indexes of the given field.
+
+    Note:
+        If scoring by "updated_at", will fallback to "created_at" in case of None.
+    """
+    value = get_sort_value(record, score_field)
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def get_sorted_index_entries(
+    prefix: str, table_type: str, record: Dict[str, Any], index_fields: List[str], score_fields: List[str]
+) -> Dict[str, float]:
+    """Return the sorted set index keys the given record belongs to, mapped to the record score in each of them.
+
+    Args:
+        prefix (str): The prefix for the keys.
+        table_type (str): The table type.
+        record (Dict[str, Any]): The record data.
+        index_fields (List[str]): The fields the table is indexed by.
+        score_fields (List[str]): The fields used as scores.
+
+    Returns:
+        Dict[str, float]: The index keys mapped to the record score.
+    """
+    entries: Dict[str, float] = {}
+    for score_field in score_fields:
+        score = get_index_score(record, score_field)
+        entries[generate_sorted_index_key(prefix, table_type, score_field)] = score
+        for field in index_fields:
+            value = record.get(field)
+            if value is not None:
+                index_key = generate_sorted_index_key(prefix, table_type, score_field, field, get_index_value(value))
+                entries[index_key] = score
+
+    return entries
+
+
 # -- DB util methods --
 
 
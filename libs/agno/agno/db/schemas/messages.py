@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from agno.utils.dttm import now_epoch_s, to_epoch_s
+
+
+@dataclass
+class IndexedMessagePair:
+    """Model for a user message and the reply to it, indexed to search messages across sessions"""
+
+    # The id of the user message
+    id: str
+    session_id: str
+    user_message: Dict[str, Any]
+    assistant_message: Dict[str, Any]
+    # Text searched by the index: the content of both messages
+    content: str
+
+    run_id: Optional[str] = None
+    user_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    team_id: Optional[str] = None
+    created_at: Optional[int] = field(default=None)
+
+    def __post_init__(self) -> None:
+        self.created_at = now_epoch_s() if self.created_at is None else to_epoch_s(self.created_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict = {
+            "id": self.id,
+            "session_id": self.session_id,
+            "run_id": self.run_id,
+            "user_id": self.user_id,
+            "agent_id": self.agent_id,
+            "team_id": self.team_id,
+            "user_message": self.user_message,
+            "assistant_message": self.assistant_message,
+            "content": self.content,
+            "created_at": self.created_at,
+        }
+        return {k: v for k, v in _dict.items() if v is not None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexedMessagePair":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
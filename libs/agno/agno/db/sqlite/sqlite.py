@@ -13,6 +13,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.schemas.messages import IndexedMessagePair
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
     apply_sorting,
@@ -25,13 +26,14 @@ from agno.db.sqlite.utils import (
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import deserialize_session_json_fields, get_search_terms, serialize_session_json_fields
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
-    from sqlalchemy import Column, MetaData, String, Table, func, select, text
+    from sqlalchemy import Column, MetaData, String, Table, bindparam, column, func, or_, select, text
+    from sqlalchemy import table as table_clause
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.orm import scoped_session, sessionmaker
@@ -59,6 +61,7 @@ class SqliteDb(BaseDb):
         component_configs_table: Optional[str] = None,
         component_links_table: Optional[str] = None,
         learnings_table: Optional[str] = None,
+        message_index_table: Optional[str] = None,
         id: Optional[str] = None,
     ):
         """
@@ -87,6 +90,7 @@ class SqliteDb(BaseDb):
             component_configs_table (Optional[str]): Name of the table to store component configurations.
             component_links_table (Optional[str]): Name of the table to store component links.
             learnings_table (Optional[str]): Name of the table to store learning records.
+            message_index_table (Optional[str]): Name of the table indexing messages to search them across sessions.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -111,6 +115,7 @@ class SqliteDb(BaseDb):
             component_configs_table=component_configs_table,
             component_links_table=component_links_table,
             learnings_table=learnings_table,
+            message_index_table=message_index_table,
         )
 
         _engine: Optional[Engine] = db_engine
@@ -133,6 +138,8 @@ class SqliteDb(BaseDb):
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
         self.metadata: MetaData = MetaData()
+        # Whether the message index can be searched with FTS5, None until checked
+        self._message_index_fts: Optional[bool] = None
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
@@ -166,6 +173,7 @@ class SqliteDb(BaseDb):
             components_table=data.get("components_table"),
             component_configs_table=data.get("component_configs_table"),
             component_links_table=data.get("component_links_table"),
+            message_index_table=data.get("message_index_table"),
             id=data.get("id"),
         )
 
@@ -519,6 +527,14 @@ class SqliteDb(BaseDb):
             )
             return self.learnings_table
 
+        elif table_type == "message_index":
+            self.message_index_table = self._get_or_create_table(
+                table_name=self.message_index_table_name,
+                table_type="message_index",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.message_index_table
+
         else:
             raise ValueError(f"Unknown table type: '{table_type}'")
 
@@ -614,12 +630,14 @@ class SqliteDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
-                if result.rowcount == 0:
-                    log_debug(f"No session found to deletewith session_id: {session_id}")
-                    return False
-                else:
-                    log_debug(f"Successfully deleted session with session_id: {session_id}")
-                    return True
+            self._delete_indexed_messages(session_ids=[session_id])
+
+            if result.rowcount == 0:
+                log_debug(f"No session found to deletewith session_id: {session_id}")
+                return False
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+                return True
 
         except Exception as e:
             log_error(f"Error deleting session: {e}")
@@ -643,6 +661,7 @@ class SqliteDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+            self._delete_indexed_messages(session_ids=session_ids)
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
@@ -2369,6 +2388,67 @@ class SqliteDb(BaseDb):
             else_=0,
         )
 
+    def _get_trace_dict(self, trace: "Trace") -> Dict[str, Any]:
+        """Get the column values of a trace record."""
+        trace_dict = trace.to_dict()
+        trace_dict.pop("total_spans", None)
+        trace_dict.pop("error_count", None)
+        return trace_dict
+
+    def _get_trace_upsert_stmt(self, table: Table, values: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """Build the upsert statement for one or more trace records."""
+        from sqlalchemy import case
+
+        insert_stmt = sqlite.insert(table).values(values)
+
+        # Build component level expressions for comparing trace priority
+        new_level = self._get_trace_component_level_expr(
+            insert_stmt.excluded.workflow_id,
+            insert_stmt.excluded.team_id,
+            insert_stmt.excluded.agent_id,
+            insert_stmt.excluded.name,
+        )
+        existing_level = self._get_trace_component_level_expr(
+            table.c.workflow_id,
+            table.c.team_id,
+            table.c.agent_id,
+            table.c.name,
+        )
+
+        # Build the ON CONFLICT DO UPDATE clause
+        # Use MIN for start_time, MAX for end_time to capture full trace duration
+        # SQLite stores timestamps as ISO strings, so string comparison works for ISO format
+        # Duration is calculated as: (MAX(end_time) - MIN(start_time)) in milliseconds
+        # SQLite doesn't have epoch extraction, so we calculate duration using julianday
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["trace_id"],
+            set_={
+                "end_time": func.max(table.c.end_time, insert_stmt.excluded.end_time),
+                "start_time": func.min(table.c.start_time, insert_stmt.excluded.start_time),
+                # Calculate duration in milliseconds using julianday (SQLite-specific)
+                # julianday returns days, so multiply by 86400000 to get milliseconds
+                "duration_ms": (
+                    func.julianday(func.max(table.c.end_time, insert_stmt.excluded.end_time))
+                    - func.julianday(func.min(table.c.start_time, insert_stmt.excluded.start_time))
+                )
+                * 86400000,
+                "status": insert_stmt.excluded.status,
+                # Update name only if new trace is from a higher-level component
+                # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
+                "name": case(
+                    (new_level > existing_level, insert_stmt.excluded.name),
+                    else_=table.c.name,
+                ),
+                # Preserve existing non-null context values using COALESCE
+                "run_id": func.coalesce(insert_stmt.excluded.run_id, table.c.run_id),
+                "session_id": func.coalesce(insert_stmt.excluded.session_id, table.c.session_id),
+                "user_id": func.coalesce(insert_stmt.excluded.user_id, table.c.user_id),
+                "agent_id": func.coalesce(insert_stmt.excluded.agent_id, table.c.agent_id),
+                "team_id": func.coalesce(insert_stmt.excluded.team_id, table.c.team_id),
+                "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
+            },
+        )
+
     def upsert_trace(self, trace: "Trace") -> None:
         """Create or update a single trace record in the database.
 
@@ -2378,76 +2458,54 @@ class SqliteDb(BaseDb):
         Args:
             trace: The Trace object to store (one per trace_id).
         """
-        from sqlalchemy import case
-
         try:
             table = self._get_table(table_type="traces", create_table_if_not_found=True)
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
+            trace_dict = self._get_trace_dict(trace)
 
             with self.Session() as sess, sess.begin():
                 # Use upsert to handle concurrent inserts atomically
                 # On conflict, update fields while preserving existing non-null context values
                 # and keeping the earliest start_time
-                insert_stmt = sqlite.insert(table).values(trace_dict)
-
-                # Build component level expressions for comparing trace priority
-                new_level = self._get_trace_component_level_expr(
-                    insert_stmt.excluded.workflow_id,
-                    insert_stmt.excluded.team_id,
-                    insert_stmt.excluded.agent_id,
-                    insert_stmt.excluded.name,
-                )
-                existing_level = self._get_trace_component_level_expr(
-                    table.c.workflow_id,
-                    table.c.team_id,
-                    table.c.agent_id,
-                    table.c.name,
-                )
-
-                # Build the ON CONFLICT DO UPDATE clause
-                # Use MIN for start_time, MAX for end_time to capture full trace duration
-                # SQLite stores timestamps as ISO strings, so string comparison works for ISO format
-                # Duration is calculated as: (MAX(end_time) - MIN(start_time)) in milliseconds
-                # SQLite doesn't have epoch extraction, so we calculate duration using julianday
-                upsert_stmt = insert_stmt.on_conflict_do_update(
-                    index_elements=["trace_id"],
-                    set_={
-                        "end_time": func.max(table.c.end_time, insert_stmt.excluded.end_time),
-                        "start_time": func.min(table.c.start_time, insert_stmt.excluded.start_time),
-                        # Calculate duration in milliseconds using julianday (SQLite-specific)
-                        # julianday returns days, so multiply by 86400000 to get milliseconds
-                        "duration_ms": (
-                            func.julianday(func.max(table.c.end_time, insert_stmt.excluded.end_time))
-                            - func.julianday(func.min(table.c.start_time, insert_stmt.excluded.start_time))
-                        )
-                        * 86400000,
-                        "status": insert_stmt.excluded.status,
-                        # Update name only if new trace is from a higher-level component
-                        # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
-                        "name": case(
-                            (new_level > existing_level, insert_stmt.excluded.name),
-                            else_=table.c.name,
-                        ),
-                        # Preserve existing non-null context values using COALESCE
-                        "run_id": func.coalesce(insert_stmt.excluded.run_id, table.c.run_id),
-                        "session_id": func.coalesce(insert_stmt.excluded.session_id, table.c.session_id),
-                        "user_id": func.coalesce(insert_stmt.excluded.user_id, table.c.user_id),
-                        "agent_id": func.coalesce(insert_stmt.excluded.agent_id, table.c.agent_id),
-                        "team_id": func.coalesce(insert_stmt.excluded.team_id, table.c.team_id),
-                        "workflow_id": func.coalesce(insert_stmt.excluded.workflow_id, table.c.workflow_id),
-                    },
-                )
+                upsert_stmt = self._get_trace_upsert_stmt(table=table, values=trace_dict)
                 sess.execute(upsert_stmt)
 
         except Exception as e:
             log_error(f"Error creating trace: {e}")
             # Don't raise - tracing should not break the main application flow
 
+    def upsert_traces(self, traces: List["Trace"], spans: Optional[List["Span"]] = None) -> None:
+        """Create or update multiple traces, and create their spans, in a single transaction.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of the traces to store.
+
+        Raises:
+            Exception: If the batch could not be written, so the caller can count the lost spans.
+        """
+        if not traces and not spans:
+            return
+
+        try:
+            traces_table = self._get_table(table_type="traces", create_table_if_not_found=True)
+            spans_table = self._get_table(table_type="spans", create_table_if_not_found=True) if spans else None
+            if traces_table is None:
+                return
+
+            with self.Session() as sess, sess.begin():
+                if traces:
+                    trace_dicts = [self._get_trace_dict(trace) for trace in traces]
+                    sess.execute(self._get_trace_upsert_stmt(table=traces_table, values=trace_dicts))
+                if spans and spans_table is not None:
+                    sess.execute(sqlite.insert(spans_table), [span.to_dict() for span in spans])
+
+        except Exception as e:
+            log_error(f"Error creating traces batch: {e}")
+            raise e
+
     def get_trace(
         self,
         trace_id: Optional[str] = None,
@@ -4320,3 +4378,162 @@ class SqliteDb(BaseDb):
         except Exception as e:
             log_debug(f"Error getting learnings: {e}")
             return []
+
+    # -- Message index methods --
+
+    def _ensure_message_index_fts(self) -> bool:
+        """Create the FTS5 table searching the message index, returning False if SQLite was built without FTS5."""
+        if self._message_index_fts is None:
+            try:
+                with self.Session() as sess, sess.begin():
+                    sess.execute(
+                        text(
+                            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{self.message_index_table_name}_fts" '
+                            "USING fts5(content, pair_id UNINDEXED, tokenize='porter unicode61')"
+                        )
+                    )
+                self._message_index_fts = True
+            except Exception as e:
+                log_warning(f"FTS5 not available, messages will be searched without a full-text index: {e}")
+                self._message_index_fts = False
+        return self._message_index_fts
+
+    def _delete_indexed_messages(self, session_ids: List[str]) -> None:
+        """Remove the indexed messages of the given sessions."""
+        table = self._get_table(table_type="message_index")
+        if table is None:
+            return
+
+        use_fts = self._ensure_message_index_fts()
+        with self.Session() as sess, sess.begin():
+            if use_fts:
+                sess.execute(
+                    text(
+                        f'DELETE FROM "{self.message_index_table_name}_fts" WHERE pair_id IN '
+                        f'(SELECT id FROM "{self.message_index_table_name}" WHERE session_id IN :session_ids)'
+                    ).bindparams(bindparam("session_ids", expanding=True)),
+                    {"session_ids": session_ids},
+                )
+            sess.execute(table.delete().where(table.c.session_id.in_(session_ids)))
+
+    def upsert_indexed_messages(self, message_pairs: List[IndexedMessagePair]) -> None:
+        """Add message pairs to the index used to search messages across sessions, replacing those with the same id.
+
+        Args:
+            message_pairs (List[IndexedMessagePair]): The message pairs to index.
+
+        Raises:
+            Exception: If an error occurs during upsert.
+        """
+        if not message_pairs:
+            return
+
+        try:
+            table = self._get_table(table_type="message_index", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            rows = [
+                {
+                    "id": pair.id,
+                    "session_id": pair.session_id,
+                    "run_id": pair.run_id,
+                    "user_id": pair.user_id,
+                    "agent_id": pair.agent_id,
+                    "team_id": pair.team_id,
+                    "user_message": pair.user_message,
+                    "assistant_message": pair.assistant_message,
+                    "content": pair.content,
+                    "created_at": pair.created_at,
+                }
+                for pair in message_pairs
+            ]
+            use_fts = self._ensure_message_index_fts()
+
+            with self.Session() as sess, sess.begin():
+                stmt = sqlite.insert(table).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_=dict(
+                        user_message=stmt.excluded.user_message,
+                        assistant_message=stmt.excluded.assistant_message,
+                        content=stmt.excluded.content,
+                    ),
+                )
+                sess.execute(stmt)
+
+                if use_fts:
+                    fts_table_name = f"{self.message_index_table_name}_fts"
+                    sess.execute(
+                        text(f'DELETE FROM "{fts_table_name}" WHERE pair_id IN :pair_ids').bindparams(
+                            bindparam("pair_ids", expanding=True)
+                        ),
+                        {"pair_ids": [row["id"] for row in rows]},
+                    )
+                    sess.execute(
+                        text(f'INSERT INTO "{fts_table_name}" (content, pair_id) VALUES (:content, :pair_id)'),
+                        [{"content": row["content"], "pair_id": row["id"]} for row in rows],
+                    )
+
+            log_debug(f"Indexed {len(rows)} message pairs")
+
+        except Exception as e:
+            log_error(f"Error upserting indexed messages: {e}")
+            raise e
+
+    def search_indexed_messages(
+        self,
+        query: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[IndexedMessagePair]:
+        """Search the indexed message pairs, using FTS5 when available.
+
+        Args:
+            query (Optional[str]): Text to search for. Pairs are ranked by relevance to it, then by recency.
+                If not provided, the most recent pairs are returned.
+            user_id (Optional[str]): Filter by user ID.
+            agent_id (Optional[str]): Filter by agent ID.
+            limit (int): Maximum number of pairs to return.
+
+        Returns:
+            List[IndexedMessagePair]: The message pairs, best match first.
+
+        Raises:
+            Exception: If an error occurs during search.
+        """
+        try:
+            table = self._get_table(table_type="message_index")
+            if table is None:
+                return []
+
+            stmt = select(table)
+            if user_id is not None:
+                stmt = stmt.where(table.c.user_id == user_id)
+            if agent_id is not None:
+                stmt = stmt.where(table.c.agent_id == agent_id)
+
+            terms = get_search_terms(query) if query else []
+            if terms and self._ensure_message_index_fts():
+                fts_table_name = f"{self.message_index_table_name}_fts"
+                fts_table = table_clause(fts_table_name, column("pair_id"))
+                match = " OR ".join(f'"{term}"' for term in terms)
+                stmt = (
+                    stmt.join(fts_table, fts_table.c.pair_id == table.c.id)
+                    .where(text(f'"{fts_table_name}" MATCH :match').bindparams(match=match))
+                    .order_by(text(f'bm25("{fts_table_name}")'), table.c.created_at.desc())
+                )
+            elif terms:
+                stmt = stmt.where(or_(*[func.lower(table.c.content).contains(term, autoescape=True) for term in terms]))
+                stmt = stmt.order_by(table.c.created_at.desc())
+            else:
+                stmt = stmt.order_by(table.c.created_at.desc())
+
+            with self.Session() as sess:
+                results = sess.execute(stmt.limit(limit)).fetchall()
+            return [IndexedMessagePair.from_dict(dict(row._mapping)) for row in results]
+
+        except Exception as e:
+            log_error(f"Error searching indexed messages: {e}")
+            raise e
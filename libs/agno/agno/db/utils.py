@@ -1,8 +1,9 @@
 """Logic shared across different database implementations"""
 
 import json
+import re
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from agno.models.message import Message
@@ -144,6 +145,11 @@ def deserialize_session_json_fields(session: dict) -> dict:
     return session
 
 
+def get_search_terms(query: str) -> List[str]:
+    """Get the words of a search query, lowercased and without duplicates, to build a full-text search."""
+    return list(dict.fromkeys(re.findall(r"\w+", query.lower())))
+
+
 def db_from_dict(db_data: Dict[str, Any]) -> Optional[Union["BaseDb"]]:
     """
     Create a database instance from a dictionary.
@@ -9,6 +9,8 @@ __all__ = [
     "AgentAsJudgeEvaluation",
     "AgentAsJudgeResult",
     "BaseEval",
+    "LoadEval",
+    "LoadResult",
     "PerformanceEval",
     "PerformanceResult",
     "ReliabilityEval",
@@ -26,6 +28,10 @@ def __getattr__(name: str):
         from agno.eval import agent_as_judge
 
         return getattr(agent_as_judge, name)
+    elif name in ("LoadEval", "LoadResult"):
+        from agno.eval import load
+
+        return getattr(load, name)
     elif name in ("PerformanceEval", "PerformanceResult"):
         from agno.eval import performance
 
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 from agno.agent import Agent
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas.evals import EvalType
-from agno.eval.utils import async_log_eval, log_eval_run, store_result_in_file
+from agno.eval.utils import arun_iterations, async_log_eval, log_eval_run, run_iterations, store_result_in_file
 from agno.exceptions import EvalError
 from agno.models.base import Model
 from agno.team.team import Team
@@ -155,6 +155,10 @@ class AccuracyEval:
     eval_id: str = field(default_factory=lambda: str(uuid4()))
     # Number of iterations to run
     num_iterations: int = 1
+    # Maximum number of iterations running at the same time
+    concurrency: int = 1
+    # Maximum duration of an iteration in seconds. Iterations that time out are left out of the results
+    iteration_timeout: Optional[float] = None
     # Result of the evaluation
     result: Optional[AccuracyResult] = None
 
@@ -322,6 +326,82 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             logger.exception(f"Failed to evaluate accuracy asynchronously: {e}")
             return None
 
+    def _run_iteration(
+        self, i: int, evaluator_agent: Agent, eval_input: str, eval_expected_output: str
+    ) -> Optional[AccuracyEvaluation]:
+        """Run the Agent or Team on the eval input and evaluate its answer, for the iteration i."""
+        agent_session_id = f"eval_{self.eval_id}_{i + 1}"
+
+        output = None
+        if self.agent is not None:
+            agent_response = self.agent.run(input=eval_input, session_id=agent_session_id, stream=False)
+            output = agent_response.content
+        elif self.team is not None:
+            team_response = self.team.run(input=eval_input, session_id=agent_session_id, stream=False)
+            output = team_response.content
+
+        if not output:
+            logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{i + 1}: {output}")
+        result = self.evaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+        )
+        if result is None:
+            logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
+        return result
+
+    async def _arun_iteration(
+        self, i: int, evaluator_agent: Agent, eval_input: str, eval_expected_output: str
+    ) -> Optional[AccuracyEvaluation]:
+        """Run the Agent or Team on the eval input and evaluate its answer asynchronously, for the iteration i."""
+        agent_session_id = f"eval_{self.eval_id}_{i + 1}"
+
+        output = None
+        if self.agent is not None:
+            agent_response = await self.agent.arun(input=eval_input, session_id=agent_session_id, stream=False)
+            output = agent_response.content
+        elif self.team is not None:
+            team_response = await self.team.arun(input=eval_input, session_id=agent_session_id, stream=False)
+            output = team_response.content
+
+        if not output:
+            logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{i + 1}: {output}")
+        result = await self.aevaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+        )
+        if result is None:
+            logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
+        return result
+
+    def _get_evaluation_input(self, eval_input: str, eval_expected_output: str, output: str) -> str:
+        """Return the input given to the evaluator agent"""
+        return dedent(f"""\
+            <agent_input>
+            {eval_input}
+            </agent_input>
+
+            <expected_output>
+            {eval_expected_output}
+            </expected_output>
+
+            <agent_output>
+            {output}
+            </agent_output>\
+            """)
+
     def run(
         self,
         *,
@@ -356,53 +436,27 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             eval_input = self.get_eval_input()
             eval_expected_output = self.get_eval_expected_output()
 
-            for i in range(self.num_iterations):
-                status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
-                live_log.update(status)
-
-                agent_session_id = f"eval_{self.eval_id}_{i + 1}"
-
-                if self.agent is not None:
-                    agent_response = self.agent.run(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = agent_response.content
-                elif self.team is not None:
-                    team_response = self.team.run(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = team_response.content
-
-                if not output:
-                    logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = self.evaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
+            def run_iteration(i: int) -> Optional[AccuracyEvaluation]:
+                live_log.update(
+                    Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
                 )
+                return self._run_iteration(
+                    i, evaluator_agent=evaluator_agent, eval_input=eval_input, eval_expected_output=eval_expected_output
+                )
+
+            # Iterations are independent, so they can run concurrently. Results keep the order of the iterations.
+            results = run_iterations(
+                run_iteration,
+                self.num_iterations,
+                concurrency=self.concurrency,
+                timeout=self.iteration_timeout,
+            )
+            for i, result in enumerate(results):
                 if result is None:
-                    logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
                     continue
-
                 self.result.results.append(result)
                 self.result.compute_stats()
-                status.update(f"Eval iteration {i + 1} finished")
-
-            status.stop()
+                logger.debug(f"Eval iteration {i + 1} finished")
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
@@ -501,53 +555,27 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             eval_input = self.get_eval_input()
             eval_expected_output = self.get_eval_expected_output()
 
-            for i in range(self.num_iterations):
-                status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
-                live_log.update(status)
-
-                agent_session_id = f"eval_{self.eval_id}_{i + 1}"
-
-                if self.agent is not None:
-                    agent_response = await self.agent.arun(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = agent_response.content
-                elif self.team is not None:
-                    team_response = await self.team.arun(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = team_response.content
-
-                if not output:
-                    logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = await self.aevaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
+            async def run_iteration(i: int) -> Optional[AccuracyEvaluation]:
+                live_log.update(
+                    Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
+                )
+                return await self._arun_iteration(
+                    i, evaluator_agent=evaluator_agent, eval_input=eval_input, eval_expected_output=eval_expected_output
                 )
+
+            # Iterations are independent, so they can run concurrently. Results keep the order of the iterations.
+            results = await arun_iterations(
+                run_iteration,
+                self.num_iterations,
+                concurrency=self.concurrency,
+                timeout=self.iteration_timeout,
+            )
+            for i, result in enumerate(results):
                 if result is None:
-                    logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
                     continue
-
                 self.result.results.append(result)
                 self.result.compute_stats()
-                status.update(f"Eval iteration {i + 1} finished")
-
-            status.stop()
+                logger.debug(f"Eval iteration {i + 1} finished")
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
@@ -632,19 +660,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         eval_input = self.get_eval_input()
         eval_expected_output = self.get_eval_expected_output()
 
-        evaluation_input = dedent(f"""\
-            <agent_input>
-            {eval_input}
-            </agent_input>
-
-            <expected_output>
-            {eval_expected_output}
-            </expected_output>
-
-            <agent_output>
-            {output}
-            </agent_output>\
-            """)
+        evaluation_input = self._get_evaluation_input(eval_input, eval_expected_output, output)
 
         result = self.evaluate_answer(
             input=eval_input,
@@ -755,19 +771,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         eval_input = self.get_eval_input()
         eval_expected_output = self.get_eval_expected_output()
 
-        evaluation_input = dedent(f"""\
-            <agent_input>
-            {eval_input}
-            </agent_input>
-
-            <expected_output>
-            {eval_expected_output}
-            </expected_output>
-
-            <agent_output>
-            {output}
-            </agent_output>\
-            """)
+        evaluation_input = self._get_evaluation_input(eval_input, eval_expected_output, output)
 
         result = await self.aevaluate_answer(
             input=eval_input,
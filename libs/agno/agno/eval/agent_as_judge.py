@@ -11,7 +11,7 @@ from agno.agent import Agent
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas.evals import EvalType
 from agno.eval.base import BaseEval
-from agno.eval.utils import async_log_eval, log_eval_run, store_result_in_file
+from agno.eval.utils import arun_iterations, async_log_eval, log_eval_run, run_iterations, store_result_in_file
 from agno.exceptions import EvalError
 from agno.models.base import Model
 from agno.run.agent import RunInput, RunOutput
@@ -188,6 +188,12 @@ class AgentAsJudgeEval(BaseEval):
     telemetry: bool = True
     run_in_background: bool = False
 
+    # Batch options
+    # Maximum number of cases evaluated at the same time
+    concurrency: int = 1
+    # Maximum duration of the evaluation of a case in seconds. Cases that time out are left out of the results
+    case_timeout: Optional[float] = None
+
     def __post_init__(self):
         """Validate scoring_strategy and threshold."""
         if self.scoring_strategy == "numeric" and not 1 <= self.threshold <= 10:
@@ -661,17 +667,19 @@ class AgentAsJudgeEval(BaseEval):
         with Live(console=console, transient=True) as live_log:
             evaluator = self.get_evaluator_agent()
 
-            for i, case in enumerate(cases):
-                status = Status(f"Evaluating {i + 1}/{len(cases)}...", spinner="dots")
-                live_log.update(status)
+            def evaluate_case(i: int) -> Optional[AgentAsJudgeEvaluation]:
+                live_log.update(Status(f"Evaluating {i + 1}/{len(cases)}...", spinner="dots"))
+                return self._evaluate(input=cases[i]["input"], output=cases[i]["output"], evaluator_agent=evaluator)
 
-                evaluation = self._evaluate(input=case["input"], output=case["output"], evaluator_agent=evaluator)
+            # Cases are independent, so they can be evaluated concurrently. Results keep the order of the cases.
+            evaluations = run_iterations(
+                evaluate_case, len(cases), concurrency=self.concurrency, timeout=self.case_timeout
+            )
+            for evaluation in evaluations:
                 if evaluation:
                     result.results.append(evaluation)
                     result.compute_stats()
 
-            status.stop()
-
         # Save result to file
         if self.file_path_to_save_results:
             store_result_in_file(
@@ -729,19 +737,21 @@ class AgentAsJudgeEval(BaseEval):
         with Live(console=console, transient=True) as live_log:
             evaluator = self.get_evaluator_agent()
 
-            for i, case in enumerate(cases):
-                status = Status(f"Evaluating {i + 1}/{len(cases)}...", spinner="dots")
-                live_log.update(status)
-
-                evaluation = await self._aevaluate(
-                    input=case["input"], output=case["output"], evaluator_agent=evaluator
+            async def evaluate_case(i: int) -> Optional[AgentAsJudgeEvaluation]:
+                live_log.update(Status(f"Evaluating {i + 1}/{len(cases)}...", spinner="dots"))
+                return await self._aevaluate(
+                    input=cases[i]["input"], output=cases[i]["output"], evaluator_agent=evaluator
                 )
+
+            # Cases are independent, so they can be evaluated concurrently. Results keep the order of the cases.
+            evaluations = await arun_iterations(
+                evaluate_case, len(cases), concurrency=self.concurrency, timeout=self.case_timeout
+            )
+            for evaluation in evaluations:
                 if evaluation:
                     result.results.append(evaluation)
                     result.compute_stats()
 
-                status.stop()
-
         # Save result to file
         if self.file_path_to_save_results:
             store_result_in_file(
@@ -0,0 +1,379 @@
+import sys
+from dataclasses import dataclass, field
+from os import getenv
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from agno.agent import Agent
+from agno.eval.utils import arun_iterations, run_iterations, store_result_in_file
+from agno.run.base import RunStatus
+from agno.team.team import Team
+from agno.utils.log import log_debug, log_warning, set_log_level_to_debug, set_log_level_to_info
+from agno.utils.timer import record_phase_times
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from agno.workflow.workflow import Workflow
+
+# Events carrying the content streamed by a run, used to measure the time to first token
+_CONTENT_EVENTS = {"RunContent", "TeamRunContent"}
+
+
+def _percentile(data: List[float], percentile: float) -> float:
+    """Get the value under which `percentile` percent of the data falls (nearest rank), 0 for no data."""
+    if not data:
+        return 0.0
+    data_sorted = sorted(data)
+    index = min(len(data_sorted) - 1, max(0, int(round(percentile / 100 * len(data_sorted))) - 1))
+    return data_sorted[index]
+
+
+def get_peak_rss() -> Optional[float]:
+    """Get the peak resident set size of the process in MiB, None where it can't be measured."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in KiB on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class LoadResult:
+    """
+    Holds the throughput and latency statistics of runs executed concurrently.
+    Latencies are in seconds, and phase times are the seconds each run spent in model requests ("model"),
+    tool calls ("tools") and everything else ("other": prompt building, DB reads and writes, hooks...).
+    """
+
+    # Configuration of the load test
+    config: Dict[str, Any] = field(default_factory=dict)
+
+    # Wall-clock duration of the measured runs in seconds
+    duration: float = 0.0
+    # Latency of each successful run, in the order of the runs
+    latencies: List[float] = field(default_factory=list)
+    # Time to the first content event of each successful streamed run
+    times_to_first_token: List[float] = field(default_factory=list)
+    # Time spent in each phase, for each successful run
+    phase_times: Dict[str, List[float]] = field(default_factory=dict)
+    # Runs that failed or timed out
+    num_errors: int = 0
+    # Peak resident set size of the process in MiB
+    peak_rss: Optional[float] = None
+
+    num_runs: int = field(init=False)
+    throughput: float = field(init=False)
+    avg_latency: float = field(init=False)
+    min_latency: float = field(init=False)
+    max_latency: float = field(init=False)
+    p50_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+    p99_latency: float = field(init=False)
+    p50_time_to_first_token: Optional[float] = field(init=False)
+    p95_time_to_first_token: Optional[float] = field(init=False)
+    avg_phase_times: Dict[str, float] = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        """Compute the throughput and the latency statistics."""
+        import statistics
+
+        self.num_runs = len(self.latencies) + self.num_errors
+        # Successful runs per second
+        self.throughput = len(self.latencies) / self.duration if self.duration > 0 else 0.0
+
+        self.avg_latency = statistics.mean(self.latencies) if self.latencies else 0.0
+        self.min_latency = min(self.latencies) if self.latencies else 0.0
+        self.max_latency = max(self.latencies) if self.latencies else 0.0
+        self.p50_latency = _percentile(self.latencies, 50)
+        self.p95_latency = _percentile(self.latencies, 95)
+        self.p99_latency = _percentile(self.latencies, 99)
+
+        self.p50_time_to_first_token = _percentile(self.times_to_first_token, 50) if self.times_to_first_token else None
+        self.p95_time_to_first_token = _percentile(self.times_to_first_token, 95) if self.times_to_first_token else None
+        self.avg_phase_times = {
+            phase: statistics.mean(times) for phase, times in self.phase_times.items() if len(times) > 0
+        }
+
+    def print_summary(self, console: Optional["Console"] = None):
+        """Print a summary table of the computed stats."""
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(title="Load Test Summary", show_header=True, header_style="bold magenta")
+        summary_table.add_column("Metric", style="cyan")
+        summary_table.add_column("Value", style="green")
+
+        summary_table.add_row("Runs", f"{self.num_runs}")
+        summary_table.add_row("Errors", f"{self.num_errors}")
+        summary_table.add_row("Concurrency", f"{self.config.get('concurrency')}")
+        summary_table.add_row("Duration (seconds)", f"{self.duration:.3f}")
+        summary_table.add_row("Throughput (runs/second)", f"{self.throughput:.3f}")
+        summary_table.add_row("Average latency", f"{self.avg_latency:.6f}")
+        summary_table.add_row("p50 latency", f"{self.p50_latency:.6f}")
+        summary_table.add_row("p95 latency", f"{self.p95_latency:.6f}")
+        summary_table.add_row("p99 latency", f"{self.p99_latency:.6f}")
+        if self.p50_time_to_first_token is not None:
+            summary_table.add_row("p50 time to first token", f"{self.p50_time_to_first_token:.6f}")
+        if self.p95_time_to_first_token is not None:
+            summary_table.add_row("p95 time to first token", f"{self.p95_time_to_first_token:.6f}")
+        for phase, avg_time in self.avg_phase_times.items():
+            summary_table.add_row(f"Average {phase} time", f"{avg_time:.6f}")
+        if self.peak_rss is not None:
+            summary_table.add_row("Peak RSS (MiB)", f"{self.peak_rss:.1f}")
+
+        console.print(summary_table)
+
+
+# Latency, time to first token and phase times of a successful run
+_RunTimes = Tuple[float, Optional[float], Dict[str, float]]
+
+
+@dataclass
+class LoadEval:
+    """
+    Evaluate the throughput and latency of an Agent, Team or Workflow under concurrent runs.
+
+    - Runs are executed `concurrency` at a time, in threads for run() and as tasks for arun().
+    - Use a `MockModel` to measure the overhead of the framework with a deterministic model latency.
+    - Runs are spread over `num_sessions` sessions, so the history of the sessions grows with the runs.
+    - Results can be saved as JSON with `file_path_to_save_results`, to track regressions.
+    - Disable telemetry on the evaluated component, so its requests are not measured.
+    """
+
+    # Agent to evaluate
+    agent: Optional[Agent] = None
+    # Team to evaluate
+    team: Optional[Team] = None
+    # Workflow to evaluate
+    workflow: Optional["Workflow"] = None
+    # Input of the runs, or a function returning the input of the run with the given index
+    input: Union[str, Callable[[int], str]] = "Hello"
+
+    # Evaluation name
+    name: Optional[str] = None
+    # Evaluation UUID
+    eval_id: str = field(default_factory=lambda: str(uuid4()))
+    # Number of measured runs
+    num_runs: int = 100
+    # Maximum number of runs executing at the same time
+    concurrency: int = 10
+    # Number of warm-up runs (not included in the results)
+    warmup_runs: int = 0
+    # Number of sessions the runs are spread over (None = a new session for each run)
+    num_sessions: Optional[int] = None
+    # Stream the runs, measuring the time to first token
+    stream: bool = False
+    # Maximum duration of a run in seconds. Runs that time out are counted as errors
+    run_timeout: Optional[float] = None
+    # Result of the evaluation
+    result: Optional[LoadResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # If set, results will be saved in the given file path
+    file_path_to_save_results: Optional[str] = None
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+
+    def _get_component(self) -> Union[Agent, Team, "Workflow"]:
+        components = [c for c in (self.agent, self.team, self.workflow) if c is not None]
+        if len(components) != 1:
+            raise ValueError("Provide exactly one of 'agent', 'team' or 'workflow' to run the evaluation.")
+        return components[0]
+
+    def _get_input(self, index: int) -> str:
+        return self.input(index) if callable(self.input) else self.input
+
+    def _get_session_id(self, index: int) -> str:
+        if index < 0:
+            return f"load_{self.eval_id}_warmup_{-index}"
+        if self.num_sessions:
+            return f"load_{self.eval_id}_{index % self.num_sessions}"
+        return f"load_{self.eval_id}_{index}"
+
+    def _get_config(self) -> Dict[str, Any]:
+        from agno import __version__ as agno_version
+
+        component = self._get_component()
+        model = getattr(component, "model", None)
+        return {
+            "name": self.name,
+            "component": type(component).__name__,
+            "component_name": getattr(component, "name", None),
+            "model_id": model.id if model is not None else None,
+            "model_provider": model.provider if model is not None else None,
+            "num_runs": self.num_runs,
+            "concurrency": self.concurrency,
+            "warmup_runs": self.warmup_runs,
+            "num_sessions": self.num_sessions,
+            "stream": self.stream,
+            "python_version": sys.version.split()[0],
+            "agno_version": agno_version,
+        }
+
+    def _run_once(self, index: int) -> Optional[_RunTimes]:
+        """Execute the run with the given index, returning None if it failed."""
+        component = self._get_component()
+        time_to_first_token = None
+        try:
+            with record_phase_times() as phase_times:
+                start = perf_counter()
+                if self.stream:
+                    for event in component.run(  # type: ignore[call-overload]
+                        input=self._get_input(index), session_id=self._get_session_id(index), stream=True
+                    ):
+                        if time_to_first_token is None and getattr(event, "event", None) in _CONTENT_EVENTS:
+                            time_to_first_token = perf_counter() - start
+                else:
+                    output = component.run(  # type: ignore[call-overload]
+                        input=self._get_input(index), session_id=self._get_session_id(index)
+                    )
+                    if getattr(output, "status", None) == RunStatus.error:
+                        log_warning(f"Run {index + 1} failed: {output.content}")
+                        return None
+                latency = perf_counter() - start
+        except Exception as e:
+            log_warning(f"Run {index + 1} failed: {e}")
+            return None
+        return latency, time_to_first_token, dict(phase_times)
+
+    async def _arun_once(self, index: int) -> Optional[_RunTimes]:
+        """Execute the run with the given index asynchronously, returning None if it failed."""
+        component = self._get_component()
+        time_to_first_token = None
+        try:
+            with record_phase_times() as phase_times:
+                start = perf_counter()
+                if self.stream:
+                    async for event in component.arun(  # type: ignore[call-overload]
+                        input=self._get_input(index), session_id=self._get_session_id(index), stream=True
+                    ):
+                        if time_to_first_token is None and getattr(event, "event", None) in _CONTENT_EVENTS:
+                            time_to_first_token = perf_counter() - start
+                else:
+                    output = await component.arun(  # type: ignore[call-overload]
+                        input=self._get_input(index), session_id=self._get_session_id(index)
+                    )
+                    if getattr(output, "status", None) == RunStatus.error:
+                        log_warning(f"Run {index + 1} failed: {output.content}")
+                        return None
+                latency = perf_counter() - start
+        except Exception as e:
+            log_warning(f"Run {index + 1} failed: {e}")
+            return None
+        return latency, time_to_first_token, dict(phase_times)
+
+    def _build_result(self, run_times: List[Optional[_RunTimes]], duration: float) -> LoadResult:
+        latencies: List[float] = []
+        times_to_first_token: List[float] = []
+        phase_times: Dict[str, List[float]] = {"model": [], "tools": [], "other": []}
+        for times in run_times:
+            if times is None:
+                continue
+            latency, time_to_first_token, run_phase_times = times
+            latencies.append(latency)
+            if time_to_first_token is not None:
+                times_to_first_token.append(time_to_first_token)
+            model_time = run_phase_times.get("model", 0.0)
+            tools_time = run_phase_times.get("tools", 0.0)
+            phase_times["model"].append(model_time)
+            phase_times["tools"].append(tools_time)
+            # Tool calls running in parallel can add up to more than the latency
+            phase_times["other"].append(max(0.0, latency - model_time - tools_time))
+
+        return LoadResult(
+            config=self._get_config(),
+            duration=duration,
+            latencies=latencies,
+            times_to_first_token=times_to_first_token,
+            phase_times=phase_times,
+            num_errors=sum(1 for times in run_times if times is None),
+            peak_rss=get_peak_rss(),
+        )
+
+    def _finish(self, print_summary: bool) -> None:
+        if self.result is None:
+            return
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.result,
+            )
+        if self.print_summary or print_summary:
+            self.result.print_summary()
+
+    def run(self, *, print_summary: bool = False) -> LoadResult:
+        """
+        Run the load test.
+        1. Do optional warm-up runs.
+        2. Execute the measured runs, `concurrency` at a time, in threads
+        3. Collect results
+        4. Save and print results as requested
+        """
+        self._get_component()
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+        log_debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        # 1. Do optional warm-up runs.
+        if self.warmup_runs > 0:
+            run_iterations(lambda i: self._run_once(-i - 1), self.warmup_runs, concurrency=self.concurrency)
+
+        # 2. Execute the measured runs
+        start = perf_counter()
+        run_times = run_iterations(
+            self._run_once, self.num_runs, concurrency=self.concurrency, timeout=self.run_timeout
+        )
+        duration = perf_counter() - start
+
+        # 3. Collect results
+        self.result = self._build_result(run_times, duration)
+
+        # 4. Save and print results as requested
+        self._finish(print_summary)
+
+        log_debug(f"*********** Load Test End: {self.eval_id} ***********")
+        return self.result
+
+    async def arun(self, *, print_summary: bool = False) -> LoadResult:
+        """
+        Run the load test asynchronously.
+        1. Do optional warm-up runs.
+        2. Execute the measured runs, `concurrency` at a time, as tasks
+        3. Collect results
+        4. Save and print results as requested
+        """
+        self._get_component()
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+        log_debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        # 1. Do optional warm-up runs.
+        if self.warmup_runs > 0:
+            await arun_iterations(lambda i: self._arun_once(-i - 1), self.warmup_runs, concurrency=self.concurrency)
+
+        # 2. Execute the measured runs
+        start = perf_counter()
+        run_times = await arun_iterations(
+            self._arun_once, self.num_runs, concurrency=self.concurrency, timeout=self.run_timeout
+        )
+        duration = perf_counter() - start
+
+        # 3. Collect results
+        self.result = self._build_result(run_times, duration)
+
+        # 4. Save and print results as requested
+        self._finish(print_summary)
+
+        log_debug(f"*********** Load Test End: {self.eval_id} ***********")
+        return self.result
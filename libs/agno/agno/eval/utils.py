@@ -1,17 +1,26 @@
+import asyncio
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextvars import copy_context
 from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from time import monotonic
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas.evals import EvalRunRecord, EvalType
-from agno.utils.log import log_debug, logger
+from agno.utils.log import log_debug, log_warning, logger
 
 if TYPE_CHECKING:
     from agno.eval.accuracy import AccuracyResult
     from agno.eval.agent_as_judge import AgentAsJudgeResult
+    from agno.eval.load import LoadResult
     from agno.eval.performance import PerformanceResult
     from agno.eval.reliability import ReliabilityResult
 
+T = TypeVar("T")
+
 
 def log_eval_run(
     db: BaseDb,
@@ -104,7 +113,7 @@ async def async_log_eval(
 
 def store_result_in_file(
     file_path: str,
-    result: Union["AccuracyResult", "AgentAsJudgeResult", "PerformanceResult", "ReliabilityResult"],
+    result: Union["AccuracyResult", "AgentAsJudgeResult", "LoadResult", "PerformanceResult", "ReliabilityResult"],
     eval_id: Optional[str] = None,
     name: Optional[str] = None,
 ):
@@ -118,3 +127,117 @@ def store_result_in_file(
         fn_path.write_text(json.dumps(asdict(result), indent=4))
     except Exception as e:
         logger.warning(f"Failed to save result to file: {e}")
+
+
+def _start_thread(fn: Callable[[], T]) -> "Future[T]":
+    """Run fn in a daemon thread, with the context of the caller"""
+    future: "Future[T]" = Future()
+    context = copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(fn))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="agno-eval-iteration", daemon=True).start()
+    return future
+
+
+def run_iterations(
+    fn: Callable[[int], T],
+    num_iterations: int,
+    concurrency: int = 1,
+    timeout: Optional[float] = None,
+) -> List[Optional[T]]:
+    """Call fn(i) for each iteration i, running up to `concurrency` iterations at a time in threads.
+
+    Args:
+        fn: Function running one iteration, given its index.
+        num_iterations: Number of iterations to run.
+        concurrency: Maximum number of iterations running at the same time. With 1 and no timeout, the iterations
+            run one after the other in the calling thread.
+        timeout: Maximum duration of an iteration in seconds. Threads can't be interrupted, so an iteration that
+            times out keeps running in the background, but its slot is given to the next iteration and its result
+            is discarded.
+
+    Returns:
+        The result of each iteration in the order of the iterations, None for the iterations that timed out.
+        The first error raised by an iteration is raised once it completes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    results: List[Optional[T]] = [None] * num_iterations
+    if concurrency == 1 and timeout is None:
+        for index in range(num_iterations):
+            results[index] = fn(index)
+        return results
+
+    next_index = 0
+    # Index and start time of the iterations running
+    running: Dict["Future[T]", Tuple[int, float]] = {}
+    while next_index < num_iterations or running:
+        while next_index < num_iterations and len(running) < concurrency:
+            running[_start_thread(partial(fn, next_index))] = (next_index, monotonic())
+            next_index += 1
+
+        wait_timeout = None
+        if timeout is not None:
+            wait_timeout = max(0.0, min(started_at for _, started_at in running.values()) + timeout - monotonic())
+        done, _ = wait(running, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, _ = running.pop(future)
+            results[index] = future.result()
+
+        if timeout is not None:
+            now = monotonic()
+            for future, (index, started_at) in list(running.items()):
+                if now - started_at >= timeout:
+                    del running[future]
+                    log_warning(f"Iteration {index + 1} timed out after {timeout}s")
+    return results
+
+
+async def arun_iterations(
+    fn: Callable[[int], Awaitable[T]],
+    num_iterations: int,
+    concurrency: int = 1,
+    timeout: Optional[float] = None,
+) -> List[Optional[T]]:
+    """Await fn(i) for each iteration i, running up to `concurrency` iterations at a time.
+
+    Args:
+        fn: Coroutine function running one iteration, given its index.
+        num_iterations: Number of iterations to run.
+        concurrency: Maximum number of iterations running at the same time.
+        timeout: Maximum duration of an iteration in seconds. Iterations that time out are cancelled.
+
+    Returns:
+        The result of each iteration in the order of the iterations, None for the iterations that timed out.
+        If an iteration raises an error, the other iterations are cancelled and the error is raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_iteration(index: int) -> Optional[T]:
+        async with semaphore:
+            if timeout is None:
+                return await fn(index)
+            try:
+                return await asyncio.wait_for(fn(index), timeout=timeout)
+            except asyncio.TimeoutError:
+                log_warning(f"Iteration {index + 1} timed out after {timeout}s")
+                return None
+
+    tasks = [asyncio.ensure_future(run_iteration(index)) for index in range(num_iterations)]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
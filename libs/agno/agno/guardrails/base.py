@@ -6,7 +6,13 @@ from agno.run.team import TeamRunInput
 
 
 class BaseGuardrail(ABC):
-    """Abstract base class for all guardrail implementations."""
+    """Abstract base class for all guardrail implementations.
+
+    Guardrails that only inspect the run input, without modifying it, should set `read_only` to True. Read-only
+    guardrails run concurrently with each other and, when enabled on the agent, alongside the first model request.
+    """
+
+    read_only: bool = False
 
     @abstractmethod
     def check(self, run_input: Union[RunInput, TeamRunInput]) -> None:
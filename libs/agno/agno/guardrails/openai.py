@@ -23,6 +23,8 @@ class OpenAIModerationGuardrail(BaseGuardrail):
         api_key (str): The API key to use for moderation. Defaults to the OPENAI_API_KEY environment variable.
     """
 
+    read_only = True
+
     def __init__(
         self,
         moderation_model: str = "omni-moderation-latest",
@@ -31,6 +31,8 @@ class PIIDetectionGuardrail(BaseGuardrail):
         import re
 
         self.mask_pii = mask_pii
+        # Masking modifies the input, so the check can't run alongside other checks
+        self.read_only = not mask_pii
         self.pii_patterns = {}
 
         if enable_ssn_check:
@@ -13,6 +13,8 @@ class PromptInjectionGuardrail(BaseGuardrail):
         injection_patterns (Optional[List[str]]): A list of patterns to check for. Defaults to a list of common prompt injection patterns.
     """
 
+    read_only = True
+
     def __init__(self, injection_patterns: Optional[List[str]] = None):
         self.injection_patterns = injection_patterns or [
             "ignore previous instructions",
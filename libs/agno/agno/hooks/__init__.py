@@ -1,3 +1,3 @@
-from agno.hooks.decorator import hook, should_run_in_background
+from agno.hooks.decorator import hook, is_read_only, should_run_in_background
 
-__all__ = ["hook", "should_run_in_background"]
+__all__ = ["hook", "is_read_only", "should_run_in_background"]
@@ -7,6 +7,9 @@ F = TypeVar("F", bound=Callable[..., Any])
 # Attribute name used to mark hooks for background execution
 HOOK_RUN_IN_BACKGROUND_ATTR = "_agno_run_in_background"
 
+# Attribute name used to mark hooks that don't modify their arguments
+HOOK_READ_ONLY_ATTR = "_agno_read_only"
+
 
 def _is_async_function(func: Callable) -> bool:
     """
@@ -46,6 +49,7 @@ def hook() -> Callable[[F], F]: ...
 def hook(
     *,
     run_in_background: bool = False,
+    read_only: bool = False,
 ) -> Callable[[F], F]: ...
 
 
@@ -61,6 +65,8 @@ def hook(*args, **kwargs) -> Union[F, Callable[[F], F]]:
                           when background_tasks is available, regardless of the agent/team's
                           run_hooks_in_background setting. This allows per-hook control over
                           background execution.  This is only use-able when running with AgentOS.
+        read_only: If True, this pre-hook only inspects its arguments and doesn't modify them. Consecutive
+                   read-only pre-hooks run concurrently with each other.
 
     Returns:
         Union[F, Callable[[F], F]]: Decorated function or decorator
@@ -86,13 +92,18 @@ def hook(*args, **kwargs) -> Union[F, Callable[[F], F]]:
             # Async hooks also supported
             await send_async_notification(run_output.content)
 
+        @hook(read_only=True)
+        async def my_input_check(run_input):
+            # Runs concurrently with other read-only pre-hooks
+            await validate(run_input.input_content)
+
         agent = Agent(
             model=OpenAIChat(id="gpt-4o"),
             post_hooks=[my_hook, my_background_hook],
         )
     """
     # Valid kwargs for the hook decorator
-    VALID_KWARGS = frozenset({"run_in_background"})
+    VALID_KWARGS = frozenset({"run_in_background", "read_only"})
 
     # Validate kwargs
     invalid_kwargs = set(kwargs.keys()) - VALID_KWARGS
@@ -108,6 +119,7 @@ def hook(*args, **kwargs) -> Union[F, Callable[[F], F]]:
         # Use OR logic: if any decorator sets run_in_background=True, it stays True
         existing_run_in_background = should_run_in_background(func)
         final_run_in_background = run_in_background or existing_run_in_background
+        final_read_only = kwargs.get("read_only", False) or is_read_only(func)
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -125,6 +137,7 @@ def hook(*args, **kwargs) -> Union[F, Callable[[F], F]]:
 
         # Set the background execution attribute (combined from all decorators)
         setattr(wrapper, HOOK_RUN_IN_BACKGROUND_ATTR, final_run_in_background)
+        setattr(wrapper, HOOK_READ_ONLY_ATTR, final_read_only)
 
         return wrapper  # type: ignore
 
@@ -135,6 +148,26 @@ def hook(*args, **kwargs) -> Union[F, Callable[[F], F]]:
     return decorator
 
 
+def _get_hook_attr(hook_func: Callable, attr: str) -> bool:
+    """Get a hook attribute, traversing the wrapper chain when multiple decorators are stacked."""
+    # Check the function directly first
+    if hasattr(hook_func, attr):
+        return getattr(hook_func, attr)
+
+    # Traverse the wrapper chain to find the attribute
+    current = hook_func
+    seen: set[int] = set()
+    while hasattr(current, "__wrapped__"):
+        if id(current) in seen:
+            break
+        seen.add(id(current))
+        current = current.__wrapped__
+        if hasattr(current, attr):
+            return getattr(current, attr)
+
+    return False
+
+
 def should_run_in_background(hook_func: Callable) -> bool:
     """
     Check if a hook function is marked to run in background.
@@ -146,19 +179,18 @@ def should_run_in_background(hook_func: Callable) -> bool:
     Returns:
         True if the hook is decorated with @hook(run_in_background=True)
     """
-    # Check the function directly first
-    if hasattr(hook_func, HOOK_RUN_IN_BACKGROUND_ATTR):
-        return getattr(hook_func, HOOK_RUN_IN_BACKGROUND_ATTR)
+    return _get_hook_attr(hook_func, HOOK_RUN_IN_BACKGROUND_ATTR)
 
-    # Traverse the wrapper chain to find the attribute
-    current = hook_func
-    seen: set[int] = set()
-    while hasattr(current, "__wrapped__"):
-        if id(current) in seen:
-            break
-        seen.add(id(current))
-        current = current.__wrapped__
-        if hasattr(current, HOOK_RUN_IN_BACKGROUND_ATTR):
-            return getattr(current, HOOK_RUN_IN_BACKGROUND_ATTR)
 
-    return False
+def is_read_only(hook_func: Callable) -> bool:
+    """
+    Check if a hook function is marked as read-only.
+    Traverses the wrapper chain to find the attribute when multiple decorators are stacked.
+
+    Args:
+        hook_func: The hook function to check
+
+    Returns:
+        True if the hook is decorated with @hook(read_only=True)
+    """
+    return _get_hook_attr(hook_func, HOOK_READ_ONLY_ATTR)
@@ -7,19 +7,23 @@ Implements the KnowledgeProtocol and provides three tools:
 - grep_file: Search for patterns in file contents
 - list_files: List files matching a glob pattern
 - get_file: Read the full contents of a specific file
+
+With use_index=True, an on-disk trigram index narrows the files grep_file has to read (see trigram_index.py).
 """
 
+import json
 from dataclasses import dataclass, field
 from os import walk as os_walk
 from os.path import isabs as path_isabs
 from pathlib import Path
-from re import IGNORECASE
+from re import IGNORECASE, Pattern
 from re import compile as re_compile
 from re import error as re_error
 from re import escape as re_escape
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from agno.knowledge.document import Document
+from agno.knowledge.trigram_index import TrigramIndex
 from agno.utils.log import log_debug, log_warning
 
 
@@ -51,6 +55,9 @@ class FileSystemKnowledge:
         # Agent can now search, list, and read files
         agent.print_response("Find where main() is defined")
         ```
+
+    For large directories, set use_index=True to keep an on-disk trigram index of the files. Searches then only read
+    the files that can match, and the index is refreshed incrementally on each call.
     """
 
     base_dir: str
@@ -59,6 +66,12 @@ class FileSystemKnowledge:
     exclude_patterns: List[str] = field(
         default_factory=lambda: [".git", "__pycache__", "node_modules", ".venv", "venv"]
     )
+    # Keep an on-disk trigram index of the files to speed up searches
+    use_index: bool = False
+    # Path to the index file. Defaults to a file in the temporary directory, named after base_dir
+    index_path: Optional[str] = None
+    # Stat all indexed files at most this often (in seconds), to catch files edited in place
+    index_full_refresh_interval: float = 300.0
 
     def __post_init__(self):
         self.base_path = Path(self.base_dir).resolve()
@@ -67,6 +80,23 @@ class FileSystemKnowledge:
         if not self.base_path.is_dir():
             raise ValueError(f"Path is not a directory: {self.base_dir}")
 
+        self._index: Optional[TrigramIndex] = None
+        if self.use_index:
+            self._index = TrigramIndex(
+                base_path=self.base_path,
+                index_path=Path(self.index_path)
+                if self.index_path
+                else TrigramIndex.get_default_index_path(self.base_path),
+                include_dir=self._should_include_dir,
+                include_file=self._should_include_file,
+                config_key=json.dumps([self.include_patterns, self.exclude_patterns]),
+                full_refresh_interval=self.index_full_refresh_interval,
+            )
+
+    def _should_include_dir(self, dir_name: str) -> bool:
+        """Check if a directory should be walked based on the exclude patterns."""
+        return not any(excl in dir_name for excl in self.exclude_patterns)
+
     def _should_include_file(self, file_path: Path) -> bool:
         """Check if a file should be included based on patterns."""
         path_str = str(file_path)
@@ -94,39 +124,33 @@ class FileSystemKnowledge:
         results: List[Document] = []
         limit = max_results or self.max_results
 
-        for root, dirs, files in os_walk(self.base_path):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not any(excl in d for excl in self.exclude_patterns)]
+        for file_path in self._iter_files():
+            if len(results) >= limit:
+                break
 
-            for filename in files:
-                if len(results) >= limit:
-                    break
+            rel_path = file_path.relative_to(self.base_path)
 
-                file_path = Path(root) / filename
-                if not self._should_include_file(file_path):
+            # Match against query pattern (check both filename and relative path)
+            if query and query != "*":
+                if not (fnmatch.fnmatch(file_path.name, query) or fnmatch.fnmatch(str(rel_path), query)):
                     continue
-
-                rel_path = file_path.relative_to(self.base_path)
-
-                # Match against query pattern (check both filename and relative path)
-                if query and query != "*":
-                    if not (fnmatch.fnmatch(filename, query) or fnmatch.fnmatch(str(rel_path), query)):
-                        continue
-                results.append(
-                    Document(
-                        name=str(rel_path),
-                        content=str(rel_path),
-                        meta_data={
-                            "type": "file_listing",
-                            "absolute_path": str(file_path),
-                            "extension": file_path.suffix,
-                            "size": file_path.stat().st_size,
-                        },
-                    )
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                # Deleted since it was indexed
+                continue
+            results.append(
+                Document(
+                    name=str(rel_path),
+                    content=str(rel_path),
+                    meta_data={
+                        "type": "file_listing",
+                        "absolute_path": str(file_path),
+                        "extension": file_path.suffix,
+                        "size": size,
+                    },
                 )
-
-            if len(results) >= limit:
-                break
+            )
 
         log_debug(f"Found {len(results)} files matching pattern: {query}")
         return results
@@ -179,70 +203,98 @@ class FileSystemKnowledge:
             # If not a valid regex, treat as literal string
             pattern = re_compile(re_escape(query), IGNORECASE)
 
-        for root, dirs, files in os_walk(self.base_path):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not any(excl in d for excl in self.exclude_patterns)]
-
-            for filename in files:
-                if len(results) >= limit:
-                    break
+        for file_path in self._iter_files(pattern=pattern):
+            if len(results) >= limit:
+                break
 
-                file_path = Path(root) / filename
-                if not self._should_include_file(file_path):
-                    continue
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="replace")
+            except Exception as e:
+                # Skip files that can't be read (binary, permissions, etc.)
+                log_debug(f"Skipping file {file_path}: {e}")
+                continue
 
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="replace")
-                    matches = list(pattern.finditer(content))
-
-                    if matches:
-                        # Extract matching lines with context
-                        lines = content.split("\n")
-                        matching_lines: List[dict[str, Any]] = []
-
-                        for match in matches[:10]:  # Limit matches per file
-                            # Find the line number
-                            line_start = content.count("\n", 0, match.start())
-                            line_num = line_start + 1
-
-                            # Get context (1 line before and after)
-                            start_idx = max(0, line_start - 1)
-                            end_idx = min(len(lines), line_start + 2)
-                            context_lines = lines[start_idx:end_idx]
-
-                            matching_lines.append(
-                                {
-                                    "line": line_num,
-                                    "match": match.group(),
-                                    "context": "\n".join(context_lines),
-                                }
-                            )
-
-                        rel_path = file_path.relative_to(self.base_path)
-                        results.append(
-                            Document(
-                                name=str(rel_path),
-                                content="\n---\n".join(str(m["context"]) for m in matching_lines),
-                                meta_data={
-                                    "type": "grep_result",
-                                    "absolute_path": str(file_path),
-                                    "match_count": len(matches),
-                                    "matches": matching_lines[:5],  # Include first 5 match details
-                                },
-                            )
-                        )
-
-                except Exception as e:
-                    # Skip files that can't be read (binary, permissions, etc.)
-                    log_debug(f"Skipping file {file_path}: {e}")
-                    continue
+            if self._index is not None:
+                self._reindex_if_changed(file_path, content)
 
-            if len(results) >= limit:
-                break
+            document = self._grep_content(file_path, content, pattern)
+            if document is not None:
+                results.append(document)
 
         log_debug(f"Found {len(results)} files with matches for: {query}")
         return results
 
+    def _grep_content(self, file_path: Path, content: str, pattern: Pattern) -> Optional[Document]:
+        """Search for a pattern within the content of a file, returning a grep result if it matches."""
+        matches = list(pattern.finditer(content))
+        if not matches:
+            return None
+
+        # Extract matching lines with context
+        lines = content.split("\n")
+        matching_lines: List[dict[str, Any]] = []
+
+        for match in matches[:10]:  # Limit matches per file
+            # Find the line number
+            line_start = content.count("\n", 0, match.start())
+            line_num = line_start + 1
+
+            # Get context (1 line before and after)
+            start_idx = max(0, line_start - 1)
+            end_idx = min(len(lines), line_start + 2)
+            context_lines = lines[start_idx:end_idx]
+
+            matching_lines.append(
+                {
+                    "line": line_num,
+                    "match": match.group(),
+                    "context": "\n".join(context_lines),
+                }
+            )
+
+        rel_path = file_path.relative_to(self.base_path)
+        return Document(
+            name=str(rel_path),
+            content="\n---\n".join(str(m["context"]) for m in matching_lines),
+            meta_data={
+                "type": "grep_result",
+                "absolute_path": str(file_path),
+                "match_count": len(matches),
+                "matches": matching_lines[:5],  # Include first 5 match details
+            },
+        )
+
+    def _iter_files(self, pattern: Optional[Pattern] = None) -> Iterator[Path]:
+        """Iterate over the files to search.
+
+        With the index, only the indexed files that can match the pattern are returned, without walking the directory.
+        """
+        if self._index is not None:
+            self._index.refresh()
+            rel_paths = self._index.list_files() if pattern is None else self._index.get_candidates(pattern.pattern)
+            for rel_path in rel_paths:
+                yield self.base_path / rel_path
+            return
+
+        for root, dirs, files in os_walk(self.base_path):
+            # Filter out excluded directories
+            dirs[:] = [d for d in dirs if self._should_include_dir(d)]
+
+            for filename in files:
+                file_path = Path(root) / filename
+                if self._should_include_file(file_path):
+                    yield file_path
+
+    def _reindex_if_changed(self, file_path: Path, content: str) -> None:
+        """Update the index of a file read by a search if it changed since it was indexed."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        rel_path = file_path.relative_to(self.base_path).as_posix()
+        if self._index.get_file_state(rel_path) != (stat.st_mtime_ns, stat.st_size):  # type: ignore
+            self._index.update_file(rel_path, stat.st_mtime_ns, stat.st_size, content)  # type: ignore
+
     # ========================================================================
     # Protocol Implementation (build_context, get_tools, retrieve)
     # ========================================================================
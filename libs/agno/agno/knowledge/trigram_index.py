@@ -0,0 +1,464 @@
+"""
+Trigram Index
+=============
+An on-disk trigram index of the files of a directory, used by FileSystemKnowledge to narrow the files a regex search
+has to read.
+
+Each file is indexed by the set of (case-folded, ASCII) trigrams of its content. The few non-ASCII characters that
+match ASCII letters in case-insensitive regexes are folded to those letters first. A regex is turned into the trigrams
+any matching text must contain, and only the files holding all of them are read and verified with the regex.
+
+The postings are stored in SQLite in two parts:
+- A base segment holding, for each trigram, the compressed list of the ids of the files containing it.
+- A small delta table of (trigram, file id) rows for the files indexed since the base segment was written.
+Files re-indexed or removed since then are filtered out of the base segment when querying, and the delta is merged
+into the base segment once it grows past `merge_threshold` postings.
+
+The index is kept up to date without watching the filesystem: each refresh stats the indexed directories, and only
+re-lists the ones whose mtime changed (files were added, removed or renamed in them). Files edited in place don't
+change the mtime of their directory, so all indexed files are also stat'ed every `full_refresh_interval` seconds.
+"""
+
+import sqlite3
+import time
+import zlib
+from array import array
+from collections import defaultdict
+from hashlib import sha256
+from os import scandir
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from agno.utils.log import log_debug
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # Python < 3.11
+    import sre_parse  # type: ignore
+
+# Files larger than this are listed but not indexed, and always read when searching
+MAX_INDEXED_FILE_SIZE = 10 * 1024 * 1024
+# Write the postings of the files being indexed once they hold this many, to bound memory use when building the index
+MAX_PENDING_POSTINGS = 8_000_000
+# Version of the way trigrams are extracted. Indexes built by other versions are rebuilt
+INDEX_VERSION = 2
+
+# The non-ASCII characters matching ASCII letters with re.IGNORECASE, folded to these letters before extracting
+# trigrams. casefold() would turn them into other non-ASCII characters, dropping trigrams the regex matches
+_ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    dir TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    indexed INTEGER NOT NULL,
+    in_base INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+CREATE TABLE IF NOT EXISTS base_postings (trigram INTEGER PRIMARY KEY, file_ids BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS delta_postings (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS delta_postings_file ON delta_postings (file_id);
+"""
+
+
+def _extract_trigram_array(text: str) -> array:
+    """Get the distinct trigrams of the case-folded text, packed as integers.
+
+    Non-ASCII characters not matching ASCII letters are replaced by "?" first. A case-insensitive regex can't match
+    them with ASCII literals, so this only adds trigrams, which can't cause a file to be missed.
+    """
+    data = text.translate(_ASCII_FOLDS).casefold().encode("ascii", "replace")
+    trigrams = {data[i : i + 3] for i in range(len(data) - 2)}
+    # Pad each 3-byte trigram to 4 bytes, so they are read as unsigned integers in C instead of packed one by one
+    packed = array("I")
+    if trigrams:
+        packed.frombytes(b"\0".join(trigrams) + b"\0")
+    return packed
+
+
+def extract_trigrams(text: str) -> Set[int]:
+    """Get the distinct trigrams of the case-folded text, packed as integers."""
+    return set(_extract_trigram_array(text))
+
+
+def _encode_file_ids(file_ids: array) -> bytes:
+    return zlib.compress(file_ids.tobytes(), 1)
+
+
+def _decode_file_ids(blob: bytes) -> array:
+    file_ids = array("I")
+    file_ids.frombytes(zlib.decompress(blob))
+    return file_ids
+
+
+def _literal_runs(parsed: Any) -> Optional[List[List[str]]]:
+    """Get the literal strings a regex match must contain, as alternatives of required strings.
+
+    Returns None when the regex has no usable literals, meaning any file may match.
+    """
+    # A top-level alternation matches if any of its branches matches
+    items = list(parsed)
+    if len(items) == 1 and items[0][0] == sre_parse.BRANCH:
+        alternatives: List[List[str]] = []
+        for branch in items[0][1][1]:
+            runs = _required_literals(branch)
+            if not runs:
+                return None
+            alternatives.append(runs)
+        return alternatives
+
+    runs = _required_literals(parsed)
+    return [runs] if runs else None
+
+
+def _required_literals(parsed: Iterable[Tuple[Any, Any]]) -> List[str]:
+    """Get the literal strings all matches of the parsed sequence must contain."""
+    runs: List[str] = []
+    current: List[str] = []
+
+    def end_run() -> None:
+        if len(current) >= 3:
+            runs.append("".join(current))
+        current.clear()
+
+    for op, value in parsed:
+        if op == sre_parse.LITERAL and chr(value).isascii():
+            current.append(chr(value))
+            continue
+
+        end_run()
+        if op == sre_parse.SUBPATTERN:
+            # (group, add_flags, del_flags, pattern)
+            runs.extend(_required_literals(value[-1]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and value[0] >= 1:
+            # (min, max, pattern): the body has to match at least once
+            runs.extend(_required_literals(value[2]))
+    end_run()
+    return runs
+
+
+def get_query_trigrams(pattern: str) -> Optional[List[Set[int]]]:
+    """Get the trigrams a file must contain to match the regex, as alternatives of required trigram sets.
+
+    Returns None when the regex can't be narrowed down by trigrams, meaning any file may match.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    alternatives = _literal_runs(parsed)
+    if alternatives is None:
+        return None
+    return [set().union(*(extract_trigrams(run) for run in runs)) for runs in alternatives]
+
+
+class TrigramIndex:
+    """An on-disk trigram index of the files of a directory, stored in SQLite.
+
+    Args:
+        base_path (Path): The indexed directory.
+        index_path (Path): Path to the SQLite index file.
+        include_dir (Callable[[str], bool]): Whether to index a directory, given its name.
+        include_file (Callable[[Path], bool]): Whether to index a file, given its path.
+        config_key (str): Identifies the include/exclude configuration. The index is rebuilt when it changes.
+        full_refresh_interval (float): Stat all indexed files at most this often, to catch files edited in place.
+        merge_threshold (int): Merge the delta postings into the base segment once they outnumber this.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        index_path: Path,
+        include_dir: Callable[[str], bool],
+        include_file: Callable[[Path], bool],
+        config_key: str = "",
+        full_refresh_interval: float = 300.0,
+        merge_threshold: int = 100_000,
+    ):
+        self.base_path = base_path
+        self.index_path = index_path
+        self.include_dir = include_dir
+        self.include_file = include_file
+        self.full_refresh_interval = full_refresh_interval
+        self.merge_threshold = merge_threshold
+
+        self._lock = Lock()
+        self._last_full_refresh: Optional[float] = None
+        # Trigrams of the files indexed during the current refresh, written in one go when it ends
+        self._pending: List[Tuple[int, array]] = []
+        self._pending_count = 0
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._reset_if_config_changed(f"{INDEX_VERSION}:{self.base_path}:{config_key}")
+
+    @staticmethod
+    def get_default_index_path(base_path: Path) -> Path:
+        """Get the default index file of a directory, outside of it so the index is not indexed itself."""
+        import tempfile
+
+        digest = sha256(str(base_path).encode("utf-8")).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / "agno_filesystem_index" / f"{digest}.db"
+
+    def _reset_if_config_changed(self, config_key: str) -> None:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        if row is not None and row[0] == config_key:
+            return
+        with self._connection:
+            for table in ("dirs", "files", "base_postings", "delta_postings"):
+                self._connection.execute(f"DELETE FROM {table}")
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('config', ?)", (config_key,))
+
+    # -- Refresh methods --
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the directory.
+
+        Only the directories whose mtime changed are listed again. All indexed files are stat'ed every
+        `full_refresh_interval` seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            full_refresh = (
+                self._last_full_refresh is None or now - self._last_full_refresh >= self.full_refresh_interval
+            )
+            with self._connection:
+                known_dirs = dict(self._connection.execute("SELECT path, mtime_ns FROM dirs").fetchall())
+                if not known_dirs:
+                    self._scan_dir("")
+                else:
+                    for rel_dir, mtime_ns in known_dirs.items():
+                        try:
+                            current_mtime_ns = (self.base_path / rel_dir).stat().st_mtime_ns
+                        except OSError:
+                            self._remove_dir(rel_dir)
+                            continue
+                        if full_refresh or current_mtime_ns != mtime_ns:
+                            self._scan_dir(rel_dir)
+                self._flush_pending()
+            if full_refresh:
+                self._last_full_refresh = now
+
+    def _scan_dir(self, rel_dir: str) -> None:
+        """List a directory, updating its files and subdirectories. New subdirectories are scanned recursively."""
+        abs_dir = self.base_path / rel_dir
+        try:
+            dir_mtime_ns = abs_dir.stat().st_mtime_ns
+            entries = list(scandir(abs_dir))
+        except OSError:
+            self._remove_dir(rel_dir)
+            return
+
+        known_files: Dict[str, Tuple[int, int, int]] = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self._connection.execute(
+                "SELECT id, path, mtime_ns, size FROM files WHERE dir = ?", (rel_dir,)
+            )
+        }
+        known_subdirs = {
+            path for (path,) in self._connection.execute("SELECT path FROM dirs WHERE parent = ?", (rel_dir,))
+        }
+
+        seen_files: Set[str] = set()
+        seen_subdirs: Set[str] = set()
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.include_dir(entry.name):
+                        seen_subdirs.add(rel_path)
+                        # Known subdirectories are refreshed on their own, from their mtime
+                        if rel_path not in known_subdirs:
+                            self._scan_dir(rel_path)
+                    continue
+                if not entry.is_file() or not self.include_file(Path(entry.path)):
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            seen_files.add(rel_path)
+            known = known_files.get(rel_path)
+            if known is None or (known[1], known[2]) != (stat.st_mtime_ns, stat.st_size):
+                self._index_file(rel_path, rel_dir, stat.st_mtime_ns, stat.st_size)
+
+        for rel_path in known_files.keys() - seen_files:
+            self._remove_file(known_files[rel_path][0])
+        for subdir in known_subdirs - seen_subdirs:
+            self._remove_dir(subdir)
+
+        parent = (rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else "") if rel_dir else None
+        self._connection.execute(
+            "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)", (rel_dir, parent, dir_mtime_ns)
+        )
+
+    def _index_file(self, rel_path: str, rel_dir: str, mtime_ns: int, size: int, content: Optional[str] = None) -> None:
+        trigrams = array("I")
+        indexed = size <= MAX_INDEXED_FILE_SIZE
+        if indexed:
+            try:
+                if content is None:
+                    content = (self.base_path / rel_path).read_text(encoding="utf-8", errors="replace")
+                trigrams = _extract_trigram_array(content)
+            except OSError:
+                indexed = False
+
+        # The base postings of a re-indexed file are ignored from now on, its new postings go to the delta
+        row = self._connection.execute("SELECT id FROM files WHERE path = ?", (rel_path,)).fetchone()
+        if row is not None:
+            file_id = row[0]
+            self._connection.execute("DELETE FROM delta_postings WHERE file_id = ?", (file_id,))
+            self._connection.execute(
+                "UPDATE files SET mtime_ns = ?, size = ?, indexed = ?, in_base = 0 WHERE id = ?",
+                (mtime_ns, size, int(indexed), file_id),
+            )
+        else:
+            cursor = self._connection.execute(
+                "INSERT INTO files (path, dir, mtime_ns, size, indexed) VALUES (?, ?, ?, ?, ?)",
+                (rel_path, rel_dir, mtime_ns, size, int(indexed)),
+            )
+            file_id = cursor.lastrowid
+
+        if trigrams:
+            self._pending.append((file_id, trigrams))
+            self._pending_count += len(trigrams)
+            if self._pending_count >= MAX_PENDING_POSTINGS:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write the postings of the files indexed during the refresh."""
+        if not self._pending:
+            return
+        delta_count = self._connection.execute("SELECT COUNT(*) FROM delta_postings").fetchone()[0]
+        if delta_count + self._pending_count >= self.merge_threshold:
+            self._merge()
+        else:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO delta_postings (trigram, file_id) VALUES (?, ?)",
+                ((trigram, file_id) for file_id, trigrams in self._pending for trigram in trigrams),
+            )
+        self._pending = []
+        self._pending_count = 0
+
+    def _merge(self) -> None:
+        """Rewrite the base segment with the delta and pending postings, dropping the postings of stale files."""
+        additions: Dict[int, array] = defaultdict(lambda: array("I"))
+        for trigram, file_id in self._connection.execute("SELECT trigram, file_id FROM delta_postings"):
+            additions[trigram].append(file_id)
+        for file_id, trigrams in self._pending:
+            for trigram in trigrams:
+                additions[trigram].append(file_id)
+
+        base_ids = {file_id for (file_id,) in self._connection.execute("SELECT id FROM files WHERE in_base = 1")}
+        updates: List[Tuple[bytes, int]] = []
+        removals: List[Tuple[int]] = []
+        for trigram, blob in self._connection.execute("SELECT trigram, file_ids FROM base_postings").fetchall():
+            file_ids = array("I", filter(base_ids.__contains__, _decode_file_ids(blob)))
+            file_ids.extend(additions.pop(trigram, array("I")))
+            if file_ids:
+                updates.append((_encode_file_ids(file_ids), trigram))
+            else:
+                removals.append((trigram,))
+
+        self._connection.executemany("UPDATE base_postings SET file_ids = ? WHERE trigram = ?", updates)
+        self._connection.executemany("DELETE FROM base_postings WHERE trigram = ?", removals)
+        self._connection.executemany(
+            "INSERT INTO base_postings (trigram, file_ids) VALUES (?, ?)",
+            ((trigram, _encode_file_ids(file_ids)) for trigram, file_ids in additions.items()),
+        )
+        self._connection.execute("DELETE FROM delta_postings")
+        self._connection.execute("UPDATE files SET in_base = 1")
+        log_debug(f"Merged trigram index postings into {self.index_path}")
+
+    def _remove_file(self, file_id: int) -> None:
+        # Its base postings are dropped on the next merge
+        self._connection.execute("DELETE FROM delta_postings WHERE file_id = ?", (file_id,))
+        self._connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self._pending = [(pending_id, trigrams) for pending_id, trigrams in self._pending if pending_id != file_id]
+
+    def _remove_dir(self, rel_dir: str) -> None:
+        """Remove a directory and everything below it from the index."""
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        for (file_id,) in self._connection.execute(
+            "SELECT id FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+        ).fetchall():
+            self._remove_file(file_id)
+        self._connection.execute(
+            "DELETE FROM dirs WHERE path = ? OR substr(path, 1, ?) = ?", (rel_dir, len(prefix), prefix)
+        )
+
+    # -- Query methods --
+
+    def list_files(self) -> List[str]:
+        """Get the relative paths of all indexed files, sorted."""
+        with self._lock:
+            return [path for (path,) in self._connection.execute("SELECT path FROM files ORDER BY path")]
+
+    def _get_file_ids(self, trigram: int, base_ids: Set[int]) -> Set[int]:
+        file_ids = {
+            file_id
+            for (file_id,) in self._connection.execute(
+                "SELECT file_id FROM delta_postings WHERE trigram = ?", (trigram,)
+            )
+        }
+        row = self._connection.execute("SELECT file_ids FROM base_postings WHERE trigram = ?", (trigram,)).fetchone()
+        if row is not None:
+            file_ids.update(base_ids.intersection(_decode_file_ids(row[0])))
+        return file_ids
+
+    def get_candidates(self, pattern: str) -> List[str]:
+        """Get the relative paths of the files that may match the regex, sorted.
+
+        Files too large to be indexed are always candidates.
+        """
+        alternatives = get_query_trigrams(pattern)
+        with self._lock:
+            rows = self._connection.execute("SELECT id, path, indexed, in_base FROM files ORDER BY path").fetchall()
+            if alternatives is None or any(not trigrams for trigrams in alternatives):
+                return [path for _, path, _, _ in rows]
+
+            base_ids = {file_id for file_id, _, _, in_base in rows if in_base}
+            matching_ids: Set[int] = set()
+            for trigrams in alternatives:
+                candidate_ids: Optional[Set[int]] = None
+                for trigram in trigrams:
+                    file_ids = self._get_file_ids(trigram, base_ids)
+                    candidate_ids = file_ids if candidate_ids is None else candidate_ids & file_ids
+                    if not candidate_ids:
+                        break
+                matching_ids.update(candidate_ids or ())
+            return [path for file_id, path, indexed, _ in rows if file_id in matching_ids or not indexed]
+
+    def get_file_state(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) the file had when it was indexed, or None if it is not indexed."""
+        with self._lock:
+            row = self._connection.execute("SELECT mtime_ns, size FROM files WHERE path = ?", (rel_path,)).fetchone()
+            return (row[0], row[1]) if row is not None else None
+
+    def update_file(self, rel_path: str, mtime_ns: int, size: int, content: str) -> None:
+        """Re-index a file from content that was already read, e.g. when a search finds it changed."""
+        rel_dir = rel_path.rsplit("/", 1)[0] if "/" in rel_path else ""
+        with self._lock, self._connection:
+            self._index_file(rel_path, rel_dir, mtime_ns, size, content=content)
+            self._flush_pending()
+        log_debug(f"Re-indexed changed file: {rel_path}")
+
+    def close(self) -> None:
+        """Close the connection to the index file."""
+        with self._lock:
+            self._connection.close()
@@ -6,6 +6,7 @@ Memory maintenance for LearningMachine.
 Keeps memories tidy through:
 - Pruning: Remove old memories
 - Deduplication: Remove exact/near-exact duplicates
+- Near-duplicate detection: Merge paraphrased duplicates using MinHash/LSH
 
 Usage:
     >>> learning = LearningMachine(db=db, model=model, user_profile=True)
@@ -15,23 +16,54 @@ Usage:
     >>>
     >>> # Remove duplicate memories
     >>> deduped = learning.curator.deduplicate(user_id="alice")
+    >>>
+    >>> # Merge paraphrased duplicates, keeping the newest of each cluster
+    >>> merged = learning.curator.deduplicate_near(user_id="alice", threshold=0.6)
 """
 
-from dataclasses import dataclass
+import hashlib
+import math
+import random
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple
+
+from agno.utils.log import log_debug, log_warning
 
-from agno.utils.log import log_debug
+if TYPE_CHECKING:
+    from agno.knowledge.embedder.base import Embedder
+
+# Mersenne prime used by the MinHash permutations
+_MERSENNE_PRIME = (1 << 61) - 1
+# Random hyperplane bands used to find candidates by embedding
+_EMBEDDING_BANDS = 16
+_EMBEDDING_ROWS = 8
 
 
 @dataclass
 class Curator:
     """Memory maintenance. Keeps things tidy.
 
-    Currently supports user_profile store only.
+    Currently supports user_profile store only. Near-duplicate detection
+    also supports the user_memory store.
+
+    Args:
+        machine: The LearningMachine whose stores are curated.
+        embedder: Optional embedder used to also find paraphrases by cosine similarity.
+        num_perm: Number of MinHash permutations per memory.
+        num_bands: Number of LSH bands. Must divide num_perm.
+        shingle_size: Size of the character shingles compared by MinHash.
     """
 
     machine: Any  # LearningMachine
+    embedder: Optional["Embedder"] = None
+    num_perm: int = 128
+    num_bands: int = 32
+    shingle_size: int = 3
+
+    # LSH index of the memories already checked, per user
+    _indexes: Dict[str, "_NearDuplicateIndex"] = field(default_factory=dict, init=False, repr=False)
 
     def prune(
         self,
@@ -118,6 +150,85 @@ class Curator:
 
         return removed
 
+    def deduplicate_near(
+        self,
+        user_id: str,
+        threshold: float = 0.7,
+        embedding_threshold: float = 0.9,
+        merge_policy: Literal["newest", "longest"] = "newest",
+    ) -> int:
+        """Merge near-duplicate memories, like paraphrases of the same fact.
+
+        Memories are compared by the Jaccard similarity of their character shingles,
+        estimated with MinHash signatures, and by the cosine similarity of their
+        embeddings when the curator has an embedder. LSH banding only compares
+        memories that are likely to be similar, so a pass takes roughly linear time.
+
+        The index is kept between calls, so only memories added or changed since the
+        previous call are compared against the others.
+
+        Args:
+            user_id: User to deduplicate memories for.
+            threshold: Minimum estimated Jaccard similarity of two duplicates.
+            embedding_threshold: Minimum cosine similarity of two duplicates, used with an embedder.
+            merge_policy: Which memory of a duplicate cluster to keep: the newest or the longest.
+
+        Returns:
+            Number of duplicate memories removed.
+        """
+        store_name, store, data = self._get_memories(user_id=user_id)
+        if data is None:
+            return 0
+
+        memories = data.memories
+        if len(memories) < 2:
+            return 0
+
+        index = self._indexes.get(user_id)
+        if index is None or index.num_perm != self.num_perm or index.num_bands != self.num_bands:
+            index = _NearDuplicateIndex(num_perm=self.num_perm, num_bands=self.num_bands)
+            self._indexes[user_id] = index
+
+        # Drop memories that were deleted or changed since the previous call
+        entries = {}
+        for position, memory in enumerate(memories):
+            key = self._get_memory_key(memory=memory, position=position)
+            if key in entries:
+                key = f"{key}:{position}"
+            entries[key] = (position, memory)
+        index.retain(set(entries))
+
+        clusters = _DisjointSet()
+        for key, (_, memory) in entries.items():
+            if key in index:
+                continue
+            content = self._normalize(memory.get("content", ""))
+            signature = index.get_signature(self._get_shingles(content))
+            embedding = self._get_embedding(content)
+            for match in index.query(signature=signature, embedding=embedding):
+                if (
+                    index.get_jaccard(key=match, signature=signature) >= threshold
+                    or index.get_cosine(key=match, embedding=embedding) >= embedding_threshold
+                ):
+                    clusters.union(key, match)
+            index.add(key=key, signature=signature, embedding=embedding)
+
+        removed_keys: Set[str] = set()
+        for cluster in clusters.get_clusters():
+            cluster_memories = [(key, *entries[key]) for key in cluster]
+            keep = self._select_memory(memories=cluster_memories, merge_policy=merge_policy)
+            removed_keys.update(key for key in cluster if key != keep)
+
+        if not removed_keys:
+            return 0
+
+        index.retain(set(entries) - removed_keys)
+        data.memories = [memory for key, (_, memory) in entries.items() if key not in removed_keys]
+        self._save_memories(store_name=store_name, store=store, user_id=user_id, data=data)
+        log_debug(f"Curator.deduplicate_near: removed {len(removed_keys)} near-duplicates for user_id={user_id}")
+
+        return len(removed_keys)
+
     # =========================================================================
     # Helpers
     # =========================================================================
@@ -177,9 +288,171 @@ class Curator:
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison."""
-        import re
-
         text = text.lower().strip()
         text = re.sub(r"[^\w\s]", "", text)
         text = re.sub(r"\s+", " ", text)
         return text
+
+    def _get_memories(self, user_id: str) -> Tuple[Optional[str], Any, Any]:
+        """Get the first store holding memories for the user, with its data."""
+        for store_name in ("user_profile", "user_memory"):
+            store = self.machine.stores.get(store_name)
+            if not store:
+                continue
+            data = store.get(user_id=user_id)
+            if data is not None and isinstance(getattr(data, "memories", None), list):
+                return store_name, store, data
+        return None, None, None
+
+    def _save_memories(self, store_name: Optional[str], store: Any, user_id: str, data: Any) -> None:
+        if store_name == "user_memory":
+            store.save(user_id=user_id, memories=data)
+        else:
+            store.save(user_id=user_id, profile=data)
+
+    def _get_memory_key(self, memory: dict, position: int) -> str:
+        """Identify a memory by its id and content, so changed memories are checked again."""
+        memory_id = memory.get("id") or str(position)
+        content_hash = hashlib.md5(memory.get("content", "").encode("utf-8")).hexdigest()
+        return f"{memory_id}:{content_hash}"
+
+    def _get_shingles(self, text: str) -> Set[str]:
+        if len(text) <= self.shingle_size:
+            return {text}
+        return {text[i : i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+
+    def _get_embedding(self, text: str) -> Optional[List[float]]:
+        if self.embedder is None or not text:
+            return None
+        try:
+            return self.embedder.get_embedding(text) or None
+        except Exception as e:
+            log_warning(f"Curator: failed to embed memory: {e}")
+            return None
+
+    def _select_memory(
+        self,
+        memories: List[Tuple[str, int, dict]],
+        merge_policy: Literal["newest", "longest"],
+    ) -> str:
+        """Get the key of the memory to keep from a cluster of duplicates."""
+
+        def recency(memory: Tuple[str, int, dict]) -> Tuple[str, int]:
+            # Memories are appended as they are added, so the position breaks ties
+            _, position, data = memory
+            return str(data.get("updated_at") or data.get("created_at") or ""), position
+
+        if merge_policy == "longest":
+            return max(memories, key=lambda memory: (len(memory[2].get("content", "")), recency(memory)))[0]
+        return max(memories, key=recency)[0]
+
+
+class _NearDuplicateIndex:
+    """MinHash signatures and embeddings of memories, bucketed by LSH bands."""
+
+    def __init__(self, num_perm: int, num_bands: int, seed: int = 1):
+        if num_bands <= 0 or num_perm % num_bands != 0:
+            raise ValueError(f"num_bands ({num_bands}) must divide num_perm ({num_perm})")
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows = num_perm // num_bands
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1)) for _ in range(num_perm)
+        ]
+        self._hyperplanes: Optional[List[List[float]]] = None
+        self._rng = rng
+
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._embeddings: Dict[str, List[float]] = {}
+        self._buckets: Dict[Tuple[Any, ...], Set[str]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def get_signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles]
+        return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) if hashes else 0 for a, b in self._permutations)
+
+    def get_jaccard(self, key: str, signature: Tuple[int, ...]) -> float:
+        other = self._signatures.get(key)
+        if other is None:
+            return 0.0
+        return sum(x == y for x, y in zip(signature, other)) / self.num_perm
+
+    def get_cosine(self, key: str, embedding: Optional[List[float]]) -> float:
+        other = self._embeddings.get(key)
+        if embedding is None or other is None:
+            return 0.0
+        dot = sum(x * y for x, y in zip(embedding, other))
+        norm = math.sqrt(sum(x * x for x in embedding)) * math.sqrt(sum(y * y for y in other))
+        return dot / norm if norm else 0.0
+
+    def query(self, signature: Tuple[int, ...], embedding: Optional[List[float]] = None) -> Set[str]:
+        """Get the keys sharing at least one band with the signature or embedding."""
+        candidates: Set[str] = set()
+        for band in self._get_bands(signature=signature, embedding=embedding):
+            candidates.update(self._buckets.get(band, ()))
+        return candidates
+
+    def add(self, key: str, signature: Tuple[int, ...], embedding: Optional[List[float]] = None) -> None:
+        self._signatures[key] = signature
+        if embedding is not None:
+            self._embeddings[key] = embedding
+        for band in self._get_bands(signature=signature, embedding=embedding):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def retain(self, keys: Set[str]) -> None:
+        """Remove all keys not in the given set."""
+        removed = [key for key in self._signatures if key not in keys]
+        for key in removed:
+            signature = self._signatures.pop(key)
+            embedding = self._embeddings.pop(key, None)
+            for band in self._get_bands(signature=signature, embedding=embedding):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band]
+
+    def _get_bands(self, signature: Tuple[int, ...], embedding: Optional[List[float]]) -> List[Tuple[Any, ...]]:
+        bands: List[Tuple[Any, ...]] = [
+            ("minhash", i, signature[i * self.rows : (i + 1) * self.rows]) for i in range(self.num_bands)
+        ]
+        if embedding is not None:
+            bits = self._get_hyperplane_bits(embedding)
+            bands.extend(
+                ("embedding", i, bits[i * _EMBEDDING_ROWS : (i + 1) * _EMBEDDING_ROWS]) for i in range(_EMBEDDING_BANDS)
+            )
+        return bands
+
+    def _get_hyperplane_bits(self, embedding: List[float]) -> Tuple[bool, ...]:
+        """Sign of the embedding against random hyperplanes; similar embeddings share most bits."""
+        if self._hyperplanes is None or len(self._hyperplanes[0]) != len(embedding):
+            self._hyperplanes = [
+                [self._rng.gauss(0, 1) for _ in embedding] for _ in range(_EMBEDDING_BANDS * _EMBEDDING_ROWS)
+            ]
+        return tuple(sum(x * y for x, y in zip(plane, embedding)) >= 0 for plane in self._hyperplanes)
+
+
+class _DisjointSet:
+    """Union-find over memory keys, used to group duplicates into clusters."""
+
+    def __init__(self):
+        self._parents: Dict[str, str] = {}
+
+    def find(self, key: str) -> str:
+        parent = self._parents.setdefault(key, key)
+        if parent != key:
+            parent = self._parents[key] = self.find(parent)
+        return parent
+
+    def union(self, a: str, b: str) -> None:
+        self._parents[self.find(a)] = self.find(b)
+
+    def get_clusters(self) -> List[List[str]]:
+        clusters: Dict[str, List[str]] = {}
+        for key in self._parents:
+            clusters.setdefault(self.find(key), []).append(key)
+        return [cluster for cluster in clusters.values() if len(cluster) > 1]
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import math
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.schemas import UserMemory
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+from agno.vectordb.base import VectorDb
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class MemoryIndex:
+    """Embeddings of user memories, used to find the memories most similar to a query.
+
+    With an embedder, memories are embedded when they are written and their embeddings are stored in the learnings
+    table of the memory db, so they are not computed again by other processes. Dbs without learnings support only keep
+    them in memory. With a vector_db, memories are stored and searched in the vector db instead.
+
+    Memories written without going through the index (e.g. by another process) are embedded on the next search.
+    """
+
+    learning_type = "user_memory_embedding"
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        vector_db: Optional[VectorDb] = None,
+        db: Optional[Union[BaseDb, AsyncBaseDb]] = None,
+    ):
+        if embedder is None and vector_db is None:
+            raise ValueError("An embedder or a vector_db is required to index memories")
+        self.embedder = embedder
+        self.vector_db = vector_db
+        self.db = db
+
+        # Memory hash and embedding by memory id, per user
+        self._embeddings: Dict[str, Dict[str, Tuple[str, List[float]]]] = {}
+        # Users whose stored embeddings were loaded from the db
+        self._loaded_users: Set[str] = set()
+        # Hashes of the memories stored in the vector db, and the hash of each indexed memory id
+        self._indexed_hashes: Set[str] = set()
+        self._indexed_hash_by_memory_id: Dict[str, str] = {}
+        # The learnings table is only used with sync dbs that implement it
+        self._store_in_db = isinstance(db, BaseDb)
+
+    def add(self, memory: UserMemory) -> None:
+        """Index a memory as it is written"""
+        if memory.memory_id is None:
+            return
+        try:
+            self._index_memories([memory], user_id=memory.user_id or "default")
+        except Exception as e:
+            log_warning(f"Failed to index memory {memory.memory_id}: {e}")
+
+    def remove(self, memory_id: str, user_id: Optional[str] = None) -> None:
+        """Remove the embedding of a deleted memory"""
+        self._embeddings.get(user_id or "default", {}).pop(memory_id, None)
+        if self.vector_db is not None:
+            self._delete_documents(memory_id)
+        if self._store_in_db:
+            try:
+                self.db.delete_learning(id=self._get_learning_id(memory_id))  # type: ignore[union-attr]
+            except NotImplementedError:
+                self._store_in_db = False
+            except Exception as e:
+                log_debug(f"Failed to delete the embedding of memory {memory_id}: {e}")
+
+    def search(
+        self, query: str, memories: List[UserMemory], user_id: str, limit: Optional[int] = None
+    ) -> List[Tuple[UserMemory, float]]:
+        """Get the memories most similar to the query, with their similarity, most similar first.
+
+        Args:
+            query: The query to compare the memories to.
+            memories: The current memories of the user. Only these are returned.
+            user_id: The user the memories belong to.
+            limit: Maximum number of memories to return.
+        """
+        memories = [memory for memory in memories if memory.memory_id is not None]
+        unindexed_memories = self._get_unindexed_memories(memories, user_id)
+        if unindexed_memories:
+            log_debug(f"Indexing {len(unindexed_memories)} memories for user {user_id}")
+            self._index_memories(unindexed_memories, user_id)
+
+        if self.vector_db is not None:
+            return self._search_vector_db(query, memories, user_id, limit)
+
+        query_embedding = self.embedder.get_embedding(query)  # type: ignore[union-attr]
+        user_embeddings = self._embeddings.get(user_id, {})
+        results = []
+        for memory in memories:
+            stored = user_embeddings.get(memory.memory_id)  # type: ignore[arg-type]
+            if stored is not None:
+                results.append((memory, _cosine_similarity(query_embedding, stored[1])))
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:limit] if limit else results
+
+    def _delete_documents(self, memory_id: str) -> None:
+        """Delete the documents of a memory from the vector db, so outdated versions don't take search results"""
+        self._indexed_hashes.discard(self._indexed_hash_by_memory_id.pop(memory_id, ""))
+        try:
+            self.vector_db.delete_by_metadata({"memory_id": memory_id})  # type: ignore[union-attr]
+        except Exception as e:
+            log_debug(f"Failed to delete the documents of memory {memory_id}: {e}")
+
+    def _get_memory_hash(self, memory: UserMemory, user_id: str) -> str:
+        return hashlib.sha256(f"{user_id}:{memory.memory_id}:{memory.memory}".encode("utf-8")).hexdigest()
+
+    def _get_learning_id(self, memory_id: str) -> str:
+        return f"{self.learning_type}_{memory_id}"
+
+    def _get_unindexed_memories(self, memories: List[UserMemory], user_id: str) -> List[UserMemory]:
+        if self.vector_db is not None:
+            unindexed_memories = []
+            for memory in memories:
+                memory_hash = self._get_memory_hash(memory, user_id)
+                if memory_hash in self._indexed_hashes:
+                    continue
+                try:
+                    exists = self.vector_db.content_hash_exists(memory_hash)
+                except NotImplementedError:
+                    exists = False
+                if exists:
+                    self._indexed_hashes.add(memory_hash)
+                    self._indexed_hash_by_memory_id[memory.memory_id] = memory_hash  # type: ignore[index]
+                else:
+                    unindexed_memories.append(memory)
+            return unindexed_memories
+
+        if user_id not in self._loaded_users:
+            self._load_embeddings(user_id)
+        user_embeddings = self._embeddings.get(user_id, {})
+        return [
+            memory
+            for memory in memories
+            if user_embeddings.get(memory.memory_id, ("",))[0] != self._get_memory_hash(memory, user_id)  # type: ignore[arg-type]
+        ]
+
+    def _load_embeddings(self, user_id: str) -> None:
+        """Load the embeddings stored in the learnings table"""
+        self._loaded_users.add(user_id)
+        if not self._store_in_db:
+            return
+        try:
+            records: List[Dict] = self.db.get_learnings(learning_type=self.learning_type, user_id=user_id)  # type: ignore
+        except NotImplementedError:
+            self._store_in_db = False
+            return
+
+        user_embeddings = self._embeddings.setdefault(user_id, {})
+        for record in records:
+            content = record.get("content")
+            if isinstance(content, str):
+                content = json.loads(content)
+            if record.get("entity_id") and content and content.get("embedding"):
+                user_embeddings.setdefault(record["entity_id"], (content.get("memory_hash"), content["embedding"]))
+
+    def _index_memories(self, memories: List[UserMemory], user_id: str) -> None:
+        for memory in memories:
+            memory_hash = self._get_memory_hash(memory, user_id)
+
+            if self.vector_db is not None:
+                # Replace the documents of previous versions of the memory
+                self._delete_documents(memory.memory_id)  # type: ignore[arg-type]
+                document = Document(
+                    id=memory.memory_id,
+                    content=memory.memory,
+                    meta_data={"user_id": user_id, "memory_id": memory.memory_id, "memory_hash": memory_hash},
+                )
+                if self.vector_db.upsert_available():
+                    self.vector_db.upsert(content_hash=memory_hash, documents=[document])
+                else:
+                    self.vector_db.insert(content_hash=memory_hash, documents=[document])
+                self._indexed_hashes.add(memory_hash)
+                self._indexed_hash_by_memory_id[memory.memory_id] = memory_hash  # type: ignore[index]
+                continue
+
+            embedding = self.embedder.get_embedding(memory.memory)  # type: ignore[union-attr]
+            if not embedding:
+                continue
+            self._embeddings.setdefault(user_id, {})[memory.memory_id] = (memory_hash, embedding)  # type: ignore[index]
+            if self._store_in_db:
+                try:
+                    self.db.upsert_learning(  # type: ignore[union-attr]
+                        id=self._get_learning_id(memory.memory_id),  # type: ignore[arg-type]
+                        learning_type=self.learning_type,
+                        content={"memory_hash": memory_hash, "embedding": embedding},
+                        user_id=user_id,
+                        entity_id=memory.memory_id,
+                    )
+                except NotImplementedError:
+                    log_debug(f"{type(self.db).__name__} does not support learnings, keeping embeddings in memory")
+                    self._store_in_db = False
+
+    def _search_vector_db(
+        self, query: str, memories: List[UserMemory], user_id: str, limit: Optional[int] = None
+    ) -> List[Tuple[UserMemory, float]]:
+        memories_by_hash = {self._get_memory_hash(memory, user_id): memory for memory in memories}
+        documents = self.vector_db.search(query=query, limit=limit or len(memories), filters={"user_id": user_id})  # type: ignore[union-attr]
+
+        results = []
+        for rank, document in enumerate(documents):
+            # Documents of memories that were changed or deleted since they were indexed are skipped
+            memory = memories_by_hash.get(document.meta_data.get("memory_hash", ""))
+            if memory is None:
+                continue
+            # Not all vector dbs return a score, so fall back to the rank of the document
+            similarity = document.reranking_score if document.reranking_score is not None else 1 - rank / len(documents)
+            results.append((memory, similarity))
+        return results
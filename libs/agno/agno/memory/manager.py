@@ -2,12 +2,14 @@ from copy import deepcopy
 from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, Field
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.knowledge.embedder.base import Embedder
+from agno.memory.index import MemoryIndex
 from agno.memory.strategies import MemoryOptimizationStrategy
 from agno.memory.strategies.types import (
     MemoryOptimizationStrategyFactory,
@@ -27,6 +29,7 @@ from agno.utils.log import (
 )
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.vectordb.base import VectorDb
 
 
 class MemorySearchResponse(BaseModel):
@@ -68,6 +71,16 @@ class MemoryManager:
     # The database to store memories
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
+    # ----- semantic search ---------
+    # Embedder used to embed memories for semantic search. Embeddings are stored in the db.
+    embedder: Optional[Embedder] = None
+    # Vector db to store and search memories in for semantic search, instead of embedding them with the embedder
+    vector_db: Optional[VectorDb] = None
+    # How much recency counts in semantic search, from 0 (only similarity) to 1 (only recency)
+    recency_weight: float = 0.1
+    # Number of memories found with semantic search that agentic search chooses from
+    num_rerank_candidates: int = 20
+
     debug_mode: bool = False
 
     def __init__(
@@ -81,6 +94,10 @@ class MemoryManager:
         update_memories: bool = True,
         add_memories: bool = True,
         clear_memories: bool = False,
+        embedder: Optional[Embedder] = None,
+        vector_db: Optional[VectorDb] = None,
+        recency_weight: float = 0.1,
+        num_rerank_candidates: int = 20,
         debug_mode: bool = False,
     ):
         self.model = model  # type: ignore[assignment]
@@ -92,8 +109,14 @@ class MemoryManager:
         self.update_memories = update_memories
         self.add_memories = add_memories
         self.clear_memories = clear_memories
+        self.embedder = embedder
+        self.vector_db = vector_db
+        self.recency_weight = recency_weight
+        self.num_rerank_candidates = num_rerank_candidates
         self.debug_mode = debug_mode
 
+        self._memory_index: Optional[MemoryIndex] = None
+
         if self.model is not None:
             self.model = get_model(self.model)
 
@@ -148,6 +171,14 @@ class MemoryManager:
             return memories
         return None
 
+    def get_memory_index(self) -> Optional[MemoryIndex]:
+        """Get the index used for semantic search, if an embedder or a vector db is configured"""
+        if self.embedder is None and self.vector_db is None:
+            return None
+        if self._memory_index is None or self._memory_index.db is not self.db:
+            self._memory_index = MemoryIndex(embedder=self.embedder, vector_db=self.vector_db, db=self.db)
+        return self._memory_index
+
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
             self.debug_mode = True
@@ -557,6 +588,9 @@ class MemoryManager:
             if not self.db:
                 raise ValueError("Memory db not initialized")
             self.db.upsert_user_memory(memory=memory)
+            memory_index = self.get_memory_index()
+            if memory_index is not None:
+                memory_index.add(memory)
             return "Memory added successfully"
         except Exception as e:
             log_warning(f"Error storing memory in db: {e}")
@@ -572,6 +606,9 @@ class MemoryManager:
                 user_id = "default"
 
             self.db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+            memory_index = self.get_memory_index()
+            if memory_index is not None:
+                memory_index.remove(memory_id=memory_id, user_id=user_id)
             return "Memory deleted successfully"
         except Exception as e:
             log_warning(f"Error deleting memory in db: {e}")
@@ -582,18 +619,21 @@ class MemoryManager:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
-                - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "agentic": Return memories most similar to the query, but using an agentic approach.
+                  With an embedder or vector_db, the model only chooses from the memories found with semantic search.
+                - "semantic": Return memories most similar to the query by embedding similarity, and recency.
+                  Requires an embedder or vector_db, otherwise the most recent memories are returned.
             user_id: The user to search for. Optional.
 
         Returns:
@@ -622,12 +662,25 @@ class MemoryManager:
             if not query:
                 raise ValueError("Query is required for agentic search")
 
-            return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
+            candidates = None
+            if self.get_memory_index() is not None:
+                candidates = self._search_user_memories_semantic(
+                    user_id=user_id, query=query, limit=self.num_rerank_candidates
+                )
+            return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit, candidates=candidates)
+
+        elif retrieval_method == "semantic" and self.get_memory_index() is not None:
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
 
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
         else:  # Default to last_n
+            if retrieval_method == "semantic":
+                log_warning("Semantic search requires an embedder or vector_db, returning the most recent memories")
             return self._get_last_n_memories(user_id=user_id, limit=limit)
 
     def _get_response_format(self) -> Union[Dict[str, Any], Type[BaseModel]]:
@@ -646,11 +699,57 @@ class MemoryManager:
         else:
             return {"type": "json_object"}
 
-    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
-        """Search through user memories using agentic search."""
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by the similarity of their embeddings to the query, and their recency."""
+        memory_index = self.get_memory_index()
         memories = self.read_from_db(user_id=user_id)
-        if memories is None:
-            memories = {}
+        if memory_index is None or not memories or not memories.get(user_id):
+            return []
+
+        user_memories: List[UserMemory] = memories[user_id]
+        # Consider more candidates than needed, as recency can move memories up
+        num_candidates = max(limit * 4, 20) if limit else None
+        results = memory_index.search(query=query, memories=user_memories, user_id=user_id, limit=num_candidates)
+        if not results:
+            return []
+
+        # Recency goes from 0 for the oldest memory to 1 for the most recent one
+        timestamps = [memory.updated_at or memory.created_at or 0 for memory in user_memories]
+        oldest, newest = min(timestamps), max(timestamps)
+
+        def get_score(result: Tuple[UserMemory, float]) -> float:
+            memory, similarity = result
+            timestamp = memory.updated_at or memory.created_at or 0
+            recency = (timestamp - oldest) / (newest - oldest) if newest > oldest else 1.0
+            return (1 - self.recency_weight) * similarity + self.recency_weight * recency
+
+        results.sort(key=get_score, reverse=True)
+        log_debug(f"Found {len(results)} memories with semantic search")
+        return [memory for memory, _ in results[:limit]]
+
+    def _search_user_memories_agentic(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None,
+        candidates: Optional[List[UserMemory]] = None,
+    ) -> List[UserMemory]:
+        """Search through user memories using agentic search.
+
+        Args:
+            user_id: The user to search for.
+            query: The search query.
+            limit: Maximum number of memories to return.
+            candidates: The memories to choose from. Defaults to all memories of the user.
+        """
+        if candidates is not None:
+            if not candidates:
+                return []
+            memories = {user_id: candidates}
+        else:
+            memories = self.read_from_db(user_id=user_id)
+            if memories is None:
+                memories = {}
 
         if not memories:
             return []
@@ -1307,6 +1406,8 @@ class MemoryManager:
         agent_id: Optional[str] = None,
         team_id: Optional[str] = None,
     ) -> List[Callable]:
+        memory_index = self.get_memory_index()
+
         def add_memory(memory: str, topics: Optional[List[str]] = None) -> str:
             """Use this function to add a memory to the database.
             Args:
@@ -1321,17 +1422,18 @@ class MemoryManager:
 
             try:
                 memory_id = str(uuid4())
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        user_id=user_id,
-                        agent_id=agent_id,
-                        team_id=team_id,
-                        memory=memory,
-                        topics=topics,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    team_id=team_id,
+                    memory=memory,
+                    topics=topics,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                if memory_index is not None:
+                    memory_index.add(user_memory)
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -1353,15 +1455,16 @@ class MemoryManager:
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
             try:
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        memory=memory,
-                        topics=topics,
-                        user_id=user_id,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    memory=memory,
+                    topics=topics,
+                    user_id=user_id,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                if memory_index is not None:
+                    memory_index.add(user_memory)
                 log_debug("Memory updated")
                 return "Memory updated successfully"
             except Exception as e:
@@ -1377,6 +1480,8 @@ class MemoryManager:
             """
             try:
                 db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+                if memory_index is not None:
+                    memory_index.remove(memory_id=memory_id, user_id=user_id)
                 log_debug("Memory deleted")
                 return "Memory deleted successfully"
             except Exception as e:
@@ -1,8 +1,8 @@
 import json
 from collections.abc import AsyncIterator
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from os import getenv
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import httpx
 from pydantic import BaseModel, ValidationError
@@ -11,6 +11,7 @@ from agno.exceptions import ModelProviderError, ModelRateLimitError
 from agno.models.base import Model
 from agno.models.message import Citations, DocumentCitation, Message, UrlCitation
 from agno.models.metrics import Metrics
+from agno.models.prompt_cache import PromptCacheStrategy
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from agno.tools.function import Function
@@ -119,6 +120,8 @@ class Claude(Model):
     top_k: Optional[int] = None
     cache_system_prompt: Optional[bool] = False
     extended_cache_time: Optional[bool] = False
+    # Place prompt cache breakpoints automatically on the tools, the system prompt and the conversation history
+    cache_strategy: Optional[PromptCacheStrategy] = None
     request_params: Optional[Dict[str, Any]] = None
 
     # Anthropic beta and experimental features
@@ -579,6 +582,53 @@ class Claude(Model):
             log_debug(f"Calling {self.provider} with request parameters: {request_kwargs}", log_level=2)
         return request_kwargs
 
+    def _get_cache_control(self) -> Dict[str, Any]:
+        extended = self.extended_cache_time or (
+            self.cache_strategy is not None and self.cache_strategy.ttl is not None and self.cache_strategy.ttl >= 3600
+        )
+        return {"type": "ephemeral", "ttl": "1h"} if extended else {"type": "ephemeral"}
+
+    def _format_request(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        compress_tool_results: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Format the messages and prepare the request keyword arguments, with the prompt cache breakpoints.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Dict[str, Any]]: The chat messages and the request keyword arguments.
+        """
+        cache_plan = None
+        if self.cache_strategy is not None:
+            # A system prompt cached with cache_system_prompt uses one of the breakpoints
+            strategy = (
+                replace(self.cache_strategy, cache_system=True) if self.cache_system_prompt else self.cache_strategy
+            )
+            cache_plan = strategy.plan(messages, has_tools=bool(tools) or bool(self.skills))
+        cache_control = self._get_cache_control()
+
+        chat_messages, system_message = format_messages(
+            messages,
+            compress_tool_results=compress_tool_results,
+            cache_message_ids=cache_plan.message_ids if cache_plan is not None else None,
+            cache_control=cache_control,
+        )
+        request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
+
+        if cache_plan is not None:
+            if cache_plan.cache_system and request_kwargs.get("system"):
+                request_kwargs["system"][-1]["cache_control"] = cache_control
+            if cache_plan.cache_tools and request_kwargs.get("tools"):
+                request_kwargs["tools"] = [
+                    *request_kwargs["tools"][:-1],
+                    {**request_kwargs["tools"][-1], "cache_control": cache_control},
+                ]
+            log_debug(f"Placed {cache_plan.num_breakpoints} prompt cache breakpoints", log_level=2)
+        return chat_messages, request_kwargs
+
     def invoke(
         self,
         messages: List[Message],
@@ -596,8 +646,9 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages, compress_tool_results=compress_tool_results)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
+            chat_messages, request_kwargs = self._format_request(
+                messages, tools=tools, response_format=response_format, compress_tool_results=compress_tool_results
+            )
 
             if self._has_beta_features(response_format=response_format, tools=tools):
                 assistant_message.metrics.start_timer()
@@ -660,8 +711,9 @@ class Claude(Model):
             RateLimitError: If the API rate limit is exceeded
             APIStatusError: For other API-related errors
         """
-        chat_messages, system_message = format_messages(messages, compress_tool_results=compress_tool_results)
-        request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
+        chat_messages, request_kwargs = self._format_request(
+            messages, tools=tools, response_format=response_format, compress_tool_results=compress_tool_results
+        )
 
         try:
             if run_response and run_response.metrics:
@@ -721,8 +773,9 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages, compress_tool_results=compress_tool_results)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
+            chat_messages, request_kwargs = self._format_request(
+                messages, tools=tools, response_format=response_format, compress_tool_results=compress_tool_results
+            )
 
             # Beta features
             if self._has_beta_features(response_format=response_format, tools=tools):
@@ -787,8 +840,9 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages, compress_tool_results=compress_tool_results)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
+            chat_messages, request_kwargs = self._format_request(
+                messages, tools=tools, response_format=response_format, compress_tool_results=compress_tool_results
+            )
 
             if self._has_beta_features(response_format=response_format, tools=tools):
                 assistant_message.metrics.start_timer()
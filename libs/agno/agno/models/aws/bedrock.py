@@ -9,6 +9,7 @@ from agno.exceptions import ModelProviderError
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.metrics import Metrics
+from agno.models.prompt_cache import PromptCachePlan, PromptCacheStrategy
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from agno.utils.log import log_debug, log_error, log_warning
@@ -33,6 +34,8 @@ except ImportError:
 BEDROCK_SUPPORTED_IMAGE_FORMATS = ["png", "jpeg", "webp", "gif"]
 BEDROCK_SUPPORTED_VIDEO_FORMATS = ["mp4", "mov", "mkv", "webm", "flv", "mpeg", "mpg", "wmv", "three_gp"]
 BEDROCK_SUPPORTED_FILE_FORMATS = ["pdf", "csv", "doc", "docx", "xls", "xlsx", "html", "txt", "md"]
+# Content block ending a cached prefix: https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html
+CACHE_POINT: Dict[str, Any] = {"cachePoint": {"type": "default"}}
 
 
 @dataclass
@@ -76,6 +79,8 @@ class AwsBedrock(Model):
     top_p: Optional[float] = None
     stop_sequences: Optional[List[str]] = None
     request_params: Optional[Dict[str, Any]] = None
+    # Place prompt cache points automatically on the tools, the system prompt and the conversation history
+    cache_strategy: Optional[PromptCacheStrategy] = None
 
     client: Optional[AwsClient] = None
     async_client: Optional[Any] = None
@@ -240,7 +245,10 @@ class AwsBedrock(Model):
         return {k: v for k, v in request_kwargs.items() if v is not None}
 
     def _format_messages(
-        self, messages: List[Message], compress_tool_results: bool = False
+        self,
+        messages: List[Message],
+        compress_tool_results: bool = False,
+        cache_plan: Optional[PromptCachePlan] = None,
     ) -> Tuple[List[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
         """
         Format the messages for the request.
@@ -248,6 +256,7 @@ class AwsBedrock(Model):
         Args:
             messages: List of messages to format
             compress_tool_results: Whether to compress tool results
+            cache_plan: Where to place the prompt cache points
 
         Returns:
             Tuple[List[Dict[str, Any]], Optional[List[Dict[str, Any]]]]: The formatted messages.
@@ -265,6 +274,8 @@ class AwsBedrock(Model):
                     "content": [{"json": {"result": content}}],
                 }
                 formatted_message: Dict[str, Any] = {"role": "user", "content": [{"toolResult": tool_result}]}
+                if cache_plan is not None and message.id in cache_plan.message_ids:
+                    formatted_message["content"].append(CACHE_POINT)
                 formatted_messages.append(formatted_message)
             else:
                 formatted_message = {"role": message.role, "content": []}
@@ -374,8 +385,12 @@ class AwsBedrock(Model):
                             }
                         )
 
+                if cache_plan is not None and message.id in cache_plan.message_ids:
+                    formatted_message["content"].append(CACHE_POINT)
                 formatted_messages.append(formatted_message)
-        # TODO: Add caching: https://docs.aws.amazon.com/bedrock/latest/userguide/conversation-inference-call.html
+
+        if system_message is not None and cache_plan is not None and cache_plan.cache_system:
+            system_message.append(CACHE_POINT)
         return formatted_messages, system_message
 
     def count_tokens(
@@ -451,11 +466,16 @@ class AwsBedrock(Model):
         Invoke the Bedrock API.
         """
         try:
-            formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
+            cache_plan = self.cache_strategy.plan(messages, has_tools=bool(tools)) if self.cache_strategy else None
+            formatted_messages, system_message = self._format_messages(
+                messages, compress_tool_results, cache_plan=cache_plan
+            )
 
             tool_config = None
             if tools:
                 tool_config = {"tools": self._format_tools_for_request(tools)}
+                if cache_plan is not None and cache_plan.cache_tools:
+                    tool_config["tools"].append(CACHE_POINT)
 
             body = {
                 "system": system_message,
@@ -500,11 +520,16 @@ class AwsBedrock(Model):
         Invoke the Bedrock API with streaming.
         """
         try:
-            formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
+            cache_plan = self.cache_strategy.plan(messages, has_tools=bool(tools)) if self.cache_strategy else None
+            formatted_messages, system_message = self._format_messages(
+                messages, compress_tool_results, cache_plan=cache_plan
+            )
 
             tool_config = None
             if tools:
                 tool_config = {"tools": self._format_tools_for_request(tools)}
+                if cache_plan is not None and cache_plan.cache_tools:
+                    tool_config["tools"].append(CACHE_POINT)
 
             body = {
                 "system": system_message,
@@ -553,11 +578,16 @@ class AwsBedrock(Model):
         Async invoke the Bedrock API.
         """
         try:
-            formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
+            cache_plan = self.cache_strategy.plan(messages, has_tools=bool(tools)) if self.cache_strategy else None
+            formatted_messages, system_message = self._format_messages(
+                messages, compress_tool_results, cache_plan=cache_plan
+            )
 
             tool_config = None
             if tools:
                 tool_config = {"tools": self._format_tools_for_request(tools)}
+                if cache_plan is not None and cache_plan.cache_tools:
+                    tool_config["tools"].append(CACHE_POINT)
 
             body = {
                 "system": system_message,
@@ -605,11 +635,16 @@ class AwsBedrock(Model):
         Async invoke the Bedrock API with streaming.
         """
         try:
-            formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
+            cache_plan = self.cache_strategy.plan(messages, has_tools=bool(tools)) if self.cache_strategy else None
+            formatted_messages, system_message = self._format_messages(
+                messages, compress_tool_results, cache_plan=cache_plan
+            )
 
             tool_config = None
             if tools:
                 tool_config = {"tools": self._format_tools_for_request(tools)}
+                if cache_plan is not None and cache_plan.cache_tools:
+                    tool_config["tools"].append(CACHE_POINT)
 
             body = {
                 "system": system_message,
@@ -798,5 +833,7 @@ class AwsBedrock(Model):
         metrics.input_tokens = response_usage.get("inputTokens", 0) or 0
         metrics.output_tokens = response_usage.get("outputTokens", 0) or 0
         metrics.total_tokens = metrics.input_tokens + metrics.output_tokens
+        metrics.cache_read_tokens = response_usage.get("cacheReadInputTokens", 0) or 0
+        metrics.cache_write_tokens = response_usage.get("cacheWriteInputTokens", 0) or 0
 
         return metrics
@@ -1,11 +1,12 @@
 import asyncio
 import collections.abc
 import json
+import random
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from hashlib import md5
-from pathlib import Path
-from time import sleep, time
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from time import monotonic, sleep
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     TYPE_CHECKING,
@@ -31,9 +32,14 @@ from pydantic import BaseModel
 
 from agno.exceptions import AgentRunException, ModelProviderError, RetryableModelProviderError
 from agno.media import Audio, File, Image, Video
+from agno.models.cache import ModelCache, get_default_model_cache, get_model_cache_key
+from agno.models.hedging import HedgingMetrics, LatencyTracker, ahedge, ahedge_stream, hedge, hedge_stream
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
+from agno.models.rate_limit import RateLimiter, RatePermit, get_rate_limiter
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.models.singleflight import get_model_requests_in_flight
+from agno.models.speculation import await_pending_checks
 from agno.run.agent import CustomEvent, RunContentEvent, RunOutput, RunOutputEvent
 from agno.run.requirement import RunRequirement
 from agno.run.team import RunContentEvent as TeamRunContentEvent
@@ -41,7 +47,7 @@ from agno.run.team import TeamRunOutput, TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
 from agno.utils.log import log_debug, log_error, log_info, log_warning
-from agno.utils.timer import Timer
+from agno.utils.timer import Timer, add_phase_time, atimed_iterator, timed_iterator
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
 
@@ -111,6 +117,39 @@ def _handle_agent_exception(a_exc: AgentRunException, additional_input: Optional
             m.stop_after_tool_call = True
 
 
+# Model settings that don't change the response, left out of the response cache key
+_MODEL_CACHE_EXCLUDED_FIELDS = {
+    "name",
+    "provider",
+    "cache_response",
+    "cache_ttl",
+    "cache_dir",
+    "model_cache",
+    "coalesce_requests",
+    "rate_limiter",
+    "requests_per_minute",
+    "tokens_per_minute",
+    "max_concurrent_requests",
+    "retries",
+    "delay_between_retries",
+    "exponential_backoff",
+    "retry_jitter",
+    "hedge_delay",
+    "hedge_percentile",
+    "hedge_model",
+    "fallback_models",
+    "hedging_metrics",
+    "retry_with_guidance",
+    "retry_with_guidance_limit",
+    "timeout",
+    "max_retries",
+}
+# Credentials and client settings, also left out of the response cache key
+_MODEL_CACHE_EXCLUDED_FIELD_PATTERN = re.compile(
+    r"(key|secret|password|token|credentials|client|headers)$|client_|access_key"
+)
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -149,7 +188,20 @@ class Model(ABC):
     # Cache model responses to avoid redundant API calls during development
     cache_response: bool = False
     cache_ttl: Optional[int] = None
+    # Directory of the default SQLite cache, used when no model_cache is set
     cache_dir: Optional[str] = None
+    # Cache backend for model responses (e.g. InMemoryModelCache, SqliteModelCache, RedisModelCache)
+    model_cache: Optional[ModelCache] = None
+    # Share one provider call between identical requests made concurrently
+    coalesce_requests: bool = False
+
+    # Client-side rate limiting, shared by the models with the same provider, id and limits
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    # Maximum number of concurrent requests. Lowered on rate limit errors, and raised back as requests succeed
+    max_concurrent_requests: Optional[int] = None
+    # Rate limiter to use instead, e.g. to share limits between models of the same provider
+    rate_limiter: Optional[RateLimiter] = None
 
     # Retry configuration for model provider errors
     # Number of retries to attempt when a ModelProviderError occurs
@@ -158,21 +210,36 @@ class Model(ABC):
     delay_between_retries: int = 1
     # Exponential backoff: if True, the delay between retries is doubled each time
     exponential_backoff: bool = False
+    # Fraction of the delay between retries that is randomized, so concurrent requests don't retry in lockstep
+    retry_jitter: float = 0.0
     # Enable retrying a model invocation once with a guidance message.
     # This is useful for known errors avoidable with extra instructions.
     retry_with_guidance: bool = True
     # Set the number of times to retry the model invocation with guidance.
     retry_with_guidance_limit: int = 1
 
+    # Hedged requests: send a second request when the first hasn't completed after hedge_delay seconds,
+    # or after the hedge_percentile (e.g. 95) of the recent latencies, and use the first to complete
+    hedge_delay: Optional[float] = None
+    hedge_percentile: Optional[float] = None
+    # Model used for the second request. Defaults to this model
+    hedge_model: Optional["Model"] = None
+    # Models tried in order when this model fails (after its retries) or times out
+    fallback_models: Optional[List["Model"]] = None
+    # Counters of the hedged requests and fallbacks
+    hedging_metrics: HedgingMetrics = field(default_factory=HedgingMetrics)
+    _request_latencies: LatencyTracker = field(default_factory=LatencyTracker, init=False, repr=False)
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
 
     def _get_retry_delay(self, attempt: int) -> float:
         """Calculate the delay before the next retry attempt."""
-        if self.exponential_backoff:
-            return self.delay_between_retries * (2**attempt)
-        return self.delay_between_retries
+        delay = self.delay_between_retries * (2**attempt) if self.exponential_backoff else self.delay_between_retries
+        if self.retry_jitter:
+            return delay * (1 + random.uniform(-self.retry_jitter, self.retry_jitter))
+        return delay
 
     def _is_retryable_error(self, error: ModelProviderError) -> bool:
         """Determine if an error is worth retrying.
@@ -217,6 +284,126 @@ class Model(ABC):
 
         return True
 
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Get the rate limiter of the model, shared by the models with the same provider, id and limits."""
+        if self.rate_limiter is None and (
+            self.requests_per_minute or self.tokens_per_minute or self.max_concurrent_requests
+        ):
+            # Models configured with other limits get their own limiter, rather than silently using the first one's
+            self.rate_limiter = get_rate_limiter(
+                f"{self.provider or self.__class__.__name__}:{self.id}:"
+                f"{self.requests_per_minute}:{self.tokens_per_minute}:{self.max_concurrent_requests}",
+                requests_per_minute=self.requests_per_minute,
+                tokens_per_minute=self.tokens_per_minute,
+                max_concurrency=self.max_concurrent_requests or 64,
+            )
+        return self.rate_limiter
+
+    def _get_request_tokens(self, rate_limiter: RateLimiter, **kwargs: Any) -> int:
+        """Estimate the input tokens of a request, when the rate limiter limits tokens."""
+        if not rate_limiter.limits_tokens:
+            return 0
+        # Estimated locally, as some providers count tokens with an API call
+        from agno.utils.tokens import count_tokens
+
+        try:
+            return count_tokens(
+                kwargs["messages"],
+                tools=kwargs.get("tools"),
+                model_id=self.id,
+                output_schema=kwargs.get("response_format"),
+            )
+        except Exception as e:
+            log_debug(f"Failed to count the tokens of the request: {e}")
+            return 0
+
+    def _release_rate_permit(
+        self,
+        permit: RatePermit,
+        error: Optional[BaseException] = None,
+        usage: Optional[Metrics] = None,
+        latency: Optional[float] = None,
+    ) -> None:
+        rate_limited = isinstance(error, ModelProviderError) and error.status_code == 429
+        tokens = usage.total_tokens if usage is not None and usage.total_tokens else None
+        permit.release(rate_limited=rate_limited, latency=latency, tokens=tokens)
+
+    def _invoke_rate_limited(self, **kwargs) -> ModelResponse:
+        """Invoke the model once the rate limiter allows it."""
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is None:
+            return self.invoke(**kwargs)
+
+        permit = rate_limiter.acquire(tokens=self._get_request_tokens(rate_limiter, **kwargs))
+        try:
+            response = self.invoke(**kwargs)
+        except BaseException as e:
+            self._release_rate_permit(permit, error=e)
+            raise
+        self._release_rate_permit(permit, usage=response.response_usage)
+        return response
+
+    async def _ainvoke_rate_limited(self, **kwargs) -> ModelResponse:
+        """Asynchronously invoke the model once the rate limiter allows it."""
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is None:
+            return await self.ainvoke(**kwargs)
+
+        permit = await rate_limiter.aacquire(tokens=self._get_request_tokens(rate_limiter, **kwargs))
+        try:
+            response = await self.ainvoke(**kwargs)
+        except BaseException as e:
+            self._release_rate_permit(permit, error=e)
+            raise
+        self._release_rate_permit(permit, usage=response.response_usage)
+        return response
+
+    def _invoke_stream_rate_limited(self, **kwargs) -> Iterator[ModelResponse]:
+        """Stream the model response once the rate limiter allows it. The stream holds its slot until it ends."""
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is None:
+            yield from self.invoke_stream(**kwargs)
+            return
+
+        permit = rate_limiter.acquire(tokens=self._get_request_tokens(rate_limiter, **kwargs))
+        usage = Metrics()
+        # The latency of a stream is the time to its first chunk, as its duration depends on the output length
+        latency: Optional[float] = None
+        try:
+            for response in self.invoke_stream(**kwargs):
+                if latency is None:
+                    latency = monotonic() - permit.started_at
+                if response.response_usage is not None:
+                    usage += response.response_usage
+                yield response
+        except BaseException as e:
+            self._release_rate_permit(permit, error=e, latency=latency)
+            raise
+        self._release_rate_permit(permit, usage=usage, latency=latency)
+
+    async def _ainvoke_stream_rate_limited(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        """Asynchronously stream the model response once the rate limiter allows it."""
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is None:
+            async for response in self.ainvoke_stream(**kwargs):
+                yield response
+            return
+
+        permit = await rate_limiter.aacquire(tokens=self._get_request_tokens(rate_limiter, **kwargs))
+        usage = Metrics()
+        latency: Optional[float] = None
+        try:
+            async for response in self.ainvoke_stream(**kwargs):
+                if latency is None:
+                    latency = monotonic() - permit.started_at
+                if response.response_usage is not None:
+                    usage += response.response_usage
+                yield response
+        except BaseException as e:
+            self._release_rate_permit(permit, error=e, latency=latency)
+            raise
+        self._release_rate_permit(permit, usage=usage, latency=latency)
+
     def _invoke_with_retry(self, **kwargs) -> ModelResponse:
         """
         Invoke the model with retry logic for ModelProviderError.
@@ -229,7 +416,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                return self.invoke(**kwargs)
+                return self._invoke_rate_limited(**kwargs)
             except ModelProviderError as e:
                 last_exception = e
                 # Check if error is non-retryable
@@ -276,7 +463,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                return await self.ainvoke(**kwargs)
+                return await self._ainvoke_rate_limited(**kwargs)
             except ModelProviderError as e:
                 last_exception = e
                 # Check if error is non-retryable
@@ -324,7 +511,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                yield from self.invoke_stream(**kwargs)
+                yield from self._invoke_stream_rate_limited(**kwargs)
                 return  # Success, exit the retry loop
             except ModelProviderError as e:
                 last_exception = e
@@ -375,7 +562,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                async for response in self.ainvoke_stream(**kwargs):
+                async for response in self._ainvoke_stream_rate_limited(**kwargs):
                     yield response
                 return  # Success, exit the retry loop
             except ModelProviderError as e:
@@ -416,6 +603,357 @@ class Model(ABC):
         # If we've exhausted all retries, raise the last exception
         raise last_exception  # type: ignore
 
+    def _should_fall_back(self, error: BaseException) -> bool:
+        """Determine if the next fallback model should be tried after an error."""
+        return isinstance(error, (ModelProviderError, TimeoutError, asyncio.TimeoutError, ConnectionError))
+
+    def _get_fallback_models(self) -> List["Model"]:
+        return [self, *(self.fallback_models or [])]
+
+    def _on_fallback(self, model: "Model", error: BaseException) -> None:
+        log_warning(f"Model {model.id} failed, falling back to the next model: {error}")
+
+    def _on_fallback_used(self, model: "Model", assistant_message: Message) -> None:
+        self.hedging_metrics.increment("fallbacks_used")
+        if assistant_message.metrics.additional_metrics is None:
+            assistant_message.metrics.additional_metrics = {}
+        assistant_message.metrics.additional_metrics["fallback_model"] = model.id
+
+    def _get_fallback_kwargs(self, model: "Model", **kwargs) -> Dict[str, Any]:
+        """Get the arguments of a request to a fallback model.
+
+        The tools and response format were formatted for this model, so they are formatted again for the fallback model.
+        """
+        if model is self:
+            return kwargs
+        tools = kwargs.get("tools")
+        if tools:
+            fallback_tools: List[Union[Function, dict]] = []
+            for tool in tools:
+                if tool.get("type") == "function" and "function" in tool:
+                    fallback_tools.append(Function.from_dict(tool["function"]))
+                elif type(model) is type(self):
+                    fallback_tools.append(tool)
+                else:
+                    log_warning(f"Built-in tool {tool.get('type')} is not supported by the fallback model {model.id}")
+            tools = model._format_tools(fallback_tools)
+        return {
+            **kwargs,
+            "tools": tools,
+            "response_format": model._get_fallback_response_format(kwargs.get("response_format")),
+        }
+
+    def _get_fallback_response_format(
+        self, response_format: Optional[Union[Dict, Type[BaseModel]]]
+    ) -> Optional[Union[Dict, Type[BaseModel]]]:
+        """Get the response format to use as a fallback model, from the response format of the primary model."""
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            if self.supports_native_structured_outputs:
+                return response_format
+            if self.supports_json_schema_outputs:
+                return {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": response_format.__name__,
+                        "schema": response_format.model_json_schema(),
+                    },
+                }
+            return {"type": "json_object"}
+        if isinstance(response_format, dict) and response_format.get("type") == "json_schema":
+            return response_format if self.supports_json_schema_outputs else {"type": "json_object"}
+        return response_format
+
+    def _invoke_with_fallbacks(self, **kwargs) -> ModelResponse:
+        """Invoke the model, and the fallback models in order while they fail."""
+        models = self._get_fallback_models()
+        for model in models:
+            try:
+                response = model._invoke_hedged(**self._get_fallback_kwargs(model, **kwargs))
+            except Exception as e:
+                if model is models[-1] or not self._should_fall_back(e):
+                    raise
+                self._on_fallback(model, e)
+                continue
+            if model is not self:
+                self._on_fallback_used(model, kwargs["assistant_message"])
+            return response
+        raise RuntimeError("No model to invoke")
+
+    async def _ainvoke_with_fallbacks(self, **kwargs) -> ModelResponse:
+        """Asynchronously invoke the model, and the fallback models in order while they fail."""
+        models = self._get_fallback_models()
+        for model in models:
+            try:
+                response = await model._ainvoke_hedged(**self._get_fallback_kwargs(model, **kwargs))
+            except Exception as e:
+                if model is models[-1] or not self._should_fall_back(e):
+                    raise
+                self._on_fallback(model, e)
+                continue
+            if model is not self:
+                self._on_fallback_used(model, kwargs["assistant_message"])
+            return response
+        raise RuntimeError("No model to invoke")
+
+    def _invoke_stream_with_fallbacks(self, **kwargs) -> Iterator[ModelResponse]:
+        """Stream the model response, from the fallback models in order while they fail before their first chunk."""
+        models = self._get_fallback_models()
+        for model in models:
+            started = False
+            try:
+                for response in model._invoke_stream_hedged(**self._get_fallback_kwargs(model, **kwargs)):
+                    if not started and model is not self:
+                        self._on_fallback_used(model, kwargs["assistant_message"])
+                    started = True
+                    yield response
+                return
+            except Exception as e:
+                if started or model is models[-1] or not self._should_fall_back(e):
+                    raise
+                self._on_fallback(model, e)
+
+    async def _ainvoke_stream_with_fallbacks(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        """Asynchronously stream the model response, from the fallback models in order while they fail."""
+        models = self._get_fallback_models()
+        for model in models:
+            started = False
+            try:
+                async for response in model._ainvoke_stream_hedged(**self._get_fallback_kwargs(model, **kwargs)):
+                    if not started and model is not self:
+                        self._on_fallback_used(model, kwargs["assistant_message"])
+                    started = True
+                    yield response
+                return
+            except Exception as e:
+                if started or model is models[-1] or not self._should_fall_back(e):
+                    raise
+                self._on_fallback(model, e)
+
+    def _get_hedge_delay(self) -> Optional[float]:
+        """Get the delay after which a second request is sent, or None if requests are not hedged."""
+        if self.hedge_percentile is not None:
+            delay = self._request_latencies.percentile(self.hedge_percentile)
+            if delay is not None:
+                return delay
+        return self.hedge_delay
+
+    def _get_hedge_kwargs(self, **kwargs) -> Dict[str, Any]:
+        """Get the arguments of one of the requests of a hedged request, so concurrent requests don't share state."""
+        assistant_message: Message = kwargs["assistant_message"]
+        return {
+            **kwargs,
+            "messages": list(kwargs["messages"]),
+            "assistant_message": assistant_message.model_copy(update={"metrics": Metrics()}),
+        }
+
+    def _on_hedge_fired(self) -> None:
+        self.hedging_metrics.increment("hedges_fired")
+        log_debug(f"Model {self.id} is slow to respond, sending a hedged request")
+
+    def _on_hedge_completed(self, assistant_message: Message, winner_kwargs: Dict[str, Any], winner: int) -> None:
+        # The metrics of the request that was used are the metrics of the assistant message
+        assistant_message.metrics = winner_kwargs["assistant_message"].metrics
+        if winner == 1:
+            self.hedging_metrics.increment("hedges_won")
+            if assistant_message.metrics.additional_metrics is None:
+                assistant_message.metrics.additional_metrics = {}
+            assistant_message.metrics.additional_metrics["hedge_won"] = True
+
+    def _invoke_timed(self, **kwargs) -> ModelResponse:
+        """Invoke the model, recording the latency of the request when it is used to hedge requests."""
+        if self.hedge_percentile is None:
+            return self._invoke_with_retry(**kwargs)
+        start = monotonic()
+        response = self._invoke_with_retry(**kwargs)
+        self._request_latencies.record(monotonic() - start)
+        return response
+
+    async def _ainvoke_timed(self, **kwargs) -> ModelResponse:
+        if self.hedge_percentile is None:
+            return await self._ainvoke_with_retry(**kwargs)
+        start = monotonic()
+        response = await self._ainvoke_with_retry(**kwargs)
+        self._request_latencies.record(monotonic() - start)
+        return response
+
+    def _invoke_stream_timed(self, **kwargs) -> Iterator[ModelResponse]:
+        """Stream the model response, recording the time to its first chunk when it is used to hedge requests."""
+        start: Optional[float] = monotonic() if self.hedge_percentile is not None else None
+        for response in self._invoke_stream_with_retry(**kwargs):
+            if start is not None:
+                self._request_latencies.record(monotonic() - start)
+                start = None
+            yield response
+
+    async def _ainvoke_stream_timed(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        start: Optional[float] = monotonic() if self.hedge_percentile is not None else None
+        async for response in self._ainvoke_stream_with_retry(**kwargs):
+            if start is not None:
+                self._request_latencies.record(monotonic() - start)
+                start = None
+            yield response
+
+    def _invoke_hedged(self, **kwargs) -> ModelResponse:
+        """Invoke the model, sending a second request if the first is slow, and using the first to complete."""
+        delay = self._get_hedge_delay()
+        if delay is None:
+            return self._invoke_timed(**kwargs)
+
+        self.hedging_metrics.increment("requests")
+        hedge_model = self.hedge_model or self
+        requests_kwargs = [self._get_hedge_kwargs(**kwargs), self._get_hedge_kwargs(**kwargs)]
+
+        def send_hedge() -> ModelResponse:
+            self._on_hedge_fired()
+            return hedge_model._invoke_timed(**requests_kwargs[1])
+
+        response, winner = hedge(lambda: self._invoke_timed(**requests_kwargs[0]), send_hedge, delay)
+        self._on_hedge_completed(kwargs["assistant_message"], requests_kwargs[winner], winner)
+        return response
+
+    async def _ainvoke_hedged(self, **kwargs) -> ModelResponse:
+        """Asynchronously invoke the model, sending a second request if the first is slow, and cancelling the slower."""
+        delay = self._get_hedge_delay()
+        if delay is None:
+            return await self._ainvoke_timed(**kwargs)
+
+        self.hedging_metrics.increment("requests")
+        hedge_model = self.hedge_model or self
+        requests_kwargs = [self._get_hedge_kwargs(**kwargs), self._get_hedge_kwargs(**kwargs)]
+
+        async def send_hedge() -> ModelResponse:
+            self._on_hedge_fired()
+            return await hedge_model._ainvoke_timed(**requests_kwargs[1])
+
+        response, winner = await ahedge(lambda: self._ainvoke_timed(**requests_kwargs[0]), send_hedge, delay)
+        self._on_hedge_completed(kwargs["assistant_message"], requests_kwargs[winner], winner)
+        return response
+
+    def _invoke_stream_hedged(self, **kwargs) -> Iterator[ModelResponse]:
+        """Stream the model response, sending a second request if the first is slow to start streaming.
+
+        The stream that yields its first chunk first is used.
+        """
+        delay = self._get_hedge_delay()
+        if delay is None:
+            yield from self._invoke_stream_timed(**kwargs)
+            return
+
+        self.hedging_metrics.increment("requests")
+        hedge_model = self.hedge_model or self
+        requests_kwargs = [self._get_hedge_kwargs(**kwargs), self._get_hedge_kwargs(**kwargs)]
+
+        def send_hedge() -> Iterator[ModelResponse]:
+            self._on_hedge_fired()
+            return hedge_model._invoke_stream_timed(**requests_kwargs[1])
+
+        started = False
+        for response, winner in hedge_stream(
+            lambda: self._invoke_stream_timed(**requests_kwargs[0]), send_hedge, delay
+        ):
+            if not started:
+                self._on_hedge_completed(kwargs["assistant_message"], requests_kwargs[winner], winner)
+                started = True
+            yield response
+
+    async def _ainvoke_stream_hedged(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        """Asynchronously stream the model response, sending a second request if the first is slow to start streaming.
+
+        The stream that yields its first chunk first is used, and the other is cancelled.
+        """
+        delay = self._get_hedge_delay()
+        if delay is None:
+            async for response in self._ainvoke_stream_timed(**kwargs):
+                yield response
+            return
+
+        self.hedging_metrics.increment("requests")
+        hedge_model = self.hedge_model or self
+        requests_kwargs = [self._get_hedge_kwargs(**kwargs), self._get_hedge_kwargs(**kwargs)]
+
+        def send_hedge() -> AsyncIterator[ModelResponse]:
+            self._on_hedge_fired()
+            return hedge_model._ainvoke_stream_timed(**requests_kwargs[1])
+
+        started = False
+        async for response, winner in ahedge_stream(
+            lambda: self._ainvoke_stream_timed(**requests_kwargs[0]), send_hedge, delay
+        ):
+            if not started:
+                self._on_hedge_completed(kwargs["assistant_message"], requests_kwargs[winner], winner)
+                started = True
+            yield response
+
+    def _get_request_key(self, stream: bool, **kwargs: Any) -> str:
+        """Get the hash of a provider request, used to share identical requests in flight."""
+        return self._get_model_cache_key(
+            kwargs["messages"],
+            stream=stream,
+            response_format=kwargs.get("response_format"),
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice"),
+            compress_tool_results=kwargs.get("compress_tool_results", False),
+        )
+
+    def _get_shared_response(self, response: ModelResponse) -> ModelResponse:
+        """Copy a response shared from another request. Its token usage is only counted by that request."""
+        shared_response = deepcopy(response)
+        shared_response.response_usage = None
+        return shared_response
+
+    def _invoke_coalesced(self, **kwargs) -> ModelResponse:
+        """Invoke the model, sharing the response of an identical request already in flight."""
+        if not self.coalesce_requests:
+            return self._invoke_with_fallbacks(**kwargs)
+
+        assistant_message: Message = kwargs["assistant_message"]
+        assistant_message.metrics.start_timer()
+        response, shared = get_model_requests_in_flight().do(
+            self._get_request_key(stream=False, **kwargs), lambda: self._invoke_with_fallbacks(**kwargs)
+        )
+        if not shared:
+            return response
+        assistant_message.metrics.stop_timer()
+        return self._get_shared_response(response)
+
+    async def _ainvoke_coalesced(self, **kwargs) -> ModelResponse:
+        """Asynchronously invoke the model, sharing the response of an identical request already in flight."""
+        if not self.coalesce_requests:
+            return await self._ainvoke_with_fallbacks(**kwargs)
+
+        assistant_message: Message = kwargs["assistant_message"]
+        assistant_message.metrics.start_timer()
+        response, shared = await get_model_requests_in_flight().ado(
+            self._get_request_key(stream=False, **kwargs), lambda: self._ainvoke_with_fallbacks(**kwargs)
+        )
+        if not shared:
+            return response
+        assistant_message.metrics.stop_timer()
+        return self._get_shared_response(response)
+
+    def _invoke_stream_coalesced(self, **kwargs) -> Iterator[ModelResponse]:
+        """Stream the model response, replaying the chunks of an identical stream already in flight."""
+        if not self.coalesce_requests:
+            yield from self._invoke_stream_with_fallbacks(**kwargs)
+            return
+
+        for response, shared in get_model_requests_in_flight().stream(
+            self._get_request_key(stream=True, **kwargs), lambda: self._invoke_stream_with_fallbacks(**kwargs)
+        ):
+            yield self._get_shared_response(response) if shared else response
+
+    async def _ainvoke_stream_coalesced(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        """Asynchronously stream the model response, replaying the chunks of an identical stream already in flight."""
+        if not self.coalesce_requests:
+            async for response in self._ainvoke_stream_with_fallbacks(**kwargs):
+                yield response
+            return
+
+        async for response, shared in get_model_requests_in_flight().astream(
+            self._get_request_key(stream=True, **kwargs), lambda: self._ainvoke_stream_with_fallbacks(**kwargs)
+        ):
+            yield self._get_shared_response(response) if shared else response
+
     def to_dict(self) -> Dict[str, Any]:
         fields = {"name", "id", "provider"}
         _dict = {field: getattr(self, field) for field in fields if getattr(self, field) is not None}
@@ -432,90 +970,122 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def _get_model_cache(self) -> ModelCache:
+        """Get the cache backend for model responses."""
+        if self.model_cache is not None:
+            return self.model_cache
+        return get_default_model_cache(self.cache_dir)
+
+    def _get_model_cache_params(self) -> Dict[str, Any]:
+        """Get the model settings sent with each request, leaving out credentials and client settings."""
+        params: Dict[str, Any] = {}
+        for model_field in fields(self):
+            name = model_field.name
+            if (
+                name.startswith("_")
+                or name in _MODEL_CACHE_EXCLUDED_FIELDS
+                or _MODEL_CACHE_EXCLUDED_FIELD_PATTERN.search(name)
+            ):
+                continue
+            value = getattr(self, name, None)
+            if value is None or isinstance(value, (str, int, float, bool)):
+                params[name] = value
+            elif isinstance(value, (list, dict)):
+                try:
+                    json.dumps(value)
+                    params[name] = value
+                except (TypeError, ValueError):
+                    continue
+        return params
+
+    def _get_model_cache_message(self, message: Message, compress_tool_results: bool = False) -> Dict[str, Any]:
+        """Get the parts of a message sent to the model, leaving out generated ids, metrics and timestamps."""
+        message_data: Dict[str, Any] = {
+            "role": message.role,
+            "content": message.get_content(use_compressed_content=compress_tool_results),
+            "name": message.name,
+            "tool_call_id": message.tool_call_id,
+            "tool_calls": message.tool_calls,
+            "reasoning_content": message.reasoning_content,
+            "redacted_reasoning_content": message.redacted_reasoning_content,
+        }
+        for media_field in ("images", "audio", "videos", "files"):
+            media = getattr(message, media_field)
+            if media:
+                message_data[media_field] = [
+                    {k: v for k, v in artifact.to_dict().items() if k != "id"} for artifact in media
+                ]
+        return {k: v for k, v in message_data.items() if v is not None}
+
     def _get_model_cache_key(self, messages: List[Message], stream: bool, **kwargs: Any) -> str:
-        """Generate a cache key based on model messages and core parameters."""
-        message_data = []
-        for msg in messages:
-            msg_dict = {
-                "role": msg.role,
-                "content": msg.content,
-            }
-            message_data.append(msg_dict)
-
-        # Include tools parameter in cache key
-        has_tools = bool(kwargs.get("tools"))
+        """Generate a cache key from the full request: model settings, messages, tools and response format."""
+        response_format = kwargs.get("response_format")
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response_format = response_format.model_json_schema()
 
         cache_data = {
-            "model_id": self.id,
-            "messages": message_data,
-            "has_tools": has_tools,
-            "response_format": kwargs.get("response_format"),
+            "model": self.__class__.__name__,
+            "params": self._get_model_cache_params(),
+            "messages": [
+                self._get_model_cache_message(message, compress_tool_results=kwargs.get("compress_tool_results", False))
+                for message in messages
+            ],
+            "tools": self._format_tools(kwargs.get("tools")),
+            "tool_choice": kwargs.get("tool_choice") or self._tool_choice,
+            "response_format": response_format,
             "stream": stream,
         }
-
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return md5(cache_str.encode()).hexdigest()
-
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
-        if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
-
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+        return get_model_cache_key(cache_data)
 
     def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
+        try:
+            return self._get_model_cache().get(cache_key)
+        except Exception as e:
+            log_warning(f"Failed to read model response cache: {e}")
             return None
 
+    async def _aget_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a cached response if it exists and is not expired."""
         try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
-        except Exception:
+            return await self._get_model_cache().aget(cache_key)
+        except Exception as e:
+            log_warning(f"Failed to read model response cache: {e}")
             return None
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
-            cache_data = {
-                "timestamp": int(time()),
-                "is_streaming": is_streaming,
-                "result": result.to_dict(),
-            }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+            cache_data = {"is_streaming": is_streaming, "result": result.to_dict()}
+            self._get_model_cache().set(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to save model response to cache: {e}")
+
+    async def _asave_model_response_to_cache(
+        self, cache_key: str, result: ModelResponse, is_streaming: bool = False
+    ) -> None:
+        """Save a model response to cache."""
+        try:
+            cache_data = {"is_streaming": is_streaming, "result": result.to_dict()}
+            await self._get_model_cache().aset(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to save model response to cache: {e}")
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
+        try:
+            cache_data = {"is_streaming": True, "streaming_responses": [r.to_dict() for r in responses]}
+            self._get_model_cache().set(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to save streaming model responses to cache: {e}")
 
+    async def _asave_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
+        """Save streaming responses to cache."""
         try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+            cache_data = {"is_streaming": True, "streaming_responses": [r.to_dict() for r in responses]}
+            await self._get_model_cache().aset(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to save streaming model responses to cache: {e}")
 
     def _model_response_from_cache(self, cached_data: Dict[str, Any]) -> ModelResponse:
         """Reconstruct a ModelResponse from cached data."""
@@ -628,7 +1198,12 @@ class Model(ABC):
             # Check cache if enabled
             if self.cache_response:
                 cache_key = self._get_model_cache_key(
-                    messages, stream=False, response_format=response_format, tools=tools
+                    messages,
+                    stream=False,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    compress_tool_results=compression_manager is not None and compression_manager.compress_tool_results,
                 )
                 cached_data = self._get_cached_model_response(cache_key)
 
@@ -834,9 +1409,14 @@ class Model(ABC):
             # Check cache if enabled
             if self.cache_response:
                 cache_key = self._get_model_cache_key(
-                    messages, stream=False, response_format=response_format, tools=tools
+                    messages,
+                    stream=False,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    compress_tool_results=compression_manager is not None and compression_manager.compress_tool_results,
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = await self._aget_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -1004,7 +1584,7 @@ class Model(ABC):
 
             # Save to cache if enabled
             if self.cache_response:
-                self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
+                await self._asave_model_response_to_cache(cache_key, model_response, is_streaming=False)
         finally:
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
@@ -1037,7 +1617,8 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response with retry logic for ModelProviderError
-        provider_response = self._invoke_with_retry(
+        request_start = monotonic()
+        provider_response = self._invoke_coalesced(
             assistant_message=assistant_message,
             messages=messages,
             response_format=response_format,
@@ -1046,6 +1627,7 @@ class Model(ABC):
             run_response=run_response,
             compress_tool_results=compress_tool_results,
         )
+        add_phase_time("model", monotonic() - request_start)
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -1096,7 +1678,8 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response with retry logic for ModelProviderError
-        provider_response = await self._ainvoke_with_retry(
+        request_start = monotonic()
+        provider_response = await self._ainvoke_coalesced(
             messages=messages,
             response_format=response_format,
             tools=tools,
@@ -1105,6 +1688,7 @@ class Model(ABC):
             run_response=run_response,
             compress_tool_results=compress_tool_results,
         )
+        add_phase_time("model", monotonic() - request_start)
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -1222,14 +1806,17 @@ class Model(ABC):
         Process a streaming response from the model with retry logic for ModelProviderError.
         """
 
-        for response_delta in self._invoke_stream_with_retry(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-            compress_tool_results=compress_tool_results,
+        for response_delta in timed_iterator(
+            "model",
+            self._invoke_stream_coalesced(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+                compress_tool_results=compress_tool_results,
+            ),
         ):
             for model_response_delta in self._populate_stream_data(
                 stream_data=stream_data,
@@ -1260,7 +1847,12 @@ class Model(ABC):
             cache_key = None
             if self.cache_response:
                 cache_key = self._get_model_cache_key(
-                    messages, stream=True, response_format=response_format, tools=tools
+                    messages,
+                    stream=True,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    compress_tool_results=compression_manager is not None and compression_manager.compress_tool_results,
                 )
                 cached_data = self._get_cached_model_response(cache_key)
 
@@ -1466,14 +2058,17 @@ class Model(ABC):
         """
         Process a streaming response from the model with retry logic for ModelProviderError.
         """
-        async for response_delta in self._ainvoke_stream_with_retry(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-            compress_tool_results=compress_tool_results,
+        async for response_delta in atimed_iterator(
+            "model",
+            self._ainvoke_stream_coalesced(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+                compress_tool_results=compress_tool_results,
+            ),
         ):
             for model_response_delta in self._populate_stream_data(
                 stream_data=stream_data,
@@ -1504,9 +2099,14 @@ class Model(ABC):
             cache_key = None
             if self.cache_response:
                 cache_key = self._get_model_cache_key(
-                    messages, stream=True, response_format=response_format, tools=tools
+                    messages,
+                    stream=True,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    compress_tool_results=compression_manager is not None and compression_manager.compress_tool_results,
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = await self._aget_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for async streaming model response")
@@ -1683,7 +2283,7 @@ class Model(ABC):
 
             # Save streaming responses to cache if enabled
             if self.cache_response and cache_key and streaming_responses:
-                self._save_streaming_responses_to_cache(cache_key, streaming_responses)
+                await self._asave_streaming_responses_to_cache(cache_key, streaming_responses)
 
         finally:
             # Close the Gemini client
@@ -1962,6 +2562,7 @@ class Model(ABC):
 
         # Stop function call timer
         function_call_timer.stop()
+        add_phase_time("tools", function_call_timer.elapsed)
 
         # Process function call output
         function_call_output: str = ""
@@ -2232,6 +2833,7 @@ class Model(ABC):
             raise e
 
         function_call_timer.stop()
+        add_phase_time("tools", function_call_timer.elapsed)
         return success, function_call_timer, function_call, result
 
     async def arun_function_calls(
@@ -2376,6 +2978,9 @@ class Model(ABC):
                 )
             ]
 
+        # Don't run tools for an input that is still being checked
+        await await_pending_checks()
+
         results = await asyncio.gather(
             *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
         )
@@ -2755,6 +3360,10 @@ class Model(ABC):
             if k in {"client", "async_client", "http_client", "mistral_client", "model_client"}:
                 setattr(new_model, k, None)
                 continue
+            # Share the response cache, the rate limiter and the hedging state between copies
+            if k in {"model_cache", "rate_limiter", "hedging_metrics", "_request_latencies"}:
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
@@ -0,0 +1,302 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+
+class ModelCache(ABC):
+    """Stores model responses, keyed by a hash of the full request sent to the model.
+
+    Values are JSON-serializable dicts holding either a single response or the responses of a stream.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        self.set(key, value, ttl=ttl)
+
+
+class InMemoryModelCache(ModelCache):
+    """Keeps model responses in memory, evicting the least recently used ones past `max_size` entries.
+
+    Args:
+        max_size: Maximum number of responses to keep (None = unbounded).
+        ttl: Default time to live of a response in seconds (None = no expiration).
+    """
+
+    def __init__(self, max_size: Optional[int] = 1024, ttl: Optional[int] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        # Expiration time and value by key, least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Copy values in and out, so callers can't change the cached ones
+        return deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        entry = (time() + ttl if ttl is not None else None, deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteModelCache(ModelCache):
+    """Stores model responses in a SQLite file, so they are reused across processes.
+
+    Args:
+        db_file: Path of the SQLite file. Defaults to ~/.agno/cache/model_responses.db.
+        max_size: Maximum number of responses to keep; the least recently used are evicted (None = unbounded).
+        ttl: Default time to live of a response in seconds (None = no expiration).
+        purge_interval: Minimum number of seconds between deletions of the expired responses. Expired responses are
+            never returned, they are only deleted on writes at most this often.
+    """
+
+    table_name = "model_responses"
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        max_size: Optional[int] = 10000,
+        ttl: Optional[int] = None,
+        purge_interval: float = 60.0,
+    ):
+        path = Path(db_file) if db_file else Path.home() / ".agno" / "cache" / "model_responses.db"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_file = str(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.purge_interval = purge_interval
+
+        self._last_purged_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table_name}_expires_at ON {self.table_name} (expires_at)"
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time()
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                return None
+            self._connection.execute(f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            log_debug(f"Failed to load cached model response: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        now = time()
+        ttl = ttl if ttl is not None else self.ttl
+        serialized = json.dumps(value, default=str)
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, serialized, now + ttl if ttl is not None else None, now),
+            )
+            if self._last_purged_at is None or now - self._last_purged_at >= self.purge_interval:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE expires_at <= ?", (now,))
+                self._last_purged_at = now
+            if self.max_size is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN "
+                    f"(SELECT key FROM {self.table_name} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    # SQLite calls block, so the async methods run them in a thread
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+
+class RedisModelCache(ModelCache):
+    """Stores model responses in Redis, so they are shared across processes and hosts.
+
+    Expired responses are removed by Redis. Past `max_size` entries, the least recently used are evicted.
+
+    Args:
+        redis_client: A Redis client. Created from `redis_url` when not provided.
+        redis_url: URL of the Redis server.
+        prefix: Prefix of the keys used by the cache.
+        max_size: Maximum number of responses to keep (None = rely on the Redis eviction policy).
+        ttl: Default time to live of a response in seconds (None = no expiration).
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        redis_url: Optional[str] = None,
+        prefix: str = "agno:model_cache",
+        max_size: Optional[int] = 10000,
+        ttl: Optional[int] = None,
+    ):
+        if redis_client is None:
+            try:
+                from redis import Redis
+            except ImportError:
+                raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+            redis_client = Redis.from_url(redis_url) if redis_url else Redis()
+        self.redis_client: Any = redis_client
+        self.prefix = prefix
+        self.max_size = max_size
+        self.ttl = ttl
+
+    @property
+    def _index_key(self) -> str:
+        # Sorted set of the cached keys, scored by their last access time
+        return f"{self.prefix}:index"
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.redis_client.get(self._get_key(key))
+        if value is None:
+            self.redis_client.zrem(self._index_key, key)
+            return None
+        if self.max_size is not None:
+            self.redis_client.zadd(self._index_key, {key: time()})
+        try:
+            return json.loads(value)
+        except ValueError as e:
+            log_debug(f"Failed to load cached model response: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        pipeline = self.redis_client.pipeline()
+        pipeline.set(self._get_key(key), json.dumps(value, default=str), ex=ttl)
+        if self.max_size is not None:
+            pipeline.zadd(self._index_key, {key: time()})
+            pipeline.zcard(self._index_key)
+        results = pipeline.execute()
+
+        if self.max_size is not None and results[-1] > self.max_size:
+            evicted = self.redis_client.zpopmin(self._index_key, results[-1] - self.max_size)
+            if evicted:
+                self.redis_client.delete(*[self._get_key(self._decode(member)) for member, _ in evicted])
+
+    def delete(self, key: str) -> None:
+        self.redis_client.delete(self._get_key(key))
+        self.redis_client.zrem(self._index_key, key)
+
+    def clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
+
+    def _decode(self, member: Any) -> str:
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+
+_default_model_caches: Dict[str, SqliteModelCache] = {}
+_default_model_caches_lock = threading.Lock()
+
+
+def get_default_model_cache(cache_dir: Optional[str] = None) -> ModelCache:
+    """Get the SQLite cache used by models with `cache_response=True` and no `model_cache`, shared per directory."""
+    cache_path = Path(cache_dir) if cache_dir else Path.home() / ".agno" / "cache"
+    db_file = str(cache_path / "model_responses.db")
+    with _default_model_caches_lock:
+        if db_file not in _default_model_caches:
+            try:
+                _default_model_caches[db_file] = SqliteModelCache(db_file=db_file)
+            except Exception as e:
+                log_warning(f"Failed to open the model response cache at {db_file}, caching in memory: {e}")
+                return _get_fallback_model_cache()
+        return _default_model_caches[db_file]
+
+
+_fallback_model_cache: Optional[InMemoryModelCache] = None
+
+
+def _get_fallback_model_cache() -> InMemoryModelCache:
+    global _fallback_model_cache
+    if _fallback_model_cache is None:
+        _fallback_model_cache = InMemoryModelCache()
+    return _fallback_model_cache
+
+
+def get_model_cache_key(payload: Dict[str, Any]) -> str:
+    """Get a stable hash of a canonical, JSON-serializable request payload."""
+    serialized = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return sha256(serialized.encode("utf-8")).hexdigest()
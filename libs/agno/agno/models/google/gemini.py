@@ -1,12 +1,13 @@
 import asyncio
 import base64
+import hashlib
 import json
 import time
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import getenv
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -17,12 +18,13 @@ from agno.models.base import Model, RetryableModelProviderError
 from agno.models.google.utils import MALFORMED_FUNCTION_CALL_GUIDANCE, GeminiFinishReason
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.metrics import Metrics
+from agno.models.prompt_cache import PromptCacheStrategy
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from agno.tools.function import Function
 from agno.utils.gemini import format_function_definitions, format_image_for_message, prepare_response_schema
 from agno.utils.log import log_debug, log_error, log_info, log_warning
-from agno.utils.tokens import count_schema_tokens, count_text_tokens, count_tool_tokens
+from agno.utils.tokens import count_schema_tokens, count_text_tokens, count_tokens, count_tool_tokens
 
 try:
     from google import genai
@@ -33,6 +35,7 @@ try:
         DynamicRetrievalConfig,
         FileSearch,
         FunctionCallingConfigMode,
+        CreateCachedContentConfig,
         GenerateContentConfig,
         GenerateContentResponse,
         GenerateContentResponseUsageMetadata,
@@ -106,6 +109,8 @@ class Gemini(Model):
     response_modalities: Optional[list[str]] = None  # "TEXT", "IMAGE", and/or "AUDIO"
     speech_config: Optional[dict[str, Any]] = None
     cached_content: Optional[Any] = None
+    # Cache the stable prefix of the requests (system prompt, tools and history) as cached contents
+    cache_strategy: Optional[PromptCacheStrategy] = None
     thinking_budget: Optional[int] = None  # Thinking budget for Gemini 2.5 models
     include_thoughts: Optional[bool] = None  # Include thought summaries in response
     thinking_level: Optional[str] = None  # "low", "high"
@@ -121,6 +126,10 @@ class Gemini(Model):
 
     # Gemini client
     client: Optional[GeminiClient] = None
+    # Names, expiration times and message ids of the cached contents created with the cache_strategy, by prefix hash
+    _prompt_caches: Dict[str, Tuple[Optional[str], float, Tuple[str, ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     # The role to map the Gemini response
     role_map = {
@@ -463,6 +472,191 @@ class Gemini(Model):
 
             return total
 
+    def _get_prompt_cache_prefix(
+        self, messages: List[Message], request_kwargs: Dict[str, Any], compress_tool_results: bool = False
+    ) -> Optional[Tuple[str, Tuple[str, ...], List[Any], List[Any]]]:
+        """
+        Get the stable prefix of a request worth caching with the cache_strategy.
+
+        The prefix ends with the last message sent by the previous request before the newest user message. It is the
+        same for every request of a run, so its cached content is reused, and the newest user message is always sent.
+
+        Returns:
+            The hash of the prefix, the ids of its messages, the contents of its messages and the contents of the
+            other messages, or None if the prefix should not be cached.
+        """
+        if self.cache_strategy is None or self.cached_content is not None or not self.cache_strategy.cache_history:
+            return None
+        newest_user_index = next(
+            (
+                index
+                for index in range(len(messages) - 1, -1, -1)
+                if messages[index].role == "user" and not messages[index].temporary
+            ),
+            None,
+        )
+        if newest_user_index is None:
+            return None
+        # The previous request ended with the last stable message followed by a model response
+        stable = [
+            (index, message)
+            for index, message in enumerate(messages[:newest_user_index])
+            if message.role not in ("system", "developer") and not message.temporary
+        ]
+        prefix_length = next(
+            (
+                stable[position][0] + 1
+                for position in range(len(stable) - 2, -1, -1)
+                if stable[position + 1][1].role == "assistant" and stable[position][1].role != "assistant"
+            ),
+            0,
+        )
+        if prefix_length == 0:
+            return None
+        if count_tokens(messages[:prefix_length], model_id=self.id) < self.cache_strategy.min_cached_tokens:
+            return None
+
+        prefix_contents, _ = self._format_messages(messages[:prefix_length], compress_tool_results)
+        contents, _ = self._format_messages(messages[prefix_length:], compress_tool_results)
+        config = request_kwargs.get("config")
+        prefix = {
+            "model": self.id,
+            "contents": [content.model_dump(mode="json", exclude_none=True) for content in prefix_contents],
+            "system_instruction": config.system_instruction if config else None,
+            "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in config.tools or []] if config else [],
+            "tool_config": config.tool_config if config else None,
+        }
+        prefix_hash = hashlib.sha256(json.dumps(prefix, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        prefix_ids = tuple(str(message.id) for message in messages[:prefix_length])
+        return prefix_hash, prefix_ids, prefix_contents, contents
+
+    def _get_cached_content_config(
+        self, prefix_contents: List[Any], request_kwargs: Dict[str, Any]
+    ) -> "CreateCachedContentConfig":
+        config = request_kwargs.get("config")
+        ttl = self.cache_strategy.ttl if self.cache_strategy and self.cache_strategy.ttl else 3600
+        return CreateCachedContentConfig(
+            contents=prefix_contents,
+            system_instruction=config.system_instruction if config else None,
+            tools=config.tools if config else None,
+            tool_config=config.tool_config if config else None,
+            ttl=f"{ttl}s",
+        )
+
+    def _get_prompt_cache(self, prefix_hash: str) -> Optional[Tuple[Optional[str], float, Tuple[str, ...]]]:
+        """Get the name (None if it failed), expiration time and message ids of the cached content of a prefix."""
+        cached = self._prompt_caches.get(prefix_hash)
+        if cached is not None and cached[1] <= time.time():
+            del self._prompt_caches[prefix_hash]
+            return None
+        return cached
+
+    def _set_prompt_cache(self, prefix_hash: str, name: Optional[str], prefix_ids: Tuple[str, ...]) -> List[str]:
+        """
+        Store the cached content of a prefix.
+
+        Returns:
+            The names of the cached contents it supersedes, the cached contents of shorter prefixes of the conversation.
+        """
+        superseded = [
+            other_hash
+            for other_hash, (_, _, other_ids) in self._prompt_caches.items()
+            if len(other_ids) < len(prefix_ids) and prefix_ids[: len(other_ids)] == other_ids
+        ]
+        names = [name for name, _, _ in (self._prompt_caches.pop(other_hash) for other_hash in superseded) if name]
+        ttl = self.cache_strategy.ttl if self.cache_strategy and self.cache_strategy.ttl else 3600
+        # Forget the cached content a little before it expires. Failed prefixes are not retried until then
+        self._prompt_caches[prefix_hash] = (name, time.time() + ttl * 0.9, prefix_ids)
+        return names
+
+    def _use_cached_content(
+        self, name: Optional[str], formatted_messages: List[Any], contents: List[Any], request_kwargs: Dict[str, Any]
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        if name is None:
+            return formatted_messages, request_kwargs
+        # The system prompt and tools are part of the cached content, and can't be sent again
+        config = request_kwargs.get("config")
+        update = {"system_instruction": None, "tools": None, "tool_config": None, "cached_content": name}
+        request_kwargs = {
+            **request_kwargs,
+            "config": config.model_copy(update=update) if config else GenerateContentConfig(cached_content=name),
+        }
+        return contents, request_kwargs
+
+    def _apply_prompt_cache(
+        self,
+        messages: List[Message],
+        formatted_messages: List[Any],
+        request_kwargs: Dict[str, Any],
+        compress_tool_results: bool = False,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Send the stable prefix of the request as cached contents, creating them if needed.
+
+        Returns:
+            The contents and request keyword arguments of the request.
+        """
+        prefix = self._get_prompt_cache_prefix(messages, request_kwargs, compress_tool_results)
+        if prefix is None:
+            return formatted_messages, request_kwargs
+        prefix_hash, prefix_ids, prefix_contents, contents = prefix
+
+        cached = self._get_prompt_cache(prefix_hash)
+        if cached is None:
+            name: Optional[str] = None
+            try:
+                cache = self.get_client().caches.create(
+                    model=self.id, config=self._get_cached_content_config(prefix_contents, request_kwargs)
+                )
+                log_debug(f"Created cached content {cache.name} for {len(prefix_contents)} messages")
+                name = cache.name
+            except Exception as e:
+                log_warning(f"Failed to create cached content, sending the full request: {e}")
+            for superseded_name in self._set_prompt_cache(prefix_hash, name, prefix_ids):
+                try:
+                    self.get_client().caches.delete(name=superseded_name)
+                except Exception as e:
+                    log_debug(f"Failed to delete cached content {superseded_name}: {e}")
+            cached = self._get_prompt_cache(prefix_hash)
+        return self._use_cached_content(cached[0] if cached else None, formatted_messages, contents, request_kwargs)
+
+    async def _aapply_prompt_cache(
+        self,
+        messages: List[Message],
+        formatted_messages: List[Any],
+        request_kwargs: Dict[str, Any],
+        compress_tool_results: bool = False,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Send the stable prefix of the request as cached contents, creating them if needed.
+
+        Returns:
+            The contents and request keyword arguments of the request.
+        """
+        prefix = self._get_prompt_cache_prefix(messages, request_kwargs, compress_tool_results)
+        if prefix is None:
+            return formatted_messages, request_kwargs
+        prefix_hash, prefix_ids, prefix_contents, contents = prefix
+
+        cached = self._get_prompt_cache(prefix_hash)
+        if cached is None:
+            name: Optional[str] = None
+            try:
+                cache = await self.get_client().aio.caches.create(
+                    model=self.id, config=self._get_cached_content_config(prefix_contents, request_kwargs)
+                )
+                log_debug(f"Created cached content {cache.name} for {len(prefix_contents)} messages")
+                name = cache.name
+            except Exception as e:
+                log_warning(f"Failed to create cached content, sending the full request: {e}")
+            for superseded_name in self._set_prompt_cache(prefix_hash, name, prefix_ids):
+                try:
+                    await self.get_client().aio.caches.delete(name=superseded_name)
+                except Exception as e:
+                    log_debug(f"Failed to delete cached content {superseded_name}: {e}")
+            cached = self._get_prompt_cache(prefix_hash)
+        return self._use_cached_content(cached[0] if cached else None, formatted_messages, contents, request_kwargs)
+
     def invoke(
         self,
         messages: List[Message],
@@ -481,6 +675,9 @@ class Gemini(Model):
         request_kwargs = self.get_request_params(
             system_message, response_format=response_format, tools=tools, tool_choice=tool_choice
         )
+        formatted_messages, request_kwargs = self._apply_prompt_cache(
+            messages, formatted_messages, request_kwargs, compress_tool_results=compress_tool_results
+        )
         try:
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
@@ -542,6 +739,9 @@ class Gemini(Model):
         request_kwargs = self.get_request_params(
             system_message, response_format=response_format, tools=tools, tool_choice=tool_choice
         )
+        formatted_messages, request_kwargs = self._apply_prompt_cache(
+            messages, formatted_messages, request_kwargs, compress_tool_results=compress_tool_results
+        )
         try:
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
@@ -599,6 +799,9 @@ class Gemini(Model):
         request_kwargs = self.get_request_params(
             system_message, response_format=response_format, tools=tools, tool_choice=tool_choice
         )
+        formatted_messages, request_kwargs = await self._aapply_prompt_cache(
+            messages, formatted_messages, request_kwargs, compress_tool_results=compress_tool_results
+        )
 
         try:
             if run_response and run_response.metrics:
@@ -661,6 +864,9 @@ class Gemini(Model):
         request_kwargs = self.get_request_params(
             system_message, response_format=response_format, tools=tools, tool_choice=tool_choice
         )
+        formatted_messages, request_kwargs = await self._aapply_prompt_cache(
+            messages, formatted_messages, request_kwargs, compress_tool_results=compress_tool_results
+        )
 
         try:
             if run_response and run_response.metrics:
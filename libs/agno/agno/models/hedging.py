@@ -0,0 +1,259 @@
+import asyncio
+import queue
+import threading
+from bisect import insort
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Coroutine, Deque, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgingMetrics:
+    """Counters of the hedged requests and fallbacks of a model"""
+
+    # Requests that could be hedged
+    requests: int = 0
+    # Second requests sent because the first was slow, and how many of them finished first
+    hedges_fired: int = 0
+    hedges_won: int = 0
+    # Requests answered by a fallback model after the previous models failed
+    fallbacks_used: int = 0
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def increment(self, counter: str) -> None:
+        """Increment a counter, under a lock as hedged requests complete in other threads."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class LatencyTracker:
+    """Latencies of the most recent requests, used to get the delay after which a request is hedged."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._sorted: List[float] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            if len(self._latencies) == self._latencies.maxlen:
+                self._sorted.remove(self._latencies[0])
+            self._latencies.append(latency)
+            insort(self._sorted, latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Get the latency under which `percentile` percent of the recent requests completed, if enough completed."""
+        with self._lock:
+            if len(self._sorted) < self.min_samples:
+                return None
+            index = min(len(self._sorted) - 1, int(len(self._sorted) * percentile / 100))
+            return self._sorted[index]
+
+
+def _start_thread(fn: Callable[[], T]) -> "Future[T]":
+    """Run fn in a daemon thread, with the context of the caller"""
+    future: "Future[T]" = Future()
+    context = copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(fn))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="agno-hedged-request", daemon=True).start()
+    return future
+
+
+def hedge(primary: Callable[[], T], secondary: Callable[[], T], delay: float) -> Tuple[T, int]:
+    """Call primary, and also secondary if primary hasn't completed after `delay` seconds.
+
+    The result of the first call to succeed is returned, with the index of that call (0 = primary). If both fail,
+    the first error is raised. Sync calls can't be interrupted, so the slower call runs to completion and its result
+    is discarded.
+    """
+    futures = [_start_thread(primary)]
+    done, _ = wait(futures, timeout=delay)
+    if done:
+        # A failed primary request is not hedged, its retries already ran
+        return futures[0].result(), 0
+    futures.append(_start_thread(secondary))
+
+    pending = set(futures)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result(), futures.index(future)
+            error = error or future.exception()
+    raise error  # type: ignore[misc]
+
+
+async def ahedge(
+    primary: Callable[[], Coroutine[Any, Any, T]], secondary: Callable[[], Coroutine[Any, Any, T]], delay: float
+) -> Tuple[T, int]:
+    """Await primary, and also secondary if primary hasn't completed after `delay` seconds.
+
+    The result of the first call to succeed is returned, with the index of that call (0 = primary), and the other
+    call is cancelled. If both fail, the first error is raised.
+    """
+    tasks: List[asyncio.Task] = [asyncio.ensure_future(primary())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return tasks[0].result(), 0
+        tasks.append(asyncio.ensure_future(secondary()))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), tasks.index(task)
+                error = error or task.exception()
+        raise error  # type: ignore[misc]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+_CHUNK, _DONE, _ERROR = "chunk", "done", "error"
+
+
+def hedge_stream(
+    primary: Callable[[], Iterator[T]], secondary: Callable[[], Iterator[T]], delay: float
+) -> Iterator[Tuple[T, int]]:
+    """Iterate primary, and also secondary if primary hasn't produced a chunk after `delay` seconds.
+
+    The stream that produces a chunk first is used, and the other is closed at its next chunk.
+
+    Yields:
+        Each chunk of the stream used, and the index of that stream (0 = primary).
+    """
+    events: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue()
+    stopped = [threading.Event(), threading.Event()]
+    context = copy_context()
+
+    def pump(index: int, stream: Callable[[], Iterator[T]]) -> None:
+        def run() -> None:
+            iterator = stream()
+            try:
+                for chunk in iterator:
+                    if stopped[index].is_set():
+                        return
+                    events.put((index, _CHUNK, chunk))
+                events.put((index, _DONE, None))
+            except BaseException as e:
+                events.put((index, _ERROR, e))
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        threading.Thread(target=lambda: context.copy().run(run), name="agno-hedged-stream", daemon=True).start()
+
+    pump(0, primary)
+    started = 1
+    failed = 0
+    winner: Optional[int] = None
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            try:
+                index, kind, value = events.get(timeout=delay if started == 1 and winner is None else None)
+            except queue.Empty:
+                pump(1, secondary)
+                started = 2
+                continue
+
+            if winner is not None and index != winner:
+                continue
+            if kind == _ERROR:
+                error = error or value
+                failed += 1
+                # A failed primary stream is not hedged, its retries already ran
+                if winner is not None or failed == started:
+                    raise error  # type: ignore[misc]
+                continue
+            if winner is None:
+                winner = index
+                stopped[1 - index].set()
+            if kind == _DONE:
+                return
+            yield value, index
+    finally:
+        for event in stopped:
+            event.set()
+
+
+async def ahedge_stream(
+    primary: Callable[[], AsyncIterator[T]], secondary: Callable[[], AsyncIterator[T]], delay: float
+) -> AsyncIterator[Tuple[T, int]]:
+    """Iterate primary, and also secondary if primary hasn't produced a chunk after `delay` seconds.
+
+    The stream that produces a chunk first is used, and the other is cancelled.
+
+    Yields:
+        Each chunk of the stream used, and the index of that stream (0 = primary).
+    """
+    events: "asyncio.Queue[Tuple[int, str, Any]]" = asyncio.Queue()
+
+    async def pump(index: int, stream: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            async for chunk in stream():
+                await events.put((index, _CHUNK, chunk))
+            await events.put((index, _DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await events.put((index, _ERROR, e))
+
+    tasks: List[asyncio.Task] = [asyncio.ensure_future(pump(0, primary))]
+    failed = 0
+    winner: Optional[int] = None
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            try:
+                if len(tasks) == 1 and winner is None:
+                    index, kind, value = await asyncio.wait_for(events.get(), timeout=delay)
+                else:
+                    index, kind, value = await events.get()
+            except asyncio.TimeoutError:
+                tasks.append(asyncio.ensure_future(pump(1, secondary)))
+                continue
+
+            if winner is not None and index != winner:
+                continue
+            if kind == _ERROR:
+                error = error or value
+                failed += 1
+                if winner is not None or failed == len(tasks):
+                    raise error  # type: ignore[misc]
+                continue
+            if winner is None:
+                winner = index
+                for other, task in enumerate(tasks):
+                    if other != index:
+                        task.cancel()
+            if kind == _DONE:
+                return
+            yield value, index
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
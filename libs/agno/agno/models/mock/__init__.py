@@ -0,0 +1,3 @@
+from agno.models.mock.mock import MockModel
+
+__all__ = ["MockModel"]
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+
+# A token is a word and the whitespace following it
+_TOKEN_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+@dataclass
+class MockModel(Model):
+    """A model answering locally, with a configurable latency and token stream, for tests and benchmarks.
+
+    No provider is called: the content of the responses is fixed or built from the messages, so the same requests
+    get the same responses. Latencies vary randomly around `latency` when `latency_jitter` is set, with the same
+    sequence of variations for the same `seed`. Tokens are counted as words.
+
+    Args:
+        response_content: Content of the responses, or a function building it from the messages of the request.
+        tool_calls: Tools called by the first response to each user message, before answering. Each tool call is a
+            dict with a "name" and optional "arguments".
+        latency: Time before the first token, in seconds.
+        latency_jitter: Maximum variation of the latency, as a fraction of it.
+        tokens_per_second: Speed at which the output tokens are generated after the first one (None = instantly).
+        tokens_per_chunk: Number of output tokens in each streamed chunk.
+        seed: Seed of the latency variations.
+    """
+
+    id: str = "mock"
+    name: str = "MockModel"
+    provider: str = "Mock"
+
+    response_content: Union[str, Callable[[List[Message]], str]] = "This is a mock response."
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    tokens_per_second: Optional[float] = None
+    tokens_per_chunk: int = 1
+    seed: Optional[int] = 0
+
+    _random: Random = field(init=False, repr=False, default_factory=Random)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._random.seed(self.seed)
+
+    def _get_latency(self) -> float:
+        if self.latency_jitter <= 0:
+            return self.latency
+        return max(0.0, self.latency * (1 + self._random.uniform(-self.latency_jitter, self.latency_jitter)))
+
+    def _get_generation_time(self, num_tokens: int) -> float:
+        if not self.tokens_per_second:
+            return 0.0
+        return num_tokens / self.tokens_per_second
+
+    def _should_call_tools(self, messages: List[Message]) -> bool:
+        """Call the tools unless they were already called since the last user message."""
+        if not self.tool_calls:
+            return False
+        for message in reversed(messages):
+            if message.role == "user":
+                return True
+            if message.role == self.tool_message_role:
+                return False
+        return True
+
+    def _get_tool_calls(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": f"call_{index}",
+                "type": "function",
+                "function": {
+                    "name": tool_call["name"],
+                    "arguments": json.dumps(tool_call.get("arguments") or {}),
+                },
+            }
+            for index, tool_call in enumerate(self.tool_calls or [])
+        ]
+
+    def _get_content(self, messages: List[Message]) -> str:
+        return self.response_content(messages) if callable(self.response_content) else self.response_content
+
+    def _get_usage(self, messages: List[Message], output_tokens: int) -> Metrics:
+        input_tokens = sum(len(str(message.content or "").split()) for message in messages)
+        return Metrics(
+            input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+        )
+
+    def _get_response(self, messages: List[Message]) -> ModelResponse:
+        model_response = ModelResponse(role=self.assistant_message_role)
+        if self._should_call_tools(messages):
+            model_response.tool_calls = self._get_tool_calls()
+            output_tokens = len(model_response.tool_calls)
+        else:
+            model_response.content = self._get_content(messages)
+            output_tokens = len(_TOKEN_PATTERN.findall(model_response.content))
+        model_response.response_usage = self._get_usage(messages, output_tokens)
+        return model_response
+
+    def _get_response_chunks(self, messages: List[Message]) -> List[ModelResponse]:
+        if self._should_call_tools(messages):
+            chunks = [ModelResponse(role=self.assistant_message_role, tool_calls=self._get_tool_calls())]
+            output_tokens = len(self.tool_calls or [])
+        else:
+            tokens = _TOKEN_PATTERN.findall(self._get_content(messages))
+            step = max(1, self.tokens_per_chunk)
+            chunks = [
+                ModelResponse(role=self.assistant_message_role, content="".join(tokens[i : i + step]))
+                for i in range(0, len(tokens), step)
+            ] or [ModelResponse(role=self.assistant_message_role, content="")]
+            output_tokens = len(tokens)
+        chunks[-1].response_usage = self._get_usage(messages, output_tokens)
+        return chunks
+
+    def _get_chunk_tokens(self, chunk: ModelResponse) -> int:
+        if chunk.tool_calls:
+            return len(chunk.tool_calls)
+        return len(_TOKEN_PATTERN.findall(chunk.content or ""))
+
+    def invoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> ModelResponse:
+        assistant_message.metrics.start_timer()
+        model_response = self._get_response(messages)
+        output_tokens = model_response.response_usage.output_tokens if model_response.response_usage else 0
+        time.sleep(self._get_latency() + self._get_generation_time(output_tokens))
+        assistant_message.metrics.stop_timer()
+        return model_response
+
+    async def ainvoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> ModelResponse:
+        assistant_message.metrics.start_timer()
+        model_response = self._get_response(messages)
+        output_tokens = model_response.response_usage.output_tokens if model_response.response_usage else 0
+        await asyncio.sleep(self._get_latency() + self._get_generation_time(output_tokens))
+        assistant_message.metrics.stop_timer()
+        return model_response
+
+    def invoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> Iterator[ModelResponse]:
+        assistant_message.metrics.start_timer()
+        time.sleep(self._get_latency())
+        for index, chunk in enumerate(self._get_response_chunks(messages)):
+            if index == 0:
+                assistant_message.metrics.set_time_to_first_token()
+            else:
+                time.sleep(self._get_generation_time(self._get_chunk_tokens(chunk)))
+            yield chunk
+        assistant_message.metrics.stop_timer()
+
+    async def ainvoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> AsyncIterator[ModelResponse]:
+        assistant_message.metrics.start_timer()
+        await asyncio.sleep(self._get_latency())
+        for index, chunk in enumerate(self._get_response_chunks(messages)):
+            if index == 0:
+                assistant_message.metrics.set_time_to_first_token()
+            else:
+                await asyncio.sleep(self._get_generation_time(self._get_chunk_tokens(chunk)))
+            yield chunk
+        assistant_message.metrics.stop_timer()
+
+    def _parse_provider_response(self, response: ModelResponse, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: ModelResponse) -> ModelResponse:
+        return response
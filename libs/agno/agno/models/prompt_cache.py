@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from agno.models.message import Message
+
+
+@dataclass
+class PromptCachePlan:
+    """Where to place the prompt cache breakpoints of a request"""
+
+    # Whether to end a cached prefix after the tool definitions and after the system prompt
+    cache_tools: bool = False
+    cache_system: bool = False
+    # Ids of the messages that end a cached prefix, oldest first
+    message_ids: List[str] = field(default_factory=list)
+
+    @property
+    def num_breakpoints(self) -> int:
+        return int(self.cache_tools) + int(self.cache_system) + len(self.message_ids)
+
+    def get_prefix_length(self, messages: List[Message]) -> int:
+        """Get the number of messages in the longest cached prefix, 0 if no message is cached."""
+        if not self.message_ids:
+            return 0
+        last_id = self.message_ids[-1]
+        for index, message in enumerate(messages):
+            if message.id == last_id:
+                return index + 1
+        return 0
+
+
+@dataclass
+class PromptCacheStrategy:
+    """Places prompt cache breakpoints in the requests sent to a model.
+
+    Providers cache the prefix of a request that ends at a breakpoint, in the order tools, system prompt, messages.
+    Breakpoints are placed after the tool definitions, after the system prompt, and on the last stable messages of the
+    history. Temporary messages are not stable, as they are removed after the request. History breakpoints are placed
+    on the last stable message, then on the messages that ended the earlier requests of the conversation (the messages
+    followed by a model response), so they move forward as the conversation grows and the prefixes cached by the
+    previous requests keep being read.
+
+    Args:
+        max_breakpoints: Maximum number of breakpoints in a request (4 for Anthropic and Bedrock).
+        cache_tools: Place a breakpoint after the tool definitions.
+        cache_system: Place a breakpoint after the system prompt.
+        cache_history: Place breakpoints on the messages.
+        ttl: Time to live of the cached prefixes in seconds, for providers where it can be set.
+        min_cached_tokens: Minimum estimated size of a prefix worth caching, for providers that store caches
+            explicitly (Gemini).
+    """
+
+    max_breakpoints: int = 4
+    cache_tools: bool = True
+    cache_system: bool = True
+    cache_history: bool = True
+    ttl: Optional[int] = None
+    min_cached_tokens: int = 1024
+
+    def plan(self, messages: List[Message], has_tools: bool = False) -> PromptCachePlan:
+        """Get the breakpoints of a request with the given messages."""
+        cache_plan = PromptCachePlan()
+        available = self.max_breakpoints
+
+        if self.cache_tools and has_tools and available > 0:
+            cache_plan.cache_tools = True
+            available -= 1
+        if self.cache_system and available > 0 and any(m.role in ("system", "developer") for m in messages):
+            cache_plan.cache_system = True
+            available -= 1
+        if not self.cache_history or available <= 0:
+            return cache_plan
+
+        # Stable messages: the conversation without system and temporary messages
+        stable = [m for m in messages if m.role not in ("system", "developer") and not m.temporary]
+        breakpoints: List[str] = []
+        if stable and stable[-1].role != "assistant":
+            breakpoints.append(stable[-1].id)
+        for index in range(len(stable) - 1, 0, -1):
+            if len(breakpoints) >= available:
+                break
+            if stable[index].role == "assistant" and stable[index - 1].role != "assistant":
+                if stable[index - 1].id not in breakpoints:
+                    breakpoints.append(stable[index - 1].id)
+        cache_plan.message_ids = list(reversed(breakpoints[:available]))
+        return cache_plan
@@ -0,0 +1,210 @@
+import asyncio
+import threading
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+
+class _TokenBucket:
+    """Bucket refilled at `capacity` units per minute. Reservations may overdraw it, making later callers wait."""
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.rate = capacity / 60
+        self.available = capacity
+        self.updated_at = monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` units from the bucket, and get the number of seconds to wait before using them."""
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        # A request larger than the bucket would never fit, so it waits for a full bucket at most
+        self.available -= min(amount, self.capacity)
+        return max(0.0, -self.available / self.rate)
+
+    def refund(self, amount: float) -> None:
+        self.available = min(self.capacity, self.available + amount)
+
+
+class RatePermit:
+    """Permission to send one request, returned by `RateLimiter.acquire`. Release it once the request is done."""
+
+    def __init__(self, limiter: "RateLimiter", estimated_tokens: int):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.started_at = monotonic()
+        self.released = False
+
+    def release(
+        self, rate_limited: bool = False, latency: Optional[float] = None, tokens: Optional[int] = None
+    ) -> None:
+        """Release the permit.
+
+        Args:
+            rate_limited: Whether the provider rejected the request with a rate limit error.
+            latency: Latency of the request in seconds. Defaults to the time since the permit was acquired.
+            tokens: Tokens actually used by the request, to correct the estimate taken from the bucket.
+        """
+        if self.released:
+            return
+        self.released = True
+        self.limiter._release(
+            rate_limited=rate_limited,
+            latency=latency if latency is not None else monotonic() - self.started_at,
+            token_correction=tokens - self.estimated_tokens if tokens is not None else 0,
+        )
+
+
+class RateLimiter:
+    """Client-side limits for the requests sent to a model provider, shared by all models using it.
+
+    Requests wait for a slot in a requests-per-minute and a tokens-per-minute token bucket, and for one of the
+    concurrent request slots. The number of concurrent requests adapts (AIMD): it grows by one request per round of
+    successful requests, and is halved when the provider returns a rate limit error or the latency exceeds
+    `target_latency`. Sync and async callers share the same limits.
+
+    Args:
+        requests_per_minute: Maximum number of requests per minute (None = no limit).
+        tokens_per_minute: Maximum number of tokens per minute (None = no limit). Input tokens are estimated
+            before the request and corrected with the usage reported by the provider.
+        max_concurrency: Maximum number of concurrent requests.
+        min_concurrency: Minimum number of concurrent requests, when backing off.
+        initial_concurrency: Number of concurrent requests allowed at first. Defaults to `max_concurrency`.
+        target_latency: Latency in seconds above which the concurrency is reduced (None = only on rate limits).
+        backoff_factor: Factor applied to the concurrency when backing off.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        backoff_factor: float = 0.5,
+    ):
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= max_concurrency")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.target_latency = target_latency
+        self.backoff_factor = backoff_factor
+
+        self.concurrency = float(initial_concurrency if initial_concurrency is not None else max_concurrency)
+        self.concurrency = min(max(self.concurrency, min_concurrency), max_concurrency)
+        self.in_flight = 0
+
+        self._request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        # Async callers waiting for a concurrent request slot, woken on their own event loop
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        # Requests started before this time belong to the round that was already backed off for
+        self._backoff_until = 0.0
+
+    @property
+    def limits_tokens(self) -> bool:
+        return self._token_bucket is not None
+
+    def acquire(self, tokens: int = 0) -> RatePermit:
+        """Wait until a request of about `tokens` input tokens can be sent."""
+        with self._condition:
+            self._condition.wait_for(self._has_slot)
+            delay = self._take_slot(tokens)
+        if delay > 0:
+            log_debug(f"Rate limit reached, waiting {delay:.2f}s")
+            sleep(delay)
+        return RatePermit(self, tokens)
+
+    async def aacquire(self, tokens: int = 0) -> RatePermit:
+        """Wait until a request of about `tokens` input tokens can be sent, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._has_slot():
+                    delay = self._take_slot(tokens)
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                raise
+        if delay > 0:
+            log_debug(f"Rate limit reached, waiting {delay:.2f}s")
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release(rate_limited=False, latency=0.0, token_correction=-tokens, adjust=False)
+                raise
+        return RatePermit(self, tokens)
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.concurrency)
+
+    def _take_slot(self, tokens: int) -> float:
+        """Take a concurrent request slot and reserve the request in the buckets. Called with the lock held."""
+        self.in_flight += 1
+        now = monotonic()
+        delay = 0.0
+        if self._request_bucket is not None:
+            delay = max(delay, self._request_bucket.reserve(1, now))
+        if self._token_bucket is not None and tokens:
+            delay = max(delay, self._token_bucket.reserve(tokens, now))
+        return delay
+
+    def _release(self, rate_limited: bool, latency: float, token_correction: int, adjust: bool = True) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if self._token_bucket is not None and token_correction:
+                if token_correction > 0:
+                    self._token_bucket.reserve(token_correction, monotonic())
+                else:
+                    self._token_bucket.refund(-token_correction)
+
+            now = monotonic()
+            overloaded = rate_limited or (self.target_latency is not None and latency > self.target_latency)
+            if adjust and overloaded:
+                # Back off once per round of requests, not once for every request of the round that failed
+                if now - latency >= self._backoff_until:
+                    self.concurrency = max(float(self.min_concurrency), self.concurrency * self.backoff_factor)
+                    self._backoff_until = now
+                    log_debug(f"Reducing model request concurrency to {int(self.concurrency)}")
+            elif adjust:
+                self.concurrency = min(float(self.max_concurrency), self.concurrency + 1 / self.concurrency)
+
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop is closed
+                pass
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, **kwargs) -> RateLimiter:
+    """Get the rate limiter shared by the models with the same key, creating it with `kwargs` if needed."""
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(**kwargs)
+        return _rate_limiters[key]
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from agno.utils.log import log_debug
+
+T = TypeVar("T")
+
+
+class InterruptedFlightError(RuntimeError):
+    """Raised to callers sharing a stream when its leader stopped consuming it midway."""
+
+
+class _Flight:
+    """A request in flight: its result once done, and the chunks it produced so far if it is a stream."""
+
+    def __init__(self):
+        self.chunks: List[Any] = []
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+        # Set when the leader stopped without a result or error, so followers make their own request
+        self.abandoned = False
+
+
+class _AsyncFlight(_Flight):
+    def __init__(self):
+        super().__init__()
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        # Wake the followers waiting on the current event, and give later waiters a new one
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class SingleFlight:
+    """Registry of requests in flight, so identical concurrent requests share a single call.
+
+    The first caller for a key (the leader) makes the call. Callers with the same key that arrive while it is
+    in flight (followers) wait for its result, or replay the chunks of its stream, and get its error if it fails.
+    Sync calls are shared across threads; async calls are shared between tasks of the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._condition = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """Call fn, or wait for the in-flight call with the same key.
+
+        Returns:
+            The result, and whether it was shared from another caller.
+        """
+        flight, is_leader = self._join(f"sync:{key}", _Flight)
+        if not is_leader:
+            with self._condition:
+                self._condition.wait_for(lambda: flight.done)
+            if not flight.abandoned:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result, True
+            return fn(), False
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(f"sync:{key}", flight)
+        return flight.result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Await fn, or wait for the in-flight call with the same key on this event loop.
+
+        Returns:
+            The result, and whether it was shared from another caller.
+        """
+        loop_key = f"async:{id(asyncio.get_running_loop())}:{key}"
+        flight, is_leader = self._join(loop_key, _AsyncFlight)
+        if not is_leader:
+            while not flight.done:
+                await flight.changed.wait()
+            if not flight.abandoned:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result, True
+            return await fn(), False
+
+        try:
+            flight.result = await fn()
+        except asyncio.CancelledError:
+            # Cancelling the leader shouldn't cancel its followers
+            flight.abandoned = True
+            raise
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(loop_key, flight)
+            flight.notify()
+        return flight.result, False
+
+    def stream(self, key: str, fn: Callable[[], Iterator[T]]) -> Iterator[Tuple[T, bool]]:
+        """Iterate fn, or replay the chunks of the in-flight stream with the same key.
+
+        Yields:
+            Each chunk, and whether it was shared from another caller.
+        """
+        flight, is_leader = self._join(f"sync_stream:{key}", _Flight)
+        if not is_leader:
+            index = 0
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: flight.done or len(flight.chunks) > index)
+                    chunks = flight.chunks[index:]
+                    done = flight.done
+                for chunk in chunks:
+                    yield chunk, True
+                index += len(chunks)
+                if done and index == len(flight.chunks):
+                    break
+            if flight.abandoned:
+                if index > 0:
+                    raise InterruptedFlightError("The shared model stream was interrupted")
+                for chunk in fn():
+                    yield chunk, False
+            elif flight.error is not None:
+                raise flight.error
+            return
+
+        completed = False
+        try:
+            for chunk in fn():
+                with self._condition:
+                    flight.chunks.append(chunk)
+                    self._condition.notify_all()
+                yield chunk, False
+            completed = True
+        except Exception as e:
+            flight.error = e
+            completed = True
+            raise
+        finally:
+            flight.abandoned = not completed
+            self._land(f"sync_stream:{key}", flight)
+
+    async def astream(self, key: str, fn: Callable[[], AsyncIterator[T]]) -> AsyncIterator[Tuple[T, bool]]:
+        """Iterate fn, or replay the chunks of the in-flight stream with the same key on this event loop.
+
+        Yields:
+            Each chunk, and whether it was shared from another caller.
+        """
+        loop_key = f"async_stream:{id(asyncio.get_running_loop())}:{key}"
+        flight, is_leader = self._join(loop_key, _AsyncFlight)
+        if not is_leader:
+            index = 0
+            while True:
+                while index < len(flight.chunks):
+                    yield flight.chunks[index], True
+                    index += 1
+                if flight.done:
+                    break
+                await flight.changed.wait()
+            if flight.abandoned:
+                if index > 0:
+                    raise InterruptedFlightError("The shared model stream was interrupted")
+                async for chunk in fn():
+                    yield chunk, False
+            elif flight.error is not None:
+                raise flight.error
+            return
+
+        completed = False
+        try:
+            async for chunk in fn():
+                flight.chunks.append(chunk)
+                flight.notify()
+                yield chunk, False
+            completed = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            flight.error = e
+            completed = True
+            raise
+        finally:
+            flight.abandoned = not completed
+            self._land(loop_key, flight)
+            flight.notify()
+
+    def _join(self, key: str, flight_class: type) -> Tuple[Any, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                log_debug(f"Joining in-flight model request {key}")
+                return flight, False
+            flight = flight_class()
+            self._flights[key] = flight
+            return flight, True
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        with self._condition:
+            flight.done = True
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            self._condition.notify_all()
+
+
+_model_requests = SingleFlight()
+
+
+def get_model_requests_in_flight() -> SingleFlight:
+    """Get the process-wide registry used by models with `coalesce_requests=True`."""
+    return _model_requests
@@ -0,0 +1,121 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The checks the tool calls of the current model request wait for, when the request started before they completed
+_pending_checks: ContextVar[Optional["asyncio.Future[Any]"]] = ContextVar("agno_pending_checks", default=None)
+
+
+async def await_pending_checks() -> None:
+    """Wait for the checks of the input of the current model request, if they haven't completed yet.
+
+    Tool calls wait for the checks, so a speculative request doesn't act on an input that fails them.
+
+    Raises:
+        The error of the checks, if they failed.
+    """
+    checks = _pending_checks.get()
+    if checks is not None:
+        # Shield the checks, so cancelling the request doesn't cancel them
+        await asyncio.shield(checks)
+
+
+def _create_gated_task(awaitable: Awaitable[T], checks: "asyncio.Future[Any]") -> "asyncio.Future[T]":
+    token = _pending_checks.set(checks)
+    try:
+        # The task copies the current context, so its tool calls see the pending checks
+        return asyncio.ensure_future(awaitable)
+    finally:
+        _pending_checks.reset(token)
+
+
+async def _cancel(task: "asyncio.Future[Any]") -> None:
+    task.cancel()
+    await asyncio.wait({task})
+    if not task.cancelled():
+        # Retrieve the error of a task that failed before it was cancelled
+        task.exception()
+
+
+async def _anext(stream: AsyncIterator[T]) -> T:
+    return await stream.__anext__()
+
+
+async def aspeculate(request: Awaitable[T], checks: "asyncio.Future[Any]") -> T:
+    """Run a model request alongside the checks of its input.
+
+    Args:
+        request: The model request.
+        checks: The checks of the input, running as a task. They are cancelled if the request is cancelled.
+
+    Returns:
+        The result of the request, once the checks passed.
+
+    Raises:
+        The error of the checks if they failed, after cancelling the request.
+    """
+    task = _create_gated_task(request, checks)
+    try:
+        await asyncio.wait({task, checks}, return_when=asyncio.FIRST_COMPLETED)
+        # The result of the request is only returned once the checks passed
+        await asyncio.shield(checks)
+        return await task
+    finally:
+        if not task.done():
+            await _cancel(task)
+        if not checks.done():
+            checks.cancel()
+
+
+async def aspeculate_stream(stream: AsyncIterator[T], checks: "asyncio.Future[Any]") -> AsyncIterator[T]:
+    """Stream a model request alongside the checks of its input.
+
+    The chunks received before the checks complete are buffered, and only yielded once they passed.
+
+    Args:
+        stream: The stream of the model request.
+        checks: The checks of the input, running as a task. They are cancelled if the stream is closed.
+
+    Yields:
+        The chunks of the stream, once the checks passed.
+
+    Raises:
+        The error of the checks if they failed, after closing the stream.
+    """
+    buffer: List[T] = []
+    exhausted = False
+    try:
+        while not checks.done():
+            next_chunk = _create_gated_task(_anext(stream), checks)
+            try:
+                await asyncio.wait({next_chunk, checks}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # The checks failed first, or the consumer stopped: cancel the request
+                if not next_chunk.done() and (not checks.done() or checks.exception() is not None):
+                    await _cancel(next_chunk)
+            if next_chunk.cancelled():
+                break
+            try:
+                buffer.append(await next_chunk)
+            except StopAsyncIteration:
+                exhausted = True
+                await asyncio.shield(checks)
+
+        # Raise the error of the checks, if they failed
+        checks.result()
+
+        for chunk in buffer:
+            yield chunk
+        buffer.clear()
+
+        if not exhausted:
+            async for chunk in stream:
+                yield chunk
+    finally:
+        if not checks.done():
+            checks.cancel()
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
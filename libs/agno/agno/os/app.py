@@ -101,6 +101,16 @@ async def db_lifespan(app: FastAPI, agent_os: "AgentOS"):
     await agent_os._close_databases()
 
 
+@asynccontextmanager
+async def tool_connections_lifespan(_):
+    """Close the tool connections shared across runs when the app shuts down."""
+    from agno.tools.connection_pool import get_tool_connection_pool
+
+    yield
+
+    await get_tool_connection_pool().aclose()
+
+
 def _combine_app_lifespans(lifespans: list) -> Any:
     """Combine multiple FastAPI app lifespan context managers into one."""
     if len(lifespans) == 1:
@@ -151,6 +161,7 @@ class AgentOS:
         tracing: bool = False,
         auto_provision_dbs: bool = True,
         run_hooks_in_background: bool = False,
+        tool_connection_lifecycle: Optional[Literal["run", "process"]] = None,
         telemetry: bool = True,
         registry: Optional[Registry] = None,
     ):
@@ -180,6 +191,8 @@ class AgentOS:
             cors_allowed_origins: List of allowed CORS origins (will be merged with default Agno domains)
             tracing: If True, enables OpenTelemetry tracing for all agents and teams in the OS
             run_hooks_in_background: If True, run agent/team pre/post hooks as FastAPI background tasks (non-blocking)
+            tool_connection_lifecycle: If set, overrides the tool_connection_lifecycle of all agents and teams in the OS.
+                Use "process" to connect database and MCP toolkits once and share them across runs until shutdown.
             telemetry: Whether to enable telemetry
             registry: Optional registry to use for the AgentOS
 
@@ -238,6 +251,9 @@ class AgentOS:
         # If True, run agent/team hooks as FastAPI background tasks
         self.run_hooks_in_background = run_hooks_in_background
 
+        # If set, when agents and teams connect their connectable tools
+        self.tool_connection_lifecycle = tool_connection_lifecycle
+
         # List of all MCP tools used inside the AgentOS
         self.mcp_tools: List[Any] = []
         self._mcp_app: Optional[Any] = None
@@ -451,6 +467,9 @@ class AgentOS:
             # Propagate run_hooks_in_background setting from AgentOS to agents
             agent._run_hooks_in_background = self.run_hooks_in_background
 
+            if self.tool_connection_lifecycle is not None:
+                agent.tool_connection_lifecycle = self.tool_connection_lifecycle
+
     def _initialize_teams(self) -> None:
         """Initialize and configure all teams for AgentOS usage."""
         if not self.teams:
@@ -482,6 +501,9 @@ class AgentOS:
             # Propagate run_hooks_in_background setting to team and all nested members
             team.propagate_run_hooks_in_background(self.run_hooks_in_background)
 
+            if self.tool_connection_lifecycle is not None:
+                team.propagate_tool_connection_lifecycle(self.tool_connection_lifecycle)
+
     def _initialize_workflows(self) -> None:
         """Initialize and configure all workflows for AgentOS usage."""
         if not self.workflows:
@@ -580,6 +602,9 @@ class AgentOS:
             # The async database lifespan
             lifespans.append(partial(db_lifespan, agent_os=self))
 
+            # The shared tool connections cleanup lifespan
+            lifespans.append(tool_connections_lifespan)
+
             # The httpx client cleanup lifespan (should be last to close after other lifespans)
             lifespans.append(http_client_lifespan)
 
@@ -608,6 +633,9 @@ class AgentOS:
             # Async database initialization lifespan
             lifespans.append(partial(db_lifespan, agent_os=self))  # type: ignore
 
+            # The shared tool connections cleanup lifespan
+            lifespans.append(tool_connections_lifespan)
+
             # The httpx client cleanup lifespan (should be last to close after other lifespans)
             lifespans.append(http_client_lifespan)
 
@@ -190,6 +190,9 @@ class StepStartedEvent(BaseWorkflowRunOutputEvent):
     step_name: Optional[str] = None
     step_index: Optional[Union[int, tuple]] = None
 
+    # True when the step output is loaded from the step output cache
+    cached: bool = False
+
 
 @dataclass
 class StepCompletedEvent(BaseWorkflowRunOutputEvent):
@@ -211,6 +214,9 @@ class StepCompletedEvent(BaseWorkflowRunOutputEvent):
     # Store actual step execution results as StepOutput objects
     step_response: Optional[StepOutput] = None
 
+    # True when the step output was loaded from the step output cache
+    cached: bool = False
+
 
 @dataclass
 class StepErrorEvent(BaseWorkflowRunOutputEvent):
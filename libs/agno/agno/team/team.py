@@ -80,6 +80,7 @@ from agno.run.team import (
 from agno.session import SessionSummaryManager, TeamSession, WorkflowSession
 from agno.session.summary import SessionSummary
 from agno.tools import Toolkit
+from agno.tools.connection_pool import get_tool_connection_pool, is_connectable_toolkit, is_mcp_toolkit
 from agno.tools.function import Function
 from agno.utils.agent import (
     aexecute_instructions,
@@ -369,6 +370,10 @@ class Team:
     tool_call_limit: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
+    # When to connect tools that require connection management (e.g. database and MCP toolkits).
+    # "run" connects them at the start of each run and closes them at the end.
+    # "process" connects them once and shares the connection across runs, until the process or AgentOS app shuts down.
+    tool_connection_lifecycle: Literal["run", "process"] = "run"
 
     # --- Team Hooks ---
     # Functions called right after team session is loaded, before processing starts
@@ -543,6 +548,7 @@ class Team:
         tool_call_limit: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
+        tool_connection_lifecycle: Literal["run", "process"] = "run",
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
         post_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
         input_schema: Optional[Type[BaseModel]] = None,
@@ -664,6 +670,7 @@ class Team:
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
         self.tool_hooks = tool_hooks
+        self.tool_connection_lifecycle = tool_connection_lifecycle
 
         # Initialize hooks
         self.pre_hooks = pre_hooks
@@ -756,6 +763,8 @@ class Team:
         self._mcp_tools_initialized_on_run: List[Any] = []
         # List of connectable tools that were initialized on the last run
         self._connectable_tools_initialized_on_run: List[Any] = []
+        # Tools leased from the process-wide connection pool, by run_id
+        self._tool_connection_leases: Dict[str, List[Any]] = {}
 
         # Lazy-initialized shared thread pool executor for background tasks (memory, cultural knowledge, etc.)
         self._background_executor: Optional[Any] = None
@@ -849,6 +858,21 @@ class Team:
             if isinstance(member, Team):
                 member.propagate_run_hooks_in_background(run_in_background)
 
+    def propagate_tool_connection_lifecycle(self, lifecycle: Literal["run", "process"]) -> None:
+        """
+        Propagate the tool_connection_lifecycle setting to this team and all nested members recursively.
+
+        Args:
+            lifecycle: "run" to connect connectable tools on each run, "process" to share their connections across runs.
+        """
+        self.tool_connection_lifecycle = lifecycle
+
+        for member in self.members:
+            if isinstance(member, Team):
+                member.propagate_tool_connection_lifecycle(lifecycle)
+            elif hasattr(member, "tool_connection_lifecycle"):
+                member.tool_connection_lifecycle = lifecycle
+
     def _set_default_model(self) -> None:
         # Set the default model
         if self.model is None:
@@ -1031,25 +1055,32 @@ class Team:
         """
         return await acancel_run_global(run_id)
 
-    async def _connect_mcp_tools(self) -> None:
-        """Connect the MCP tools to the agent."""
+    async def _connect_mcp_tools(self, run_id: Optional[str] = None) -> None:
+        """Connect the MCP tools to the team."""
         if self.tools is not None:
             for tool in self.tools:
-                # Alternate method of using isinstance(tool, (MCPTools, MultiMCPTools)) to avoid imports
-                if (
-                    hasattr(type(tool), "__mro__")
-                    and any(c.__name__ in ["MCPTools", "MultiMCPTools"] for c in type(tool).__mro__)
-                    and not tool.initialized  # type: ignore
-                ):
+                if not is_mcp_toolkit(tool):
+                    continue
+                if self.tool_connection_lifecycle == "process":
+                    try:
+                        # Lease the shared connection from the process-wide pool
+                        await get_tool_connection_pool().aacquire(tool)
+                        self._tool_connection_leases.setdefault(run_id or "", []).append(tool)
+                    except Exception as e:
+                        log_warning(f"Error connecting tool: {str(e)}")
+                elif not tool.initialized:  # type: ignore
                     try:
                         # Connect the MCP server
                         await tool.connect()  # type: ignore
-                        self._mcp_tools_initialized_on_run.append(tool)
+                        self._mcp_tools_initialized_on_run.append(tool)  # type: ignore
                     except Exception as e:
                         log_warning(f"Error connecting tool: {str(e)}")
 
-    async def _disconnect_mcp_tools(self) -> None:
-        """Disconnect the MCP tools from the agent."""
+    async def _disconnect_mcp_tools(self, run_id: Optional[str] = None) -> None:
+        """Disconnect the MCP tools from the team."""
+        if self.tool_connection_lifecycle == "process":
+            self._release_tool_connections(run_id=run_id)
+            return
         for tool in self._mcp_tools_initialized_on_run:
             try:
                 await tool.close()
@@ -1057,24 +1088,28 @@ class Team:
                 log_warning(f"Error disconnecting tool: {str(e)}")
         self._mcp_tools_initialized_on_run = []
 
-    def _connect_connectable_tools(self) -> None:
+    def _connect_connectable_tools(self, run_id: Optional[str] = None) -> None:
         """Connect tools that require connection management (e.g., database connections)."""
         if self.tools:
             for tool in self.tools:
-                if (
-                    hasattr(tool, "requires_connect")
-                    and tool.requires_connect  # type: ignore
-                    and hasattr(tool, "connect")
-                    and tool not in self._connectable_tools_initialized_on_run
-                ):
-                    try:
+                if not is_connectable_toolkit(tool) or tool in self._connectable_tools_initialized_on_run:
+                    continue
+                try:
+                    if self.tool_connection_lifecycle == "process":
+                        # Lease the shared connection from the process-wide pool
+                        get_tool_connection_pool().acquire(tool)
+                        self._tool_connection_leases.setdefault(run_id or "", []).append(tool)
+                    else:
                         tool.connect()  # type: ignore
                         self._connectable_tools_initialized_on_run.append(tool)
-                    except Exception as e:
-                        log_warning(f"Error connecting tool: {str(e)}")
+                except Exception as e:
+                    log_warning(f"Error connecting tool: {str(e)}")
 
-    def _disconnect_connectable_tools(self) -> None:
+    def _disconnect_connectable_tools(self, run_id: Optional[str] = None) -> None:
         """Disconnect tools that require connection management."""
+        if self.tool_connection_lifecycle == "process":
+            self._release_tool_connections(run_id=run_id)
+            return
         for tool in self._connectable_tools_initialized_on_run:
             if hasattr(tool, "close"):
                 try:
@@ -1083,6 +1118,12 @@ class Team:
                     log_warning(f"Error disconnecting tool: {str(e)}")
         self._connectable_tools_initialized_on_run = []
 
+    def _release_tool_connections(self, run_id: Optional[str] = None) -> None:
+        """Release the pooled tool connections leased by the given run. The tools stay connected for later runs."""
+        pool = get_tool_connection_pool()
+        for tool in self._tool_connection_leases.pop(run_id or "", []):
+            pool.release(tool)
+
     def _execute_pre_hooks(
         self,
         hooks: Optional[List[Callable[..., Any]]],
@@ -1692,7 +1733,7 @@ class Team:
                 memory_future.cancel()
 
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
         return run_response
@@ -2047,7 +2088,7 @@ class Team:
                 memory_future.cancel()
 
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
             # Always clean up the run tracking
             cleanup_run(run_response.run_id)  # type: ignore
 
@@ -2403,7 +2444,7 @@ class Team:
                     # 4. Determine tools for model
                     team_run_context: Dict[str, Any] = {}
                     self.model = cast(Model, self.model)
-                    await self._check_and_refresh_mcp_tools()
+                    await self._check_and_refresh_mcp_tools(run_id=run_response.run_id)
                     _tools = self._determine_tools_for_model(
                         model=self.model,
                         run_response=run_response,
@@ -2599,8 +2640,8 @@ class Team:
                     return run_response
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
-            await self._disconnect_mcp_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Cancel background task on error (await_for_open_threads handles waiting on success)
             if memory_task is not None and not memory_task.done():
@@ -2709,7 +2750,7 @@ class Team:
                     # 5. Determine tools for model
                     team_run_context: Dict[str, Any] = {}
                     self.model = cast(Model, self.model)
-                    await self._check_and_refresh_mcp_tools()
+                    await self._check_and_refresh_mcp_tools(run_id=run_response.run_id)
                     _tools = self._determine_tools_for_model(
                         model=self.model,
                         run_response=run_response,
@@ -2992,8 +3033,8 @@ class Team:
 
         finally:
             # Always disconnect connectable tools
-            self._disconnect_connectable_tools()
-            await self._disconnect_mcp_tools()
+            self._disconnect_connectable_tools(run_id=run_response.run_id)  # type: ignore
+            await self._disconnect_mcp_tools(run_id=run_response.run_id)  # type: ignore
 
             # Cancel background task on error (await_for_thread_tasks_stream handles waiting on success)
             if memory_task is not None and not memory_task.done():
@@ -5264,9 +5305,9 @@ class Team:
             except Exception as e:
                 log_warning(f"Failed to resolve context for '{key}': {e}")
 
-    async def _check_and_refresh_mcp_tools(self) -> None:
+    async def _check_and_refresh_mcp_tools(self, run_id: Optional[str] = None) -> None:
         # Connect MCP tools
-        await self._connect_mcp_tools()
+        await self._connect_mcp_tools(run_id=run_id)
 
         # Add provided tools
         if self.tools is not None:
@@ -5313,7 +5354,7 @@ class Team:
         check_mcp_tools: bool = True,
     ) -> List[Union[Function, dict]]:
         # Connect tools that require connection management
-        self._connect_connectable_tools()
+        self._connect_connectable_tools(run_id=run_response.run_id)
 
         # Prepare tools
         _tools: List[Union[Toolkit, Callable, Function, Dict]] = []
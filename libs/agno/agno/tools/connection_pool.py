@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from agno.utils.log import log_debug, log_warning
+
+
+def is_mcp_toolkit(tool: Any) -> bool:
+    # Alternate method of using isinstance(tool, (MCPTools, MultiMCPTools)) to avoid imports
+    return hasattr(type(tool), "__mro__") and any(
+        c.__name__ in ["MCPTools", "MultiMCPTools"] for c in type(tool).__mro__
+    )
+
+
+def is_connectable_toolkit(tool: Any) -> bool:
+    return bool(getattr(tool, "requires_connect", False)) and hasattr(tool, "connect")
+
+
+class ToolConnectionPool:
+    """Keeps connectable toolkits connected for the lifetime of the process, sharing them across runs.
+
+    Runs lease the toolkits they use: the first lease connects a toolkit, and later leases reuse its connection after
+    checking it is still alive, reconnecting it otherwise. Toolkits stay connected when their leases are released and
+    are only closed by `close`/`aclose`, e.g. when the AgentOS app shuts down.
+
+    Args:
+        connect_retries (int): Number of times to retry connecting a toolkit before giving up.
+        retry_delay_seconds (float): Delay between connection attempts, doubled after each attempt.
+        health_check_interval_seconds (float): Ping MCP toolkits not checked for this long before leasing them.
+    """
+
+    def __init__(
+        self,
+        connect_retries: int = 2,
+        retry_delay_seconds: float = 0.5,
+        health_check_interval_seconds: float = 30.0,
+    ):
+        self.connect_retries = connect_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+
+        # Pooled toolkits and their number of active leases, keyed by id(toolkit)
+        self._tools: Dict[int, Any] = {}
+        self._leases: Dict[int, int] = {}
+        self._last_checked_at: Dict[int, float] = {}
+
+        self._lock = threading.Condition()
+        # Per-toolkit locks, so concurrent runs connect a toolkit only once
+        self._tool_locks: Dict[int, threading.Lock] = {}
+        self._async_tool_locks: Dict[int, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __contains__(self, tool: Any) -> bool:
+        return id(tool) in self._tools
+
+    def get_lease_count(self, tool: Any) -> int:
+        """Get the number of active leases of the given toolkit."""
+        with self._lock:
+            return self._leases.get(id(tool), 0)
+
+    # -- Leasing methods --
+
+    def acquire(self, tool: Any) -> None:
+        """Lease a connectable toolkit, connecting it first if it is not connected.
+
+        Raises:
+            Exception: The last connection error, if the toolkit could not be connected.
+        """
+        key = id(tool)
+        with self._lock:
+            tool_lock = self._tool_locks.setdefault(key, threading.Lock())
+
+        with tool_lock:
+            if key not in self._tools or not self._is_connected(tool):
+                self._connect(tool)
+            self._add_lease(tool)
+
+    async def aacquire(self, tool: Any) -> None:
+        """Lease a toolkit from an async run, connecting it first if it is not connected.
+
+        MCP toolkits are connected asynchronously, and pinged before being leased if they were not checked recently.
+        Other toolkits are connected in a thread, so connecting and retrying doesn't block the event loop.
+
+        Raises:
+            Exception: The last connection error, if the toolkit could not be connected.
+        """
+        if not is_mcp_toolkit(tool):
+            await asyncio.to_thread(self.acquire, tool)
+            return
+
+        key = id(tool)
+        tool_lock = self._async_tool_locks.setdefault(key, asyncio.Lock())
+        async with tool_lock:
+            if not await self._ais_connected(tool):
+                await self._aconnect(tool)
+            self._add_lease(tool)
+
+    def release(self, tool: Any) -> None:
+        """Release a lease of the given toolkit. The toolkit stays connected for later runs."""
+        with self._lock:
+            key = id(tool)
+            leases = self._leases.get(key, 0)
+            if leases <= 1:
+                self._leases.pop(key, None)
+                self._lock.notify_all()
+            else:
+                self._leases[key] = leases - 1
+
+    # -- Shutdown methods --
+
+    def close(self, timeout_seconds: Optional[float] = 30.0) -> None:
+        """Close all pooled toolkits, waiting up to `timeout_seconds` for their leases to be released.
+
+        MCP toolkits can only be closed from an event loop, use `aclose` to close them too.
+        """
+        self._wait_for_leases(timeout_seconds)
+        for tool in self._pop_tools():
+            if is_mcp_toolkit(tool):
+                log_warning(f"Cannot close {tool} synchronously, use aclose() instead")
+                continue
+            self._close_tool(tool)
+
+    async def aclose(self, timeout_seconds: Optional[float] = 30.0) -> None:
+        """Close all pooled toolkits, waiting up to `timeout_seconds` for their leases to be released."""
+        await asyncio.to_thread(self._wait_for_leases, timeout_seconds)
+        for tool in self._pop_tools():
+            if is_mcp_toolkit(tool):
+                try:
+                    await tool.close()
+                except Exception as e:
+                    log_warning(f"Error disconnecting tool: {str(e)}")
+            else:
+                self._close_tool(tool)
+
+    # -- Private methods --
+
+    def _add_lease(self, tool: Any) -> None:
+        key = id(tool)
+        with self._lock:
+            self._tools[key] = tool
+            self._leases[key] = self._leases.get(key, 0) + 1
+
+    def _wait_for_leases(self, timeout_seconds: Optional[float]) -> None:
+        with self._lock:
+            if not self._lock.wait_for(lambda: not self._leases, timeout=timeout_seconds):
+                log_warning(f"Closing pooled tools while {sum(self._leases.values())} leases are still active")
+
+    def _pop_tools(self) -> List[Any]:
+        with self._lock:
+            tools = list(self._tools.values())
+            self._tools.clear()
+            self._leases.clear()
+            self._last_checked_at.clear()
+            self._tool_locks.clear()
+            self._async_tool_locks.clear()
+        return tools
+
+    def _is_connected(self, tool: Any) -> bool:
+        # Toolkits not reporting their connection state are trusted to reconnect by themselves
+        is_connected = getattr(tool, "is_connected", None)
+        return is_connected is None or bool(is_connected)
+
+    async def _ais_connected(self, tool: Any) -> bool:
+        key = id(tool)
+        if key not in self._tools or not tool.initialized:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_checked_at.get(key, 0.0) < self.health_check_interval_seconds:
+            return True
+        if not await tool.is_alive():
+            log_debug(f"Pooled tool {tool} failed its health check, reconnecting it")
+            return False
+        self._last_checked_at[key] = now
+        return True
+
+    def _close_tool(self, tool: Any) -> None:
+        try:
+            tool.close()
+        except Exception as e:
+            log_warning(f"Error disconnecting tool: {str(e)}")
+
+    def _connect(self, tool: Any) -> None:
+        delay = self.retry_delay_seconds
+        for attempt in range(self.connect_retries + 1):
+            try:
+                # Drop a broken connection before opening a new one
+                if id(tool) in self._tools:
+                    self._close_tool(tool)
+                tool.connect()
+                log_debug(f"Connected pooled tool {tool}")
+                return
+            except Exception as e:
+                if attempt == self.connect_retries:
+                    raise
+                log_warning(f"Error connecting tool {tool}, retrying: {str(e)}")
+                time.sleep(delay)
+                delay *= 2
+
+    async def _aconnect(self, tool: Any) -> None:
+        delay = self.retry_delay_seconds
+        for attempt in range(self.connect_retries + 1):
+            # MCP toolkits log connection errors instead of raising them
+            await tool.connect(force=id(tool) in self._tools)
+            if tool.initialized:
+                self._last_checked_at[id(tool)] = time.monotonic()
+                log_debug(f"Connected pooled tool {tool}")
+                return
+            if attempt == self.connect_retries:
+                raise ConnectionError(f"Failed to connect to {tool}")
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+_tool_connection_pool: Optional[ToolConnectionPool] = None
+_tool_connection_pool_lock = threading.Lock()
+
+
+def get_tool_connection_pool() -> ToolConnectionPool:
+    """Get the process-wide pool used by agents and teams with `tool_connection_lifecycle="process"`."""
+    global _tool_connection_pool
+    with _tool_connection_pool_lock:
+        if _tool_connection_pool is None:
+            _tool_connection_pool = ToolConnectionPool()
+        return _tool_connection_pool
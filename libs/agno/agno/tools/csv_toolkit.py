@@ -1,7 +1,9 @@
 import csv
 import json
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
@@ -30,10 +32,21 @@ class CsvTools(Toolkit):
                     self.csvs.append(_csv)
                 else:
                     raise ValueError(f"Invalid csv file: {_csv}")
+        # Lookup of the csv files by name. The first file wins when several share the same name.
+        self._csvs_by_name: Dict[str, Path] = {}
+        for _csv in self.csvs:
+            self._csvs_by_name.setdefault(_csv.stem, _csv)
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
 
+        # Connection created by the toolkit when none is provided, kept open across queries
+        self._duckdb_connection: Optional[Any] = None
+        # Tables loaded in the DuckDB catalog, with the (mtime, size) of the csv file they were loaded from
+        self._loaded_tables: Dict[str, Tuple[int, int]] = {}
+        # DuckDB connections can't be used by several threads at once
+        self._duckdb_lock = Lock()
+
         tools: List[Any] = []
         if all or enable_read_csv_file:
             tools.append(self.read_csv_file)
@@ -59,6 +72,9 @@ class CsvTools(Toolkit):
         """
         return json.dumps([_csv.stem for _csv in self.csvs])
 
+    def _get_csv_path(self, csv_name: str) -> Optional[Path]:
+        return self._csvs_by_name.get(csv_name)
+
     def read_csv_file(self, csv_name: str, row_limit: Optional[int] = None) -> str:
         """Use this function to read the contents of a csv file `name` without the extension.
 
@@ -70,21 +86,17 @@ class CsvTools(Toolkit):
             str: The contents of the csv file if successful, otherwise returns an error message.
         """
         try:
-            if csv_name not in [_csv.stem for _csv in self.csvs]:
+            file_path = self._get_csv_path(csv_name)
+            if file_path is None:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
             log_info(f"Reading file: {csv_name}")
-            file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Read the csv file
-            csv_data = []
+            # Read the csv file, stopping once the row limit is reached
             _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
+                csv_data = list(islice(reader, _row_limit))
             return json.dumps(csv_data)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
@@ -100,11 +112,11 @@ class CsvTools(Toolkit):
             str: The columns of the csv file if successful, otherwise returns an error message.
         """
         try:
-            if csv_name not in [_csv.stem for _csv in self.csvs]:
+            file_path = self._get_csv_path(csv_name)
+            if file_path is None:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
             log_info(f"Reading columns from file: {csv_name}")
-            file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
             # Get the columns of the csv file
             with open(str(file_path), newline="") as csvfile:
@@ -132,54 +144,78 @@ class CsvTools(Toolkit):
             str: The query results if successful, otherwise returns an error message.
         """
         try:
-            import duckdb
-
-            if csv_name not in [_csv.stem for _csv in self.csvs]:
+            file_path = self._get_csv_path(csv_name)
+            if file_path is None:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            log_info(f"Loading csv file: {csv_name}")
-            file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
-
-            # Create duckdb connection
-            con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
-            if con is None:
-                logger.error("Error connecting to DuckDB")
-                return "Error connecting to DuckDB, please check the connection."
-
-            # Create a table from the csv file
-            con.execute(
-                f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
-            )
-
-            # -*- Format the SQL Query
-            # Remove backticks
-            formatted_sql = sql_query.replace("`", "")
-            # If there are multiple statements, only run the first one
-            formatted_sql = formatted_sql.split(";")[0]
-            # -*- Run the SQL Query
-            log_info(f"Running query: {formatted_sql}")
-            query_result = con.sql(formatted_sql)
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            with self._duckdb_lock:
+                con = self._get_duckdb_connection()
+                if con is None:
+                    logger.error("Error connecting to DuckDB")
+                    return "Error connecting to DuckDB, please check the connection."
+
+                # Load the csv file into duckdb, unless it is already loaded and unchanged
+                self._load_csv_table(con, csv_name, file_path)
+
+                # -*- Format the SQL Query
+                # Remove backticks
+                formatted_sql = sql_query.replace("`", "")
+                # If there are multiple statements, only run the first one
+                formatted_sql = formatted_sql.split(";")[0]
+                # -*- Run the SQL Query
+                log_info(f"Running query: {formatted_sql}")
+                query_result = con.sql(formatted_sql)
+                result_output = "No output"
+                if query_result is not None:
+                    try:
+                        results_as_python_objects = query_result.fetchall()
+                        result_rows = []
+                        for row in results_as_python_objects:
+                            if len(row) == 1:
+                                result_rows.append(str(row[0]))
+                            else:
+                                result_rows.append(",".join(str(x) for x in row))
+
+                        result_data = "\n".join(result_rows)
+                        result_output = ",".join(query_result.columns) + "\n" + result_data
+                    except AttributeError:
+                        result_output = str(query_result)
 
             log_debug(f"Query result: {result_output}")
             return result_output
         except Exception as e:
             logger.error(f"Error querying csv: {e}")
             return f"Error querying csv: {e}"
+
+    def _get_duckdb_connection(self) -> Optional[Any]:
+        if self.duckdb_connection is not None:
+            return self.duckdb_connection
+        if self._duckdb_connection is None:
+            import duckdb
+
+            self._duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
+        return self._duckdb_connection
+
+    def _load_csv_table(self, con: Any, csv_name: str, file_path: Path) -> None:
+        """Load the csv file as a table named after it, if it was not loaded yet or changed since it was loaded."""
+        stat = file_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        if self._loaded_tables.get(csv_name) == version:
+            return
+
+        log_info(f"Loading csv file: {csv_name}")
+        table_name = csv_name.replace('"', '""')
+        escaped_path = str(file_path).replace("'", "''")
+        con.execute(
+            f'CREATE OR REPLACE TABLE "{table_name}" AS '
+            f"SELECT * FROM read_csv('{escaped_path}', ignore_errors=false, auto_detect=true)"
+        )
+        self._loaded_tables[csv_name] = version
+
+    def close(self) -> None:
+        """Close the DuckDB connection opened by the toolkit. Connections provided to the toolkit are left open."""
+        with self._duckdb_lock:
+            if self._duckdb_connection is not None:
+                self._duckdb_connection.close()
+                self._duckdb_connection = None
+            self._loaded_tables = {}
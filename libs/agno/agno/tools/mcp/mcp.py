@@ -1,13 +1,14 @@
 import inspect
-import time
 import weakref
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Literal, Optional, Tuple, Union
 
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.tools.mcp.params import SSEClientParams, StreamableHTTPClientParams
+from agno.tools.mcp.session_pool import MCPSessionPool
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.mcp import get_entrypoint_for_tool, prepare_command
 
@@ -52,6 +53,8 @@ class MCPTools(Toolkit):
         refresh_connection: bool = False,
         tool_name_prefix: Optional[str] = None,
         header_provider: Optional[Callable[..., dict[str, Any]]] = None,
+        max_sessions: int = 16,
+        session_idle_timeout_seconds: float = 300.0,
         **kwargs,
     ):
         """
@@ -72,7 +75,9 @@ class MCPTools(Toolkit):
             refresh_connection: If True, the connection and tools will be refreshed on each run
             header_provider: Optional function to generate dynamic HTTP headers.
                 Only relevant with HTTP transports (Streamable HTTP or SSE).
-                Creates a new session per agent run with dynamic headers merged into connection config.
+                Runs resolving the same headers share a pooled session, with the headers merged into connection config.
+            max_sessions: Maximum number of pooled sessions opened with dynamic headers
+            session_idle_timeout_seconds: Close pooled sessions not used for this many seconds
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -161,11 +166,10 @@ class MCPTools(Toolkit):
         self._context = None
         self._session_context = None
 
-        # Session management for per-agent-run sessions with dynamic headers
-        # Maps run_id to (session, timestamp) for TTL-based cleanup
-        self._run_sessions: dict[str, Tuple[ClientSession, float]] = {}
-        self._run_session_contexts: dict[str, Any] = {}  # Maps run_id to session context managers
-        self._session_ttl_seconds: float = 300.0  # 5 minutes TTL for MCP sessions
+        # Sessions opened with dynamic headers, shared by the runs resolving the same headers
+        self._session_pool = MCPSessionPool(
+            max_sessions=max_sessions, idle_timeout_seconds=session_idle_timeout_seconds
+        )
 
         def cleanup():
             """Cancel active connections"""
@@ -262,22 +266,6 @@ class MCPTools(Toolkit):
             log_warning(f"Error calling header_provider: {e}")
             return {}
 
-    async def _cleanup_stale_sessions(self) -> None:
-        """Clean up sessions older than TTL to prevent memory leaks."""
-        if not self._run_sessions:
-            return
-
-        now = time.time()
-        stale_run_ids = [
-            run_id
-            for run_id, (_, created_at) in self._run_sessions.items()
-            if now - created_at > self._session_ttl_seconds
-        ]
-
-        for run_id in stale_run_ids:
-            log_debug(f"Cleaning up stale MCP sessions for run_id={run_id}")
-            await self.cleanup_run_session(run_id)
-
     async def get_session_for_run(
         self,
         run_context: Optional["RunContext"] = None,
@@ -285,10 +273,11 @@ class MCPTools(Toolkit):
         team: Optional["Team"] = None,
     ) -> ClientSession:
         """
-        Get or create a session for the given run context.
+        Get the session to use for the given run context.
 
-        If header_provider is set and run_context is provided, creates a new session
-        with dynamic headers merged into the connection config.
+        If header_provider is set and run_context is provided, returns a pooled session opened with the dynamic
+        headers merged into the connection config. Runs resolving the same headers share the same session.
+        Pooled sessions returned here are not leased, see `lease_session_for_run`.
 
         Args:
             run_context: The RunContext for the current agent run
@@ -298,27 +287,61 @@ class MCPTools(Toolkit):
         Returns:
             ClientSession for the run
         """
+        async with self.lease_session_for_run(run_context=run_context, agent=agent, team=team) as session:
+            return session
+
+    @asynccontextmanager
+    async def lease_session_for_run(
+        self,
+        run_context: Optional["RunContext"] = None,
+        agent: Optional["Agent"] = None,
+        team: Optional["Team"] = None,
+    ) -> AsyncIterator[ClientSession]:
+        """
+        Use the session for the given run context while the context is open.
+
+        Pooled sessions are leased meanwhile, so the pool doesn't close them while the run uses them.
+
+        Args:
+            run_context: The RunContext for the current agent run
+            agent: The Agent instance (if running within an agent)
+            team: The Team instance (if running within a team)
+
+        Yields:
+            ClientSession for the run
+        """
         # If no header_provider or no run_context, use the default session
         if not self.header_provider or not run_context:
             if self.session is None:
                 raise ValueError("Session is not initialized")
-            return self.session
-
-        # Lazy cleanup of stale sessions
-        await self._cleanup_stale_sessions()
-
-        # Check if we already have a session for this run
-        run_id = run_context.run_id
-        if run_id in self._run_sessions:
-            session, _ = self._run_sessions[run_id]
-            return session
+            yield self.session
+            return
 
-        # Create a new session with dynamic headers for this run
-        log_debug(f"Creating new session for run_id={run_id} with dynamic headers")
+        if self.transport not in ["sse", "streamable-http"]:
+            # stdio doesn't support headers, fall back to default session
+            log_warning(f"Cannot use dynamic headers with {self.transport} transport, using default session")
+            if self.session is None:
+                raise ValueError("Session is not initialized")
+            yield self.session
+            return
 
         # Generate dynamic headers from the provider
         dynamic_headers = self._call_header_provider(run_context=run_context, agent=agent, team=team)
 
+        async with self._session_pool.lease(
+            key=MCPSessionPool.get_key(dynamic_headers),
+            create_session=lambda: self._create_session_with_headers(dynamic_headers),
+        ) as session:
+            yield session
+
+    async def _create_session_with_headers(self, dynamic_headers: dict[str, Any]) -> Tuple[ClientSession, Any, Any]:
+        """Open and initialize a new session with the given headers merged into the connection config.
+
+        Returns:
+            Tuple[ClientSession, Any, Any]: The session, and its transport and session context managers.
+        """
+        log_debug("Creating new MCP session with dynamic headers")
+
         # Create new session with merged headers based on transport type
         if self.transport == "sse":
             sse_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
@@ -326,19 +349,19 @@ class MCPTools(Toolkit):
                 sse_params["url"] = self.url
 
             # Merge dynamic headers into existing headers
-            existing_headers = sse_params.get("headers", {})
+            existing_headers = sse_params.get("headers") or {}
             sse_params["headers"] = {**existing_headers, **dynamic_headers}
 
             context = sse_client(**sse_params)  # type: ignore
             client_timeout = min(self.timeout_seconds, sse_params.get("timeout", self.timeout_seconds))
 
-        elif self.transport == "streamable-http":
+        else:
             streamable_http_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
             if "url" not in streamable_http_params:
                 streamable_http_params["url"] = self.url
 
             # Merge dynamic headers into existing headers
-            existing_headers = streamable_http_params.get("headers", {})
+            existing_headers = streamable_http_params.get("headers") or {}
             streamable_http_params["headers"] = {**existing_headers, **dynamic_headers}
 
             context = streamablehttp_client(**streamable_http_params)  # type: ignore
@@ -346,12 +369,6 @@ class MCPTools(Toolkit):
             if isinstance(params_timeout, timedelta):
                 params_timeout = int(params_timeout.total_seconds())
             client_timeout = min(self.timeout_seconds, params_timeout)
-        else:
-            # stdio doesn't support headers, fall back to default session
-            log_warning(f"Cannot use dynamic headers with {self.transport} transport, using default session")
-            if self.session is None:
-                raise ValueError("Session is not initialized")
-            return self.session
 
         # Enter the context and create session
         session_params = await context.__aenter__()  # type: ignore
@@ -363,49 +380,7 @@ class MCPTools(Toolkit):
         # Initialize the session
         await session.initialize()
 
-        # Store the session with timestamp and context for cleanup
-        self._run_sessions[run_id] = (session, time.time())
-        self._run_session_contexts[run_id] = (context, session_context)
-
-        return session
-
-    async def cleanup_run_session(self, run_id: str) -> None:
-        """
-        Clean up the session for a specific run.
-
-        Note: Cleanup may fail due to async context manager limitations when
-        contexts are entered/exited across different tasks. Errors are logged
-        but not raised.
-        """
-        if run_id not in self._run_sessions:
-            return
-
-        try:
-            # Get the context managers
-            context, session_context = self._run_session_contexts.get(run_id, (None, None))
-
-            # Try to clean up session context
-            # Silently ignore cleanup errors - these are harmless
-            if session_context is not None:
-                try:
-                    await session_context.__aexit__(None, None, None)
-                except (RuntimeError, Exception):
-                    pass  # Silently ignore
-
-            # Try to clean up transport context
-            if context is not None:
-                try:
-                    await context.__aexit__(None, None, None)
-                except (RuntimeError, Exception):
-                    pass  # Silently ignore
-
-            # Remove from tracking regardless of cleanup success
-            # The connections will be cleaned up by garbage collection
-            del self._run_sessions[run_id]
-            del self._run_session_contexts[run_id]
-
-        except Exception:
-            pass  # Silently ignore all cleanup errors
+        return session, context, session_context
 
     async def is_alive(self) -> bool:
         if self.session is None:
@@ -495,10 +470,8 @@ class MCPTools(Toolkit):
             warnings.filterwarnings("ignore", message=".*cancel scope.*")
 
             try:
-                # Clean up all per-run sessions first
-                run_ids = list(self._run_sessions.keys())
-                for run_id in run_ids:
-                    await self.cleanup_run_session(run_id)
+                # Clean up all pooled sessions first
+                await self._session_pool.close()
 
                 # Clean up the main session
                 if self._session_context is not None:
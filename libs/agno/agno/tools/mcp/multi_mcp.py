@@ -1,16 +1,16 @@
 import inspect
-import time
 import warnings
 import weakref
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import asdict
 from datetime import timedelta
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.tools.mcp.params import SSEClientParams, StreamableHTTPClientParams
+from agno.tools.mcp.session_pool import MCPSessionPool
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.mcp import get_entrypoint_for_tool, prepare_command
 
@@ -56,6 +56,8 @@ class MultiMCPTools(Toolkit):
         refresh_connection: bool = False,
         allow_partial_failure: bool = False,
         header_provider: Optional[Callable[..., dict[str, Any]]] = None,
+        max_sessions: int = 16,
+        session_idle_timeout_seconds: float = 300.0,
         **kwargs,
     ):
         """
@@ -74,6 +76,8 @@ class MultiMCPTools(Toolkit):
             allow_partial_failure: If True, allows toolkit to initialize even if some MCP servers fail to connect. If False, any failure will raise an exception.
             refresh_connection: If True, the connection and tools will be refreshed on each run
             header_provider: Header provider function for all servers. Takes RunContext and returns dict of HTTP headers.
+            max_sessions: Maximum number of pooled sessions opened with dynamic headers, across all servers.
+            session_idle_timeout_seconds: Close pooled sessions not used for this many seconds.
         """
         warnings.warn(
             "The MultiMCPTools class is deprecated and will be removed in a future version. Please use multiple MCPTools instances instead.",
@@ -158,12 +162,10 @@ class MultiMCPTools(Toolkit):
         self._sessions: list[ClientSession] = []
         self._session_to_server_idx: Dict[int, int] = {}  # Maps session list index to server params index
 
-        # Session management for per-agent-run sessions with dynamic headers
-        # For MultiMCP, we track sessions per (run_id, server_idx) since we have multiple servers
-        # Maps (run_id, server_idx) to (session, timestamp) for TTL-based cleanup
-        self._run_sessions: Dict[Tuple[str, int], Tuple[ClientSession, float]] = {}
-        self._run_session_contexts: Dict[Tuple[str, int], Any] = {}  # Maps (run_id, server_idx) to context managers
-        self._session_ttl_seconds: float = 300.0  # 5 minutes default TTL
+        # Sessions opened with dynamic headers, shared by the runs resolving the same headers for the same server
+        self._session_pool = MCPSessionPool(
+            max_sessions=max_sessions, idle_timeout_seconds=session_idle_timeout_seconds
+        )
 
         self.allow_partial_failure = allow_partial_failure
 
@@ -247,22 +249,6 @@ class MultiMCPTools(Toolkit):
             log_warning(f"Error calling header_provider: {e}")
             return {}
 
-    async def _cleanup_stale_sessions(self) -> None:
-        """Clean up sessions older than TTL to prevent memory leaks."""
-        if not self._run_sessions:
-            return
-
-        now = time.time()
-        stale_keys = [
-            cache_key
-            for cache_key, (_, created_at) in self._run_sessions.items()
-            if now - created_at > self._session_ttl_seconds
-        ]
-
-        for run_id, server_idx in stale_keys:
-            log_debug(f"Cleaning up stale session for run_id={run_id}, server_idx={server_idx}")
-            await self.cleanup_run_session(run_id, server_idx)
-
     async def get_session_for_run(
         self,
         run_context: Optional["RunContext"] = None,
@@ -271,10 +257,11 @@ class MultiMCPTools(Toolkit):
         team: Optional["Team"] = None,
     ) -> ClientSession:
         """
-        Get or create a session for the given run_context and server index.
+        Get the session to use for the given run_context and server index.
 
-        If header_provider is configured and run_context is provided, this creates
-        a new session with dynamic headers for this specific agent run and server.
+        If header_provider is configured and run_context is provided, returns a pooled session for this server opened
+        with the dynamic headers. Runs resolving the same headers share the same session.
+        Pooled sessions returned here are not leased, see `lease_session_for_run`.
 
         Args:
             run_context: The RunContext containing user_id, metadata, etc.
@@ -283,64 +270,93 @@ class MultiMCPTools(Toolkit):
             team: The Team instance (if running within a team)
 
         Returns:
-            ClientSession: Either the default session or a per-run session with dynamic headers
+            ClientSession: Either the default session or a pooled session with dynamic headers
+        """
+        async with self.lease_session_for_run(
+            run_context=run_context, server_idx=server_idx, agent=agent, team=team
+        ) as session:
+            return session
+
+    @asynccontextmanager
+    async def lease_session_for_run(
+        self,
+        run_context: Optional["RunContext"] = None,
+        server_idx: int = 0,
+        agent: Optional["Agent"] = None,
+        team: Optional["Team"] = None,
+    ) -> AsyncIterator[ClientSession]:
+        """
+        Use the session for the given run_context and server index while the context is open.
+
+        Pooled sessions are leased meanwhile, so the pool doesn't close them while the run uses them.
+
+        Args:
+            run_context: The RunContext containing user_id, metadata, etc.
+            server_idx: Index of the server in self._sessions list
+            agent: The Agent instance (if running within an agent)
+            team: The Team instance (if running within a team)
+
+        Yields:
+            ClientSession: Either the default session or a pooled session with dynamic headers
         """
         # If no header_provider or no run_context, use the default session
         if not self.header_provider or not run_context:
-            # Return the default session for this server
+            # Use the default session for this server
             if server_idx < len(self._sessions):
-                return self._sessions[server_idx]
+                yield self._sessions[server_idx]
+                return
             raise ValueError(f"Server index {server_idx} out of range")
 
-        # Lazy cleanup of stale sessions
-        await self._cleanup_stale_sessions()
-
-        # Check if we already have a session for this (run_id, server_idx)
-        run_id = run_context.run_id
-        cache_key = (run_id, server_idx)
-        if cache_key in self._run_sessions:
-            session, _ = self._run_sessions[cache_key]
-            return session
+        # Get the server params for this server index
+        if server_idx >= len(self.server_params_list):
+            raise ValueError(f"Server index {server_idx} out of range")
 
-        # Create a new session with dynamic headers for this run and server
-        log_debug(f"Creating new session for run_id={run_id}, server_idx={server_idx} with dynamic headers")
+        server_params = self.server_params_list[server_idx]
+        if not isinstance(server_params, (SSEClientParams, StreamableHTTPClientParams)):
+            # stdio doesn't support headers, fall back to default session
+            log_warning(
+                f"Cannot use dynamic headers with stdio transport for server {server_idx}, using default session"
+            )
+            if server_idx < len(self._sessions):
+                yield self._sessions[server_idx]
+                return
+            raise ValueError(f"Server index {server_idx} out of range")
 
         # Generate dynamic headers from the provider
         dynamic_headers = self._call_header_provider(run_context=run_context, agent=agent, team=team)
 
-        # Get the server params for this server index
-        if server_idx >= len(self.server_params_list):
-            raise ValueError(f"Server index {server_idx} out of range")
+        async with self._session_pool.lease(
+            key=MCPSessionPool.get_key(dynamic_headers, namespace=str(server_idx)),
+            create_session=lambda: self._create_session_with_headers(server_params, dynamic_headers),
+        ) as session:
+            yield session
 
-        server_params = self.server_params_list[server_idx]
+    async def _create_session_with_headers(
+        self,
+        server_params: Union[SSEClientParams, StreamableHTTPClientParams],
+        dynamic_headers: Dict[str, Any],
+    ) -> Tuple[ClientSession, Any, Any]:
+        """Open and initialize a new session to the given server, with the given headers merged into its config.
+
+        Returns:
+            Tuple[ClientSession, Any, Any]: The session, and its transport and session context managers.
+        """
+        log_debug("Creating new MCP session with dynamic headers")
+
+        params_dict = asdict(server_params)
+        existing_headers = params_dict.get("headers") or {}
+        params_dict["headers"] = {**existing_headers, **dynamic_headers}
 
         # Create new session with merged headers based on transport type
         if isinstance(server_params, SSEClientParams):
-            params_dict = asdict(server_params)
-            existing_headers = params_dict.get("headers") or {}
-            params_dict["headers"] = {**existing_headers, **dynamic_headers}
-
             context = sse_client(**params_dict)  # type: ignore
             client_timeout = min(self.timeout_seconds, params_dict.get("timeout", self.timeout_seconds))
-
-        elif isinstance(server_params, StreamableHTTPClientParams):
-            params_dict = asdict(server_params)
-            existing_headers = params_dict.get("headers") or {}
-            params_dict["headers"] = {**existing_headers, **dynamic_headers}
-
+        else:
             context = streamablehttp_client(**params_dict)  # type: ignore
             params_timeout = params_dict.get("timeout", self.timeout_seconds)
             if isinstance(params_timeout, timedelta):
                 params_timeout = int(params_timeout.total_seconds())
             client_timeout = min(self.timeout_seconds, params_timeout)
-        else:
-            # stdio doesn't support headers, fall back to default session
-            log_warning(
-                f"Cannot use dynamic headers with stdio transport for server {server_idx}, using default session"
-            )
-            if server_idx < len(self._sessions):
-                return self._sessions[server_idx]
-            raise ValueError(f"Server index {server_idx} out of range")
 
         # Enter the context and create session
         session_params = await context.__aenter__()  # type: ignore
@@ -352,39 +368,7 @@ class MultiMCPTools(Toolkit):
         # Initialize the session
         await session.initialize()
 
-        # Store the session with timestamp and context for cleanup
-        self._run_sessions[cache_key] = (session, time.time())
-        self._run_session_contexts[cache_key] = (context, session_context)
-
-        return session
-
-    async def cleanup_run_session(self, run_id: str, server_idx: int) -> None:
-        """Clean up a per-run session."""
-        cache_key = (run_id, server_idx)
-        if cache_key not in self._run_sessions:
-            return
-
-        try:
-            context, session_context = self._run_session_contexts[cache_key]
-
-            # Exit session context - silently ignore errors
-            try:
-                await session_context.__aexit__(None, None, None)
-            except (RuntimeError, Exception):
-                pass  # Silently ignore
-
-            # Exit transport context - silently ignore errors
-            try:
-                await context.__aexit__(None, None, None)
-            except (RuntimeError, Exception):
-                pass  # Silently ignore
-
-        except Exception:
-            pass  # Silently ignore all cleanup errors
-        finally:
-            # Remove from cache
-            self._run_sessions.pop(cache_key, None)
-            self._run_session_contexts.pop(cache_key, None)
+        return session, context, session_context
 
     async def connect(self, force: bool = False):
         """Initialize a MultiMCPTools instance and connect to the MCP servers"""
@@ -509,10 +493,8 @@ class MultiMCPTools(Toolkit):
             warnings.filterwarnings("ignore", message=".*cancel scope.*")
 
             try:
-                # Clean up all per-run sessions first
-                cache_keys = list(self._run_sessions.keys())
-                for run_id, server_idx in cache_keys:
-                    await self.cleanup_run_session(run_id, server_idx)
+                # Clean up all pooled sessions first
+                await self._session_pool.close()
 
                 # Clean up main sessions
                 await self._async_exit_stack.aclose()
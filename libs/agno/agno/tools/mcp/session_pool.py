@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+try:
+    from mcp import ClientSession
+except (ImportError, ModuleNotFoundError):
+    raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
+
+# Creates a connected and initialized session. Returns the session with its transport and session context managers.
+SessionFactory = Callable[[], Awaitable[Tuple[ClientSession, Any, Any]]]
+
+
+@dataclass
+class PooledSession:
+    """A session held by the pool, with the context managers to exit when closing it."""
+
+    session: ClientSession
+    transport_context: Any
+    session_context: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_checked_at: float = field(default_factory=time.monotonic)
+    # Number of runs using the session. Leased sessions are never evicted.
+    leases: int = 0
+    # Whether the session was removed from the pool while leased, to close it once the last lease is released
+    removed: bool = False
+
+
+class MCPSessionPool:
+    """A bounded pool of MCP client sessions, keyed by the headers they were opened with.
+
+    Runs resolving the same headers (e.g. the same tenant token) share one session, so they don't pay for the
+    transport connection and the `initialize` handshake again. MCP sessions multiplex concurrent requests, so a
+    session can be used by several runs at once.
+
+    Runs hold a lease on the session while using it, see `lease`. Leased sessions are not evicted.
+
+    Args:
+        max_sessions (int): Maximum number of open sessions. The least recently used session not leased is closed to
+            make room for a new one. When all sessions are leased, the pool opens one more.
+        idle_timeout_seconds (float): Close sessions not used for this long.
+        health_check_interval_seconds (float): Ping sessions not checked for this long before handing them out,
+            replacing the ones not answering.
+        health_check_timeout_seconds (float): How long to wait for the answer to a health check ping.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 16,
+        idle_timeout_seconds: float = 300.0,
+        health_check_interval_seconds: float = 30.0,
+        health_check_timeout_seconds: float = 5.0,
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.max_sessions = max_sessions
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+
+        # Sessions in least recently used order
+        self._sessions: "OrderedDict[str, PooledSession]" = OrderedDict()
+        # Per-key locks, so concurrent runs with the same headers open a single session
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sessions
+
+    @staticmethod
+    def get_key(headers: Dict[str, Any], namespace: Optional[str] = None) -> str:
+        """Get the pool key of the given headers.
+
+        Args:
+            headers: The resolved headers of the session.
+            namespace: Optional namespace to keep apart sessions with the same headers, e.g. one per server.
+
+        Returns:
+            str: A hash of the headers, so secrets in them are not kept as keys.
+        """
+        payload = json.dumps(headers, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{namespace}:{digest}" if namespace is not None else digest
+
+    async def get_session(self, key: str, create_session: SessionFactory) -> ClientSession:
+        """Get the pooled session for the given key, opening it with `create_session` if needed.
+
+        The session is not leased, so the pool may close it once idle or to make room. Use `lease` to hold it.
+
+        Args:
+            key: The pool key, see `get_key`.
+            create_session: Opens a new connected and initialized session for this key.
+
+        Returns:
+            ClientSession: A healthy session for the key.
+        """
+        async with self.lease(key, create_session) as session:
+            return session
+
+    @asynccontextmanager
+    async def lease(self, key: str, create_session: SessionFactory) -> AsyncIterator[ClientSession]:
+        """Lease the pooled session for the given key while the context is open, opening it if needed.
+
+        Args:
+            key: The pool key, see `get_key`.
+            create_session: Opens a new connected and initialized session for this key.
+
+        Yields:
+            ClientSession: A healthy session for the key, not closed by the pool until the lease is released.
+        """
+        pooled = await self._acquire(key, create_session)
+        try:
+            yield pooled.session
+        finally:
+            await self._release(pooled)
+
+    async def remove(self, key: str) -> None:
+        """Remove the session for the given key, if any. It is closed once no run is using it."""
+        pooled = self._sessions.pop(key, None)
+        lock = self._key_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._key_locks[key]
+        if pooled is None:
+            return
+        if pooled.leases > 0:
+            pooled.removed = True
+        else:
+            await self._close_session(pooled)
+
+    async def close(self) -> None:
+        """Close all pooled sessions."""
+        for key in list(self._sessions.keys()):
+            await self.remove(key)
+        self._key_locks.clear()
+
+    async def _acquire(self, key: str, create_session: SessionFactory) -> PooledSession:
+        await self._evict_idle_sessions()
+
+        lock = self._key_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None:
+                # Lease the session before checking it, so it isn't evicted meanwhile
+                pooled.leases += 1
+                if not await self._is_healthy(pooled):
+                    log_debug("Pooled MCP session failed its health check, replacing it")
+                    await self._release(pooled)
+                    await self.remove(key)
+                    pooled = None
+
+            if pooled is None:
+                await self._make_room()
+                session, transport_context, session_context = await create_session()
+                pooled = PooledSession(
+                    session=session, transport_context=transport_context, session_context=session_context, leases=1
+                )
+                self._sessions[key] = pooled
+                log_debug(f"Opened pooled MCP session ({len(self._sessions)}/{self.max_sessions})")
+
+            pooled.last_used_at = time.monotonic()
+            self._sessions.move_to_end(key)
+            return pooled
+
+    async def _release(self, pooled: PooledSession) -> None:
+        pooled.leases -= 1
+        pooled.last_used_at = time.monotonic()
+        if pooled.leases == 0 and pooled.removed:
+            await self._close_session(pooled)
+
+    async def _is_healthy(self, pooled: PooledSession) -> bool:
+        now = time.monotonic()
+        if now - pooled.last_checked_at < self.health_check_interval_seconds:
+            return True
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=self.health_check_timeout_seconds)
+        except Exception:
+            return False
+        pooled.last_checked_at = now
+        return True
+
+    def _is_idle(self, pooled: PooledSession, now: float) -> bool:
+        return pooled.leases == 0 and now - pooled.last_used_at > self.idle_timeout_seconds
+
+    async def _evict_idle_sessions(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, pooled in self._sessions.items() if self._is_idle(pooled, now)]:
+            # Closing a session yields to other runs, which may have leased this one since
+            pooled = self._sessions.get(key)
+            if pooled is not None and self._is_idle(pooled, now):
+                log_debug("Closing idle pooled MCP session")
+                await self.remove(key)
+
+    async def _make_room(self) -> None:
+        while len(self._sessions) >= self.max_sessions:
+            least_recently_used_key = next((key for key, pooled in self._sessions.items() if pooled.leases == 0), None)
+            if least_recently_used_key is None:
+                log_debug("MCP session pool is full of sessions in use, opening one more")
+                return
+            log_debug("MCP session pool is full, closing the least recently used session")
+            await self.remove(least_recently_used_key)
+
+    async def _close_session(self, pooled: PooledSession) -> None:
+        # Exiting the contexts may fail when they were entered in another task. Errors are harmless and ignored,
+        # the connections are then released by garbage collection.
+        try:
+            await pooled.session_context.__aexit__(None, None, None)
+        except Exception:
+            pass
+        try:
+            await pooled.transport_context.__aexit__(None, None, None)
+        except Exception:
+            pass
@@ -3,40 +3,109 @@ Custom OpenTelemetry SpanExporter that writes traces to Agno database.
 """
 
 import asyncio
+import queue
+import threading
+import time
 from collections import defaultdict
-from typing import Dict, List, Sequence, Union
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Sequence, Union
 
 from opentelemetry.sdk.trace import ReadableSpan  # type: ignore
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult  # type: ignore
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.remote.base import RemoteDb
-from agno.tracing.schemas import Span, create_trace_from_spans
+from agno.tracing.schemas import Span, Trace, create_trace_from_spans
 from agno.utils.log import logger
 
+# Maximum time to wait for the event loop of the application to write a batch to an async database
+ASYNC_WRITE_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class SpanExportMetrics:
+    """Counters of the spans handled by a DatabaseSpanExporter"""
+
+    # Spans and traces written to the database
+    exported_spans: int = 0
+    exported_traces: int = 0
+    # Spans dropped because the queue was full, or lost in a failed flush
+    dropped_spans: int = 0
+    failed_spans: int = 0
+    # Flushes and their duration
+    flushes: int = 0
+    failed_flushes: int = 0
+    last_flush_duration_ms: float = 0.0
+    total_flush_duration_ms: float = 0.0
+
+
+class _FlushRequest:
+    """Queued after the spans to flush; set once they are written"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
 
 class DatabaseSpanExporter(SpanExporter):
-    """Custom OpenTelemetry SpanExporter that writes to Agno database"""
+    """Custom OpenTelemetry SpanExporter that writes to Agno database.
+
+    Spans are put in a bounded queue and written by a background thread, which bulk-upserts
+    the traces and bulk-inserts the spans of each batch in a single transaction.
 
-    def __init__(self, db: Union[BaseDb, AsyncBaseDb, RemoteDb]):
+    Async databases are written from the event loop spans were last exported from, as their
+    connections belong to it. Without a running loop, the thread runs its own.
+    """
+
+    def __init__(
+        self,
+        db: Union[BaseDb, AsyncBaseDb, RemoteDb],
+        max_queue_size: int = 8192,
+        max_batch_size: int = 512,
+        flush_interval_millis: int = 1000,
+        queue_full_policy: Literal["drop", "block"] = "drop",
+        block_timeout_millis: int = 5000,
+    ):
         """
         Initialize the DatabaseSpanExporter.
 
         Args:
             db: Database instance (sync or async) to store traces
+            max_queue_size: Maximum number of spans waiting to be written
+            max_batch_size: Maximum number of spans written per flush
+            flush_interval_millis: Maximum delay in milliseconds before queued spans are written
+            queue_full_policy: Whether to drop spans or block the caller when the queue is full
+            block_timeout_millis: Maximum time in milliseconds to block before dropping a span
         """
         self.db = db
+        self.max_batch_size = max_batch_size
+        self.flush_interval_millis = flush_interval_millis
+        self.queue_full_policy = queue_full_policy
+        self.block_timeout_millis = block_timeout_millis
+        self.metrics = SpanExportMetrics()
+
+        self._queue: "queue.Queue[Union[Span, _FlushRequest]]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        # The event loop of the application, where async databases are written
+        self._db_loop: Optional[asyncio.AbstractEventLoop] = None
+        # The event loop of the thread, used for async databases when the application has no running loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._shutdown = False
 
+    @property
+    def queue_size(self) -> int:
+        """Number of spans waiting to be written"""
+        return self._queue.qsize()
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """
-        Export spans to the database.
+        Queue spans to be written to the database.
 
         This method:
         1. Converts OpenTelemetry spans to Span objects
-        2. Groups spans by trace_id
-        3. Creates Trace records (one per trace_id)
-        4. Creates Span records (multiple per trace_id)
+        2. Puts them in the queue, dropping or blocking when it is full
+
+        The background thread then groups them by trace_id and writes the Trace and Span records.
 
         Args:
             spans: Sequence of OpenTelemetry ReadableSpan objects
@@ -48,114 +117,174 @@ class DatabaseSpanExporter(SpanExporter):
             logger.warning("DatabaseSpanExporter is shutdown, cannot export spans")
             return SpanExportResult.FAILURE
 
-        if not spans:
+        # Skipping remote database because it handles its own tracing
+        if not spans or isinstance(self.db, RemoteDb):
             return SpanExportResult.SUCCESS
 
         try:
-            # Convert OpenTelemetry spans to Span objects
-            converted_spans: List[Span] = []
+            if isinstance(self.db, AsyncBaseDb):
+                try:
+                    self._db_loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    pass
+            self._start_worker()
+
+            dropped = 0
             for span in spans:
                 try:
                     converted_span = Span.from_otel_span(span)
-                    converted_spans.append(converted_span)
                 except Exception as e:
                     logger.error(f"Failed to convert span {span.name}: {e}")
                     # Continue processing other spans
                     continue
 
-            if not converted_spans:
-                return SpanExportResult.SUCCESS
+                if not self._put(converted_span):
+                    dropped += 1
 
-            # Group spans by trace_id
-            spans_by_trace: Dict[str, List[Span]] = defaultdict(list)
-            for converted_span in converted_spans:
-                spans_by_trace[converted_span.trace_id].append(converted_span)
-
-            # Handle async DB
-            if isinstance(self.db, RemoteDb):
-                # Skipping remote database because it handles its own tracing
-                pass
-            elif isinstance(self.db, AsyncBaseDb):
-                self._export_async(spans_by_trace)
-            else:
-                # Synchronous database
-                self._export_sync(spans_by_trace)
+            if dropped:
+                with self._lock:
+                    self.metrics.dropped_spans += dropped
+                logger.warning(f"DatabaseSpanExporter queue is full, dropped {dropped} spans")
 
             return SpanExportResult.SUCCESS
         except Exception as e:
             logger.error(f"Failed to export spans to database: {e}", exc_info=True)
             return SpanExportResult.FAILURE
 
-    def _export_sync(self, spans_by_trace: Dict[str, List[Span]]) -> None:
-        """Export traces and spans to synchronous database"""
+    def _put(self, item: Union[Span, _FlushRequest]) -> bool:
         try:
-            # Create trace and span records for each trace
-            for trace_id, spans in spans_by_trace.items():
-                # Create trace record (aggregate of all spans)
-                trace = create_trace_from_spans(spans)
-                if trace:
-                    self.db.upsert_trace(trace)  # type: ignore
+            if self.queue_full_policy == "block":
+                self._queue.put(item, timeout=self.block_timeout_millis / 1000)
+            else:
+                self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            return False
 
-                # Create span records
-                self.db.create_spans(spans)  # type: ignore
+    def _start_worker(self) -> None:
+        """Start the background thread writing the queued spans"""
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="agno-span-exporter", daemon=True)
+                self._worker.start()
 
-        except Exception as e:
-            logger.error(f"Failed to export sync traces: {e}", exc_info=True)
-            raise
+    def _run(self) -> None:
+        """Write batches of spans until the exporter is shut down"""
+        while True:
+            batch: List[Span] = []
+            flush_requests: List[_FlushRequest] = []
+            deadline = time.monotonic() + self.flush_interval_millis / 1000
+
+            # Collect spans until the batch is full, the interval elapses or a flush is requested
+            while len(batch) < self.max_batch_size and not flush_requests:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if isinstance(item, _FlushRequest):
+                    flush_requests.append(item)
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._flush(batch)
+            for flush_request in flush_requests:
+                flush_request.done.set()
+
+            if self._shutdown and self._queue.empty():
+                break
+
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def _flush(self, spans: List[Span]) -> None:
+        """Write a batch of spans and their traces to the database"""
+        start = time.perf_counter()
+
+        # Group spans by trace_id
+        spans_by_trace: Dict[str, List[Span]] = defaultdict(list)
+        for span in spans:
+            spans_by_trace[span.trace_id].append(span)
+
+        # Create trace records (aggregate of the spans of each trace)
+        traces: List[Trace] = []
+        for trace_spans in spans_by_trace.values():
+            trace = create_trace_from_spans(trace_spans)
+            if trace:
+                traces.append(trace)
 
-    def _export_async(self, spans_by_trace: Dict[str, List[Span]]) -> None:
-        """Handle async database export"""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in an async context, schedule the coroutine
-                asyncio.create_task(self._do_async_export(spans_by_trace))
+            if isinstance(self.db, AsyncBaseDb):
+                db_loop = self._db_loop
+                if db_loop is not None and db_loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(self.db.upsert_traces(traces, spans), db_loop)
+                    future.result(timeout=ASYNC_WRITE_TIMEOUT_SECONDS)
+                else:
+                    if self._loop is None:
+                        self._loop = asyncio.new_event_loop()
+                    self._loop.run_until_complete(self.db.upsert_traces(traces, spans))
             else:
-                # No running loop, run in new loop
-                loop.run_until_complete(self._do_async_export(spans_by_trace))
-        except RuntimeError:
-            # No event loop, create new one
-            try:
-                asyncio.run(self._do_async_export(spans_by_trace))
-            except Exception as e:
-                logger.error(f"Failed to export async traces: {e}", exc_info=True)
-
-    async def _do_async_export(self, spans_by_trace: Dict[str, List[Span]]) -> None:
-        """Actually perform the async export"""
-        try:
-            # Create trace and span records for each trace
-            for trace_id, spans in spans_by_trace.items():
-                # Create trace record (aggregate of all spans)
-                trace = create_trace_from_spans(spans)
-                if trace:
-                    create_trace_result = self.db.upsert_trace(trace)  # type: ignore
-                    if create_trace_result is not None:
-                        await create_trace_result
-
-                # Create span records
-                create_spans_result = self.db.create_spans(spans)  # type: ignore
-                if create_spans_result is not None:
-                    await create_spans_result
-
+                self.db.upsert_traces(traces, spans)  # type: ignore[union-attr]
         except Exception as e:
-            logger.error(f"Failed to do async export: {e}", exc_info=True)
-            raise
+            logger.error(f"Failed to export {len(spans)} spans to database: {e}", exc_info=True)
+            with self._lock:
+                self.metrics.failed_flushes += 1
+                self.metrics.failed_spans += len(spans)
+            return
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.metrics.flushes += 1
+            self.metrics.exported_spans += len(spans)
+            self.metrics.exported_traces += len(traces)
+            self.metrics.last_flush_duration_ms = duration_ms
+            self.metrics.total_flush_duration_ms += duration_ms
+        logger.debug(f"Exported {len(spans)} spans of {len(traces)} traces in {duration_ms:.1f}ms")
 
     def shutdown(self) -> None:
-        """Shutdown the exporter"""
+        """Write the queued spans and shutdown the exporter"""
+        if self._shutdown:
+            return
+        self.force_flush()
         self._shutdown = True
+        if self._worker is not None:
+            # Wake up the worker so it exits
+            self._put(_FlushRequest())
+            self._worker.join(timeout=self.flush_interval_millis / 1000 + 5)
         logger.debug("DatabaseSpanExporter shutdown")
 
+    def _is_db_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._db_loop
+        except RuntimeError:
+            return False
+
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """
         Force flush any pending spans.
 
-        Since we write immediately to the database, this is a no-op.
-
         Args:
             timeout_millis: Timeout in milliseconds
 
         Returns:
-            True if flush was successful
+            True if all queued spans were written before the timeout
         """
-        return True
+        if self._worker is None or self._shutdown:
+            return True
+        if isinstance(self.db, AsyncBaseDb) and self._is_db_loop_thread():
+            # The spans are written on this event loop, so they can't be waited for here
+            logger.warning("DatabaseSpanExporter can't flush async database writes from their own event loop")
+            return False
+
+        flush_request = _FlushRequest()
+        try:
+            self._queue.put(flush_request, timeout=timeout_millis / 1000)
+        except queue.Full:
+            return False
+        return flush_request.done.wait(timeout=timeout_millis / 1000)
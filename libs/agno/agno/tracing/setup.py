@@ -40,8 +40,9 @@ def setup_tracing(
 
     Args:
         db: Database instance to store traces (sync or async)
-        batch_processing: If True, use BatchSpanProcessor for better performance
-                            If False, use SimpleSpanProcessor (immediate export)
+        batch_processing: If True, use BatchSpanProcessor
+                            If False (default), use SimpleSpanProcessor. Spans are handed to the exporter as they
+                            end, and it already writes them in batches from its own queue
         max_queue_size: Maximum queue size for batch processor
         max_export_batch_size: Maximum batch size for export
         schedule_delay_millis: Delay in milliseconds between batch exports
@@ -17,6 +17,7 @@ from typing import (
 
 from pydantic import BaseModel
 
+from agno.db.schemas.messages import IndexedMessagePair
 from agno.media import Audio, File, Image, Video
 from agno.models.message import Message
 from agno.models.metrics import Metrics
@@ -525,6 +526,48 @@ def scrub_history_messages_from_run_output(run_response: Union[RunOutput, TeamRu
         run_response.messages = [msg for msg in run_response.messages if not msg.from_history]
 
 
+def get_indexed_message_pairs(run_response: RunOutput) -> List[IndexedMessagePair]:
+    """
+    Pair each user message of a run with the last assistant message answering it, to index them for searching
+    messages across sessions. Messages from history are skipped, as they are indexed with their own run.
+    """
+    if not run_response.messages or run_response.session_id is None:
+        return []
+
+    session_id: str = run_response.session_id
+    message_pairs: List[IndexedMessagePair] = []
+    user_message: Optional[Message] = None
+    reply: Optional[Message] = None
+
+    def add_pair() -> None:
+        if user_message is None or reply is None:
+            return
+        message_pairs.append(
+            IndexedMessagePair(
+                id=user_message.id,
+                session_id=session_id,
+                run_id=run_response.run_id,
+                user_id=run_response.user_id,
+                agent_id=run_response.agent_id,
+                user_message=user_message.to_dict(),
+                assistant_message=reply.to_dict(),
+                content=f"{user_message.get_content_string()}\n{reply.get_content_string()}",
+                created_at=user_message.created_at,
+            )
+        )
+
+    for message in run_response.messages:
+        if message.from_history:
+            continue
+        if message.role == "user":
+            add_pair()
+            user_message, reply = message, None
+        elif message.role == "assistant" and message.content:
+            reply = message
+    add_pair()
+    return message_pairs
+
+
 def get_run_output_util(
     entity: Union["Agent", "Team"], run_id: str, session_id: Optional[str] = None
 ) -> Optional[
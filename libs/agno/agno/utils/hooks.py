@@ -1,9 +1,9 @@
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from agno.eval.base import BaseEval
 from agno.guardrails.base import BaseGuardrail
-from agno.hooks.decorator import HOOK_RUN_IN_BACKGROUND_ATTR
+from agno.hooks.decorator import HOOK_RUN_IN_BACKGROUND_ATTR, is_read_only
 from agno.utils.log import log_warning
 
 # Keys that should be deep copied for background hooks to prevent race conditions
@@ -54,6 +54,67 @@ def should_run_hook_in_background(hook: Callable[..., Any]) -> bool:
     return getattr(hook, HOOK_RUN_IN_BACKGROUND_ATTR, False)
 
 
+def is_read_only_hook(hook: Callable[..., Any]) -> bool:
+    """
+    Check if a hook only inspects its arguments, without modifying them.
+
+    Args:
+        hook: The hook function to check
+
+    Returns:
+        True if the hook is the check of a read-only guardrail, or is decorated with @hook(read_only=True)
+    """
+    guardrail = getattr(hook, "__self__", None)
+    if isinstance(guardrail, BaseGuardrail):
+        return guardrail.read_only
+    return is_read_only(hook)
+
+
+def group_pre_hooks(hooks: List[Callable[..., Any]]) -> List[List[Callable[..., Any]]]:
+    """
+    Group consecutive read-only pre-hooks, so they can run concurrently.
+
+    Every other hook is in a group of its own, so it still runs after the hooks before it and before the hooks
+    after it.
+
+    Args:
+        hooks: The normalized pre-hooks, in order
+
+    Returns:
+        The groups of hooks, in order
+    """
+    groups: List[List[Callable[..., Any]]] = []
+    for hook in hooks:
+        if is_read_only_hook(hook) and groups and is_read_only_hook(groups[-1][0]):
+            groups[-1].append(hook)
+        else:
+            groups.append([hook])
+    return groups
+
+
+def split_speculative_pre_hooks(
+    hooks: Optional[List[Callable[..., Any]]],
+) -> Tuple[Optional[List[Callable[..., Any]]], Optional[List[Callable[..., Any]]]]:
+    """
+    Split the pre-hooks that must complete before the model request from the ones that can run alongside it.
+
+    Only the read-only hooks at the end of the list can run alongside the model request, as no later hook
+    depends on them.
+
+    Args:
+        hooks: The normalized pre-hooks, in order
+
+    Returns:
+        The hooks to run before the model request, and the hooks to run alongside it
+    """
+    if not hooks:
+        return hooks, None
+    num_blocking = len(hooks)
+    while num_blocking > 0 and is_read_only_hook(hooks[num_blocking - 1]):
+        num_blocking -= 1
+    return hooks[:num_blocking] or None, hooks[num_blocking:] or None
+
+
 def normalize_pre_hooks(
     hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]],
     async_mode: bool = False,
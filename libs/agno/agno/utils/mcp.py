@@ -1,4 +1,5 @@
 import json
+from contextlib import AsyncExitStack
 from functools import partial
 from typing import TYPE_CHECKING, Optional, Union
 from uuid import uuid4
@@ -52,32 +53,35 @@ def get_entrypoint_for_tool(
     ) -> ToolResult:
         # Execute the MCP tool call
         try:
-            # Get the appropriate session for this run
-            # If mcp_tools_instance has header_provider and run_context is provided,
-            # this will create/reuse a session with dynamic headers
-            if mcp_tools_instance and hasattr(mcp_tools_instance, "get_session_for_run"):
-                # Import here to avoid circular imports
-                from agno.tools.mcp.multi_mcp import MultiMCPTools
-
-                # For MultiMCPTools, pass server_idx; for MCPTools, only pass run_context
-                if isinstance(mcp_tools_instance, MultiMCPTools):
-                    active_session = await mcp_tools_instance.get_session_for_run(
-                        run_context=run_context, server_idx=server_idx, agent=agent, team=team
-                    )
+            async with AsyncExitStack() as stack:
+                # Get the appropriate session for this run
+                # If mcp_tools_instance has header_provider and run_context is provided,
+                # this will create/reuse a pooled session with dynamic headers, leased until the call returns
+                if mcp_tools_instance and hasattr(mcp_tools_instance, "lease_session_for_run"):
+                    # Import here to avoid circular imports
+                    from agno.tools.mcp.multi_mcp import MultiMCPTools
+
+                    # For MultiMCPTools, pass server_idx; for MCPTools, only pass run_context
+                    if isinstance(mcp_tools_instance, MultiMCPTools):
+                        active_session = await stack.enter_async_context(
+                            mcp_tools_instance.lease_session_for_run(
+                                run_context=run_context, server_idx=server_idx, agent=agent, team=team
+                            )
+                        )
+                    else:
+                        active_session = await stack.enter_async_context(
+                            mcp_tools_instance.lease_session_for_run(run_context=run_context, agent=agent, team=team)
+                        )
                 else:
-                    active_session = await mcp_tools_instance.get_session_for_run(
-                        run_context=run_context, agent=agent, team=team
-                    )
-            else:
-                active_session = session
+                    active_session = session
 
-            try:
-                await active_session.send_ping()
-            except Exception as e:
-                log_exception(e)
+                try:
+                    await active_session.send_ping()
+                except Exception as e:
+                    log_exception(e)
 
-            log_debug(f"Calling MCP Tool '{tool_name}' with args: {kwargs}")
-            result: CallToolResult = await active_session.call_tool(tool_name, kwargs)  # type: ignore
+                log_debug(f"Calling MCP Tool '{tool_name}' with args: {kwargs}")
+                result: CallToolResult = await active_session.call_tool(tool_name, kwargs)  # type: ignore
 
             # Return an error if the tool call failed
             if result.isError:
@@ -39,3 +39,13 @@ def merge_parallel_session_states(original_state: Dict[str, Any], modified_state
     # Apply all collected changes to the original state
     for key, value in all_changes.items():
         original_state[key] = value
+
+
+def get_session_state_delta(original_state: Dict[str, Any], modified_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the top-level keys of a session state copy whose values differ from the state it was copied from.
+    Like merge_parallel_session_states, removed keys are not part of the delta.
+    """
+    return {
+        key: value for key, value in modified_state.items() if key not in original_state or original_state[key] != value
+    }
@@ -221,8 +221,36 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     return None
 
 
+def add_cache_control(content: List[Any], cache_control: Dict[str, Any]) -> None:
+    """Mark the last cacheable block of a message content as a prompt cache breakpoint."""
+    for index in range(len(content) - 1, -1, -1):
+        block = content[index]
+        if isinstance(block, dict):
+            if block.get("type") in ("thinking", "redacted_thinking"):
+                continue
+            content[index] = {**block, "cache_control": cache_control}
+            return
+        block_type = getattr(block, "type", None)
+        # Thinking blocks can't be marked, they are cached with the rest of the prefix
+        if block_type == "text":
+            content[index] = {"type": "text", "text": block.text, "cache_control": cache_control}
+            return
+        if block_type == "tool_use":
+            content[index] = {
+                "type": "tool_use",
+                "id": block.id,
+                "name": block.name,
+                "input": block.input,
+                "cache_control": cache_control,
+            }
+            return
+
+
 def format_messages(
-    messages: List[Message], compress_tool_results: bool = False
+    messages: List[Message],
+    compress_tool_results: bool = False,
+    cache_message_ids: Optional[List[str]] = None,
+    cache_control: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[Dict[str, Union[str, list]]], str]:
     """
     Process the list of messages and separate them into API messages and system messages.
@@ -230,6 +258,8 @@ def format_messages(
     Args:
         messages (List[Message]): The list of messages to process.
         compress_tool_results: Whether to compress tool results.
+        cache_message_ids: Ids of the messages to mark as prompt cache breakpoints.
+        cache_control: The cache control of the breakpoints.
 
     Returns:
         Tuple[List[Dict[str, Union[str, list]]], str]: A tuple containing the list of API messages and the concatenated system messages.
@@ -320,6 +350,11 @@ def format_messages(
         if message.role == "assistant" and not content:
             continue
 
+        if cache_message_ids and message.id in cache_message_ids and isinstance(content, list):
+            # Copied, as the content may be the one of the message
+            content = list(content)
+            add_cache_control(content, cache_control or {"type": "ephemeral"})
+
         chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
     return chat_messages, " ".join(system_messages)
 
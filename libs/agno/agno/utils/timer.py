@@ -1,5 +1,10 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from time import perf_counter
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 class Timer:
@@ -39,3 +44,79 @@ class Timer:
             "end_time": str(self.end_time) if self.end_time is not None else None,
             "elapsed": self.elapsed,
         }
+
+
+# Time spent in each phase of the runs started in the current context, when recorded
+_phase_times: ContextVar[Optional[Dict[str, float]]] = ContextVar("agno_phase_times", default=None)
+_phase_times_lock = threading.Lock()
+
+
+@contextmanager
+def record_phase_times() -> Iterator[Dict[str, float]]:
+    """Collect the time spent in each phase ("model", "tools") of the runs started in this context, in seconds.
+
+    Phases running concurrently, like parallel tool calls, are all counted.
+    """
+    phase_times: Dict[str, float] = {}
+    token = _phase_times.set(phase_times)
+    try:
+        yield phase_times
+    finally:
+        _phase_times.reset(token)
+
+
+def add_phase_time(phase: str, seconds: float) -> None:
+    """Add time spent in a phase, if phase times are recorded in this context."""
+    phase_times = _phase_times.get()
+    if phase_times is not None:
+        with _phase_times_lock:
+            phase_times[phase] = phase_times.get(phase, 0.0) + seconds
+
+
+def timed_iterator(phase: str, iterator: Iterator[T]) -> Iterator[T]:
+    """Get the items of iterator, adding the time spent waiting for them to a phase if phase times are recorded."""
+    if _phase_times.get() is None:
+        return iterator
+    return _timed_iterator(phase, iterator)
+
+
+def _timed_iterator(phase: str, iterator: Iterator[T]) -> Iterator[T]:
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            finally:
+                add_phase_time(phase, perf_counter() - start)
+            yield item
+    except StopIteration:
+        return
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def atimed_iterator(phase: str, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Get the items of an async iterator, adding the time spent waiting for them to a phase if phase times are
+    recorded."""
+    if _phase_times.get() is None:
+        return iterator
+    return _atimed_iterator(phase, iterator)
+
+
+async def _atimed_iterator(phase: str, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                item = await iterator.__anext__()
+            finally:
+                add_phase_time(phase, perf_counter() - start)
+            yield item
+    except StopAsyncIteration:
+        return
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
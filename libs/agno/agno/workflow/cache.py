@@ -0,0 +1,263 @@
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Dict, List, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.utils.log import log_debug, log_warning
+from agno.workflow.types import StepOutput
+
+
+class StepOutputCache(ABC):
+    """Stores the outputs of steps with `cache_output=True`, keyed by a hash of everything the step reads."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[StepOutput]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, step_output: StepOutput) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Optional[StepOutput]:
+        return self.get(key)
+
+    async def aset(self, key: str, step_output: StepOutput) -> None:
+        self.set(key, step_output)
+
+
+class InMemoryStepOutputCache(StepOutputCache):
+    """Keeps step outputs in memory, evicting the least recently used ones past `max_size` entries."""
+
+    def __init__(self, max_size: Optional[int] = 1024):
+        self.max_size = max_size
+        self._outputs: "OrderedDict[str, StepOutput]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def get(self, key: str) -> Optional[StepOutput]:
+        with self._lock:
+            step_output = self._outputs.get(key)
+            if step_output is None:
+                return None
+            self._outputs.move_to_end(key)
+        # Copy outputs in and out, so later steps can't change the cached ones
+        return deepcopy(step_output)
+
+    def set(self, key: str, step_output: StepOutput) -> None:
+        step_output = deepcopy(step_output)
+        with self._lock:
+            self._outputs[key] = step_output
+            self._outputs.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._outputs) > self.max_size:
+                    self._outputs.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._outputs.clear()
+
+
+class DbStepOutputCache(StepOutputCache):
+    """Stores step outputs in the learnings table of a database, so they are shared across processes.
+
+    Falls back to an in-memory cache for databases that don't support learnings.
+    """
+
+    learning_type = "workflow_step_output"
+
+    def __init__(self, db: Union[BaseDb, AsyncBaseDb]):
+        self.db = db
+        self._fallback: Optional[InMemoryStepOutputCache] = None
+
+    def get(self, key: str) -> Optional[StepOutput]:
+        if self._fallback is not None:
+            return self._fallback.get(key)
+        try:
+            result = self.db.get_learning(learning_type=self.learning_type, entity_id=key)  # type: ignore[union-attr]
+        except NotImplementedError:
+            return self._use_fallback().get(key)
+        return self._parse_result(result)  # type: ignore[arg-type]
+
+    def set(self, key: str, step_output: StepOutput) -> None:
+        if self._fallback is not None:
+            self._fallback.set(key, step_output)
+            return
+        try:
+            self.db.upsert_learning(**self._get_learning_record(key, step_output))  # type: ignore[union-attr]
+        except NotImplementedError:
+            self._use_fallback().set(key, step_output)
+
+    async def aget(self, key: str) -> Optional[StepOutput]:
+        if not isinstance(self.db, AsyncBaseDb) or self._fallback is not None:
+            return self.get(key)
+        try:
+            result = await self.db.get_learning(learning_type=self.learning_type, entity_id=key)
+        except NotImplementedError:
+            return self._use_fallback().get(key)
+        return self._parse_result(result)
+
+    async def aset(self, key: str, step_output: StepOutput) -> None:
+        if not isinstance(self.db, AsyncBaseDb) or self._fallback is not None:
+            self.set(key, step_output)
+            return
+        try:
+            await self.db.upsert_learning(**self._get_learning_record(key, step_output))
+        except NotImplementedError:
+            self._use_fallback().set(key, step_output)
+
+    def _use_fallback(self) -> InMemoryStepOutputCache:
+        log_warning(f"{type(self.db).__name__} does not support learnings, caching step outputs in memory instead")
+        self._fallback = InMemoryStepOutputCache()
+        return self._fallback
+
+    def _get_learning_record(self, key: str, step_output: StepOutput) -> Dict[str, Any]:
+        content = step_output.to_dict()
+        if step_output.files:
+            content["files"] = [file.to_dict() for file in step_output.files]
+        return {
+            "id": f"{self.learning_type}_{key}",
+            "learning_type": self.learning_type,
+            "entity_id": key,
+            "content": content,
+        }
+
+    def _parse_result(self, result: Optional[Dict[str, Any]]) -> Optional[StepOutput]:
+        if not result or not result.get("content"):
+            return None
+        try:
+            return StepOutput.from_dict(result["content"])
+        except Exception as e:
+            log_debug(f"Failed to load cached step output: {e}")
+            return None
+
+
+_default_step_output_cache: Optional[InMemoryStepOutputCache] = None
+_default_step_output_cache_lock = threading.Lock()
+
+
+def get_default_step_output_cache() -> InMemoryStepOutputCache:
+    """Get the process-wide in-memory cache used by steps with `output_cache="memory"`."""
+    global _default_step_output_cache
+    with _default_step_output_cache_lock:
+        if _default_step_output_cache is None:
+            _default_step_output_cache = InMemoryStepOutputCache()
+        return _default_step_output_cache
+
+
+def _get_json_value(value: Any) -> Any:
+    """Get a JSON form of a value json can't serialize, tagged with its type so it can't collide with other values.
+
+    Raises:
+        TypeError: If the value has no unique JSON form.
+    """
+    tag = f"__{type(value).__name__}__"
+    if isinstance(value, BaseModel):
+        return {tag: value.model_dump(mode="json")}
+    if is_dataclass(value) and not isinstance(value, type):
+        return {tag: asdict(value)}
+    if isinstance(value, (datetime, date, time)):
+        return {tag: value.isoformat()}
+    if isinstance(value, (UUID, Decimal, PurePath)):
+        return {tag: str(value)}
+    if isinstance(value, Enum):
+        return {tag: value.value}
+    if isinstance(value, (set, frozenset)):
+        return {tag: sorted(_dump(item) for item in value)}
+    if isinstance(value, bytes):
+        return {tag: hashlib.sha256(value).hexdigest()}
+    raise TypeError(f"Values of type {type(value).__name__} can't be hashed")
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=_get_json_value, separators=(",", ":"))
+
+
+def get_cache_key(payload: Dict[str, Any]) -> str:
+    """Get a stable hash of a payload.
+
+    Raises:
+        TypeError: If the payload has values without a unique JSON form.
+        ValueError: If the payload has circular references.
+    """
+    return hashlib.sha256(_dump(payload).encode("utf-8")).hexdigest()
+
+
+def get_function_fingerprint(function: Callable) -> Optional[Dict[str, Any]]:
+    """Get the code and captured values of a function for hashing, or None if they can't be hashed.
+
+    Closures are identified by the values of their cells, and partials by their function and arguments. Bound methods
+    and callable objects depend on the state of their instance, so they can't be hashed.
+    """
+    fingerprint: Dict[str, Any]
+    if isinstance(function, functools.partial):
+        function_fingerprint = get_function_fingerprint(function.func)
+        if function_fingerprint is None:
+            return None
+        fingerprint = {
+            "partial": function_fingerprint,
+            "args": list(function.args),
+            "keywords": dict(function.keywords),
+        }
+    elif inspect.isfunction(function):
+        try:
+            source = inspect.getsource(function)
+            closure = [cell.cell_contents for cell in function.__closure__ or []]
+        except (OSError, TypeError, ValueError):
+            # No source, or a closure cell that is not set yet
+            return None
+        fingerprint = {
+            "function": f"{function.__module__}.{function.__qualname__}",
+            "source": source,
+            "closure": closure,
+        }
+    else:
+        return None
+    try:
+        _dump(fingerprint)
+    except (TypeError, ValueError):
+        return None
+    return fingerprint
+
+
+def get_value_fingerprint(value: Any) -> Any:
+    """Convert a step input or output value to a JSON-serializable form for hashing."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+def get_media_fingerprint(media: Optional[List[Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Get the content of media artifacts for hashing, leaving out their generated ids."""
+    if not media:
+        return None
+    return [{k: v for k, v in artifact.to_dict().items() if k != "id"} for artifact in media]
+
+
+def get_step_output_fingerprint(step_output: StepOutput) -> Dict[str, Any]:
+    """Get the parts of a step output later steps can read, leaving out run ids and metrics."""
+    return {
+        "step_name": step_output.step_name,
+        "content": get_value_fingerprint(step_output.content),
+        "success": step_output.success,
+        "images": get_media_fingerprint(step_output.images),
+        "videos": get_media_fingerprint(step_output.videos),
+        "audio": get_media_fingerprint(step_output.audio),
+        "files": get_media_fingerprint(step_output.files),
+        "steps": [get_step_output_fingerprint(nested) for nested in step_output.steps or []],
+    }
@@ -15,7 +15,7 @@ from agno.run.workflow import (
 from agno.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, logger
 from agno.workflow.step import Step
-from agno.workflow.types import StepInput, StepOutput, StepType
+from agno.workflow.types import StepInput, StepOutput, StepOutputs, StepType
 
 WorkflowSteps = List[
     Union[
@@ -96,9 +96,7 @@ class Condition:
             all_audio = step_outputs.audio or []
             previous_step_content = step_outputs.content
 
-        updated_previous_step_outputs = {}
-        if step_input.previous_step_outputs:
-            updated_previous_step_outputs.update(step_input.previous_step_outputs)
+        updated_previous_step_outputs = StepOutputs(step_input.previous_step_outputs)
         if condition_step_outputs:
             updated_previous_step_outputs.update(condition_step_outputs)
 
@@ -1,9 +1,14 @@
+import ast
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import inspect
+import queue
+import textwrap
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from contextvars import copy_context
 from copy import deepcopy
-from dataclasses import dataclass
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 from agno.models.metrics import Metrics
@@ -18,10 +23,10 @@ from agno.run.workflow import (
 )
 from agno.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, logger
-from agno.utils.merge_dict import merge_parallel_session_states
+from agno.utils.merge_dict import get_session_state_delta, merge_parallel_session_states
 from agno.workflow.condition import Condition
 from agno.workflow.step import Step
-from agno.workflow.types import StepInput, StepOutput, StepType
+from agno.workflow.types import StepInput, StepOutput, StepOutputs, StepType
 
 WorkflowSteps = List[
     Union[
@@ -38,24 +43,161 @@ WorkflowSteps = List[
 ]
 
 
+@lru_cache(maxsize=256)
+def _get_referenced_step_names(executor: Callable) -> Tuple[str, ...]:
+    """Get the step names a function executor reads with StepInput.get_step_output() or get_step_content()"""
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(executor)))
+    except (OSError, TypeError, SyntaxError):
+        return ()
+
+    step_names = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("get_step_output", "get_step_content")
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            step_names.append(node.args[0].value)
+    return tuple(step_names)
+
+
+class _StepGraph:
+    """Tracks which steps of a Parallel can start, and merges the session_state changes of finished steps"""
+
+    def __init__(
+        self,
+        steps: WorkflowSteps,
+        dependencies: Dict[int, List[int]],
+        step_input: StepInput,
+        session_state: Optional[Dict[str, Any]] = None,
+        run_context: Optional[RunContext] = None,
+    ):
+        self.steps = steps
+        self.dependencies = dependencies
+        self.step_input = step_input
+        self.session_state = session_state
+        # With a run context, all steps share the run context session_state
+        self.shared_session_state = run_context.session_state if run_context is not None else None
+
+        self.results: Dict[int, List[StepOutput]] = {}
+        self._pending = list(range(len(steps)))
+        # Copy of the session_state as of the last merge, which steps started since then compare their changes to
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._step_snapshots: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.steps)
+
+    def start_ready_steps(self) -> List[Tuple[int, Any, StepInput, Dict[str, Any]]]:
+        """Get the steps whose dependencies have completed, with their input and session_state"""
+        ready_steps = []
+        while True:
+            skipped = False
+            for idx in list(self._pending):
+                dependency_ids = self.dependencies[idx]
+                if not all(dependency_id in self.results for dependency_id in dependency_ids):
+                    continue
+                self._pending.remove(idx)
+
+                failed_dependencies = [
+                    self._get_step_name(dependency_id)
+                    for dependency_id in dependency_ids
+                    if any(output.success is False for output in self.results[dependency_id])
+                ]
+                if failed_dependencies:
+                    # Steps that depend on a failed step are not executed
+                    step_name = self._get_step_name(idx)
+                    error = f"Step {step_name} skipped: {', '.join(failed_dependencies)} failed"
+                    logger.warning(error)
+                    self.results[idx] = [StepOutput(step_name=step_name, content=error, success=False, error=error)]
+                    skipped = True
+                    continue
+
+                ready_steps.append(
+                    (idx, self.steps[idx], self._get_step_input(dependency_ids), self._get_step_session_state(idx))
+                )
+            # Skipping a step can make the steps depending on it ready to be skipped as well
+            if not skipped:
+                return ready_steps
+
+    def complete(self, idx: int, step_outputs: List[StepOutput], step_session_state: Dict[str, Any]) -> None:
+        """Record the outputs of a finished step and merge its session_state changes"""
+        self.results[idx] = step_outputs
+        snapshot = self._step_snapshots.pop(idx, None)
+        if snapshot is None or self.session_state is None:
+            return
+        session_state_delta = get_session_state_delta(snapshot, step_session_state)
+        if session_state_delta:
+            self.session_state.update(session_state_delta)
+            self._snapshot = None
+
+    def get_results(self) -> List[StepOutput]:
+        """Get the outputs of all steps, in the order the steps were given"""
+        return [output for idx in range(len(self.steps)) for output in self.results.get(idx, [])]
+
+    def _get_step_name(self, idx: int) -> str:
+        return getattr(self.steps[idx], "name", None) or f"step_{idx}"
+
+    def _get_step_input(self, dependency_ids: List[int]) -> StepInput:
+        """Add the outputs of the dependencies to the previous step outputs"""
+        if not dependency_ids:
+            return self.step_input
+
+        previous_step_outputs = StepOutputs(self.step_input.previous_step_outputs)
+        for dependency_id in dependency_ids:
+            for output in self.results[dependency_id]:
+                previous_step_outputs[output.step_name or self._get_step_name(dependency_id)] = output
+        last_output = self.results[dependency_ids[-1]][-1]
+        return replace(
+            self.step_input,
+            previous_step_content=last_output.content,
+            previous_step_outputs=previous_step_outputs,
+        )
+
+    def _get_step_session_state(self, idx: int) -> Dict[str, Any]:
+        if self.shared_session_state is not None:
+            return self.shared_session_state
+        if self.session_state is None:
+            return {}
+        # Steps get their own copy, and only the keys they change are merged back
+        if self._snapshot is None:
+            self._snapshot = deepcopy(self.session_state)
+        self._step_snapshots[idx] = self._snapshot
+        return deepcopy(self._snapshot)
+
+
 @dataclass
 class Parallel:
-    """A list of steps that execute in parallel"""
+    """A list of steps that execute in parallel
+
+    Steps can depend on other steps of the Parallel, either with `Step(depends_on=[...])` or by reading their output
+    with `step_input.get_step_output("<step name>")` in a function executor. A step then starts as soon as the steps
+    it depends on have completed, and receives their outputs as previous step outputs.
+    """
 
     steps: WorkflowSteps
 
     name: Optional[str] = None
     description: Optional[str] = None
+    # Maximum number of steps executed at the same time. Defaults to all of them.
+    max_workers: Optional[int] = None
 
     def __init__(
         self,
         *steps: WorkflowSteps,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ):
         self.steps = list(steps)
         self.name = name
         self.description = description
+        self.max_workers = max_workers
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
@@ -81,6 +223,252 @@ class Parallel:
 
         self.steps = prepared_steps
 
+    def _get_dependencies(self) -> Dict[int, List[int]]:
+        """Get the indices of the steps each step depends on, from `depends_on` and the step outputs it reads"""
+        step_indices = {step.name: idx for idx, step in enumerate(self.steps) if getattr(step, "name", None)}  # type: ignore[union-attr]
+
+        dependencies: Dict[int, List[int]] = {}
+        for idx, step in enumerate(self.steps):
+            step_names: Set[str] = set(getattr(step, "depends_on", None) or [])
+            if isinstance(step, Step) and step._executor_type == "function":
+                step_names.update(_get_referenced_step_names(step.active_executor))  # type: ignore[arg-type]
+            # Names of steps outside this Parallel have completed before it started
+            dependencies[idx] = sorted(
+                step_indices[step_name]
+                for step_name in step_names
+                if step_name in step_indices and step_indices[step_name] != idx
+            )
+
+        # Check for cycles by repeatedly removing the steps without remaining dependencies
+        remaining = {idx: set(dependency_ids) for idx, dependency_ids in dependencies.items()}
+        while remaining:
+            ready = [idx for idx, dependency_ids in remaining.items() if not dependency_ids]
+            if not ready:
+                cycle = ", ".join(getattr(self.steps[idx], "name", None) or f"step_{idx}" for idx in remaining)
+                raise ValueError(f"Parallel {self.name} has a dependency cycle between steps: {cycle}")
+            for idx in ready:
+                del remaining[idx]
+            for dependency_ids in remaining.values():
+                dependency_ids.difference_update(ready)
+
+        return dependencies
+
+    def _use_step_graph(self, dependencies: Dict[int, List[int]]) -> bool:
+        return self.max_workers is not None or any(dependencies.values())
+
+    def _get_max_workers(self) -> int:
+        return max(1, min(self.max_workers or len(self.steps), len(self.steps)))
+
+    @staticmethod
+    def _get_sub_step_index(step_index: Optional[Union[int, tuple]], idx: int) -> Union[int, tuple]:
+        # If step_index is None or integer (main step): create (step_index, sub_index)
+        # If step_index is tuple (child step): all parallel sub-steps get same index
+        if step_index is None or isinstance(step_index, int):
+            return (step_index if step_index is not None else 0, idx)
+        return step_index
+
+    @staticmethod
+    def _get_failed_output(step: Any, idx: int, exc: Exception) -> StepOutput:
+        parallel_step_name = getattr(step, "name", f"step_{idx}")
+        logger.error(f"Parallel step {parallel_step_name} failed: {exc}")
+        return StepOutput(
+            step_name=parallel_step_name,
+            content=f"Step {parallel_step_name} failed: {str(exc)}",
+            success=False,
+            error=str(exc),
+        )
+
+    def _execute_step_graph(
+        self,
+        dependencies: Dict[int, List[int]],
+        step_input: StepInput,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[StepOutput]:
+        """Execute the steps on a shared thread pool, starting each step once its dependencies have completed"""
+        graph = _StepGraph(self.steps, dependencies, step_input, session_state, run_context)
+
+        def execute_step(
+            idx: int, step: Any, graph_step_input: StepInput, step_session_state: Dict[str, Any]
+        ) -> List[StepOutput]:
+            try:
+                step_result = step.execute(
+                    graph_step_input, run_context=run_context, session_state=step_session_state, **kwargs
+                )
+            except Exception as exc:
+                step_result = self._get_failed_output(step, idx, exc)
+            return step_result if isinstance(step_result, list) else [step_result]
+
+        with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+            running: Dict[Future, Tuple[int, Dict[str, Any]]] = {}
+            while True:
+                for idx, step, graph_step_input, step_session_state in graph.start_ready_steps():
+                    future = executor.submit(
+                        copy_context().run, execute_step, idx, step, graph_step_input, step_session_state
+                    )
+                    running[future] = (idx, step_session_state)
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, step_session_state = running.pop(future)
+                    graph.complete(idx, future.result(), step_session_state)
+                    log_debug(f"Parallel step {graph._get_step_name(idx)} completed")
+
+        return graph.get_results()
+
+    def _execute_step_graph_stream(
+        self,
+        dependencies: Dict[int, List[int]],
+        step_input: StepInput,
+        step_results: List[StepOutput],
+        step_index: Optional[Union[int, tuple]] = None,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Iterator[WorkflowRunOutputEvent]:
+        """Execute the steps on a shared thread pool with streaming, adding their outputs to step_results"""
+        graph = _StepGraph(self.steps, dependencies, step_input, session_state, run_context)
+        event_queue: queue.Queue = queue.Queue()
+
+        def execute_step_stream(
+            idx: int, step: Any, graph_step_input: StepInput, step_session_state: Dict[str, Any]
+        ) -> None:
+            step_outputs: List[StepOutput] = []
+            try:
+                for event in step.execute_stream(
+                    graph_step_input,
+                    step_index=self._get_sub_step_index(step_index, idx),
+                    run_context=run_context,
+                    session_state=step_session_state,
+                    **kwargs,
+                ):
+                    if isinstance(event, StepOutput):
+                        step_outputs.append(event)
+                    else:
+                        event_queue.put(("event", idx, event))
+            except Exception as exc:
+                step_outputs = [self._get_failed_output(step, idx, exc)]
+            event_queue.put(("complete", idx, step_outputs, step_session_state))
+
+        with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+            running = 0
+            while True:
+                for idx, step, graph_step_input, step_session_state in graph.start_ready_steps():
+                    executor.submit(
+                        copy_context().run, execute_step_stream, idx, step, graph_step_input, step_session_state
+                    )
+                    running += 1
+                if not running:
+                    break
+
+                message_type, idx, *data = event_queue.get()
+                if message_type == "event":
+                    yield data[0]
+                else:
+                    running -= 1
+                    graph.complete(idx, *data)
+                    log_debug(f"Parallel step {graph._get_step_name(idx)} streaming completed")
+
+        step_results.extend(graph.get_results())
+
+    async def _aexecute_step_graph(
+        self,
+        dependencies: Dict[int, List[int]],
+        step_input: StepInput,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[StepOutput]:
+        """Execute the steps as asyncio tasks, starting each step once its dependencies have completed"""
+        graph = _StepGraph(self.steps, dependencies, step_input, session_state, run_context)
+        semaphore = asyncio.Semaphore(self._get_max_workers())
+
+        async def execute_step(
+            idx: int, step: Any, graph_step_input: StepInput, step_session_state: Dict[str, Any]
+        ) -> Tuple[int, List[StepOutput], Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    step_result = await step.aexecute(
+                        graph_step_input, run_context=run_context, session_state=step_session_state, **kwargs
+                    )
+                except Exception as exc:
+                    step_result = self._get_failed_output(step, idx, exc)
+            return idx, step_result if isinstance(step_result, list) else [step_result], step_session_state
+
+        running: Set[asyncio.Task] = set()
+        while True:
+            for ready_step in graph.start_ready_steps():
+                running.add(asyncio.create_task(execute_step(*ready_step)))
+            if not running:
+                break
+
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                idx, step_outputs, step_session_state = task.result()
+                graph.complete(idx, step_outputs, step_session_state)
+                log_debug(f"Parallel step {graph._get_step_name(idx)} completed")
+
+        return graph.get_results()
+
+    async def _aexecute_step_graph_stream(
+        self,
+        dependencies: Dict[int, List[int]],
+        step_input: StepInput,
+        step_results: List[StepOutput],
+        step_index: Optional[Union[int, tuple]] = None,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[WorkflowRunOutputEvent, TeamRunOutputEvent, RunOutputEvent]]:
+        """Execute the steps as asyncio tasks with streaming, adding their outputs to step_results"""
+        graph = _StepGraph(self.steps, dependencies, step_input, session_state, run_context)
+        semaphore = asyncio.Semaphore(self._get_max_workers())
+        event_queue: asyncio.Queue = asyncio.Queue()
+
+        async def execute_step_stream(
+            idx: int, step: Any, graph_step_input: StepInput, step_session_state: Dict[str, Any]
+        ) -> None:
+            step_outputs: List[StepOutput] = []
+            async with semaphore:
+                try:
+                    async for event in step.aexecute_stream(
+                        graph_step_input,
+                        step_index=self._get_sub_step_index(step_index, idx),
+                        run_context=run_context,
+                        session_state=step_session_state,
+                        **kwargs,
+                    ):
+                        if isinstance(event, StepOutput):
+                            step_outputs.append(event)
+                        else:
+                            await event_queue.put(("event", idx, event))
+                except Exception as exc:
+                    step_outputs = [self._get_failed_output(step, idx, exc)]
+            await event_queue.put(("complete", idx, step_outputs, step_session_state))
+
+        tasks = []
+        running = 0
+        while True:
+            for ready_step in graph.start_ready_steps():
+                tasks.append(asyncio.create_task(execute_step_stream(*ready_step)))
+                running += 1
+            if not running:
+                break
+
+            message_type, idx, *data = await event_queue.get()
+            if message_type == "event":
+                yield data[0]
+            else:
+                running -= 1
+                graph.complete(idx, *data)
+                log_debug(f"Parallel step {graph._get_step_name(idx)} async streaming completed")
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        step_results.extend(graph.get_results())
+
     def _aggregate_results(self, step_outputs: List[StepOutput]) -> StepOutput:
         """Aggregate multiple step outputs into a single StepOutput"""
         if not step_outputs:
@@ -215,6 +603,25 @@ class Parallel:
 
         self._prepare_steps()
 
+        dependencies = self._get_dependencies()
+        if self._use_step_graph(dependencies):
+            graph_results = self._execute_step_graph(
+                dependencies,
+                step_input,
+                run_context=run_context,
+                session_state=session_state,
+                session_id=session_id,
+                user_id=user_id,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            )
+            log_debug(f"Parallel End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+            return self._aggregate_results(graph_results)
+
         # Create individual session_state copies for each step to prevent race conditions
         session_state_copies = []
         for _ in range(len(self.steps)):
@@ -347,9 +754,13 @@ class Parallel:
 
         self._prepare_steps()
 
+        dependencies = self._get_dependencies()
+        use_step_graph = self._use_step_graph(dependencies)
+
         # Create individual session_state copies for each step to prevent race conditions
+        # Steps executed as a graph get their copy when they start instead
         session_state_copies = []
-        for _ in range(len(self.steps)):
+        for _ in range(0 if use_step_graph else len(self.steps)):
             # If using run context, no need to deepcopy the state. We want the direct reference.
             if run_context is not None and run_context.session_state is not None:
                 session_state_copies.append(run_context.session_state)
@@ -373,122 +784,141 @@ class Parallel:
                 parent_step_id=parent_step_id,
             )
 
-        import queue
-
-        event_queue = queue.Queue()  # type: ignore
-        step_results = []
-        modified_session_states = []
-
-        def execute_step_stream_with_index(step_with_index):
-            """Execute a single step with streaming and put events in queue immediately"""
-            idx, step = step_with_index
-            # Use the individual session_state copy for this step
-            step_session_state = session_state_copies[idx]
-
-            try:
-                step_outputs = []
-
-                # If step_index is None or integer (main step): create (step_index, sub_index)
-                # If step_index is tuple (child step): all parallel sub-steps get same index
-                if step_index is None or isinstance(step_index, int):
-                    # Parallel is a main step - sub-steps get sequential numbers: 1.1, 1.2, 1.3
-                    sub_step_index = (step_index if step_index is not None else 0, idx)
-                else:
-                    # Parallel is a child step - all sub-steps get the same parent number: 1.1, 1.1, 1.1
-                    sub_step_index = step_index
-
-                # All workflow step types have execute_stream() method
-                for event in step.execute_stream(  # type: ignore[union-attr]
-                    step_input,
-                    session_id=session_id,
-                    user_id=user_id,
-                    stream_events=stream_events,
-                    stream_executor_events=stream_executor_events,
-                    workflow_run_response=workflow_run_response,
-                    step_index=sub_step_index,
-                    store_executor_outputs=store_executor_outputs,
-                    session_state=step_session_state,
-                    run_context=run_context,
-                    parent_step_id=parallel_step_id,
-                    workflow_session=workflow_session,
-                    add_workflow_history_to_steps=add_workflow_history_to_steps,
-                    num_history_runs=num_history_runs,
-                    background_tasks=background_tasks,
-                ):
-                    # Put event immediately in queue
-                    event_queue.put(("event", idx, event))
-                    if isinstance(event, StepOutput):
-                        step_outputs.append(event)
-
-                # Signal completion for this step
-                event_queue.put(("complete", idx, step_outputs, step_session_state))
-                return idx, step_outputs, step_session_state
-            except Exception as exc:
-                parallel_step_name = getattr(step, "name", f"step_{idx}")
-                logger.error(f"Parallel step {parallel_step_name} streaming failed: {exc}")
-                error_event = StepOutput(
-                    step_name=parallel_step_name,
-                    content=f"Step {parallel_step_name} failed: {str(exc)}",
-                    success=False,
-                    error=str(exc),
-                )
-                event_queue.put(("event", idx, error_event))
-                event_queue.put(("complete", idx, [error_event], step_session_state))
-                return idx, [error_event], step_session_state
+        step_results: List[StepOutput] = []
+        if use_step_graph:
+            yield from self._execute_step_graph_stream(
+                dependencies,
+                step_input,
+                step_results,
+                step_index=step_index,
+                run_context=run_context,
+                session_state=session_state,
+                session_id=session_id,
+                user_id=user_id,
+                stream_events=stream_events,
+                stream_executor_events=stream_executor_events,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                parent_step_id=parallel_step_id,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            )
+        else:
+            event_queue = queue.Queue()  # type: ignore
+            modified_session_states = []
 
-        # Submit all parallel tasks
-        indexed_steps = list(enumerate(self.steps))
+            def execute_step_stream_with_index(step_with_index):
+                """Execute a single step with streaming and put events in queue immediately"""
+                idx, step = step_with_index
+                # Use the individual session_state copy for this step
+                step_session_state = session_state_copies[idx]
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks
-            # Use copy_context().run to propagate context variables to child threads
-            futures = [
-                executor.submit(copy_context().run, execute_step_stream_with_index, indexed_step)
-                for indexed_step in indexed_steps
-            ]
-
-            # Process events from queue as they arrive
-            completed_steps = 0
-            total_steps = len(self.steps)
-
-            while completed_steps < total_steps:
                 try:
-                    message_type, step_idx, *data = event_queue.get(timeout=1.0)
-
-                    if message_type == "event":
-                        event = data[0]
-                        # Yield events immediately as they arrive (except StepOutputs)
-                        if not isinstance(event, StepOutput):
-                            yield event
-
-                    elif message_type == "complete":
-                        step_outputs, step_session_state = data
-                        step_results.extend(step_outputs)
-                        modified_session_states.append(step_session_state)
+                    step_outputs = []
+
+                    # If step_index is None or integer (main step): create (step_index, sub_index)
+                    # If step_index is tuple (child step): all parallel sub-steps get same index
+                    if step_index is None or isinstance(step_index, int):
+                        # Parallel is a main step - sub-steps get sequential numbers: 1.1, 1.2, 1.3
+                        sub_step_index = (step_index if step_index is not None else 0, idx)
+                    else:
+                        # Parallel is a child step - all sub-steps get the same parent number: 1.1, 1.1, 1.1
+                        sub_step_index = step_index
+
+                    # All workflow step types have execute_stream() method
+                    for event in step.execute_stream(  # type: ignore[union-attr]
+                        step_input,
+                        session_id=session_id,
+                        user_id=user_id,
+                        stream_events=stream_events,
+                        stream_executor_events=stream_executor_events,
+                        workflow_run_response=workflow_run_response,
+                        step_index=sub_step_index,
+                        store_executor_outputs=store_executor_outputs,
+                        session_state=step_session_state,
+                        run_context=run_context,
+                        parent_step_id=parallel_step_id,
+                        workflow_session=workflow_session,
+                        add_workflow_history_to_steps=add_workflow_history_to_steps,
+                        num_history_runs=num_history_runs,
+                        background_tasks=background_tasks,
+                    ):
+                        # Put event immediately in queue
+                        event_queue.put(("event", idx, event))
+                        if isinstance(event, StepOutput):
+                            step_outputs.append(event)
+
+                    # Signal completion for this step
+                    event_queue.put(("complete", idx, step_outputs, step_session_state))
+                    return idx, step_outputs, step_session_state
+                except Exception as exc:
+                    parallel_step_name = getattr(step, "name", f"step_{idx}")
+                    logger.error(f"Parallel step {parallel_step_name} streaming failed: {exc}")
+                    error_event = StepOutput(
+                        step_name=parallel_step_name,
+                        content=f"Step {parallel_step_name} failed: {str(exc)}",
+                        success=False,
+                        error=str(exc),
+                    )
+                    event_queue.put(("event", idx, error_event))
+                    event_queue.put(("complete", idx, [error_event], step_session_state))
+                    return idx, [error_event], step_session_state
+
+            # Submit all parallel tasks
+            indexed_steps = list(enumerate(self.steps))
+
+            with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
+                # Submit all tasks
+                # Use copy_context().run to propagate context variables to child threads
+                futures = [
+                    executor.submit(copy_context().run, execute_step_stream_with_index, indexed_step)
+                    for indexed_step in indexed_steps
+                ]
+
+                # Process events from queue as they arrive
+                completed_steps = 0
+                total_steps = len(self.steps)
+
+                while completed_steps < total_steps:
+                    try:
+                        message_type, step_idx, *data = event_queue.get(timeout=1.0)
+
+                        if message_type == "event":
+                            event = data[0]
+                            # Yield events immediately as they arrive (except StepOutputs)
+                            if not isinstance(event, StepOutput):
+                                yield event
+
+                        elif message_type == "complete":
+                            step_outputs, step_session_state = data
+                            step_results.extend(step_outputs)
+                            modified_session_states.append(step_session_state)
+                            completed_steps += 1
+
+                            step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
+                            log_debug(f"Parallel step {step_name} streaming completed")
+
+                    except queue.Empty:
+                        for i, future in enumerate(futures):
+                            if future.done() and future.exception():
+                                logger.error(f"Parallel step {i} failed: {future.exception()}")
+                                if completed_steps < total_steps:
+                                    completed_steps += 1
+                    except Exception as e:
+                        logger.error(f"Error processing parallel step events: {e}")
                         completed_steps += 1
 
-                        step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
-                        log_debug(f"Parallel step {step_name} streaming completed")
-
-                except queue.Empty:
-                    for i, future in enumerate(futures):
-                        if future.done() and future.exception():
-                            logger.error(f"Parallel step {i} failed: {future.exception()}")
-                            if completed_steps < total_steps:
-                                completed_steps += 1
-                except Exception as e:
-                    logger.error(f"Error processing parallel step events: {e}")
-                    completed_steps += 1
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Future completion error: {e}")
 
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Future completion error: {e}")
-
-        # Merge all session_state changes back into the original session_state
-        if run_context is None and session_state is not None:
-            merge_parallel_session_states(session_state, modified_session_states)
+            # Merge all session_state changes back into the original session_state
+            if run_context is None and session_state is not None:
+                merge_parallel_session_states(session_state, modified_session_states)
 
         # Flatten step_results - handle steps that return List[StepOutput] (like Condition/Loop)
         flattened_step_results: List[StepOutput] = []
@@ -541,6 +971,25 @@ class Parallel:
 
         self._prepare_steps()
 
+        dependencies = self._get_dependencies()
+        if self._use_step_graph(dependencies):
+            graph_results = await self._aexecute_step_graph(
+                dependencies,
+                step_input,
+                run_context=run_context,
+                session_state=session_state,
+                session_id=session_id,
+                user_id=user_id,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            )
+            log_debug(f"Parallel End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+            return self._aggregate_results(graph_results)
+
         # Create individual session_state copies for each step to prevent race conditions
         session_state_copies = []
         for _ in range(len(self.steps)):
@@ -673,9 +1122,13 @@ class Parallel:
 
         self._prepare_steps()
 
+        dependencies = self._get_dependencies()
+        use_step_graph = self._use_step_graph(dependencies)
+
         # Create individual session_state copies for each step to prevent race conditions
+        # Steps executed as a graph get their copy when they start instead
         session_state_copies = []
-        for _ in range(len(self.steps)):
+        for _ in range(0 if use_step_graph else len(self.steps)):
             # If using run context, no need to deepcopy the state. We want the direct reference.
             if run_context is not None and run_context.session_state is not None:
                 session_state_copies.append(run_context.session_state)
@@ -699,106 +1152,127 @@ class Parallel:
                 parent_step_id=parent_step_id,
             )
 
-        import asyncio
-
-        event_queue = asyncio.Queue()  # type: ignore
-        step_results = []
-        modified_session_states = []
-
-        async def execute_step_stream_async_with_index(step_with_index):
-            """Execute a single step with async streaming and yield events immediately"""
-            idx, step = step_with_index
-            # Use the individual session_state copy for this step
-            step_session_state = session_state_copies[idx]
+        step_results: List[StepOutput] = []
+        if use_step_graph:
+            async for event in self._aexecute_step_graph_stream(
+                dependencies,
+                step_input,
+                step_results,
+                step_index=step_index,
+                run_context=run_context,
+                session_state=session_state,
+                session_id=session_id,
+                user_id=user_id,
+                stream_events=stream_events,
+                stream_executor_events=stream_executor_events,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                parent_step_id=parallel_step_id,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            ):
+                yield event
+        else:
+            event_queue = asyncio.Queue()  # type: ignore
+            modified_session_states = []
 
-            try:
-                step_outputs = []
+            async def execute_step_stream_async_with_index(step_with_index):
+                """Execute a single step with async streaming and yield events immediately"""
+                idx, step = step_with_index
+                # Use the individual session_state copy for this step
+                step_session_state = session_state_copies[idx]
 
-                # If step_index is None or integer (main step): create (step_index, sub_index)
-                # If step_index is tuple (child step): all parallel sub-steps get same index
-                if step_index is None or isinstance(step_index, int):
-                    # Parallel is a main step - sub-steps get sequential numbers: 1.1, 1.2, 1.3
-                    sub_step_index = (step_index if step_index is not None else 0, idx)
-                else:
-                    # Parallel is a child step - all sub-steps get the same parent number: 1.1, 1.1, 1.1
-                    sub_step_index = step_index
+                try:
+                    step_outputs = []
+
+                    # If step_index is None or integer (main step): create (step_index, sub_index)
+                    # If step_index is tuple (child step): all parallel sub-steps get same index
+                    if step_index is None or isinstance(step_index, int):
+                        # Parallel is a main step - sub-steps get sequential numbers: 1.1, 1.2, 1.3
+                        sub_step_index = (step_index if step_index is not None else 0, idx)
+                    else:
+                        # Parallel is a child step - all sub-steps get the same parent number: 1.1, 1.1, 1.1
+                        sub_step_index = step_index
+
+                    # All workflow step types have aexecute_stream() method
+                    async for event in step.aexecute_stream(
+                        step_input,
+                        session_id=session_id,
+                        user_id=user_id,
+                        stream_events=stream_events,
+                        stream_executor_events=stream_executor_events,
+                        workflow_run_response=workflow_run_response,
+                        step_index=sub_step_index,
+                        store_executor_outputs=store_executor_outputs,
+                        session_state=step_session_state,
+                        run_context=run_context,
+                        parent_step_id=parallel_step_id,
+                        workflow_session=workflow_session,
+                        add_workflow_history_to_steps=add_workflow_history_to_steps,
+                        num_history_runs=num_history_runs,
+                        background_tasks=background_tasks,
+                    ):  # type: ignore[union-attr]
+                        # Yield events immediately to the queue
+                        await event_queue.put(("event", idx, event))
+                        if isinstance(event, StepOutput):
+                            step_outputs.append(event)
+
+                    # Signal completion for this step
+                    await event_queue.put(("complete", idx, step_outputs, step_session_state))
+                    return idx, step_outputs, step_session_state
+                except Exception as e:
+                    parallel_step_name = getattr(step, "name", f"step_{idx}")
+                    logger.error(f"Parallel step {parallel_step_name} async streaming failed: {e}")
+                    error_event = StepOutput(
+                        step_name=parallel_step_name,
+                        content=f"Step {parallel_step_name} failed: {str(e)}",
+                        success=False,
+                        error=str(e),
+                    )
+                    await event_queue.put(("event", idx, error_event))
+                    await event_queue.put(("complete", idx, [error_event], step_session_state))
+                    return idx, [error_event], step_session_state
+
+            # Start all parallel tasks
+            indexed_steps = list(enumerate(self.steps))
+            tasks = [
+                asyncio.create_task(execute_step_stream_async_with_index(indexed_step))
+                for indexed_step in indexed_steps
+            ]
 
-                # All workflow step types have aexecute_stream() method
-                async for event in step.aexecute_stream(
-                    step_input,
-                    session_id=session_id,
-                    user_id=user_id,
-                    stream_events=stream_events,
-                    stream_executor_events=stream_executor_events,
-                    workflow_run_response=workflow_run_response,
-                    step_index=sub_step_index,
-                    store_executor_outputs=store_executor_outputs,
-                    session_state=step_session_state,
-                    run_context=run_context,
-                    parent_step_id=parallel_step_id,
-                    workflow_session=workflow_session,
-                    add_workflow_history_to_steps=add_workflow_history_to_steps,
-                    num_history_runs=num_history_runs,
-                    background_tasks=background_tasks,
-                ):  # type: ignore[union-attr]
-                    # Yield events immediately to the queue
-                    await event_queue.put(("event", idx, event))
-                    if isinstance(event, StepOutput):
-                        step_outputs.append(event)
+            # Process events as they arrive and track completion
+            completed_steps = 0
+            total_steps = len(self.steps)
 
-                # Signal completion for this step
-                await event_queue.put(("complete", idx, step_outputs, step_session_state))
-                return idx, step_outputs, step_session_state
-            except Exception as e:
-                parallel_step_name = getattr(step, "name", f"step_{idx}")
-                logger.error(f"Parallel step {parallel_step_name} async streaming failed: {e}")
-                error_event = StepOutput(
-                    step_name=parallel_step_name,
-                    content=f"Step {parallel_step_name} failed: {str(e)}",
-                    success=False,
-                    error=str(e),
-                )
-                await event_queue.put(("event", idx, error_event))
-                await event_queue.put(("complete", idx, [error_event], step_session_state))
-                return idx, [error_event], step_session_state
+            while completed_steps < total_steps:
+                try:
+                    message_type, step_idx, *data = await event_queue.get()
 
-        # Start all parallel tasks
-        indexed_steps = list(enumerate(self.steps))
-        tasks = [
-            asyncio.create_task(execute_step_stream_async_with_index(indexed_step)) for indexed_step in indexed_steps
-        ]
+                    if message_type == "event":
+                        event = data[0]
+                        if not isinstance(event, StepOutput):
+                            yield event
 
-        # Process events as they arrive and track completion
-        completed_steps = 0
-        total_steps = len(self.steps)
+                    elif message_type == "complete":
+                        step_outputs, step_session_state = data
+                        step_results.extend(step_outputs)
+                        modified_session_states.append(step_session_state)
+                        completed_steps += 1
 
-        while completed_steps < total_steps:
-            try:
-                message_type, step_idx, *data = await event_queue.get()
+                        step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
+                        log_debug(f"Parallel step {step_name} async streaming completed")
 
-                if message_type == "event":
-                    event = data[0]
-                    if not isinstance(event, StepOutput):
-                        yield event
-
-                elif message_type == "complete":
-                    step_outputs, step_session_state = data
-                    step_results.extend(step_outputs)
-                    modified_session_states.append(step_session_state)
+                except Exception as e:
+                    logger.error(f"Error processing parallel step events: {e}")
                     completed_steps += 1
 
-                    step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
-                    log_debug(f"Parallel step {step_name} async streaming completed")
-
-            except Exception as e:
-                logger.error(f"Error processing parallel step events: {e}")
-                completed_steps += 1
-
-        await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Merge all session_state changes back into the original session_state
-        if run_context is None and session_state is not None:
-            merge_parallel_session_states(session_state, modified_session_states)
+            # Merge all session_state changes back into the original session_state
+            if run_context is None and session_state is not None:
+                merge_parallel_session_states(session_state, modified_session_states)
 
         # Flatten step_results - handle steps that return List[StepOutput] (like Condition/Loop)
         flattened_step_results: List[StepOutput] = []
@@ -1,7 +1,7 @@
 import inspect
 from copy import copy
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, Union, cast
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -30,6 +30,15 @@ from agno.session.workflow import WorkflowSession
 from agno.team import Team
 from agno.utils.log import log_debug, log_warning, logger, use_agent_logger, use_team_logger, use_workflow_logger
 from agno.utils.merge_dict import merge_dictionaries
+from agno.workflow.cache import (
+    StepOutputCache,
+    get_cache_key,
+    get_default_step_output_cache,
+    get_function_fingerprint,
+    get_media_fingerprint,
+    get_step_output_fingerprint,
+    get_value_fingerprint,
+)
 from agno.workflow.types import StepInput, StepOutput, StepType
 
 StepExecutor = Callable[
@@ -72,6 +81,14 @@ class Step:
     add_workflow_history: Optional[bool] = None
     num_history_runs: int = 3
 
+    # If True, reuse the output of an earlier execution with the same input, previous step outputs and configuration
+    cache_output: bool = False
+    # Where to cache the output: "memory", "db" (the workflow db) or a custom StepOutputCache
+    output_cache: Union[StepOutputCache, Literal["memory", "db"]] = "memory"
+
+    # Names of the steps in the same Parallel that must complete before this step starts
+    depends_on: Optional[List[str]] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -87,6 +104,9 @@ class Step:
         strict_input_validation: bool = False,
         add_workflow_history: Optional[bool] = None,
         num_history_runs: int = 3,
+        cache_output: bool = False,
+        output_cache: Union[StepOutputCache, Literal["memory", "db"]] = "memory",
+        depends_on: Optional[List[str]] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -107,6 +127,11 @@ class Step:
         self.strict_input_validation = strict_input_validation
         self.add_workflow_history = add_workflow_history
         self.num_history_runs = num_history_runs
+        self.cache_output = cache_output
+        self.output_cache = output_cache
+        # Identifies function executors that can't be hashed, so their outputs are only shared by this step
+        self._executor_cache_id = str(uuid4())
+        self.depends_on = depends_on
         self.step_id = step_id
 
         if step_id is None:
@@ -117,7 +142,7 @@ class Step:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert step to a dictionary representation."""
-        result = {
+        result: Dict[str, Any] = {
             "name": self.name,
             "step_id": self.step_id,
             "description": self.description,
@@ -126,7 +151,12 @@ class Step:
             "strict_input_validation": self.strict_input_validation,
             "add_workflow_history": self.add_workflow_history,
             "num_history_runs": self.num_history_runs,
+            "cache_output": self.cache_output,
         }
+        if isinstance(self.output_cache, str):
+            result["output_cache"] = self.output_cache
+        if self.depends_on:
+            result["depends_on"] = self.depends_on
 
         if self.agent is not None:
             result["agent_id"] = self.agent.id
@@ -189,6 +219,9 @@ class Step:
             strict_input_validation=config.get("strict_input_validation", False),
             add_workflow_history=config.get("add_workflow_history"),
             num_history_runs=config.get("num_history_runs", 3),
+            cache_output=config.get("cache_output", False),
+            output_cache=config.get("output_cache", "memory"),
+            depends_on=config.get("depends_on"),
             agent=agent,
             team=team,
             executor=executor,
@@ -360,6 +393,12 @@ class Step:
         else:
             session_state_copy = copy(session_state) if session_state is not None else {}
 
+        # Reuse the output of an earlier execution with the same inputs
+        cache_key = self._get_cache_key(step_input, workflow_session, add_workflow_history_to_steps, num_history_runs)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -507,6 +546,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_output(cache_key, step_output)
 
                 return step_output
 
@@ -524,6 +564,126 @@ class Step:
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
+    def _get_executor_fingerprint(self) -> Any:
+        """Get the configuration of the executor, for the cache key"""
+        if self._executor_type == "function":
+            fingerprint = get_function_fingerprint(self.active_executor)  # type: ignore[arg-type]
+            return fingerprint if fingerprint is not None else {"step_executor": self._executor_cache_id}
+
+        config = self.active_executor.to_dict()  # type: ignore[union-attr]
+        # Session details change across runs without changing what the agent or team does
+        for key in ["session_id", "user_id", "session_state"]:
+            config.pop(key, None)
+        return config
+
+    def _get_cache_key(
+        self,
+        step_input: StepInput,
+        workflow_session: Optional[WorkflowSession] = None,
+        add_workflow_history_to_steps: Optional[bool] = False,
+        num_history_runs: int = 3,
+    ) -> Optional[str]:
+        """Get the key the output of this step is cached under, or None if it is not cached.
+
+        The key is a hash of the step configuration, the resolved input and the previous step outputs the executor
+        reads. Changes to the session_state are not part of the key.
+        """
+        if not self.cache_output:
+            return None
+
+        payload: Dict[str, Any] = {
+            "step": {
+                "name": self.name,
+                "executor_type": self._executor_type,
+                "executor": self._get_executor_fingerprint(),
+            },
+            "input": get_value_fingerprint(step_input.input),
+            "additional_data": step_input.additional_data,
+            "images": get_media_fingerprint(step_input.images),
+            "videos": get_media_fingerprint(step_input.videos),
+            "audio": get_media_fingerprint(step_input.audio),
+            "files": get_media_fingerprint(step_input.files),
+        }
+        if self._executor_type == "function":
+            # Functions can read the output of any previous step
+            payload["previous_step_outputs"] = {
+                step_name: get_step_output_fingerprint(step_output)
+                for step_name, step_output in (step_input.previous_step_outputs or {}).items()
+            }
+        else:
+            # Agents and teams read the last step output, and the workflow history if enabled
+            message = self._prepare_message(step_input.input, step_input.previous_step_outputs)
+            payload["message"] = get_value_fingerprint(message)
+            use_history = (
+                self.add_workflow_history if self.add_workflow_history is not None else add_workflow_history_to_steps
+            )
+            if use_history and workflow_session:
+                payload["history"] = workflow_session.get_workflow_history_context(
+                    num_runs=self.num_history_runs or num_history_runs
+                )
+
+        try:
+            return get_cache_key(payload)
+        except (TypeError, ValueError) as e:
+            log_warning(f"Output of step {self.name} is not cached, as its input can't be hashed: {e}")
+            return None
+
+    def _get_output_cache(self) -> StepOutputCache:
+        if isinstance(self.output_cache, StepOutputCache):
+            return self.output_cache
+        if self.output_cache == "db":
+            # Set to the workflow db when the step is prepared by a workflow with a db
+            log_warning(f"Step {self.name} caches its output in the workflow db, but has no db. Using memory instead.")
+        return get_default_step_output_cache()
+
+    def _prepare_cached_output(self, cached_output: Optional[StepOutput]) -> Optional[StepOutput]:
+        if cached_output is None:
+            return None
+        log_debug(f"Using cached output for step: {self.name}")
+        cached_output = self._process_step_output(cached_output)
+        cached_output.cached = True
+        # The executor did not run, so the cached output has no metrics
+        cached_output.metrics = None
+        return cached_output
+
+    def _get_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        """Get the cached output of this step for the given key, if any"""
+        if cache_key is None:
+            return None
+        try:
+            return self._prepare_cached_output(self._get_output_cache().get(cache_key))
+        except Exception as e:
+            log_warning(f"Failed to read the cached output of step {self.name}: {e}")
+            return None
+
+    async def _aget_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        """Get the cached output of this step for the given key, if any"""
+        if cache_key is None:
+            return None
+        try:
+            return self._prepare_cached_output(await self._get_output_cache().aget(cache_key))
+        except Exception as e:
+            log_warning(f"Failed to read the cached output of step {self.name}: {e}")
+            return None
+
+    def _cache_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        """Cache a successful output of this step"""
+        if cache_key is None or not step_output.success:
+            return
+        try:
+            self._get_output_cache().set(cache_key, step_output)
+        except Exception as e:
+            log_warning(f"Failed to cache the output of step {self.name}: {e}")
+
+    async def _acache_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        """Cache a successful output of this step"""
+        if cache_key is None or not step_output.success:
+            return
+        try:
+            await self._get_output_cache().aset(cache_key, step_output)
+        except Exception as e:
+            log_warning(f"Failed to cache the output of step {self.name}: {e}")
+
     def _function_has_run_context_param(self) -> bool:
         """Check if the custom function has a run_context parameter"""
         if self._executor_type != "function":
@@ -604,6 +764,10 @@ class Step:
         else:
             session_state_copy = copy(session_state) if session_state is not None else {}
 
+        # Reuse the output of an earlier execution with the same inputs
+        cache_key = self._get_cache_key(step_input, workflow_session, add_workflow_history_to_steps, num_history_runs)
+        cached_output = self._get_cached_output(cache_key)
+
         # Emit StepStartedEvent
         if stream_events and workflow_run_response:
             yield StepStartedEvent(
@@ -615,8 +779,26 @@ class Step:
                 step_index=step_index,
                 step_id=self.step_id,
                 parent_step_id=parent_step_id,
+                cached=cached_output is not None,
             )
 
+        if cached_output is not None:
+            yield cached_output
+            if stream_events and workflow_run_response:
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                    parent_step_id=parent_step_id,
+                    cached=True,
+                )
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -786,6 +968,7 @@ class Step:
 
                 # Yield the step output
                 final_response = self._process_step_output(final_response)
+                self._cache_output(cache_key, final_response)
                 yield final_response
 
                 # Emit StepCompletedEvent
@@ -852,6 +1035,12 @@ class Step:
         else:
             session_state_copy = copy(session_state) if session_state is not None else {}
 
+        # Reuse the output of an earlier execution with the same inputs
+        cache_key = self._get_cache_key(step_input, workflow_session, add_workflow_history_to_steps, num_history_runs)
+        cached_output = await self._aget_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -1029,6 +1218,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                await self._acache_output(cache_key, step_output)
 
                 return step_output
 
@@ -1079,6 +1269,10 @@ class Step:
         else:
             session_state_copy = copy(session_state) if session_state is not None else {}
 
+        # Reuse the output of an earlier execution with the same inputs
+        cache_key = self._get_cache_key(step_input, workflow_session, add_workflow_history_to_steps, num_history_runs)
+        cached_output = await self._aget_cached_output(cache_key)
+
         if stream_events and workflow_run_response:
             # Emit StepStartedEvent
             yield StepStartedEvent(
@@ -1090,8 +1284,28 @@ class Step:
                 step_index=step_index,
                 step_id=self.step_id,
                 parent_step_id=parent_step_id,
+                cached=cached_output is not None,
             )
 
+        if cached_output is not None:
+            yield cached_output
+            if stream_events and workflow_run_response:
+                # Emit StepCompletedEvent
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    step_id=self.step_id,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                    parent_step_id=parent_step_id,
+                    cached=True,
+                )
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -1303,6 +1517,7 @@ class Step:
 
                 # Yield the final response
                 final_response = self._process_step_output(final_response)
+                await self._acache_output(cache_key, final_response)
                 yield final_response
 
                 if stream_events and workflow_run_response:
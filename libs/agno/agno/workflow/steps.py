@@ -14,6 +14,7 @@ from agno.run.workflow import (
 from agno.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, logger
 from agno.workflow.step import Step, StepInput, StepOutput, StepType
+from agno.workflow.types import StepOutputs
 
 WorkflowSteps = List[
     Union[
@@ -97,9 +98,7 @@ class Steps:
             step_audio = step_outputs.audio or []
             previous_step_content = step_outputs.content
 
-        updated_previous_step_outputs = {}
-        if step_input.previous_step_outputs:
-            updated_previous_step_outputs.update(step_input.previous_step_outputs)
+        updated_previous_step_outputs = StepOutputs(step_input.previous_step_outputs)
         if steps_step_outputs:
             updated_previous_step_outputs.update(steps_step_outputs)
 
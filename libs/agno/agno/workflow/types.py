@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -66,6 +66,18 @@ class WorkflowExecutionInput:
             "files": [file.to_dict() for file in self.files] if self.files else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowExecutionInput":
+        """Create WorkflowExecutionInput from dictionary"""
+        return cls(
+            input=data.get("input"),
+            additional_data=data.get("additional_data"),
+            images=reconstruct_images(data.get("images")),
+            videos=reconstruct_videos(data.get("videos")),
+            audio=reconstruct_audio_list(data.get("audio")),
+            files=reconstruct_files(data.get("files")),
+        )
+
 
 @dataclass
 class StepInput:
@@ -105,44 +117,19 @@ class StepInput:
     def get_step_output(self, step_name: str) -> Optional["StepOutput"]:
         """Get output from a specific previous step by name
 
-        Searches recursively through nested steps (Parallel, Condition, Router, Loop, Steps)
-        to find step outputs at any depth.
+        Also finds step outputs nested at any depth in other steps (Parallel, Condition, Router, Loop, Steps), by
+        their name or by their name qualified with the names of the steps around them, e.g. "research.web_search".
         """
         if not self.previous_step_outputs:
             return None
 
-        # First try direct lookup
-        direct = self.previous_step_outputs.get(step_name)
-        if direct:
-            return direct
-
-        # Search recursively in nested steps
-        return self._search_nested_steps(step_name)
-
-    def _search_nested_steps(self, step_name: str) -> Optional["StepOutput"]:
-        """Recursively search for a step output in nested steps (Parallel, Condition, etc.)"""
-        if not self.previous_step_outputs:
-            return None
+        return self._get_indexed_step_outputs().get_step_output(step_name)
 
-        for step_output in self.previous_step_outputs.values():
-            result = self._search_in_step_output(step_output, step_name)
-            if result:
-                return result
-        return None
-
-    def _search_in_step_output(self, step_output: "StepOutput", step_name: str) -> Optional["StepOutput"]:
-        """Helper to recursively search within a single StepOutput"""
-        if not step_output.steps:
-            return None
-
-        for nested_step in step_output.steps:
-            if nested_step.step_name == step_name:
-                return nested_step
-            # Recursively search deeper
-            result = self._search_in_step_output(nested_step, step_name)
-            if result:
-                return result
-        return None
+    def _get_indexed_step_outputs(self) -> "StepOutputs":
+        """Get the previous step outputs with their index, building it if they were given as a plain dict"""
+        if isinstance(self.previous_step_outputs, StepOutputs):
+            return self.previous_step_outputs
+        return StepOutputs(self.previous_step_outputs)
 
     def get_step_content(self, step_name: str) -> Optional[Union[str, Dict[str, str]]]:
         """Get content from a specific previous step by name
@@ -194,19 +181,14 @@ class StepInput:
         if not self.previous_step_outputs:
             return ""
 
-        content_parts = []
-        for step_name, output in self.previous_step_outputs.items():
-            if output.content:
-                content_parts.append(f"=== {step_name} ===\n{output.content}")
-
-        return "\n\n".join(content_parts)
+        return self._get_indexed_step_outputs().get_all_content()
 
     def get_last_step_content(self) -> Optional[str]:
         """Get content from the most recent step (for backward compatibility)"""
         if not self.previous_step_outputs:
             return None
 
-        last_output = list(self.previous_step_outputs.values())[-1] if self.previous_step_outputs else None
+        last_output = next(reversed(self.previous_step_outputs.values()), None)
         if not last_output:
             return None
 
@@ -305,6 +287,9 @@ class StepOutput:
 
     stop: bool = False
 
+    # True when the output was loaded from the step output cache instead of executing the step
+    cached: bool = False
+
     steps: Optional[List["StepOutput"]] = None
 
     def to_dict(self) -> Dict[str, Any]:
@@ -334,6 +319,7 @@ class StepOutput:
             "success": self.success,
             "error": self.error,
             "stop": self.stop,
+            "cached": self.cached,
             "files": [file for file in self.files] if self.files else None,
         }
 
@@ -386,10 +372,113 @@ class StepOutput:
             success=data.get("success", True),
             error=data.get("error"),
             stop=data.get("stop", False),
+            cached=data.get("cached", False),
             steps=steps,
         )
 
 
+class StepOutputs(Dict[str, StepOutput]):
+    """Outputs of the previous steps by step name, with an index of the outputs nested in other steps
+
+    The outputs nested in Parallel, Loop, Condition, Router and Steps outputs are indexed as they are added, under their
+    own name and under their name qualified with the names of the steps around them, e.g. "research.web_search".
+    """
+
+    def __init__(
+        self, step_outputs: Optional[Union[Mapping[str, StepOutput], Iterable[Tuple[str, StepOutput]]]] = None
+    ):
+        super().__init__()
+        self._nested_step_outputs: Dict[str, StepOutput] = {}
+        self._all_content: Optional[str] = None
+        # Set when an output is replaced or removed, as the index then has to be rebuilt
+        self._stale = False
+
+        if isinstance(step_outputs, StepOutputs):
+            # Copy the index instead of building it again
+            super().update(step_outputs)
+            self._nested_step_outputs = dict(step_outputs._nested_step_outputs)
+            self._all_content = step_outputs._all_content
+            self._stale = step_outputs._stale
+        elif step_outputs:
+            self.update(step_outputs)
+
+    def __setitem__(self, step_name: str, step_output: StepOutput) -> None:
+        if step_name in self:
+            self._stale = True
+        super().__setitem__(step_name, step_output)
+        self._all_content = None
+        if not self._stale:
+            self._index_nested_step_outputs(step_name, step_output)
+
+    def __delitem__(self, step_name: str) -> None:
+        super().__delitem__(step_name)
+        self._invalidate()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        for step_name, step_output in dict(*args, **kwargs).items():
+            self[step_name] = step_output
+
+    def setdefault(self, step_name: str, step_output: StepOutput) -> StepOutput:  # type: ignore[override]
+        if step_name not in self:
+            self[step_name] = step_output
+        return self[step_name]
+
+    def pop(self, step_name: str, *args: Any) -> Any:  # type: ignore[override]
+        self._invalidate()
+        return super().pop(step_name, *args)
+
+    def popitem(self) -> Tuple[str, StepOutput]:
+        self._invalidate()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def copy(self) -> "StepOutputs":  # type: ignore[override]
+        return StepOutputs(self)
+
+    def get_step_output(self, step_name: str) -> Optional[StepOutput]:
+        """Get the output of a step by name, qualified name or the name of a step nested in another step"""
+        step_output = self.get(step_name)
+        if step_output:
+            return step_output
+
+        if self._stale:
+            self._rebuild_index()
+        return self._nested_step_outputs.get(step_name)
+
+    def get_all_content(self) -> str:
+        """Get the content of all steps, concatenated with their names as headers"""
+        if self._all_content is None:
+            self._all_content = "\n\n".join(
+                f"=== {step_name} ===\n{step_output.content}"
+                for step_name, step_output in self.items()
+                if step_output.content
+            )
+        return self._all_content
+
+    def _invalidate(self) -> None:
+        self._stale = True
+        self._all_content = None
+
+    def _rebuild_index(self) -> None:
+        self._nested_step_outputs = {}
+        self._stale = False
+        for step_name, step_output in self.items():
+            self._index_nested_step_outputs(step_name, step_output)
+
+    def _index_nested_step_outputs(self, qualified_name: str, step_output: StepOutput) -> None:
+        # The first output found for a name wins, as with a depth-first search through the previous steps
+        for nested_step_output in step_output.steps or []:
+            if not nested_step_output.step_name:
+                continue
+            nested_qualified_name = f"{qualified_name}.{nested_step_output.step_name}"
+            self._nested_step_outputs.setdefault(nested_step_output.step_name, nested_step_output)
+            self._nested_step_outputs.setdefault(nested_qualified_name, nested_step_output)
+            self._index_nested_step_outputs(nested_qualified_name, nested_step_output)
+
+
 @dataclass
 class StepMetrics:
     """Metrics for a single step execution"""
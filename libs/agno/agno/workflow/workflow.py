@@ -82,6 +82,7 @@ from agno.utils.print_response.workflow import (
 )
 from agno.utils.string import generate_id_from_name
 from agno.workflow.agent import WorkflowAgent
+from agno.workflow.cache import DbStepOutputCache
 from agno.workflow.condition import Condition
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
@@ -92,6 +93,7 @@ from agno.workflow.types import (
     StepInput,
     StepMetrics,
     StepOutput,
+    StepOutputs,
     StepType,
     WorkflowExecutionInput,
     WorkflowMetrics,
@@ -194,6 +196,9 @@ class Workflow:
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
 
+    # If True, save the run to the database after each step, so it can be continued with resume() if interrupted
+    checkpoint_steps: bool = False
+
     # If True, run hooks as FastAPI background tasks (non-blocking). Set by AgentOS.
     _run_hooks_in_background: bool = False
 
@@ -223,6 +228,7 @@ class Workflow:
         telemetry: bool = True,
         add_workflow_history_to_steps: bool = False,
         num_history_runs: int = 3,
+        checkpoint_steps: bool = False,
     ):
         self.id = id
         self.name = name
@@ -247,6 +253,7 @@ class Workflow:
         self.telemetry = telemetry
         self.add_workflow_history_to_steps = add_workflow_history_to_steps
         self.num_history_runs = num_history_runs
+        self.checkpoint_steps = checkpoint_steps
         self._workflow_session: Optional[WorkflowSession] = None
         self.stream_events = stream_events
 
@@ -257,6 +264,13 @@ class Workflow:
                 "History won't be persisted. Add a database to persist runs across executions. "
             )
 
+        # Warn if step checkpointing is enabled without a database
+        if self.checkpoint_steps and self.db is None:
+            log_warning(
+                "Step checkpointing is enabled (checkpoint_steps=True) but no database is configured. "
+                "Runs can't be resumed without a database."
+            )
+
     def set_id(self) -> None:
         if self.id is None:
             self.id = generate_id_from_name(self.name)
@@ -573,6 +587,9 @@ class Workflow:
         config["add_workflow_history_to_steps"] = self.add_workflow_history_to_steps
         config["num_history_runs"] = self.num_history_runs
 
+        # --- Checkpoint settings ---
+        config["checkpoint_steps"] = self.checkpoint_steps
+
         # --- Streaming settings ---
         if self.stream is not None:
             config["stream"] = self.stream
@@ -674,6 +691,8 @@ class Workflow:
             # --- History settings ---
             add_workflow_history_to_steps=config.get("add_workflow_history_to_steps", False),
             num_history_runs=config.get("num_history_runs", 3),
+            # --- Checkpoint settings ---
+            checkpoint_steps=config.get("checkpoint_steps", False),
             # --- Streaming settings ---
             stream=config.get("stream"),
             stream_events=config.get("stream_events", False),
@@ -1483,9 +1502,9 @@ class Workflow:
 
         previous_step_content = None
         if previous_step_outputs:
-            last_output = list(previous_step_outputs.values())[-1]
+            last_step_name, last_output = next(reversed(previous_step_outputs.items()))
             previous_step_content = last_output.content if last_output else None
-            log_debug(f"Using previous step content from: {list(previous_step_outputs.keys())[-1]}")
+            log_debug(f"Using previous step content from: {last_step_name}")
 
         return StepInput(
             input=execution_input.input,
@@ -1596,6 +1615,115 @@ class Workflow:
                 partial_step_content += event.content
         return partial_step_content
 
+    def _get_checkpoint(self, session: WorkflowSession, run_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint stored in the session for the given run, if any"""
+        if session.session_data is None or run_id is None:
+            return None
+        return session.session_data.get("workflow_checkpoints", {}).get(run_id)
+
+    def _update_checkpoint(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+    ) -> None:
+        """Record the steps completed so far on the run and in its checkpoint"""
+        if session.session_data is None:
+            session.session_data = {}
+        checkpoints = session.session_data.setdefault("workflow_checkpoints", {})
+        # The execution input is stored once, before the steps add their media to it
+        checkpoint = checkpoints.setdefault(
+            workflow_run_response.run_id, {"execution_input": execution_input.to_dict()}
+        )
+        checkpoint["completed_steps"] = len(collected_step_outputs)
+
+        workflow_run_response.step_results = list(collected_step_outputs)
+        session.upsert_run(run=workflow_run_response)
+
+    def _save_checkpoint(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+    ) -> None:
+        """Save the steps completed so far to the database, so the run can be resumed if it is interrupted"""
+        self._update_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+        # Not using save_session(), as it removes run keys from the session_state the next steps still use
+        self._upsert_session(session=session)
+
+    async def _asave_checkpoint(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+    ) -> None:
+        """Save the steps completed so far to the database, so the run can be resumed if it is interrupted"""
+        self._update_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+        if self._has_async_db():
+            await self._aupsert_session(session=session)
+        else:
+            self._upsert_session(session=session)
+
+    def _clear_checkpoint(self, session: WorkflowSession, workflow_run_response: WorkflowRunOutput) -> None:
+        """Remove the checkpoint of a completed run, as there is nothing left to resume"""
+        if workflow_run_response.status != RunStatus.completed or session.session_data is None:
+            return
+        checkpoints = session.session_data.get("workflow_checkpoints")
+        if checkpoints is not None:
+            checkpoints.pop(workflow_run_response.run_id, None)
+            if not checkpoints:
+                session.session_data.pop("workflow_checkpoints")
+
+    def _get_checkpointed_step_outputs(
+        self, session: WorkflowSession, workflow_run_response: WorkflowRunOutput
+    ) -> List[Tuple[str, StepOutput]]:
+        """Get the (step_name, step_output) pairs of the steps a resumed run completed before being interrupted"""
+        checkpoint = self._get_checkpoint(session, workflow_run_response.run_id)
+        if checkpoint is None or not workflow_run_response.step_results:
+            return []
+
+        # Step results after the completed steps hold partial outputs of the interrupted step
+        completed_step_outputs = workflow_run_response.step_results[: checkpoint.get("completed_steps", 0)]
+
+        checkpointed_step_outputs: List[Tuple[str, StepOutput]] = []
+        for i, (step, step_output) in enumerate(zip(self.steps, completed_step_outputs)):  # type: ignore[arg-type]
+            step_name = getattr(step, "name", f"step_{i + 1}")
+            step_output = cast(StepOutput, step_output)
+            if step_name is not None and step_output.step_name is not None and step_output.step_name != step_name:
+                log_warning(
+                    f"Step {i + 1} changed since run {workflow_run_response.run_id} was checkpointed, "
+                    f"resuming from step {step_name}"
+                )
+                break
+            checkpointed_step_outputs.append((step_name, step_output))
+
+        log_debug(f"Resuming run {workflow_run_response.run_id} after {len(checkpointed_step_outputs)} completed steps")
+        return checkpointed_step_outputs
+
+    def _load_checkpointed_run(
+        self, session: WorkflowSession, run_id: str
+    ) -> Tuple[WorkflowRunOutput, WorkflowExecutionInput]:
+        """Load an interrupted run and its execution input from the checkpoint stored in the session"""
+        checkpoint = self._get_checkpoint(session, run_id)
+        workflow_run_response = session.get_run(run_id=run_id)
+        if checkpoint is None or workflow_run_response is None:
+            raise ValueError(f"No checkpoint found for run {run_id} in session {session.session_id}")
+
+        execution_input = WorkflowExecutionInput.from_dict(checkpoint["execution_input"])
+        if execution_input.input is not None and self.input_schema is not None:
+            execution_input.input = validate_input(execution_input.input, self.input_schema)
+
+        # Restart the run, keeping the outputs of the steps completed before it was interrupted
+        workflow_run_response.input = execution_input.input
+        workflow_run_response.content = None
+        workflow_run_response.metrics = WorkflowMetrics(steps={})
+        workflow_run_response.metrics.start_timer()
+
+        return workflow_run_response, execution_input
+
     def _execute(
         self,
         session: WorkflowSession,
@@ -1633,7 +1761,7 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                previous_step_outputs = StepOutputs()
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -1644,7 +1772,25 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
+                # Restore the steps completed before the run was interrupted, when resuming it
+                checkpointed_step_outputs = self._get_checkpointed_step_outputs(session, workflow_run_response)
+                for step_name, step_output in checkpointed_step_outputs:
+                    previous_step_outputs[step_name] = step_output
+                    collected_step_outputs.append(step_output)
+                    shared_images.extend(step_output.images or [])
+                    shared_videos.extend(step_output.videos or [])
+                    shared_audio.extend(step_output.audio or [])
+                    shared_files.extend(step_output.files or [])
+                    output_images.extend(step_output.images or [])
+                    output_videos.extend(step_output.videos or [])
+                    output_audio.extend(step_output.audio or [])
+                    output_files.extend(step_output.files or [])
+                if self.checkpoint_steps:
+                    self._save_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < len(checkpointed_step_outputs):
+                        continue
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1694,6 +1840,9 @@ class Workflow:
                     output_audio.extend(step_output.audio or [])
                     output_files.extend(step_output.files or [])
 
+                    if self.checkpoint_steps:
+                        self._save_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+
                     if step_output.stop:
                         logger.info(f"Early termination requested by step {step_name}")
                         break
@@ -1756,6 +1905,7 @@ class Workflow:
                 if workflow_run_response.metrics:
                     workflow_run_response.metrics.stop_timer()
 
+                self._clear_checkpoint(session, workflow_run_response)
                 self._update_session_metrics(session=session, workflow_run_response=workflow_run_response)
                 session.upsert_run(run=workflow_run_response)
                 self.save_session(session=session)
@@ -1814,7 +1964,7 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                previous_step_outputs = StepOutputs()
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -1832,7 +1982,25 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
+                # Restore the steps completed before the run was interrupted, when resuming it
+                checkpointed_step_outputs = self._get_checkpointed_step_outputs(session, workflow_run_response)
+                for step_name, step_output in checkpointed_step_outputs:
+                    previous_step_outputs[step_name] = step_output
+                    collected_step_outputs.append(step_output)
+                    shared_images.extend(step_output.images or [])
+                    shared_videos.extend(step_output.videos or [])
+                    shared_audio.extend(step_output.audio or [])
+                    shared_files.extend(step_output.files or [])
+                    output_images.extend(step_output.images or [])
+                    output_videos.extend(step_output.videos or [])
+                    output_audio.extend(step_output.audio or [])
+                    output_files.extend(step_output.files or [])
+                if self.checkpoint_steps:
+                    self._save_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < len(checkpointed_step_outputs):
+                        continue
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1938,6 +2106,9 @@ class Workflow:
                             if self.stream_executor_events:
                                 yield self._handle_event(enriched_event, workflow_run_response)  # type: ignore
 
+                    if self.checkpoint_steps:
+                        self._save_checkpoint(session, execution_input, workflow_run_response, collected_step_outputs)
+
                     # Break out of main step loop if early termination was requested
                     if "early_termination" in locals() and early_termination:
                         break
@@ -2083,6 +2254,7 @@ class Workflow:
             workflow_run_response.metrics.stop_timer()
 
         # Store the completed workflow response
+        self._clear_checkpoint(session, workflow_run_response)
         self._update_session_metrics(session=session, workflow_run_response=workflow_run_response)
         session.upsert_run(run=workflow_run_response)
         self.save_session(session=session)
@@ -2217,7 +2389,7 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                previous_step_outputs = StepOutputs()
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -2228,7 +2400,27 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
+                # Restore the steps completed before the run was interrupted, when resuming it
+                checkpointed_step_outputs = self._get_checkpointed_step_outputs(workflow_session, workflow_run_response)
+                for step_name, step_output in checkpointed_step_outputs:
+                    previous_step_outputs[step_name] = step_output
+                    collected_step_outputs.append(step_output)
+                    shared_images.extend(step_output.images or [])
+                    shared_videos.extend(step_output.videos or [])
+                    shared_audio.extend(step_output.audio or [])
+                    shared_files.extend(step_output.files or [])
+                    output_images.extend(step_output.images or [])
+                    output_videos.extend(step_output.videos or [])
+                    output_audio.extend(step_output.audio or [])
+                    output_files.extend(step_output.files or [])
+                if self.checkpoint_steps:
+                    await self._asave_checkpoint(
+                        workflow_session, execution_input, workflow_run_response, collected_step_outputs
+                    )
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < len(checkpointed_step_outputs):
+                        continue
                     await araise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -2278,6 +2470,11 @@ class Workflow:
                     output_audio.extend(step_output.audio or [])
                     output_files.extend(step_output.files or [])
 
+                    if self.checkpoint_steps:
+                        await self._asave_checkpoint(
+                            workflow_session, execution_input, workflow_run_response, collected_step_outputs
+                        )
+
                     if step_output.stop:
                         logger.info(f"Early termination requested by step {step_name}")
                         break
@@ -2335,6 +2532,7 @@ class Workflow:
         if workflow_run_response.metrics:
             workflow_run_response.metrics.stop_timer()
 
+        self._clear_checkpoint(workflow_session, workflow_run_response)
         self._update_session_metrics(session=workflow_session, workflow_run_response=workflow_run_response)
         workflow_session.upsert_run(run=workflow_run_response)
         if self._has_async_db():
@@ -2413,7 +2611,7 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                previous_step_outputs = StepOutputs()
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -2431,7 +2629,27 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
+                # Restore the steps completed before the run was interrupted, when resuming it
+                checkpointed_step_outputs = self._get_checkpointed_step_outputs(workflow_session, workflow_run_response)
+                for step_name, step_output in checkpointed_step_outputs:
+                    previous_step_outputs[step_name] = step_output
+                    collected_step_outputs.append(step_output)
+                    shared_images.extend(step_output.images or [])
+                    shared_videos.extend(step_output.videos or [])
+                    shared_audio.extend(step_output.audio or [])
+                    shared_files.extend(step_output.files or [])
+                    output_images.extend(step_output.images or [])
+                    output_videos.extend(step_output.videos or [])
+                    output_audio.extend(step_output.audio or [])
+                    output_files.extend(step_output.files or [])
+                if self.checkpoint_steps:
+                    await self._asave_checkpoint(
+                        workflow_session, execution_input, workflow_run_response, collected_step_outputs
+                    )
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < len(checkpointed_step_outputs):
+                        continue
                     if workflow_run_response.run_id:
                         await araise_if_cancelled(workflow_run_response.run_id)
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -2540,6 +2758,11 @@ class Workflow:
                                     enriched_event, workflow_run_response, websocket_handler=websocket_handler
                                 )  # type: ignore
 
+                    if self.checkpoint_steps:
+                        await self._asave_checkpoint(
+                            workflow_session, execution_input, workflow_run_response, collected_step_outputs
+                        )
+
                     # Break out of main step loop if early termination was requested
                     if "early_termination" in locals() and early_termination:
                         break
@@ -2689,6 +2912,7 @@ class Workflow:
             workflow_run_response.metrics.stop_timer()
 
         # Store the completed workflow response
+        self._clear_checkpoint(workflow_session, workflow_run_response)
         self._update_session_metrics(session=workflow_session, workflow_run_response=workflow_run_response)
         workflow_session.upsert_run(run=workflow_run_response)
         if self._has_async_db():
@@ -4191,6 +4415,209 @@ class Workflow:
                 **kwargs,
             )
 
+    def resume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream: bool = False,
+        stream_events: Optional[bool] = None,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunOutput, Iterator[WorkflowRunOutputEvent]]:
+        """Resume an interrupted run, continuing at the first step it did not complete.
+
+        The run must have been started with `checkpoint_steps=True`. The outputs of its completed steps are restored
+        from the database instead of being executed again. A step interrupted midway, including a Parallel, Loop,
+        Condition or Router step, is executed again from its start.
+
+        Args:
+            run_id: The id of the run to resume.
+            session_id: The session the run belongs to. Defaults to the workflow session_id.
+            user_id: The user the run belongs to. Defaults to the workflow user_id.
+            stream: Stream the events of the remaining steps.
+            stream_events: Stream the intermediate events of the remaining steps.
+            background_tasks: FastAPI background tasks to run hooks in.
+
+        Returns:
+            The completed WorkflowRunOutput, or an iterator of events when streaming.
+        """
+        if self._has_async_db():
+            raise Exception("`resume()` is not supported with an async DB. Please use `aresume()`.")
+        if self.db is None:
+            raise ValueError("A database is required to resume a run")
+
+        self._set_debug()
+
+        self.initialize_workflow()
+        session_id, user_id = self._initialize_session(session_id=session_id, user_id=user_id)
+
+        workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
+        self._update_metadata(session=workflow_session)
+        workflow_run_response, inputs = self._load_checkpointed_run(session=workflow_session, run_id=run_id)
+        register_run(run_id)
+
+        session_state = self._load_session_state(session=workflow_session, session_state={})
+        session_state = self._initialize_session_state(
+            session_state=session_state,
+            session_id=session_id,
+            user_id=user_id,
+            run_id=run_id,
+        )
+
+        log_debug(f"Workflow Run Resume: {self.name}", center=True)
+
+        stream = stream or self.stream or False
+        stream_events = (stream_events or self.stream_events) if stream else False
+
+        self._prepare_steps()
+        self.update_agents_and_teams_session_info()
+
+        run_context = RunContext(
+            run_id=run_id,
+            session_id=session_id,
+            user_id=user_id,
+            session_state=session_state,
+            workflow_id=self.id,
+            workflow_name=self.name,
+        )
+
+        if stream:
+            return self._execute_stream(
+                session=workflow_session,
+                execution_input=inputs,
+                workflow_run_response=workflow_run_response,
+                stream_events=stream_events,
+                run_context=run_context,
+                background_tasks=background_tasks,
+                **kwargs,
+            )
+        else:
+            return self._execute(
+                session=workflow_session,
+                execution_input=inputs,
+                workflow_run_response=workflow_run_response,
+                run_context=run_context,
+                background_tasks=background_tasks,
+                **kwargs,
+            )
+
+    def aresume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream: bool = False,
+        stream_events: Optional[bool] = None,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Union[Awaitable[WorkflowRunOutput], AsyncIterator[WorkflowRunOutputEvent]]:
+        """Resume an interrupted run asynchronously, continuing at the first step it did not complete.
+
+        See `resume()` for details.
+        """
+        if self.db is None:
+            raise ValueError("A database is required to resume a run")
+
+        self._set_debug()
+
+        self.initialize_workflow()
+        session_id, user_id = self._initialize_session(session_id=session_id, user_id=user_id)
+
+        log_debug(f"Async Workflow Run Resume: {self.name}", center=True)
+
+        stream = stream or self.stream or False
+        stream_events = (stream_events or self.stream_events) if stream else False
+
+        self._prepare_steps()
+        self.update_agents_and_teams_session_info()
+
+        if stream:
+            return self._aresume_stream(
+                run_id=run_id,
+                session_id=session_id,
+                user_id=user_id,
+                stream_events=stream_events,
+                background_tasks=background_tasks,
+                **kwargs,
+            )
+        else:
+            return self._aresume(
+                run_id=run_id,
+                session_id=session_id,
+                user_id=user_id,
+                background_tasks=background_tasks,
+                **kwargs,
+            )
+
+    async def _aload_checkpointed_run(
+        self, run_id: str, session_id: str, user_id: Optional[str]
+    ) -> Tuple[WorkflowRunOutput, WorkflowExecutionInput]:
+        if self._has_async_db():
+            workflow_session = await self.aread_or_create_session(session_id=session_id, user_id=user_id)
+        else:
+            workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
+        return self._load_checkpointed_run(session=workflow_session, run_id=run_id)
+
+    async def _aresume(
+        self,
+        run_id: str,
+        session_id: str,
+        user_id: Optional[str],
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> WorkflowRunOutput:
+        workflow_run_response, inputs = await self._aload_checkpointed_run(
+            run_id=run_id, session_id=session_id, user_id=user_id
+        )
+        run_context = RunContext(
+            run_id=run_id,
+            session_id=session_id,
+            user_id=user_id,
+            workflow_id=self.id,
+            workflow_name=self.name,
+        )
+        return await self._aexecute(
+            session_id=session_id,
+            user_id=user_id,
+            execution_input=inputs,
+            workflow_run_response=workflow_run_response,
+            run_context=run_context,
+            background_tasks=background_tasks,
+            **kwargs,
+        )
+
+    async def _aresume_stream(
+        self,
+        run_id: str,
+        session_id: str,
+        user_id: Optional[str],
+        stream_events: bool = False,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[WorkflowRunOutputEvent]:
+        workflow_run_response, inputs = await self._aload_checkpointed_run(
+            run_id=run_id, session_id=session_id, user_id=user_id
+        )
+        run_context = RunContext(
+            run_id=run_id,
+            session_id=session_id,
+            user_id=user_id,
+            workflow_id=self.id,
+            workflow_name=self.name,
+        )
+        async for event in self._aexecute_stream(
+            session_id=session_id,
+            user_id=user_id,
+            execution_input=inputs,
+            workflow_run_response=workflow_run_response,
+            run_context=run_context,
+            stream_events=stream_events,
+            background_tasks=background_tasks,
+            **kwargs,
+        ):
+            yield event
+
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
@@ -4223,8 +4650,32 @@ class Workflow:
                     raise ValueError(f"Invalid step type: {type(step).__name__}")
 
             self.steps = prepared_steps  # type: ignore
+            for step in prepared_steps:
+                self._set_step_output_cache(step)
             log_debug("Step preparation completed")
 
+    def _set_step_output_cache(self, step: Any) -> None:
+        """Point steps caching their output in the "db" to the workflow db"""
+        if isinstance(step, Step):
+            if step.cache_output and isinstance(step.output_cache, str) and step.output_cache == "db":
+                if self.db is None:
+                    log_warning(
+                        f"Step '{step.name}' caches its output in the db, but no database is configured in the "
+                        "Workflow. Caching the output in memory instead."
+                    )
+                    step.output_cache = "memory"
+                else:
+                    step.output_cache = DbStepOutputCache(self.db)
+            return
+        if isinstance(step, (Steps, Loop, Parallel, Condition)):
+            nested_steps = step.steps
+        elif isinstance(step, Router):
+            nested_steps = step.choices
+        else:
+            return
+        for nested_step in nested_steps if isinstance(nested_steps, list) else []:
+            self._set_step_output_cache(nested_step)
+
     def print_response(
         self,
         input: Union[str, Dict[str, Any], List[Any], BaseModel, List[Message]],
@@ -4908,6 +5359,9 @@ class Workflow:
                 "strict_input_validation",
                 "add_workflow_history",
                 "num_history_runs",
+                "cache_output",
+                "output_cache",
+                "depends_on",
             ]:
                 if hasattr(step, attr):
                     value = getattr(step, attr)
@@ -4927,7 +5381,9 @@ class Workflow:
         # Handle Parallel steps
         if isinstance(step, Parallel):
             copied_parallel_steps = [self._deep_copy_single_step(s) for s in step.steps] if step.steps else []
-            return Parallel(*copied_parallel_steps, name=step.name, description=step.description)
+            return Parallel(
+                *copied_parallel_steps, name=step.name, description=step.description, max_workers=step.max_workers
+            )
 
         # Handle Loop steps
         if isinstance(step, Loop):
@@ -0,0 +1,299 @@
+"""Unit tests for running read-only pre-hooks concurrently, and alongside the model request"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from agno.agent import Agent
+from agno.exceptions import CheckTrigger, InputCheckError
+from agno.guardrails import BaseGuardrail, PIIDetectionGuardrail
+from agno.hooks import hook, is_read_only
+from agno.memory import MemoryManager
+from agno.models.mock import MockModel
+from agno.models.response import ModelResponse
+from agno.run.agent import RunContentEvent, RunErrorEvent
+from agno.run.base import RunStatus
+from agno.utils.hooks import group_pre_hooks, normalize_pre_hooks, split_speculative_pre_hooks
+
+
+class SlowGuardrail(BaseGuardrail):
+    read_only = True
+
+    def __init__(self, delay: float, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.cancelled = False
+
+    def check(self, run_input) -> None:
+        time.sleep(self.delay)
+        if self.fail:
+            raise InputCheckError("Input blocked", check_trigger=CheckTrigger.INPUT_NOT_ALLOWED)
+
+    async def async_check(self, run_input) -> None:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise InputCheckError("Input blocked", check_trigger=CheckTrigger.INPUT_NOT_ALLOWED)
+
+
+class WaitingGuardrail(BaseGuardrail):
+    """Guardrail passing once `event` is set, which fails if it is not set within 5 seconds"""
+
+    read_only = True
+
+    def __init__(self, event: asyncio.Event, on_pass=None):
+        self.event = event
+        self.on_pass = on_pass
+        self.passed = False
+
+    def check(self, run_input) -> None:
+        raise NotImplementedError
+
+    async def async_check(self, run_input) -> None:
+        await asyncio.wait_for(self.event.wait(), timeout=5)
+        self.passed = True
+        if self.on_pass is not None:
+            self.on_pass()
+
+
+@dataclass
+class CancellableMockModel(MockModel):
+    """MockModel recording whether its async request was cancelled"""
+
+    cancelled: bool = False
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        try:
+            return await super().ainvoke(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def _get_agent(pre_hooks, **kwargs) -> Agent:
+    kwargs.setdefault("model", MockModel(response_content="The answer"))
+    return Agent(pre_hooks=pre_hooks, telemetry=False, **kwargs)
+
+
+def test_read_only_flags():
+    @hook(read_only=True)
+    def read_only_hook(run_input):
+        pass
+
+    @hook
+    def other_hook(run_input):
+        pass
+
+    assert is_read_only(read_only_hook)
+    assert not is_read_only(other_hook)
+    assert PIIDetectionGuardrail().read_only
+    assert not PIIDetectionGuardrail(mask_pii=True).read_only
+
+
+def test_group_and_split_pre_hooks():
+    def modify_input(run_input):
+        pass
+
+    first, second, third = SlowGuardrail(0), SlowGuardrail(0), SlowGuardrail(0)
+    hooks = normalize_pre_hooks([first, second, modify_input, third])
+    assert hooks is not None
+
+    assert [len(group) for group in group_pre_hooks(hooks)] == [2, 1, 1]
+    blocking, speculative = split_speculative_pre_hooks(hooks)
+    assert blocking == hooks[:3]
+    assert speculative == hooks[3:]
+    assert split_speculative_pre_hooks([modify_input]) == ([modify_input], None)
+
+
+def test_read_only_pre_hooks_run_concurrently():
+    # Each hook waits for the other to start, which only happens if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    met = []
+
+    @hook(read_only=True)
+    def first_check(run_input):
+        barrier.wait()
+        met.append("first")
+
+    @hook(read_only=True)
+    def second_check(run_input):
+        barrier.wait()
+        met.append("second")
+
+    agent = _get_agent([first_check, second_check])
+    response = agent.run("Hello")
+
+    assert response.status == RunStatus.completed
+    assert sorted(met) == ["first", "second"]
+
+
+def test_modifying_pre_hook_runs_in_order():
+    seen = []
+
+    def add_context(run_input):
+        run_input.input_content = f"{run_input.input_content} (checked)"
+
+    @hook(read_only=True)
+    def record_input(run_input):
+        seen.append(run_input.input_content)
+
+    agent = _get_agent([record_input, add_context, record_input])
+    agent.run("Hello")
+
+    assert seen == ["Hello", "Hello (checked)"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_guardrails_run_concurrently_async():
+    # The last guardrail lets the others pass, which only happens if they run at the same time
+    all_started = asyncio.Event()
+    guardrails = [WaitingGuardrail(all_started), WaitingGuardrail(all_started)]
+
+    @hook(read_only=True)
+    async def release(run_input):
+        all_started.set()
+
+    agent = _get_agent([*guardrails, release])
+    response = await agent.arun("Hello")
+
+    assert response.status == RunStatus.completed
+    assert all(guardrail.passed for guardrail in guardrails)
+
+
+@pytest.mark.asyncio
+async def test_sync_pre_hook_runs_off_event_loop():
+    threads = []
+
+    def sync_hook(run_input):
+        threads.append(threading.current_thread())
+
+    agent = _get_agent([sync_hook])
+    await agent.arun("Hello")
+
+    assert threads and threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_check_error_cancels_concurrent_guardrails():
+    slow = SlowGuardrail(5)
+    agent = _get_agent([slow, SlowGuardrail(0.01, fail=True)])
+
+    response = await agent.arun("Hello")
+    await asyncio.sleep(0)
+
+    assert response.status == RunStatus.error
+    assert response.content == "Input blocked"
+    assert slow.cancelled
+
+
+@pytest.mark.asyncio
+async def test_speculative_model_request_runs_alongside_guardrails():
+    # The guardrail only passes once the model answered, which only happens if the model runs alongside it
+    answered = asyncio.Event()
+    guardrail = WaitingGuardrail(answered)
+
+    def answer(messages) -> str:
+        answered.set()
+        return "The answer"
+
+    agent = _get_agent([guardrail], model=MockModel(response_content=answer), speculative_pre_hooks=True)
+    response = await agent.arun("Hello")
+
+    assert response.status == RunStatus.completed
+    assert response.content == "The answer"
+    assert guardrail.passed
+
+
+@pytest.mark.asyncio
+async def test_speculative_model_request_cancelled_on_check_error():
+    model = CancellableMockModel(response_content="The answer", latency=5)
+    agent = _get_agent([SlowGuardrail(0.1, fail=True)], model=model, speculative_pre_hooks=True)
+
+    response = await agent.arun("Hello")
+    await asyncio.sleep(0)
+
+    assert response.status == RunStatus.error
+    assert response.content == "Input blocked"
+    assert model.cancelled
+
+
+@pytest.mark.asyncio
+async def test_speculative_model_request_waits_for_guardrails_before_tools():
+    calls = []
+
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        calls.append((a, b))
+        return a + b
+
+    agent = _get_agent(
+        [SlowGuardrail(0.2, fail=True)],
+        model=MockModel(response_content="done", tool_calls=[{"name": "add", "arguments": {"a": 2, "b": 3}}]),
+        tools=[add],
+        speculative_pre_hooks=True,
+    )
+
+    response = await agent.arun("Add 2 and 3")
+
+    assert response.status == RunStatus.error
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_speculative_stream_buffers_output_until_guardrails_pass():
+    # The guardrail passes once the model answered, and its output is only streamed after that
+    answered = asyncio.Event()
+    order = []
+
+    def answer(messages) -> str:
+        answered.set()
+        return "one two three"
+
+    agent = _get_agent(
+        [WaitingGuardrail(answered, on_pass=lambda: order.append("passed"))],
+        model=MockModel(response_content=answer),
+        speculative_pre_hooks=True,
+    )
+
+    contents = []
+    async for event in agent.arun("Hello", stream=True):
+        if isinstance(event, RunContentEvent) and event.content:
+            order.append("content")
+            contents.append(event.content)
+
+    assert "".join(contents) == "one two three"
+    assert order[0] == "passed"
+
+
+@pytest.mark.asyncio
+async def test_speculative_stream_discards_output_on_check_error():
+    agent = _get_agent(
+        [SlowGuardrail(0.2, fail=True)],
+        model=MockModel(response_content="one two three"),
+        speculative_pre_hooks=True,
+    )
+
+    events = [event async for event in agent.arun("Hello", stream=True)]
+
+    assert not any(isinstance(event, RunContentEvent) for event in events)
+    assert isinstance(events[-1], RunErrorEvent)
+    assert events[-1].content == "Input blocked"
+
+
+def test_no_speculation_when_memories_use_the_input():
+    agent = _get_agent(
+        [SlowGuardrail(0)],
+        memory_manager=MemoryManager(model=MockModel()),
+        update_memory_on_run=True,
+        speculative_pre_hooks=True,
+    )
+
+    assert not agent._can_speculate_pre_hooks()
+    agent.update_memory_on_run = False
+    assert agent._can_speculate_pre_hooks()
@@ -0,0 +1,135 @@
+import pytest
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.run.base import RunContext
+from agno.session import AgentSession
+
+
+def _get_run_context(**session_state) -> RunContext:
+    return RunContext(run_id="run", session_id="session", session_state=session_state)
+
+
+def _count_templates(agent: Agent, monkeypatch) -> list:
+    templates: list = []
+    get_state_template = agent._get_state_template
+
+    def counting_get_state_template(message, format_variables):
+        templates.append(message)
+        return get_state_template(message, format_variables)
+
+    monkeypatch.setattr(agent, "_get_state_template", counting_get_state_template)
+    return templates
+
+
+def test_templates_built_once(monkeypatch):
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), description="An agent", instructions=["Answer in {language}"])
+    templates = _count_templates(agent, monkeypatch)
+    session = AgentSession(session_id="session")
+
+    first = agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+    second = agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+
+    assert first is not None and second is not None
+    assert first.content == second.content
+    assert len(templates) == 1
+
+
+def test_sections_follow_changed_inputs(monkeypatch):
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions=["Be brief in {language}"], expected_output="A haiku")
+    templates = _count_templates(agent, monkeypatch)
+    session = AgentSession(session_id="session")
+    agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+
+    agent.instructions.append("Be kind")  # type: ignore[union-attr]
+    agent.expected_output = "A limerick"
+    message = agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+
+    assert message is not None
+    assert "- Be kind" in message.content  # type: ignore[operator]
+    assert "A limerick" in message.content  # type: ignore[operator]
+    assert "A haiku" not in message.content  # type: ignore[operator]
+    assert len(templates) == 2
+
+
+def test_state_variables_formatted_on_each_run():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions=["The user lives in {city}", "Prices are in $"])
+    session = AgentSession(session_id="session")
+
+    paris = agent.get_system_message(session=session, run_context=_get_run_context(city="Paris"))
+    rome = agent.get_system_message(session=session, run_context=_get_run_context(city="Rome"))
+    unresolved = agent.get_system_message(session=session, run_context=_get_run_context())
+
+    assert "The user lives in Paris" in paris.content  # type: ignore[union-attr,operator]
+    assert "The user lives in Rome" in rome.content  # type: ignore[union-attr,operator]
+    assert "The user lives in {city}" in unresolved.content  # type: ignore[union-attr,operator]
+    assert "Prices are in $" in rome.content  # type: ignore[union-attr,operator]
+
+
+def test_tool_instructions_follow_the_run():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions=["Be brief"])
+    session = AgentSession(session_id="session")
+
+    agent._tool_instructions = ["Use the search tool"]
+    with_tools = agent.get_system_message(session=session, run_context=_get_run_context())
+    agent._tool_instructions = []
+    without_tools = agent.get_system_message(session=session, run_context=_get_run_context())
+
+    assert "Use the search tool" in with_tools.content  # type: ignore[union-attr,operator]
+    assert "Use the search tool" not in without_tools.content  # type: ignore[union-attr,operator]
+
+
+def test_dynamic_sections_keep_a_stable_prefix():
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        description="An agent",
+        instructions=["Be brief"],
+        add_datetime_to_context=True,
+    )
+    session = AgentSession(session_id="session")
+
+    first = agent.get_system_message(session=session, run_context=_get_run_context())
+    second = agent.get_system_message(session=session, run_context=_get_run_context())
+
+    prefix = "An agent\nBe brief\n\n<additional_information>"
+    assert first.content.startswith(prefix)  # type: ignore[union-attr]
+    assert second.content.startswith(prefix)  # type: ignore[union-attr]
+    assert "The current time is" in second.content  # type: ignore[union-attr,operator]
+
+
+def test_invalidate_system_message_cache(monkeypatch):
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), instructions=["Be brief in {language}"])
+    templates = _count_templates(agent, monkeypatch)
+    session = AgentSession(session_id="session")
+
+    agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+    agent.invalidate_system_message_cache()
+    agent.get_system_message(session=session, run_context=_get_run_context(language="French"))
+
+    assert len(templates) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_system_message_matches_sync():
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        description="I help {name}",
+        role="Assistant",
+        instructions=["Be brief", "Answer in {language}"],
+        use_instruction_tags=True,
+        expected_output="A short answer",
+        additional_context="Extra context",
+        markdown=True,
+    )
+    agent._tool_instructions = ["Use the tools of {name}"]
+    session = AgentSession(session_id="session")
+    run_context = _get_run_context(name="Ada", language="French")
+
+    sync_message = agent.get_system_message(session=session, run_context=run_context)
+    async_message = await agent.aget_system_message(session=session, run_context=run_context)
+
+    assert async_message is not None and sync_message is not None
+    assert async_message.content == sync_message.content
+    assert "I help Ada" in async_message.content  # type: ignore[operator]
+    assert "- Answer in French" in async_message.content  # type: ignore[operator]
+    assert "Use the tools of Ada" in async_message.content  # type: ignore[operator]
@@ -0,0 +1,253 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+import boto3  # noqa: E402
+
+import agno.db.dynamo.dynamo as dynamo_module  # noqa: E402
+from agno.db.dynamo import DynamoDb  # noqa: E402
+from agno.db.dynamo.schemas import (  # noqa: E402
+    KNOWLEDGE_PARTITION_INDEX,
+    MEMORY_PARTITION_INDEX,
+    METRICS_PARTITION_INDEX,
+    TABLE_PARTITION_ATTRIBUTE,
+)
+from agno.db.dynamo.utils import batch_get_items  # noqa: E402
+from agno.db.schemas.knowledge import KnowledgeRow  # noqa: E402
+from agno.db.schemas.memory import UserMemory  # noqa: E402
+
+
+@pytest.fixture
+def dynamo_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        yield boto3.client("dynamodb", region_name="us-east-1")
+
+
+@pytest.fixture
+def dynamo_db(dynamo_client):
+    return DynamoDb(db_client=dynamo_client)
+
+
+def _fail_scan(*args, **kwargs):
+    raise AssertionError("scan should not be called")
+
+
+def _store_memories(dynamo_db, count: int, user_id: str = "user_1"):
+    for i in range(count):
+        dynamo_db.upsert_user_memory(
+            UserMemory(memory_id=f"{user_id}_memory_{i}", memory=f"Memory {i}", user_id=user_id, topics=[f"topic_{i}"])
+        )
+
+
+def test_get_user_memories_queries_instead_of_scanning(dynamo_db, monkeypatch):
+    _store_memories(dynamo_db, 4)
+    _store_memories(dynamo_db, 2, user_id="user_2")
+    monkeypatch.setattr(dynamo_db.client, "scan", _fail_scan)
+
+    memories, total_count = dynamo_db.get_user_memories(user_id="user_1", deserialize=False)
+    assert total_count == 4
+
+    memories, total_count = dynamo_db.get_user_memories(limit=2, page=2, sort_order="asc", deserialize=False)
+    assert total_count == 6
+    assert [m["memory_id"] for m in memories] == ["user_1_memory_2", "user_1_memory_3"]
+
+    assert [m.memory_id for m in dynamo_db.get_user_memories(topics=["topic_1"])] == [
+        "user_1_memory_1",
+        "user_2_memory_1",
+    ]
+    assert [m.memory_id for m in dynamo_db.get_user_memories(search_content="Memory 3")] == ["user_1_memory_3"]
+    assert sorted(dynamo_db.get_all_memory_topics()) == ["topic_0", "topic_1", "topic_2", "topic_3"]
+
+
+def test_get_user_memory_stats(dynamo_db, monkeypatch):
+    _store_memories(dynamo_db, 3)
+    _store_memories(dynamo_db, 1, user_id="user_2")
+    monkeypatch.setattr(dynamo_db.client, "scan", _fail_scan)
+
+    stats, total_count = dynamo_db.get_user_memory_stats()
+    assert total_count == 2
+    assert {s["user_id"]: s["total_memories"] for s in stats} == {"user_1": 3, "user_2": 1}
+
+    stats, total_count = dynamo_db.get_user_memory_stats(user_id="user_1")
+    assert total_count == 1
+    assert stats[0]["total_memories"] == 3
+    assert stats[0]["last_memory_updated_at"] is not None
+
+    assert dynamo_db.get_user_memory_stats(user_id="unknown") == ([], 0)
+
+
+def test_get_knowledge_contents_fetches_only_the_requested_page(dynamo_db, monkeypatch):
+    for i in range(5):
+        dynamo_db.upsert_knowledge_content(
+            KnowledgeRow(id=f"content_{i}", name=f"Content {i}", description="", created_at=1000 + i)
+        )
+    monkeypatch.setattr(dynamo_db.client, "scan", _fail_scan)
+
+    fetched_keys = []
+    batch_get_item = dynamo_db.client.batch_get_item
+
+    def record_batch_get_item(RequestItems):
+        fetched_keys.extend(key["id"]["S"] for table in RequestItems.values() for key in table["Keys"])
+        return batch_get_item(RequestItems=RequestItems)
+
+    monkeypatch.setattr(dynamo_db.client, "batch_get_item", record_batch_get_item)
+
+    rows, total_count = dynamo_db.get_knowledge_contents(limit=2, page=1, sort_by="created_at", sort_order="desc")
+    assert total_count == 5
+    assert [row.id for row in rows] == ["content_4", "content_3"]
+    assert fetched_keys == ["content_4", "content_3"]
+
+
+def test_get_metrics_by_date_range(dynamo_db, monkeypatch):
+    table_name = dynamo_db._get_table("metrics")
+    for day in range(1, 4):
+        dynamo_db._create_new_metrics_record(
+            table_name,
+            {"id": f"metrics_{day}", "date": f"2025-01-0{day}", "aggregation_period": "daily", "completed": True},
+        )
+    monkeypatch.setattr(dynamo_db.client, "scan", _fail_scan)
+
+    metrics, total_count = dynamo_db.get_metrics(starting_date=date(2025, 1, 2))
+    assert total_count == 2
+    assert [m["date"] for m in metrics] == ["2025-01-02", "2025-01-03"]
+    assert all(TABLE_PARTITION_ATTRIBUTE not in m for m in metrics)
+
+    assert dynamo_db._get_metrics_calculation_starting_date() == date(2025, 1, 4)
+
+
+def test_get_user_memories_sorts_by_created_at_by_default(dynamo_db):
+    # Memories created last are updated first
+    for i in range(3):
+        dynamo_db.upsert_user_memory(
+            UserMemory(memory_id=f"memory_{i}", memory=f"Memory {i}", user_id="user_1", created_at=1000 - i)
+        )
+
+    assert [m.memory_id for m in dynamo_db.get_user_memories()] == ["memory_2", "memory_1", "memory_0"]
+    assert [m.memory_id for m in dynamo_db.get_user_memories(user_id="user_1")] == [
+        "memory_2",
+        "memory_1",
+        "memory_0",
+    ]
+    assert [m.memory_id for m in dynamo_db.get_user_memories(sort_by="updated_at")] == [
+        "memory_0",
+        "memory_1",
+        "memory_2",
+    ]
+
+
+def _create_legacy_table(dynamo_client, table_name: str, key_attribute: str):
+    # Table created before the table-wide indexes existed
+    dynamo_client.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": key_attribute, "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": key_attribute, "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def test_reads_scan_tables_missing_the_table_wide_indexes(dynamo_client, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(dynamo_module, "log_warning", warnings.append)
+    _create_legacy_table(dynamo_client, "agno_memories", "memory_id")
+    _create_legacy_table(dynamo_client, "agno_metrics", "id")
+    _create_legacy_table(dynamo_client, "agno_knowledge", "id")
+    for i in range(3):
+        dynamo_client.put_item(
+            TableName="agno_memories",
+            Item={
+                "memory_id": {"S": f"legacy_{i}"},
+                "memory": {"S": f"Legacy memory {i}"},
+                "user_id": {"S": "user_1"},
+                "topics": {"L": [{"S": f"topic_{i}"}]},
+                "created_at": {"N": str(1000 - i)},
+                "updated_at": {"S": f"2025-01-0{i + 1}T00:00:00+00:00"},
+            },
+        )
+    for day in range(1, 4):
+        dynamo_client.put_item(
+            TableName="agno_metrics",
+            Item={"id": {"S": f"metrics_{day}"}, "date": {"S": f"2025-01-0{day}"}, "completed": {"BOOL": True}},
+        )
+
+    dynamo_db = DynamoDb(db_client=dynamo_client)
+    dynamo_db.upsert_knowledge_content(KnowledgeRow(id="content_1", name="Content 1", description=""))
+
+    memories, total_count = dynamo_db.get_user_memories(limit=2, page=1, deserialize=False)
+    assert total_count == 3
+    assert [m["memory_id"] for m in memories] == ["legacy_2", "legacy_1"]
+    assert [m.memory_id for m in dynamo_db.get_user_memories(search_content="memory 1")] == ["legacy_1"]
+    assert [m.memory_id for m in dynamo_db.get_user_memories(topics=["topic_0"])] == ["legacy_0"]
+    assert sorted(dynamo_db.get_all_memory_topics()) == ["topic_0", "topic_1", "topic_2"]
+    stats, _ = dynamo_db.get_user_memory_stats()
+    assert stats[0]["total_memories"] == 3
+
+    metrics, total_count = dynamo_db.get_metrics(starting_date=date(2025, 1, 2))
+    assert sorted(m["date"] for m in metrics) == ["2025-01-02", "2025-01-03"]
+    assert dynamo_db._get_metrics_calculation_starting_date() == date(2025, 1, 4)
+
+    rows, total_count = dynamo_db.get_knowledge_contents()
+    assert [row.id for row in rows] == ["content_1"]
+
+    # Each missing index is reported once, pointing to the migration
+    assert len(warnings) == 3
+    for index_name in (MEMORY_PARTITION_INDEX, METRICS_PARTITION_INDEX, KNOWLEDGE_PARTITION_INDEX):
+        assert any(index_name in warning and "migrate_indexes()" in warning for warning in warnings)
+
+    # Once migrated, the indexes are queried
+    dynamo_db.migrate_indexes(table_types=["memories"], poll_interval=0)
+    monkeypatch.setattr(dynamo_db.client, "scan", _fail_scan)
+    memories, total_count = dynamo_db.get_user_memories(deserialize=False)
+    assert [m["memory_id"] for m in memories] == ["legacy_2", "legacy_1", "legacy_0"]
+
+
+def test_batch_get_items_keeps_key_order(dynamo_db):
+    _store_memories(dynamo_db, 3)
+
+    items = batch_get_items(
+        dynamo_db.client,
+        dynamo_db.memory_table_name,
+        "memory_id",
+        ["user_1_memory_2", "missing", "user_1_memory_0", "user_1_memory_2"],
+    )
+    assert [item["memory_id"]["S"] for item in items] == ["user_1_memory_2", "user_1_memory_0"]
+
+
+def test_migrate_indexes_updates_existing_tables(dynamo_client):
+    # Memory table created before the table-wide index existed
+    dynamo_client.create_table(
+        TableName="agno_memories",
+        KeySchema=[{"AttributeName": "memory_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "memory_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    dynamo_client.put_item(
+        TableName="agno_memories",
+        Item={
+            "memory_id": {"S": "legacy"},
+            "memory": {"S": "Legacy memory"},
+            "user_id": {"S": "user_1"},
+            "updated_at": {"S": "2025-01-01T00:00:00+00:00"},
+        },
+    )
+
+    dynamo_db = DynamoDb(db_client=dynamo_client)
+    created_indexes = dynamo_db.migrate_indexes(table_types=["memories"], poll_interval=0)
+    assert MEMORY_PARTITION_INDEX in created_indexes["memories"]
+    assert "user_id-updated_at-index" in created_indexes["memories"]
+
+    # Nothing left to migrate
+    assert dynamo_db.migrate_indexes(table_types=["memories"], poll_interval=0) == {"memories": []}
+
+    memories, total_count = dynamo_db.get_user_memories(deserialize=False)
+    assert total_count == 1
+    assert memories[0]["memory_id"] == "legacy"
+
+
+def test_migrate_indexes_rejects_unknown_tables(dynamo_db):
+    with pytest.raises(ValueError):
+        dynamo_db.migrate_indexes(table_types=["unknown"])
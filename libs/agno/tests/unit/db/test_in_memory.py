@@ -0,0 +1,146 @@
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.in_memory.utils import InMemoryTable
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession, TeamSession
+
+
+def _store_sessions(db: InMemoryDb, count: int, user_id: str = "user_1", agent_id: str = "agent_1"):
+    for i in range(count):
+        db.upsert_session(
+            AgentSession(
+                session_id=f"{user_id}_session_{i}",
+                agent_id=agent_id,
+                user_id=user_id,
+                session_data={"session_name": f"Session {i}"},
+                created_at=1000 + i,
+            )
+        )
+
+
+def test_get_session_returns_independent_copies():
+    db = InMemoryDb()
+    db.upsert_session(AgentSession(session_id="session", agent_id="agent", session_data={"session_state": {"a": 1}}))
+
+    session = db.get_session(session_id="session", session_type=SessionType.AGENT)
+    session.session_data["session_state"]["a"] = 2  # type: ignore
+
+    stored = db.get_session(session_id="session", session_type=SessionType.AGENT)
+    assert stored.session_data["session_state"]["a"] == 1  # type: ignore
+
+
+def test_upsert_session_returns_copy_independent_of_store():
+    db = InMemoryDb()
+    result = db.upsert_session(AgentSession(session_id="session", session_data={"key": "value"}), deserialize=False)
+    result["session_data"]["key"] = "changed"  # type: ignore
+
+    stored = db.get_session(session_id="session", session_type=SessionType.AGENT, deserialize=False)
+    assert stored["session_data"]["key"] == "value"  # type: ignore
+
+
+def test_get_session_filters_by_user():
+    db = InMemoryDb()
+    _store_sessions(db, 1)
+
+    assert db.get_session(session_id="user_1_session_0", session_type=SessionType.AGENT, user_id="user_1") is not None
+    assert db.get_session(session_id="user_1_session_0", session_type=SessionType.AGENT, user_id="user_2") is None
+
+
+def test_get_sessions_filters_sorts_and_paginates():
+    db = InMemoryDb()
+    _store_sessions(db, 5)
+    _store_sessions(db, 3, user_id="user_2", agent_id="agent_2")
+    db.upsert_session(TeamSession(session_id="team_session", team_id="team", user_id="user_1"))
+
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT, user_id="user_1", sort_by="created_at", limit=2, page=2, deserialize=False
+    )
+    assert total_count == 5
+    # Sorting defaults to descending order
+    assert [s["session_id"] for s in sessions] == ["user_1_session_2", "user_1_session_1"]
+
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT,
+        component_id="agent_2",
+        sort_by="created_at",
+        sort_order="asc",
+        deserialize=False,
+    )
+    assert total_count == 3
+    assert [s["session_id"] for s in sessions] == ["user_2_session_0", "user_2_session_1", "user_2_session_2"]
+
+    team_sessions = db.get_sessions(session_type=SessionType.TEAM)
+    assert [s.session_id for s in team_sessions] == ["team_session"]
+
+
+def test_get_sessions_by_timestamp_and_name():
+    db = InMemoryDb()
+    _store_sessions(db, 5)
+
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT, start_timestamp=1001, end_timestamp=1002, deserialize=False
+    )
+    assert total_count == 2
+    assert [s["session_id"] for s in sessions] == ["user_1_session_1", "user_1_session_2"]
+
+    db.rename_session(session_id="user_1_session_4", session_type=SessionType.AGENT, session_name="Renamed")
+    renamed = db.get_sessions(session_type=SessionType.AGENT, session_name="renamed")
+    assert [s.session_id for s in renamed] == ["user_1_session_4"]
+
+
+def test_delete_sessions_updates_indexes():
+    db = InMemoryDb()
+    _store_sessions(db, 3)
+
+    assert db.delete_session("user_1_session_0") is True
+    assert db.delete_session("user_1_session_0") is False
+    db.delete_sessions(["user_1_session_1"])
+
+    sessions, total_count = db.get_sessions(session_type=SessionType.AGENT, user_id="user_1", deserialize=False)
+    assert total_count == 1
+    assert [s["session_id"] for s in sessions] == ["user_1_session_2"]
+
+
+def test_user_memories_are_indexed():
+    db = InMemoryDb()
+    for i in range(4):
+        db.upsert_user_memory(
+            UserMemory(memory_id=f"memory_{i}", memory=f"Memory {i}", user_id="user_1", topics=[f"topic_{i}"])
+        )
+    db.upsert_user_memory(UserMemory(memory_id="other", memory="Other memory", user_id="user_2"))
+
+    memories, total_count = db.get_user_memories(user_id="user_1", limit=3, deserialize=False)
+    assert total_count == 4
+    assert len(memories) == 3
+
+    assert [m.memory_id for m in db.get_user_memories(topics=["topic_2"])] == ["memory_2"]
+    assert [m.memory_id for m in db.get_user_memories(search_content="other")] == ["other"]
+    assert sorted(db.get_all_memory_topics()) == ["topic_0", "topic_1", "topic_2", "topic_3"]
+
+    db.delete_user_memory("memory_0", user_id="user_2")
+    assert db.get_user_memory("memory_0") is not None
+    db.delete_user_memory("memory_0", user_id="user_1")
+    assert db.get_user_memory("memory_0") is None
+
+    stats, total_count = db.get_user_memory_stats()
+    assert total_count == 2
+    assert {s["user_id"]: s["total_memories"] for s in stats} == {"user_1": 3, "user_2": 1}
+
+    db.clear_memories()
+    assert db.get_user_memories() == []
+
+
+def test_table_keeps_insertion_order_for_equal_sort_values():
+    table = InMemoryTable(hash_fields=["user_id"], sorted_fields=["updated_at"], get_fields=dict)
+    for record_id, updated_at in [("a", 1), ("b", 2), ("c", 2), ("d", 3)]:
+        table.put(record_id, {"id": record_id, "user_id": "user", "updated_at": updated_at})
+
+    records, _ = table.query(sort_by="updated_at", sort_order="desc")
+    assert [r["id"] for r in records] == ["d", "b", "c", "a"]
+
+    records, _ = table.query(conditions={"user_id": "user"}, sort_by="updated_at", sort_order="desc")
+    assert [r["id"] for r in records] == ["d", "b", "c", "a"]
+
+    table.put("b", {"id": "b", "user_id": "user", "updated_at": 4})
+    records, _ = table.query(sort_by="updated_at", sort_order="asc")
+    assert [r["id"] for r in records] == ["a", "c", "d", "b"]
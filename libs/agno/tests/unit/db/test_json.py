@@ -0,0 +1,186 @@
+import json
+import multiprocessing
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.json import JsonDb
+from agno.db.json.append_log import AppendLogTable
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession
+
+
+@pytest.fixture(params=[False, True], ids=["json", "append_log"])
+def json_db(request, tmp_path):
+    return JsonDb(db_path=str(tmp_path), append_log=request.param)
+
+
+def test_session_crud(json_db):
+    json_db.upsert_session(AgentSession(session_id="session_1", agent_id="agent", user_id="user", session_data={}))
+    json_db.upsert_session(AgentSession(session_id="session_2", agent_id="agent", user_id="user"))
+
+    session = json_db.get_session(session_id="session_1", session_type=SessionType.AGENT)
+    assert session is not None and session.session_id == "session_1"
+    assert json_db.get_session(session_id="session_1", session_type=SessionType.AGENT, user_id="other") is None
+
+    renamed = json_db.rename_session("session_1", SessionType.AGENT, "Renamed", deserialize=False)
+    assert renamed["session_data"]["session_name"] == "Renamed"
+
+    sessions, total_count = json_db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 2
+    assert [s["session_id"] for s in sessions] == ["session_1", "session_2"]
+
+    assert json_db.delete_session("session_1") is True
+    assert json_db.delete_session("session_1") is False
+    assert json_db.get_session(session_id="session_1", session_type=SessionType.AGENT) is None
+
+
+def test_memory_crud(json_db):
+    json_db.upsert_user_memory(UserMemory(memory_id="memory_1", memory="First", user_id="user"))
+    json_db.upsert_user_memory(UserMemory(memory_id="memory_2", memory="Second", user_id="user"))
+    json_db.upsert_user_memory(UserMemory(memory_id="memory_1", memory="First, updated", user_id="user"))
+
+    assert json_db.get_user_memory("memory_1").memory == "First, updated"
+
+    json_db.delete_user_memory("memory_1", user_id="other")
+    assert json_db.get_user_memory("memory_1") is not None
+
+    json_db.delete_user_memories(["memory_1", "memory_2"], user_id="user")
+    assert json_db.get_user_memories() == []
+
+
+def test_append_log_only_appends_on_upsert(tmp_path):
+    db = JsonDb(db_path=str(tmp_path), append_log=True)
+    for i in range(3):
+        db.upsert_session(AgentSession(session_id=f"session_{i}", agent_id="agent"))
+    db.upsert_session(AgentSession(session_id="session_0", agent_id="agent", session_data={"key": "value"}))
+
+    lines = (tmp_path / f"{db.session_table_name}.jsonl").read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1])["key"] == "session_0"
+
+    # A new instance rebuilds its index from the log
+    reopened = JsonDb(db_path=str(tmp_path), append_log=True)
+    session = reopened.get_session(session_id="session_0", session_type=SessionType.AGENT)
+    assert session.session_data == {"key": "value"}
+
+
+def test_append_log_sees_writes_of_other_instances(tmp_path):
+    first_db = JsonDb(db_path=str(tmp_path), append_log=True)
+    second_db = JsonDb(db_path=str(tmp_path), append_log=True)
+
+    first_db.upsert_session(AgentSession(session_id="session_1", agent_id="agent"))
+    second_db.upsert_session(AgentSession(session_id="session_2", agent_id="agent"))
+    first_db.delete_session("session_2")
+
+    sessions, total_count = second_db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 1
+    assert sessions[0]["session_id"] == "session_1"
+
+
+def test_append_log_imports_existing_json_file(tmp_path):
+    JsonDb(db_path=str(tmp_path)).upsert_session(AgentSession(session_id="legacy", agent_id="agent"))
+
+    db = JsonDb(db_path=str(tmp_path), append_log=True)
+    assert db.get_session(session_id="legacy", session_type=SessionType.AGENT) is not None
+
+
+def test_compaction_keeps_live_records(tmp_path):
+    table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id", min_compaction_entries=10)
+    for i in range(30):
+        table.put([{"id": f"record_{i % 3}", "value": i}])
+    table.delete(["record_0"])
+
+    # Compaction is triggered once the log holds more than twice as many entries as live records
+    assert len((tmp_path / "table.jsonl").read_text().splitlines()) < 10
+    assert table.read_all() == [{"id": "record_1", "value": 28}, {"id": "record_2", "value": 29}]
+
+    # Instances indexed before the compaction rebuild their index
+    other_table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id")
+    assert other_table.get("record_2") == {"id": "record_2", "value": 29}
+    table.compact()
+    assert other_table.get("record_2") == {"id": "record_2", "value": 29}
+    assert len(other_table) == 2
+
+
+def test_partial_line_is_ignored_and_dropped_on_next_write(tmp_path):
+    table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id")
+    table.put([{"id": "record_1"}])
+    with open(tmp_path / "table.jsonl", "ab") as f:
+        f.write(b'{"op": "put", "key": "record_2"')
+
+    other_table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id")
+    assert other_table.read_all() == [{"id": "record_1"}]
+
+    other_table.put([{"id": "record_3"}])
+    assert [r["id"] for r in AppendLogTable(path=tmp_path / "table.jsonl", key_field="id").read_all()] == [
+        "record_1",
+        "record_3",
+    ]
+
+
+def _put_records(path, worker: int, count: int):
+    table = AppendLogTable(path=path, key_field="id", min_compaction_entries=20)
+    for i in range(count):
+        table.put([{"id": f"{worker}_{i}"}])
+        table.put([{"id": f"{worker}_{i}", "updated": True}])
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork")
+def test_concurrent_processes_do_not_lose_updates(tmp_path):
+    path = tmp_path / "table.jsonl"
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_put_records, args=(path, worker, 25)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    records = AppendLogTable(path=path, key_field="id").read_all()
+    assert len(records) == 100
+    assert all(record.get("updated") for record in records)
+
+
+def _increment_counter(path, count: int):
+    table = AppendLogTable(path=path, key_field="id", min_compaction_entries=20)
+    for _ in range(count):
+        table.update("counter", lambda record: {"value": (record or {"value": 0})["value"] + 1})
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork")
+def test_concurrent_read_modify_writes_do_not_lose_updates(tmp_path):
+    path = tmp_path / "table.jsonl"
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_increment_counter, args=(path, 25)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert AppendLogTable(path=path, key_field="id").get("counter") == {"value": 100, "id": "counter"}
+
+
+def test_update_leaves_table_unchanged_when_update_returns_none(tmp_path):
+    table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id")
+
+    assert table.update("missing", lambda record: None) is None
+    assert len(table) == 0
+
+
+def test_import_does_not_overwrite_an_existing_log(tmp_path):
+    table = AppendLogTable(path=tmp_path / "table.jsonl", key_field="id")
+    assert table.import_records(lambda: [{"id": "imported"}]) is True
+
+    table.put([{"id": "appended"}])
+    assert table.import_records(lambda: [{"id": "imported_again"}]) is False
+    assert [record["id"] for record in table.read_all()] == ["imported", "appended"]
+
+
+def test_json_file_keeps_sessions_of_different_components_with_the_same_id(tmp_path):
+    db = JsonDb(db_path=str(tmp_path))
+    db.upsert_session(AgentSession(session_id="shared", agent_id="agent_1"))
+    db.upsert_session(AgentSession(session_id="shared", agent_id="agent_2"))
+
+    sessions, total_count = db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 2
+    assert sorted(s["agent_id"] for s in sessions) == ["agent_1", "agent_2"]
@@ -0,0 +1,156 @@
+import json
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.db.postgres.schemas import get_table_schema_definition as get_postgres_table_schema_definition
+from agno.db.schemas.messages import IndexedMessagePair
+from agno.db.sqlite import SqliteDb
+from agno.db.utils import get_search_terms
+from agno.models.message import Message
+from agno.models.mock import MockModel
+from agno.run.agent import RunOutput
+from agno.utils.agent import get_indexed_message_pairs
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+    db._get_table(table_type="sessions", create_table_if_not_found=True)
+    return db
+
+
+def _pair(id: str, content: str, session_id: str = "session_1", user_id: str = "user_1", created_at: int = 1):
+    return IndexedMessagePair(
+        id=id,
+        session_id=session_id,
+        user_id=user_id,
+        user_message={"role": "user", "content": content},
+        assistant_message={"role": "assistant", "content": "Noted"},
+        content=content,
+        created_at=created_at,
+    )
+
+
+def test_get_search_terms():
+    assert get_search_terms('Trip to "Paris"? trip OR paris!') == ["trip", "to", "paris", "or"]
+
+
+def test_sqlite_search_by_relevance(sqlite_db):
+    sqlite_db.upsert_indexed_messages(
+        [
+            _pair("1", "I am planning a trip to Paris", created_at=1),
+            _pair("2", "Paris has great museums, the trip was fun", created_at=2),
+            _pair("3", "A recipe for pasta", created_at=3),
+        ]
+    )
+
+    results = sqlite_db.search_indexed_messages(query="paris trips", user_id="user_1")
+
+    assert {pair.id for pair in results} == {"1", "2"}
+    assert results[0].user_message == {"role": "user", "content": results[0].content}
+
+
+def test_sqlite_search_most_recent_without_query(sqlite_db):
+    sqlite_db.upsert_indexed_messages([_pair(str(i), f"Message {i}", created_at=i) for i in range(5)])
+    sqlite_db.upsert_indexed_messages([_pair("other", "Message of another user", user_id="user_2", created_at=10)])
+
+    results = sqlite_db.search_indexed_messages(user_id="user_1", limit=2)
+
+    assert [pair.id for pair in results] == ["4", "3"]
+
+
+def test_sqlite_upsert_replaces_pairs(sqlite_db):
+    sqlite_db.upsert_indexed_messages([_pair("1", "Talking about cats")])
+    sqlite_db.upsert_indexed_messages([_pair("1", "Talking about dogs")])
+
+    assert sqlite_db.search_indexed_messages(query="cats") == []
+    assert [pair.content for pair in sqlite_db.search_indexed_messages(query="dogs")] == ["Talking about dogs"]
+
+
+def test_sqlite_delete_session_removes_indexed_messages(sqlite_db):
+    sqlite_db.upsert_indexed_messages(
+        [_pair("1", "Hiking in the Alps", session_id="session_1"), _pair("2", "Hiking boots", session_id="session_2")]
+    )
+
+    sqlite_db.delete_sessions(["session_1"])
+
+    assert [pair.id for pair in sqlite_db.search_indexed_messages(query="hiking")] == ["2"]
+
+
+def test_sqlite_search_without_fts(sqlite_db):
+    sqlite_db._message_index_fts = False
+    sqlite_db.upsert_indexed_messages([_pair("1", "Learning 100% of Python"), _pair("2", "Learning Rust")])
+
+    assert [pair.id for pair in sqlite_db.search_indexed_messages(query="python")] == ["1"]
+
+
+def test_postgres_message_index_schema():
+    schema = get_postgres_table_schema_definition("message_index")
+
+    assert {"id", "session_id", "user_id", "content", "created_at"} <= set(schema)
+
+
+def test_get_indexed_message_pairs():
+    run_response = RunOutput(
+        run_id="run_1",
+        session_id="session_1",
+        user_id="user_1",
+        agent_id="agent_1",
+        messages=[
+            Message(role="system", content="You are helpful"),
+            Message(role="user", content="Old question", from_history=True),
+            Message(role="assistant", content="Old answer", from_history=True),
+            Message(role="user", content="What is 2 + 2?"),
+            Message(role="assistant", tool_calls=[{"id": "call", "type": "function", "function": {"name": "add"}}]),
+            Message(role="tool", content="4"),
+            Message(role="assistant", content="It is 4"),
+        ],
+    )
+
+    pairs = get_indexed_message_pairs(run_response)
+
+    assert len(pairs) == 1
+    assert pairs[0].content == "What is 2 + 2?\nIt is 4"
+    assert pairs[0].session_id == "session_1"
+    assert pairs[0].user_id == "user_1"
+    assert pairs[0].assistant_message["content"] == "It is 4"
+
+
+def _get_agent(db) -> Agent:
+    return Agent(
+        model=MockModel(response_content=lambda messages: f"Answer: {messages[-1].content}"),
+        db=db,
+        search_session_history=True,
+        telemetry=False,
+    )
+
+
+def test_previous_sessions_tool_searches_the_index(sqlite_db):
+    agent = _get_agent(sqlite_db)
+    agent.run("Plan a trip to Paris", session_id="session_1", user_id="user_1")
+    agent.run("Share a pasta recipe", session_id="session_2", user_id="user_1")
+    agent.run("Plan a trip to Rome", session_id="session_3", user_id="user_2")
+
+    get_previous_session_messages = agent._get_previous_sessions_messages_function(user_id="user_1")
+
+    found = json.loads(get_previous_session_messages(query="paris"))
+    assert [message["content"] for message in found] == ["Plan a trip to Paris", "Answer: Plan a trip to Paris"]
+    recent = json.loads(get_previous_session_messages())
+    assert {message["content"] for message in recent if message["role"] == "user"} == {
+        "Plan a trip to Paris",
+        "Share a pasta recipe",
+    }
+    assert get_previous_session_messages(query="quantum physics") == "No history found"
+
+
+@pytest.mark.asyncio
+async def test_previous_sessions_tool_reads_sessions_without_index():
+    agent = _get_agent(InMemoryDb())
+    await agent.arun("Plan a trip to Paris", session_id="session_1", user_id="user_1")
+
+    function = await agent._aget_previous_sessions_messages_function(user_id="user_1")
+    result = await function.entrypoint(query="paris")  # type: ignore[misc]
+
+    assert "Plan a trip to Paris" in result
@@ -0,0 +1,198 @@
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agno.db.base import SessionType  # noqa: E402
+from agno.db.redis import RedisDb  # noqa: E402
+from agno.db.redis.utils import generate_redis_key, serialize_data  # noqa: E402
+from agno.db.schemas.memory import UserMemory  # noqa: E402
+from agno.session import AgentSession, TeamSession  # noqa: E402
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def redis_db(redis_client):
+    return RedisDb(redis_client=redis_client, db_prefix="test")
+
+
+def _store_sessions(redis_db, count: int, user_id: str = "user_1", agent_id: str = "agent_1"):
+    for i in range(count):
+        redis_db.upsert_session(
+            AgentSession(
+                session_id=f"{user_id}_session_{i}",
+                agent_id=agent_id,
+                user_id=user_id,
+                session_data={},
+                created_at=1000 + i,
+            )
+        )
+
+
+def test_get_sessions_does_not_scan_keyspace(redis_db, redis_client, monkeypatch):
+    _store_sessions(redis_db, 3)
+    redis_db.get_sessions(session_type=SessionType.AGENT)
+
+    def fail_scan(*args, **kwargs):
+        raise AssertionError("scan_iter should not be called once the indexes are built")
+
+    monkeypatch.setattr(redis_client, "scan_iter", fail_scan)
+
+    sessions = redis_db.get_sessions(session_type=SessionType.AGENT, user_id="user_1")
+    assert len(sessions) == 3
+
+
+def test_get_sessions_sorted_and_paginated(redis_db):
+    _store_sessions(redis_db, 5)
+    _store_sessions(redis_db, 2, user_id="user_2")
+
+    sessions, total_count = redis_db.get_sessions(
+        session_type=SessionType.AGENT,
+        user_id="user_1",
+        sort_by="created_at",
+        sort_order="desc",
+        limit=2,
+        page=2,
+        deserialize=False,
+    )
+
+    assert total_count == 5
+    assert [s["session_id"] for s in sessions] == ["user_1_session_2", "user_1_session_1"]
+
+
+def test_get_sessions_without_sort_field_in_insertion_order(redis_db):
+    _store_sessions(redis_db, 3)
+
+    sessions = redis_db.get_sessions(session_type=SessionType.AGENT, sort_order="desc", deserialize=False)[0]
+
+    assert [s["session_id"] for s in sessions] == [f"user_1_session_{i}" for i in range(3)]
+
+
+def test_get_sessions_filters_by_component_and_type(redis_db):
+    _store_sessions(redis_db, 2, agent_id="agent_1")
+    _store_sessions(redis_db, 1, user_id="user_2", agent_id="agent_2")
+    redis_db.upsert_session(TeamSession(session_id="team_session", team_id="team_1", user_id="user_1"))
+
+    agent_sessions = redis_db.get_sessions(session_type=SessionType.AGENT, component_id="agent_2")
+    team_sessions = redis_db.get_sessions(session_type=SessionType.TEAM, user_id="user_1")
+
+    assert [s.session_id for s in agent_sessions] == ["user_2_session_0"]
+    assert [s.session_id for s in team_sessions] == ["team_session"]
+
+
+def test_get_sessions_by_timestamp_and_name(redis_db):
+    _store_sessions(redis_db, 5)
+    redis_db.rename_session("user_1_session_3", SessionType.AGENT, "Renamed session")
+
+    sessions, total_count = redis_db.get_sessions(
+        session_type=SessionType.AGENT, start_timestamp=1001, end_timestamp=1003, deserialize=False
+    )
+    assert total_count == 3
+    assert [s["session_id"] for s in sessions] == ["user_1_session_1", "user_1_session_2", "user_1_session_3"]
+
+    renamed = redis_db.get_sessions(session_type=SessionType.AGENT, session_name="renamed")
+    assert [s.session_id for s in renamed] == ["user_1_session_3"]
+
+
+def test_upsert_moves_record_between_indexes(redis_db):
+    redis_db.upsert_session(AgentSession(session_id="session", agent_id="agent_1", user_id="user_1"))
+    redis_db.upsert_session(AgentSession(session_id="session", agent_id="agent_1", user_id="user_2"))
+
+    assert redis_db.get_sessions(session_type=SessionType.AGENT, user_id="user_1") == []
+    assert [s.session_id for s in redis_db.get_sessions(session_type=SessionType.AGENT, user_id="user_2")] == [
+        "session"
+    ]
+
+
+def test_delete_session_removes_index_entries(redis_db):
+    _store_sessions(redis_db, 2)
+    redis_db.delete_session("user_1_session_0")
+
+    sessions, total_count = redis_db.get_sessions(session_type=SessionType.AGENT, user_id="user_1", deserialize=False)
+    assert total_count == 1
+    assert [s["session_id"] for s in sessions] == ["user_1_session_1"]
+
+
+def test_existing_records_are_indexed_on_first_read(redis_client):
+    # Records stored before the indexes existed
+    now = int(time.time())
+    for i in range(3):
+        key = generate_redis_key(prefix="test", table_type="sessions", key_id=f"legacy_{i}")
+        redis_client.set(
+            key,
+            serialize_data(
+                {
+                    "session_id": f"legacy_{i}",
+                    "session_type": "agent",
+                    "agent_id": "agent_1",
+                    "user_id": "user_1",
+                    "created_at": now + i,
+                    "updated_at": now + i,
+                }
+            ),
+        )
+
+    redis_db = RedisDb(redis_client=redis_client, db_prefix="test")
+    sessions = redis_db.get_sessions(session_type=SessionType.AGENT, user_id="user_1", sort_by="created_at")
+    assert [s.session_id for s in sessions] == ["legacy_0", "legacy_1", "legacy_2"]
+
+
+def test_rebuild_indexes_drops_entries_of_deleted_records(redis_db, redis_client):
+    _store_sessions(redis_db, 3)
+    redis_db.get_sessions(session_type=SessionType.AGENT)
+
+    # Deleted without going through RedisDb
+    redis_client.delete(generate_redis_key(prefix="test", table_type="sessions", key_id="user_1_session_0"))
+    redis_db.rebuild_indexes()
+
+    _, total_count = redis_db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 2
+
+
+def test_rebuild_indexes_rejects_unindexed_tables(redis_db):
+    with pytest.raises(ValueError):
+        redis_db.rebuild_indexes(table_types=["metrics"])
+
+
+def test_get_user_memories_uses_indexes(redis_db):
+    for i in range(4):
+        redis_db.upsert_user_memory(
+            UserMemory(memory_id=f"memory_{i}", memory=f"Likes topic {i}", user_id="user_1", topics=[f"topic_{i}"])
+        )
+    redis_db.upsert_user_memory(UserMemory(memory_id="other", memory="Other user", user_id="user_2"))
+
+    memories, total_count = redis_db.get_user_memories(user_id="user_1", limit=3, deserialize=False)
+    assert total_count == 4
+    assert len(memories) == 3
+
+    by_topic = redis_db.get_user_memories(user_id="user_1", topics=["topic_2"])
+    assert [m.memory_id for m in by_topic] == ["memory_2"]
+
+    by_content = redis_db.get_user_memories(search_content="other")
+    assert [m.memory_id for m in by_content] == ["other"]
+
+
+def test_get_user_memory_stats_for_user(redis_db):
+    for i in range(3):
+        redis_db.upsert_user_memory(UserMemory(memory_id=f"memory_{i}", memory="memory", user_id="user_1"))
+
+    stats, total_count = redis_db.get_user_memory_stats(user_id="user_1")
+    assert total_count == 1
+    assert stats[0]["user_id"] == "user_1"
+    assert stats[0]["total_memories"] == 3
+    assert stats[0]["last_memory_updated_at"] > 0
+
+    assert redis_db.get_user_memory_stats(user_id="unknown") == ([], 0)
+
+
+def test_clear_memories_clears_indexes(redis_db):
+    redis_db.upsert_user_memory(UserMemory(memory_id="memory", memory="memory", user_id="user_1"))
+    redis_db.clear_memories()
+
+    assert redis_db.get_user_memories(user_id="user_1") == []
+    assert redis_db.get_user_memory_stats(user_id="user_1") == ([], 0)
@@ -0,0 +1,205 @@
+"""Unit tests for running eval iterations concurrently"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.agent import Agent
+from agno.eval.accuracy import AccuracyAgentResponse, AccuracyEval
+from agno.eval.agent_as_judge import AgentAsJudgeEval, BinaryJudgeResponse
+from agno.eval.utils import arun_iterations, run_iterations
+from agno.models.openai import OpenAIChat
+from agno.run.agent import RunOutput
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def __exit__(self, *args):
+        with self._lock:
+            self.running -= 1
+
+
+def test_run_iterations_keeps_order_and_bounds_concurrency():
+    tracker = ConcurrencyTracker()
+
+    def iteration(i: int) -> int:
+        with tracker:
+            # Later iterations finish first
+            time.sleep(0.01 * (8 - i))
+            return i * 10
+
+    results = run_iterations(iteration, 8, concurrency=3)
+
+    assert results == [i * 10 for i in range(8)]
+    assert tracker.max_running == 3
+
+
+def test_run_iterations_sequential_in_calling_thread():
+    threads = []
+
+    def iteration(i: int) -> int:
+        threads.append(threading.current_thread())
+        return i
+
+    assert run_iterations(iteration, 3) == [0, 1, 2]
+    assert threads == [threading.current_thread()] * 3
+
+
+def test_run_iterations_timeout():
+    release = threading.Event()
+
+    def iteration(i: int) -> int:
+        if i == 1:
+            release.wait(5)
+        return i
+
+    start = time.monotonic()
+    results = run_iterations(iteration, 4, concurrency=2, timeout=0.1)
+    release.set()
+
+    assert results == [0, None, 2, 3]
+    assert time.monotonic() - start < 2
+
+
+def test_run_iterations_raises_errors():
+    def iteration(i: int) -> int:
+        if i == 2:
+            raise ValueError("iteration failed")
+        return i
+
+    with pytest.raises(ValueError, match="iteration failed"):
+        run_iterations(iteration, 4, concurrency=2)
+
+
+def test_run_iterations_invalid_concurrency():
+    with pytest.raises(ValueError):
+        run_iterations(lambda i: i, 2, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_arun_iterations_keeps_order_and_bounds_concurrency():
+    tracker = ConcurrencyTracker()
+
+    async def iteration(i: int) -> int:
+        with tracker:
+            await asyncio.sleep(0.01 * (8 - i))
+            return i * 10
+
+    results = await arun_iterations(iteration, 8, concurrency=3)
+
+    assert results == [i * 10 for i in range(8)]
+    assert tracker.max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_arun_iterations_timeout_cancels_iteration():
+    cancelled = []
+
+    async def iteration(i: int) -> int:
+        if i == 0:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+        return i
+
+    results = await arun_iterations(iteration, 3, concurrency=3, timeout=0.05)
+
+    assert results == [None, 1, 2]
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio
+async def test_arun_iterations_error_cancels_other_iterations():
+    cancelled = []
+
+    async def iteration(i: int) -> int:
+        if i == 0:
+            raise ValueError("iteration failed")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return i
+
+    with pytest.raises(ValueError, match="iteration failed"):
+        await arun_iterations(iteration, 3, concurrency=3)
+    await asyncio.sleep(0)
+
+    assert sorted(cancelled) == [1, 2]
+
+
+def _get_accuracy_eval(num_iterations: int, concurrency: int) -> AccuracyEval:
+    agent = Agent(model=OpenAIChat(id="gpt-4o"))
+
+    def run_agent(input, session_id, stream):
+        # Iterations finish in reverse order
+        iteration = int(session_id.rsplit("_", 1)[1])
+        time.sleep(0.01 * (num_iterations - iteration))
+        return RunOutput(content=f"answer {iteration}")
+
+    agent.run = MagicMock(side_effect=run_agent)  # type: ignore[method-assign]
+
+    evaluator = Agent(model=OpenAIChat(id="gpt-4o"))
+
+    def run_evaluator(evaluation_input, stream):
+        score = int(evaluation_input.split("answer ")[1][0])
+        return RunOutput(content=AccuracyAgentResponse(accuracy_score=score, accuracy_reason="Mocked"))
+
+    evaluator.run = MagicMock(side_effect=run_evaluator)  # type: ignore[method-assign]
+
+    return AccuracyEval(
+        input="What is 2 + 2?",
+        expected_output="4",
+        agent=agent,
+        evaluator_agent=evaluator,
+        num_iterations=num_iterations,
+        concurrency=concurrency,
+        telemetry=False,
+    )
+
+
+def test_accuracy_eval_concurrent_iterations():
+    accuracy_eval = _get_accuracy_eval(num_iterations=5, concurrency=5)
+
+    result = accuracy_eval.run(print_summary=False, print_results=False)
+
+    assert result is not None
+    assert [r.score for r in result.results] == [1, 2, 3, 4, 5]
+    assert [r.output for r in result.results] == [f"answer {i}" for i in range(1, 6)]
+    assert result.avg_score == 3
+
+
+def test_agent_as_judge_concurrent_batch():
+    judge_eval = AgentAsJudgeEval(criteria="Must be polite", concurrency=4, telemetry=False)
+    evaluator = judge_eval.get_evaluator_agent()
+    evaluator.model = MagicMock()
+
+    def run_evaluator(prompt, stream):
+        passed = "Thanks" in prompt
+        time.sleep(0.01)
+        return RunOutput(content=BinaryJudgeResponse(passed=passed, reason="Mocked"))
+
+    evaluator.run = MagicMock(side_effect=run_evaluator)  # type: ignore[method-assign]
+    judge_eval.evaluator_agent = evaluator
+
+    cases = [{"input": f"Question {i}", "output": "Thanks!" if i % 2 == 0 else "No."} for i in range(6)]
+    result = judge_eval.run(cases=cases, print_summary=False)
+
+    assert result is not None
+    assert [r.input for r in result.results] == [f"Question {i}" for i in range(6)]
+    assert [r.passed for r in result.results] == [True, False, True, False, True, False]
@@ -0,0 +1,108 @@
+"""Unit tests for the load test harness"""
+
+import json
+
+import pytest
+
+from agno.agent import Agent
+from agno.eval.load import LoadEval, LoadResult
+from agno.models.mock import MockModel
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def _get_agent(**model_kwargs) -> Agent:
+    return Agent(model=MockModel(**model_kwargs), tools=[add], telemetry=False)
+
+
+def test_load_result_stats():
+    result = LoadResult(
+        config={"concurrency": 2},
+        duration=2.0,
+        latencies=[float(i) for i in range(1, 101)],
+        phase_times={"model": [1.0, 3.0]},
+        num_errors=2,
+    )
+
+    assert result.num_runs == 102
+    assert result.throughput == 50
+    assert result.p50_latency == 50
+    assert result.p95_latency == 95
+    assert result.p99_latency == 99
+    assert result.max_latency == 100
+    assert result.p50_time_to_first_token is None
+    assert result.avg_phase_times == {"model": 2.0}
+
+
+def test_load_eval_concurrent_runs():
+    agent = _get_agent(latency=0.05, tool_calls=[{"name": "add", "arguments": {"a": 1, "b": 2}}])
+
+    result = LoadEval(agent=agent, num_runs=8, concurrency=4).run()
+
+    assert result.num_runs == 8
+    assert result.num_errors == 0
+    # Two model requests of 50ms per run: 4 runs at a time finish 8 runs in well under 8 * 100ms
+    assert result.duration < 0.6
+    assert result.throughput > 8 / 0.6
+    assert result.p50_latency >= 0.1
+    assert result.p50_latency <= result.p95_latency <= result.p99_latency <= result.max_latency
+    assert all(model_time >= 0.1 for model_time in result.phase_times["model"])
+    assert len(result.phase_times["tools"]) == 8
+    assert result.config["concurrency"] == 4
+    assert result.config["model_provider"] == "Mock"
+
+
+def test_load_eval_stream_time_to_first_token():
+    agent = _get_agent(latency=0.05, tokens_per_second=100, tokens_per_chunk=2)
+
+    result = LoadEval(agent=agent, num_runs=4, concurrency=2, stream=True).run()
+
+    assert result.num_errors == 0
+    assert len(result.times_to_first_token) == 4
+    assert result.p50_time_to_first_token is not None
+    assert 0.05 <= result.p50_time_to_first_token < result.p50_latency
+
+
+def test_load_eval_counts_errors():
+    def respond(messages) -> str:
+        if "fail" in messages[-1].content:
+            raise RuntimeError("mock failure")
+        return "ok"
+
+    agent = _get_agent(response_content=respond)
+
+    result = LoadEval(agent=agent, input=lambda i: "fail" if i % 2 else "hello", num_runs=6, concurrency=3).run()
+
+    assert result.num_runs == 6
+    assert result.num_errors == 3
+    assert len(result.latencies) == 3
+
+
+def test_load_eval_saves_results(tmp_path):
+    file_path = str(tmp_path / "{name}.json")
+
+    LoadEval(agent=_get_agent(), name="load", num_runs=2, concurrency=2, file_path_to_save_results=file_path).run()
+
+    saved = json.loads((tmp_path / "load.json").read_text())
+    assert saved["num_runs"] == 2
+    assert len(saved["latencies"]) == 2
+
+
+def test_load_eval_requires_one_component():
+    with pytest.raises(ValueError):
+        LoadEval().run()
+
+
+@pytest.mark.asyncio
+async def test_load_eval_async_runs_share_sessions():
+    agent = _get_agent(latency=0.02)
+
+    load_eval = LoadEval(agent=agent, num_runs=6, concurrency=3, num_sessions=2)
+    result = await load_eval.arun()
+
+    assert result.num_errors == 0
+    assert result.num_runs == 6
+    assert len(result.phase_times["model"]) == 6
@@ -605,3 +605,143 @@ def test_symlinks_are_handled(tmp_path):
     except OSError:
         # Symlinks might not be supported on all systems
         pytest.skip("Symlinks not supported on this system")
+
+
+# Trigram index tests
+
+
+@pytest.fixture
+def indexed_knowledge(tmp_path):
+    """FileSystemKnowledge over a small tree, with its index stored outside of it."""
+    base_dir = tmp_path / "docs"
+    (base_dir / "src").mkdir(parents=True)
+    (base_dir / "src" / "main.py").write_text("def main():\n    print('Hello')\n")
+    (base_dir / "src" / "utils.py").write_text("def helper():\n    return 42\n")
+    (base_dir / "README.md").write_text("# Project\nRun main to start.\n")
+
+    fs_knowledge = FileSystemKnowledge(
+        base_dir=str(base_dir),
+        use_index=True,
+        index_path=str(tmp_path / "index.db"),
+        index_full_refresh_interval=3600,
+    )
+    yield fs_knowledge
+    fs_knowledge._index.close()
+
+
+def test_get_query_trigrams():
+    """Test that only the literals every match must contain are turned into trigrams."""
+    from agno.knowledge.trigram_index import extract_trigrams, get_query_trigrams
+
+    assert get_query_trigrams("Hello") == [extract_trigrams("hello")]
+    assert get_query_trigrams(r"def \w+\(") == [extract_trigrams("def ")]
+    assert get_query_trigrams("foo|barbaz") == [extract_trigrams("foo"), extract_trigrams("barbaz")]
+    assert get_query_trigrams("(abc)+xyz") == [extract_trigrams("abc") | extract_trigrams("xyz")]
+
+    # Optional parts and short literals don't narrow the search
+    assert get_query_trigrams("ab") is None
+    assert get_query_trigrams("(abc)?") is None
+    assert get_query_trigrams("foo|b") is None
+
+
+def test_grep_with_index_matches_grep_without_index(indexed_knowledge):
+    """Test that indexed searches find the same files as full scans."""
+    unindexed_knowledge = FileSystemKnowledge(base_dir=indexed_knowledge.base_dir)
+
+    for query in ["main", "HELLO", r"def \w+", "return|print", "[0-9]+", "not present anywhere", "("]:
+        indexed = sorted(doc.name for doc in indexed_knowledge._grep(query))
+        unindexed = sorted(doc.name for doc in unindexed_knowledge._grep(query))
+        assert indexed == unindexed, query
+
+
+def test_grep_with_index_finds_letters_matching_ascii_letters(indexed_knowledge):
+    """Test that the index keeps the trigrams of letters like İ and ı, which case-insensitive regexes match."""
+    (indexed_knowledge.base_path / "turkish.txt").write_text("İstanbul ıs here, 5 \u212aelvin\n", encoding="utf-8")
+    unindexed_knowledge = FileSystemKnowledge(base_dir=indexed_knowledge.base_dir)
+
+    for query in ["istanbul", "is here", "5 kelvin"]:
+        indexed = [doc.name for doc in indexed_knowledge._grep(query)]
+        assert indexed == [doc.name for doc in unindexed_knowledge._grep(query)] == ["turkish.txt"], query
+
+
+def test_grep_with_index_only_reads_candidate_files(indexed_knowledge, monkeypatch):
+    """Test that files without the query trigrams are not read."""
+    indexed_knowledge._index.refresh()
+
+    read_files = []
+    read_text = Path.read_text
+
+    def record_read_text(self, *args, **kwargs):
+        read_files.append(self.name)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", record_read_text)
+
+    docs = indexed_knowledge._grep("helper")
+    assert [doc.name for doc in docs] == ["src/utils.py"]
+    assert read_files == ["utils.py"]
+
+
+def test_index_picks_up_added_changed_and_removed_files(indexed_knowledge):
+    """Test that the index is refreshed incrementally between searches."""
+    base_path = indexed_knowledge.base_path
+    assert indexed_knowledge._grep("needle") == []
+
+    # Added file, in a new directory
+    (base_path / "new").mkdir()
+    (base_path / "new" / "found.txt").write_text("a needle in a haystack")
+    assert [doc.name for doc in indexed_knowledge._grep("needle")] == ["new/found.txt"]
+
+    # Removed directory
+    (base_path / "new" / "found.txt").unlink()
+    (base_path / "new").rmdir()
+    assert indexed_knowledge._grep("needle") == []
+    assert "new/found.txt" not in indexed_knowledge._index.list_files()
+
+    # Renamed file
+    (base_path / "README.md").rename(base_path / "GUIDE.md")
+    assert [doc.name for doc in indexed_knowledge._list_files("*.md")] == ["GUIDE.md"]
+
+
+def test_index_catches_files_edited_in_place(indexed_knowledge):
+    """Test that the periodic full refresh catches files edited without changing their directory."""
+    indexed_knowledge._index.refresh()
+    (indexed_knowledge.base_path / "src" / "utils.py").write_text("def helper():\n    return 'needle'\n")
+
+    indexed_knowledge._index.full_refresh_interval = 0
+    assert [doc.name for doc in indexed_knowledge._grep("needle")] == ["src/utils.py"]
+
+
+def test_index_is_reused_across_instances(indexed_knowledge, tmp_path):
+    """Test that a new instance reuses the index on disk."""
+    indexed_knowledge._index.refresh()
+    reopened = FileSystemKnowledge(
+        base_dir=indexed_knowledge.base_dir, use_index=True, index_path=str(tmp_path / "index.db")
+    )
+    assert reopened._index.list_files() == ["README.md", "src/main.py", "src/utils.py"]
+
+    # Changing the include patterns rebuilds the index
+    filtered = FileSystemKnowledge(
+        base_dir=indexed_knowledge.base_dir,
+        use_index=True,
+        index_path=str(tmp_path / "index.db"),
+        include_patterns=["*.md"],
+    )
+    assert [doc.name for doc in filtered._list_files("*")] == ["README.md"]
+
+
+def test_index_merges_delta_into_base_segment(indexed_knowledge):
+    """Test that merging the delta keeps re-indexed and removed files out of the base segment."""
+    index = indexed_knowledge._index
+    index.merge_threshold = 0
+    index.refresh()
+    assert index._connection.execute("SELECT COUNT(*) FROM delta_postings").fetchone()[0] == 0
+
+    base_path = indexed_knowledge.base_path
+    (base_path / "src" / "main.py").unlink()
+    (base_path / "src" / "utils.py").write_text("def renamed_helper():\n    return 42\n")
+    (base_path / "src" / "extra.py").write_text("def helper():\n    pass\n")
+
+    assert [doc.name for doc in indexed_knowledge._grep("def helper")] == ["src/extra.py"]
+    assert [doc.name for doc in indexed_knowledge._grep("renamed_helper")] == ["src/utils.py"]
+    assert indexed_knowledge._grep("print") == []
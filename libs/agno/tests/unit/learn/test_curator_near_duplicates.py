@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.learn import LearningMachine
+
+try:
+    from agno.db.sqlite import SqliteDb
+except ImportError:
+    SqliteDb = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(SqliteDb is None, reason="SqliteDb dependencies are not installed")
+
+
+@dataclass
+class TopicEmbedder(Embedder):
+    """Embeds texts by the topics they mention"""
+
+    dimensions: Optional[int] = 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float("coffee" in text or "espresso" in text), float("dog" in text)]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def make_learning(tmp_path):
+    def make(memories: List[str]) -> LearningMachine:
+        db_file = str(tmp_path / f"learning_{len(list(tmp_path.iterdir()))}.db")
+        learning = LearningMachine(db=SqliteDb(db_file=db_file), user_memory=True)
+        for memory in memories:
+            learning.stores["user_memory"].add_memory(user_id="alice", memory=memory)
+        return learning
+
+    return make
+
+
+def get_memories(learning: LearningMachine) -> List[str]:
+    return [memory["content"] for memory in learning.stores["user_memory"].get(user_id="alice").memories]
+
+
+def test_near_duplicates_are_merged(make_learning):
+    learning = make_learning(
+        [
+            "User works at Stripe as an engineer",
+            "User lives in Berlin",
+            "The user works at Stripe as an engineer.",
+            "User works at Stripe as engineer",
+        ]
+    )
+
+    removed = learning.curator.deduplicate_near(user_id="alice", threshold=0.6)
+
+    assert removed == 2
+    # The newest memory of the cluster is kept
+    assert get_memories(learning) == ["User lives in Berlin", "User works at Stripe as engineer"]
+
+
+def test_merge_policy_keeps_the_longest_memory(make_learning):
+    learning = make_learning(["User works at Stripe as an engineer", "User works at Stripe as engineer"])
+
+    learning.curator.deduplicate_near(user_id="alice", threshold=0.6, merge_policy="longest")
+
+    assert get_memories(learning) == ["User works at Stripe as an engineer"]
+
+
+def test_only_new_memories_are_compared(make_learning, monkeypatch):
+    learning = make_learning(["User lives in Berlin", "User has a dog named Rex"])
+    curator = learning.curator
+    assert curator.deduplicate_near(user_id="alice") == 0
+
+    signed = []
+    get_shingles = curator._get_shingles
+    monkeypatch.setattr(curator, "_get_shingles", lambda text: signed.append(text) or get_shingles(text))
+    learning.stores["user_memory"].add_memory(user_id="alice", memory="User lives in Berlin!")
+
+    assert curator.deduplicate_near(user_id="alice") == 1
+    assert signed == ["user lives in berlin"]
+    assert get_memories(learning) == ["User has a dog named Rex", "User lives in Berlin!"]
+
+
+def test_embeddings_find_paraphrases(make_learning):
+    memories = ["User drinks coffee every morning", "User owns a dog", "Starts each day with an espresso"]
+
+    assert make_learning(memories).curator.deduplicate_near(user_id="alice") == 0
+
+    learning = make_learning(memories)
+    learning.curator.embedder = TopicEmbedder()
+    assert learning.curator.deduplicate_near(user_id="alice") == 1
+    assert get_memories(learning) == ["User owns a dog", "Starts each day with an espresso"]
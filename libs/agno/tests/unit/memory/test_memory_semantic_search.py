@@ -0,0 +1,258 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.memory import MemoryManager, UserMemory
+from agno.vectordb.base import VectorDb
+
+try:
+    from agno.db.sqlite import SqliteDb
+except ImportError:
+    SqliteDb = None  # type: ignore
+
+VOCABULARY = ["basketball", "sports", "color", "blue", "name", "john", "pizza", "food"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds texts as counts of known keywords"""
+
+    dimensions: Optional[int] = len(VOCABULARY)
+    embedded: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.embedded.append(text)
+        words = text.lower().replace("'", " ").split()
+        return [float(sum(word.startswith(keyword) for word in words)) for keyword in VOCABULARY]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+class KeywordVectorDb(VectorDb):
+    """Keeps every inserted document, and ranks them by keyword similarity"""
+
+    def __init__(self):
+        super().__init__()
+        self.embedder = KeywordEmbedder()
+        self.documents: List[Document] = []
+
+    def _similarity(self, query: str, document: Document) -> float:
+        a, b = self.embedder.get_embedding(query), self.embedder.get_embedding(document.content)
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.documents.extend(documents)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Any] = None) -> List[Document]:
+        documents = [
+            document
+            for document in self.documents
+            if all(document.meta_data.get(key) == value for key, value in (filters or {}).items())
+        ]
+        documents.sort(key=lambda document: self._similarity(query, document), reverse=True)
+        return documents[:limit]
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return any(document.meta_data.get("memory_hash") == content_hash for document in self.documents)
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        count = len(self.documents)
+        self.documents = [
+            document
+            for document in self.documents
+            if any(document.meta_data.get(key) != value for key, value in metadata.items())
+        ]
+        return len(self.documents) < count
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    async def async_insert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    async def async_upsert(self, content_hash: str, documents: List[Document], filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    async def async_search(self, query: str, limit: int = 5, filters: Optional[Any] = None) -> List[Document]:
+        return self.search(query, limit, filters)
+
+    def drop(self) -> None:
+        self.documents = []
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.drop()
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return False
+
+    def delete_by_name(self, name: str) -> bool:
+        return False
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return False
+
+    def get_supported_search_types(self) -> List[str]:
+        return ["vector"]
+
+
+MEMORIES = [
+    ("The user's name is John", 100),
+    ("The user plays basketball and likes sports", 200),
+    ("The user's favorite color is blue", 300),
+    ("The user likes pizza and food from Italy", 400),
+]
+
+
+def add_memories(manager: MemoryManager):
+    for memory, updated_at in MEMORIES:
+        manager.add_user_memory(UserMemory(memory=memory, updated_at=updated_at), user_id="user_1")
+
+
+def test_semantic_search_returns_the_most_similar_memories():
+    embedder = KeywordEmbedder()
+    manager = MemoryManager(db=InMemoryDb(), embedder=embedder)
+    add_memories(manager)
+
+    # Memories are embedded as they are written
+    assert len(embedder.embedded) == 4
+
+    results = manager.search_user_memories(
+        query="what sports does the user play", retrieval_method="semantic", limit=1, user_id="user_1"
+    )
+    assert [memory.memory for memory in results] == ["The user plays basketball and likes sports"]
+    # Only the query is embedded when searching
+    assert len(embedder.embedded) == 5
+
+
+def test_recency_breaks_ties(monkeypatch):
+    manager = MemoryManager(db=InMemoryDb(), embedder=KeywordEmbedder(), recency_weight=0.5)
+    memories = [
+        UserMemory(memory=memory, memory_id=str(updated_at), user_id="user_1", updated_at=updated_at)
+        for memory, updated_at in MEMORIES
+    ]
+    monkeypatch.setattr(manager, "read_from_db", lambda user_id=None: {"user_1": memories})
+
+    results = manager.search_user_memories(query="unrelated", retrieval_method="semantic", user_id="user_1")
+
+    assert [memory.memory for memory in results] == [memory for memory, _ in reversed(MEMORIES)]
+
+
+def test_changed_and_deleted_memories_are_reindexed():
+    embedder = KeywordEmbedder()
+    manager = MemoryManager(db=InMemoryDb(), embedder=embedder)
+    add_memories(manager)
+    memories = {memory.memory: memory for memory in manager.get_user_memories(user_id="user_1")}
+
+    # Changes made directly in the db are picked up on the next search
+    blue = memories["The user's favorite color is blue"]
+    manager.db.upsert_user_memory(  # type: ignore
+        UserMemory(memory="The user eats pizza daily", memory_id=blue.memory_id, user_id="user_1")
+    )
+    manager.delete_user_memory(
+        memory_id=memories["The user likes pizza and food from Italy"].memory_id,  # type: ignore
+        user_id="user_1",
+    )
+
+    results = manager.search_user_memories(query="pizza", retrieval_method="semantic", limit=1, user_id="user_1")
+
+    assert [memory.memory for memory in results] == ["The user eats pizza daily"]
+    assert "The user eats pizza daily" in embedder.embedded
+
+
+def test_vector_db_only_keeps_the_current_version_of_memories():
+    vector_db = KeywordVectorDb()
+    manager = MemoryManager(db=InMemoryDb(), vector_db=vector_db)
+    add_memories(manager)
+    memories = {memory.memory: memory for memory in manager.get_user_memories(user_id="user_1")}
+
+    pizza = memories["The user likes pizza and food from Italy"]
+    manager.replace_user_memory(
+        memory_id=pizza.memory_id,  # type: ignore[arg-type]
+        memory=UserMemory(memory="The user likes pizza"),
+        user_id="user_1",
+    )
+    manager.delete_user_memory(
+        memory_id=memories["The user's favorite color is blue"].memory_id,  # type: ignore[arg-type]
+        user_id="user_1",
+    )
+
+    assert sorted(document.content for document in vector_db.documents) == [
+        "The user likes pizza",
+        "The user plays basketball and likes sports",
+        "The user's name is John",
+    ]
+    # The outdated version of the memory doesn't take the only search result
+    results = manager.search_user_memories(query="pizza food", retrieval_method="semantic", limit=1, user_id="user_1")
+    assert [memory.memory for memory in results] == ["The user likes pizza"]
+
+
+@pytest.mark.skipif(SqliteDb is None, reason="SqliteDb dependencies are not installed")
+def test_embeddings_are_stored_in_the_db(tmp_path):
+    db_file = str(tmp_path / "memory.db")
+    add_memories(MemoryManager(db=SqliteDb(db_file=db_file), embedder=KeywordEmbedder()))
+
+    embedder = KeywordEmbedder()
+    manager = MemoryManager(db=SqliteDb(db_file=db_file), embedder=embedder)
+    results = manager.search_user_memories(query="blue", retrieval_method="semantic", limit=1, user_id="user_1")
+
+    assert [memory.memory for memory in results] == ["The user's favorite color is blue"]
+    # The stored embeddings are reused, so only the query is embedded
+    assert embedder.embedded == ["blue"]
+
+
+def test_agentic_search_reranks_semantic_candidates(monkeypatch):
+    manager = MemoryManager(db=InMemoryDb(), embedder=KeywordEmbedder(), num_rerank_candidates=2)
+    add_memories(manager)
+
+    received = []
+
+    def search_agentic(user_id, query, limit=None, candidates=None):
+        received.extend(candidates)
+        return candidates[:limit]
+
+    monkeypatch.setattr(manager, "_search_user_memories_agentic", search_agentic)
+    manager.search_user_memories(query="john", retrieval_method="agentic", limit=1, user_id="user_1")
+
+    assert len(received) == 2
+    assert received[0].memory == "The user's name is John"
+
+
+def test_semantic_search_without_embedder_returns_recent_memories():
+    manager = MemoryManager(db=InMemoryDb())
+    add_memories(manager)
+
+    results = manager.search_user_memories(query="sports", retrieval_method="semantic", limit=1, user_id="user_1")
+
+    assert [memory.memory for memory in results] == ["The user likes pizza and food from Italy"]
@@ -0,0 +1,58 @@
+import pytest
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.models.mock import MockModel
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def test_mock_model_response_and_usage():
+    model = MockModel(response_content="one two three")
+
+    response = model.invoke(
+        messages=[Message(role="user", content="hello there")], assistant_message=Message(role="assistant")
+    )
+
+    assert response.content == "one two three"
+    assert response.response_usage is not None
+    assert response.response_usage.input_tokens == 2
+    assert response.response_usage.output_tokens == 3
+
+
+def test_mock_model_streams_chunks():
+    model = MockModel(response_content="one two three four five", tokens_per_chunk=2)
+
+    chunks = list(
+        model.invoke_stream(messages=[Message(role="user", content="hi")], assistant_message=Message(role="assistant"))
+    )
+    contents = [chunk.content for chunk in chunks if chunk.content]
+
+    assert "".join(contents) == "one two three four five"
+    assert len(contents) == 3
+
+
+def test_mock_model_calls_tools_once():
+    agent = Agent(
+        model=MockModel(response_content="done", tool_calls=[{"name": "add", "arguments": {"a": 2, "b": 3}}]),
+        tools=[add],
+        telemetry=False,
+    )
+
+    output = agent.run("Add 2 and 3")
+
+    assert output.content == "done"
+    assert output.tools is not None and len(output.tools) == 1
+    assert output.tools[0].result == "5"
+
+
+@pytest.mark.asyncio
+async def test_mock_model_async_stream():
+    agent = Agent(model=MockModel(response_content="hello world"), telemetry=False)
+
+    contents = [event.content async for event in agent.arun("hi", stream=True) if event.event == "RunContent"]
+
+    assert "".join(c for c in contents if c) == "hello world"
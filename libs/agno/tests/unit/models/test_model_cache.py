@@ -0,0 +1,202 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, List
+
+import pytest
+
+from agno.models.base import Model
+from agno.models.cache import InMemoryModelCache, ModelCache, RedisModelCache, SqliteModelCache
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.function import Function
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None  # type: ignore
+
+invocations: List[str] = []
+
+
+@dataclass
+class CountingModel(Model):
+    """Model whose responses are numbered by how often it was invoked"""
+
+    id: str = "counting-model"
+    api_key: str = "secret"
+    temperature: float = 0.0
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        invocations.append("invoke")
+        return ModelResponse(role="assistant", content=f"response {len(invocations)}")
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        return self.invoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        invocations.append("invoke_stream")
+        yield ModelResponse(role="assistant", content="Hello ")
+        yield ModelResponse(content=f"world {len(invocations)}")
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        for response in self.invoke_stream(*args, **kwargs):
+            yield response
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+@pytest.fixture(autouse=True)
+def reset_invocations():
+    invocations.clear()
+
+
+def make_caches(tmp_path) -> List[ModelCache]:
+    caches: List[ModelCache] = [
+        InMemoryModelCache(max_size=2),
+        SqliteModelCache(str(tmp_path / "cache.db"), max_size=2),
+    ]
+    if fakeredis is not None:
+        caches.append(RedisModelCache(redis_client=fakeredis.FakeRedis(), max_size=2))
+    return caches
+
+
+def test_caches_evict_least_recently_used(tmp_path):
+    for cache in make_caches(tmp_path):
+        cache.set("a", {"result": "a"})
+        cache.set("b", {"result": "b"})
+        cache.get("a")
+        cache.set("c", {"result": "c"})
+
+        assert cache.get("b") is None, type(cache).__name__
+        assert cache.get("a") == {"result": "a"}
+        assert cache.get("c") == {"result": "c"}
+
+
+def test_caches_expire_entries(tmp_path):
+    caches = make_caches(tmp_path)
+    for cache in caches:
+        cache.set("short", {"result": "short"}, ttl=1)
+        cache.set("long", {"result": "long"}, ttl=60)
+
+    time.sleep(1.1)
+
+    for cache in caches:
+        assert cache.get("short") is None, type(cache).__name__
+        assert cache.get("long") == {"result": "long"}
+
+
+def test_sqlite_cache_purges_expired_entries_periodically(tmp_path, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("agno.models.cache.time", lambda: now)
+    cache = SqliteModelCache(str(tmp_path / "cache.db"), purge_interval=60)
+
+    def count_rows() -> int:
+        return cache._connection.execute(f"SELECT COUNT(*) FROM {cache.table_name}").fetchone()[0]
+
+    cache.set("short", {"result": "short"}, ttl=1)
+    now += 10
+    # Expired entries are not deleted before the next purge
+    cache.set("other", {"result": "other"})
+    assert count_rows() == 2
+    now += 50
+    cache.set("purging", {"result": "purging"})
+    assert count_rows() == 2
+    assert cache.get("other") == {"result": "other"}
+
+    indexes = [row[1] for row in cache._connection.execute(f"PRAGMA index_list({cache.table_name})")]
+    assert f"{cache.table_name}_expires_at" in indexes
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_runs_async_calls_in_a_thread(tmp_path, monkeypatch):
+    cache = SqliteModelCache(str(tmp_path / "cache.db"))
+    threads = []
+    get, set_ = cache.get, cache.set
+    monkeypatch.setattr(cache, "get", lambda *args: threads.append(threading.current_thread()) or get(*args))
+    monkeypatch.setattr(cache, "set", lambda *args: threads.append(threading.current_thread()) or set_(*args))
+
+    await cache.aset("key", {"result": "value"}, 60)
+    assert await cache.aget("key") == {"result": "value"}
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_cache_key_covers_the_full_request():
+    model = CountingModel()
+    messages = [Message(role="user", content="hi")]
+    key = model._get_model_cache_key(messages, stream=False)
+
+    def get_tool(description: str) -> Function:
+        return Function(name="search", description=description, parameters={"type": "object", "properties": {}})
+
+    # Generated ids, timestamps and credentials don't change the key
+    assert model._get_model_cache_key([Message(role="user", content="hi")], stream=False) == key
+    assert CountingModel(api_key="other")._get_model_cache_key(messages, stream=False) == key
+
+    other_keys = [
+        model._get_model_cache_key(messages, stream=True),
+        model._get_model_cache_key([Message(role="user", content="hi", name="alice")], stream=False),
+        model._get_model_cache_key(messages, stream=False, tools=[get_tool("Search the web")]),
+        model._get_model_cache_key(messages, stream=False, tools=[get_tool("Search the docs")]),
+        model._get_model_cache_key(messages, stream=False, tool_choice="none"),
+        model._get_model_cache_key([Message(role="tool", content="result", tool_call_id="call_1")], stream=False),
+        model._get_model_cache_key([Message(role="tool", content="result", tool_call_id="call_2")], stream=False),
+        CountingModel(temperature=0.5)._get_model_cache_key(messages, stream=False),
+    ]
+    assert len(set(other_keys + [key])) == len(other_keys) + 1
+
+
+def test_responses_are_served_from_the_cache():
+    model = CountingModel(cache_response=True, model_cache=InMemoryModelCache())
+
+    first = model.response(messages=[Message(role="user", content="hi")])
+    second = model.response(messages=[Message(role="user", content="hi")])
+    third = model.response(messages=[Message(role="user", content="bye")])
+
+    assert invocations == ["invoke", "invoke"]
+    assert second.content == first.content == "response 1"
+    assert third.content == "response 2"
+
+
+def test_streaming_responses_are_replayed_from_the_cache(tmp_path):
+    model = CountingModel(cache_response=True, model_cache=SqliteModelCache(str(tmp_path / "cache.db")))
+
+    first = [r.content for r in model.response_stream(messages=[Message(role="user", content="hi")]) if r.content]
+    second = [r.content for r in model.response_stream(messages=[Message(role="user", content="hi")]) if r.content]
+
+    assert invocations == ["invoke_stream"]
+    assert second == first == ["Hello ", "world 1"]
+
+
+def test_default_cache_is_stored_in_cache_dir(tmp_path):
+    CountingModel(cache_response=True, cache_dir=str(tmp_path)).response(messages=[Message(role="user", content="hi")])
+    response = CountingModel(cache_response=True, cache_dir=str(tmp_path)).response(
+        messages=[Message(role="user", content="hi")]
+    )
+
+    assert (tmp_path / "model_responses.db").exists()
+    assert invocations == ["invoke"]
+    assert response.content == "response 1"
+
+
+@pytest.mark.asyncio
+async def test_async_responses_are_served_from_the_cache():
+    model = CountingModel(cache_response=True, model_cache=InMemoryModelCache())
+
+    await model.aresponse(messages=[Message(role="user", content="hi")])
+    streamed = [
+        r.content async for r in model.aresponse_stream(messages=[Message(role="user", content="hi")]) if r.content
+    ]
+    replayed = [
+        r.content async for r in model.aresponse_stream(messages=[Message(role="user", content="hi")]) if r.content
+    ]
+    response = await model.aresponse(messages=[Message(role="user", content="hi")])
+
+    assert invocations == ["invoke", "invoke_stream"]
+    assert replayed == streamed == ["Hello ", "world 2"]
+    assert response.content == "response 1"
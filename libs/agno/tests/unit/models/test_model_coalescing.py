@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, List
+
+import pytest
+
+from agno.exceptions import ModelProviderError
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.models.singleflight import InterruptedFlightError, SingleFlight
+
+invocations: List[str] = []
+
+
+@dataclass
+class SlowModel(Model):
+    """Model that takes a while to answer, and fails for prompts starting with 'fail'"""
+
+    id: str = "slow-model"
+
+    def invoke(self, *args, messages: List[Message], **kwargs) -> ModelResponse:
+        invocations.append(messages[-1].content)
+        time.sleep(0.2)
+        if messages[-1].content.startswith("fail"):
+            raise ModelProviderError("provider is down", status_code=400)
+        return ModelResponse(
+            role="assistant",
+            content=f"answer {len(invocations)}",
+            response_usage=Metrics(input_tokens=10, output_tokens=5, total_tokens=15),
+        )
+
+    async def ainvoke(self, *args, messages: List[Message], **kwargs) -> ModelResponse:
+        invocations.append(messages[-1].content)
+        await asyncio.sleep(0.2)
+        if messages[-1].content.startswith("fail"):
+            raise ModelProviderError("provider is down", status_code=400)
+        return ModelResponse(role="assistant", content=f"answer {len(invocations)}")
+
+    def invoke_stream(self, *args, messages: List[Message], **kwargs) -> Iterator[ModelResponse]:
+        invocations.append(messages[-1].content)
+        for word in ["one ", "two ", "three"]:
+            time.sleep(0.05)
+            yield ModelResponse(role="assistant", content=word)
+
+    async def ainvoke_stream(self, *args, messages: List[Message], **kwargs) -> AsyncIterator[ModelResponse]:
+        invocations.append(messages[-1].content)
+        for word in ["one ", "two ", "three"]:
+            await asyncio.sleep(0.05)
+            yield ModelResponse(role="assistant", content=word)
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+@pytest.fixture(autouse=True)
+def reset_invocations():
+    invocations.clear()
+
+
+def run_concurrently(fn, prompts: List[str]) -> List[Any]:
+    with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+        futures = [executor.submit(fn, prompt) for prompt in prompts]
+        return [future.result() if future.exception() is None else future.exception() for future in futures]
+
+
+def test_identical_concurrent_requests_share_one_call():
+    model = SlowModel(coalesce_requests=True)
+
+    responses = run_concurrently(
+        lambda prompt: model.response(messages=[Message(role="user", content=prompt)]), ["faq"] * 5 + ["other"]
+    )
+
+    assert sorted(invocations) == ["faq", "other"]
+    faq_responses = responses[:5]
+    assert len({response.content for response in faq_responses}) == 1
+    # Only the caller that made the request counts its tokens
+    assert sorted(response.response_usage is not None for response in faq_responses) == [False] * 4 + [True]
+
+
+def test_requests_are_not_shared_without_opt_in():
+    model = SlowModel()
+
+    run_concurrently(lambda prompt: model.response(messages=[Message(role="user", content=prompt)]), ["faq"] * 3)
+
+    assert invocations == ["faq"] * 3
+
+
+def test_errors_are_propagated_to_every_caller():
+    model = SlowModel(coalesce_requests=True)
+
+    results = run_concurrently(
+        lambda prompt: model.response(messages=[Message(role="user", content=prompt)]), ["fail"] * 3
+    )
+
+    assert invocations == ["fail"]
+    assert all(isinstance(result, ModelProviderError) for result in results)
+
+
+def test_streams_are_fanned_out():
+    model = SlowModel(coalesce_requests=True)
+
+    def stream(prompt: str) -> List[str]:
+        responses = model.response_stream(messages=[Message(role="user", content=prompt)])
+        return [response.content for response in responses if isinstance(response, ModelResponse) and response.content]
+
+    results = run_concurrently(stream, ["faq"] * 4)
+
+    assert invocations == ["faq"]
+    assert results == [["one ", "two ", "three"]] * 4
+
+
+def test_followers_are_interrupted_when_the_leader_stops_early():
+    flights = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def produce():
+        calls.append(1)
+        started.set()
+        for i in range(3):
+            time.sleep(0.05)
+            yield i
+
+    leader = flights.stream("key", produce)
+    next(leader)
+    follower_chunks: List[int] = []
+    follower_errors: List[Exception] = []
+
+    def follow():
+        try:
+            for chunk, shared in flights.stream("key", produce):
+                follower_chunks.append(chunk)
+        except InterruptedFlightError as e:
+            follower_errors.append(e)
+
+    thread = threading.Thread(target=follow)
+    thread.start()
+    time.sleep(0.02)
+    leader.close()
+    thread.join(timeout=5)
+
+    # The follower already replayed the first chunk, so it can't restart the stream
+    assert follower_chunks == [0]
+    assert len(follower_errors) == 1
+    assert len(calls) == 1
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_identical_requests_share_one_call():
+    model = SlowModel(coalesce_requests=True)
+
+    responses = await asyncio.gather(
+        *[model.aresponse(messages=[Message(role="user", content="faq")]) for _ in range(5)],
+    )
+    results = await asyncio.gather(
+        *[model.aresponse(messages=[Message(role="user", content="fail")]) for _ in range(2)],
+        return_exceptions=True,
+    )
+
+    assert invocations == ["faq", "fail"]
+    assert len({response.content for response in responses}) == 1
+    assert all(isinstance(result, ModelProviderError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_streams_are_fanned_out():
+    model = SlowModel(coalesce_requests=True)
+
+    async def stream() -> List[str]:
+        return [
+            response.content
+            async for response in model.aresponse_stream(messages=[Message(role="user", content="faq")])
+            if isinstance(response, ModelResponse) and response.content
+        ]
+
+    results = await asyncio.gather(*[stream() for _ in range(3)])
+
+    assert invocations == ["faq"]
+    assert results == [["one ", "two ", "three"]] * 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    flights = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "result"
+
+    leader = asyncio.create_task(flights.ado("key", call))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.ado("key", call))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == ("result", False)
+    assert len(calls) == 2
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import pytest
+from pydantic import BaseModel
+
+from agno.exceptions import ModelProviderError
+from agno.models.base import Model
+from agno.models.hedging import LatencyTracker
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.function import Function
+
+
+@dataclass
+class FakeProvider(Model):
+    """Model calling a fake provider, which takes the next of `delays` seconds to answer each request"""
+
+    id: str = "fake-model"
+    delays: List[float] = field(default_factory=list)
+    fail: bool = False
+    calls: int = 0
+    cancelled: int = 0
+
+    def _next_delay(self) -> float:
+        self.calls += 1
+        return self.delays.pop(0) if self.delays else 0.0
+
+    def _response(self, content: str) -> ModelResponse:
+        if self.fail:
+            raise ModelProviderError("provider is down", status_code=503, model_id=self.id)
+        return ModelResponse(role="assistant", content=content)
+
+    def invoke(self, *args, assistant_message: Message, **kwargs) -> ModelResponse:
+        assistant_message.metrics.start_timer()
+        time.sleep(self._next_delay())
+        assistant_message.metrics.stop_timer()
+        return self._response(f"{self.id} {self.calls}")
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        delay = self._next_delay()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._response(f"{self.id} {self.calls}")
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        time.sleep(self._next_delay())
+        call = self.calls
+        for word in ["one", "two"]:
+            yield self._response(f"{self.id} {call} {word}")
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        delay = self._next_delay()
+        call = self.calls
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        for word in ["one", "two"]:
+            yield self._response(f"{self.id} {call} {word}")
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+def messages() -> List[Message]:
+    return [Message(role="user", content="hi")]
+
+
+def stream_contents(responses) -> List[str]:
+    return [r.content for r in responses if isinstance(r, ModelResponse) and r.content]
+
+
+def test_fast_requests_are_not_hedged():
+    model = FakeProvider(hedge_delay=0.5)
+
+    assert model.response(messages=messages()).content == "fake-model 1"
+    assert model.calls == 1
+    assert model.hedging_metrics.requests == 1
+    assert model.hedging_metrics.hedges_fired == 0
+
+
+def test_slow_requests_are_hedged():
+    model = FakeProvider(delays=[1.0, 0.0], hedge_delay=0.05)
+
+    start = time.perf_counter()
+    response = model.response(messages=messages())
+
+    assert time.perf_counter() - start < 0.5
+    assert response.content == "fake-model 2"
+    assert model.hedging_metrics.hedges_fired == 1
+    assert model.hedging_metrics.hedges_won == 1
+
+
+def test_hedges_can_use_another_model():
+    alternate = FakeProvider(id="alternate")
+    model = FakeProvider(delays=[1.0], hedge_delay=0.05, hedge_model=alternate)
+
+    assert model.response(messages=messages()).content == "alternate 1"
+
+
+def test_hedge_delay_follows_the_latency_percentile():
+    model = FakeProvider(hedge_percentile=90)
+    assert model._get_hedge_delay() is None
+
+    for latency in range(100):
+        model._request_latencies.record(latency / 100)
+    assert model._get_hedge_delay() == pytest.approx(0.9)
+
+
+def test_latency_tracker_keeps_the_most_recent_latencies():
+    tracker = LatencyTracker(window=10, min_samples=5)
+    for latency in range(100):
+        tracker.record(float(latency))
+
+    assert len(tracker) == 10
+    assert tracker.percentile(0) == 90.0
+    assert tracker.percentile(100) == 99.0
+
+
+def test_fallback_models_are_used_in_order_on_errors():
+    second = FakeProvider(id="second", fail=True)
+    third = FakeProvider(id="third")
+    model = FakeProvider(fail=True, fallback_models=[second, third])
+
+    response = model.response(messages=messages())
+
+    assert response.content == "third 1"
+    assert (model.calls, second.calls, third.calls) == (1, 1, 1)
+    assert model.hedging_metrics.fallbacks_used == 1
+
+
+@dataclass
+class JsonSchemaProvider(FakeProvider):
+    """Fake provider supporting json schema outputs, which records the arguments of its requests"""
+
+    supports_json_schema_outputs: bool = True
+    requests: List[Dict[str, Any]] = field(default_factory=list)
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        self.requests.append(kwargs)
+        return super().invoke(*args, **kwargs)
+
+
+class Answer(BaseModel):
+    text: str
+
+
+def test_fallback_models_get_their_own_tools_and_response_format():
+    fallback = JsonSchemaProvider(id="fallback")
+    model = FakeProvider(fail=True, supports_native_structured_outputs=True, fallback_models=[fallback])
+    tools: List[Any] = [
+        Function(name="search", parameters={"type": "object", "properties": {}}),
+        {"type": "web_search"},
+    ]
+
+    model.response(messages=messages(), tools=tools, response_format=Answer)
+
+    request = fallback.requests[0]
+    assert [(tool["type"], tool["function"]["name"]) for tool in request["tools"]] == [("function", "search")]
+    assert request["response_format"] == {
+        "type": "json_schema",
+        "json_schema": {"name": "Answer", "schema": Answer.model_json_schema()},
+    }
+
+
+def test_errors_are_raised_when_every_model_fails():
+    model = FakeProvider(fail=True, fallback_models=[FakeProvider(id="second", fail=True)])
+
+    with pytest.raises(ModelProviderError):
+        model.response(messages=messages())
+
+
+def test_streams_commit_to_the_first_to_start():
+    model = FakeProvider(delays=[1.0, 0.0], hedge_delay=0.05)
+
+    responses = stream_contents(model.response_stream(messages=messages()))
+
+    assert responses == ["fake-model 2 one", "fake-model 2 two"]
+    assert model.hedging_metrics.hedges_won == 1
+
+
+def test_streams_fall_back_before_their_first_chunk():
+    fallback = FakeProvider(id="fallback")
+    model = FakeProvider(fail=True, fallback_models=[fallback])
+
+    responses = stream_contents(model.response_stream(messages=messages()))
+
+    assert responses == ["fallback 1 one", "fallback 1 two"]
+
+
+@pytest.mark.asyncio
+async def test_async_hedges_cancel_the_slower_request():
+    model = FakeProvider(delays=[1.0, 0.0], hedge_delay=0.05)
+
+    response = await model.aresponse(messages=messages())
+    await asyncio.sleep(0)
+
+    assert response.content == "fake-model 2"
+    assert model.cancelled == 1
+    assert model.hedging_metrics.hedges_won == 1
+
+
+@pytest.mark.asyncio
+async def test_async_streams_commit_to_the_first_to_start():
+    model = FakeProvider(delays=[1.0, 0.0], hedge_delay=0.05)
+
+    responses = stream_contents([r async for r in model.aresponse_stream(messages=messages())])
+    await asyncio.sleep(0)
+
+    assert responses == ["fake-model 2 one", "fake-model 2 two"]
+    assert model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_async_fallback_models():
+    model = FakeProvider(fail=True, fallback_models=[FakeProvider(id="fallback")])
+
+    response = await model.aresponse(messages=messages())
+    responses = stream_contents([r async for r in model.aresponse_stream(messages=messages())])
+
+    assert response.content == "fallback 1"
+    assert responses == ["fallback 2 one", "fallback 2 two"]
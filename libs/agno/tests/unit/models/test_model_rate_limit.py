@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, List
+
+import pytest
+
+from agno.exceptions import ModelRateLimitError
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.rate_limit import RateLimiter, _TokenBucket
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class FakeProvider(Model):
+    """Model calling a fake provider, which rejects requests past `capacity` concurrent requests"""
+
+    id: str = "fake-model"
+    capacity: int = 100
+    in_flight: int = 0
+    peak: int = 0
+    rejected: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _start(self) -> None:
+        with self.lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise ModelRateLimitError("Too many requests", model_name=self.name, model_id=self.id)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _end(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+    def _response(self) -> ModelResponse:
+        return ModelResponse(
+            role="assistant", content="ok", response_usage=Metrics(input_tokens=10, output_tokens=5, total_tokens=15)
+        )
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        self._start()
+        try:
+            time.sleep(0.05)
+            return self._response()
+        finally:
+            self._end()
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        self._start()
+        try:
+            await asyncio.sleep(0.05)
+            return self._response()
+        finally:
+            self._end()
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        self._start()
+        try:
+            time.sleep(0.05)
+            yield ModelResponse(role="assistant", content="ok")
+        finally:
+            self._end()
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        self._start()
+        try:
+            await asyncio.sleep(0.05)
+            yield ModelResponse(role="assistant", content="ok")
+        finally:
+            self._end()
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+def ask(model: Model) -> ModelResponse:
+    return model.response(messages=[Message(role="user", content="hi")])
+
+
+def ask_concurrently(model: Model, n: int) -> List[Any]:
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        return list(executor.map(lambda _: ask(model), range(n)))
+
+
+def test_concurrent_requests_are_limited():
+    model = FakeProvider(id="fake-concurrency", max_concurrent_requests=2)
+
+    ask_concurrently(model, 6)
+
+    assert model.peak == 2
+    assert model.rate_limiter is not None and model.rate_limiter.in_flight == 0
+
+
+def test_models_with_the_same_id_share_limits():
+    first = FakeProvider(id="fake-shared", max_concurrent_requests=1)
+    second = FakeProvider(id="fake-shared", max_concurrent_requests=1)
+    ask(first)
+    ask(second)
+
+    assert first.rate_limiter is second.rate_limiter
+    assert FakeProvider(id="fake-other", max_concurrent_requests=1)._get_rate_limiter() is not first.rate_limiter
+
+
+def test_models_with_other_limits_get_their_own_limiter():
+    first = FakeProvider(id="fake-limits", requests_per_minute=60)
+    second = FakeProvider(id="fake-limits", requests_per_minute=600)
+
+    assert first._get_rate_limiter() is not second._get_rate_limiter()
+    assert second.rate_limiter is not None and second.rate_limiter.requests_per_minute == 600
+
+
+def test_concurrency_backs_off_on_rate_limits_and_recovers():
+    rate_limiter = RateLimiter(max_concurrency=8)
+    model = FakeProvider(id="fake-aimd", capacity=2, rate_limiter=rate_limiter, retries=5, delay_between_retries=0)
+
+    ask_concurrently(model, 8)
+
+    assert model.rejected > 0
+    assert rate_limiter.concurrency < 8
+
+    concurrency = rate_limiter.concurrency
+    for _ in range(4):
+        ask(model)
+    assert rate_limiter.concurrency > concurrency
+
+
+def test_rate_limits_of_one_round_back_off_once():
+    rate_limiter = RateLimiter(max_concurrency=16)
+    permits = [rate_limiter.acquire() for _ in range(8)]
+    for permit in permits:
+        permit.release(rate_limited=True)
+
+    assert rate_limiter.concurrency == 8
+    assert rate_limiter.in_flight == 0
+
+
+def test_slow_responses_reduce_concurrency():
+    rate_limiter = RateLimiter(max_concurrency=10, target_latency=0.5)
+
+    rate_limiter.acquire().release(latency=1.0)
+    assert rate_limiter.concurrency == 5
+
+    rate_limiter.acquire().release(latency=0.1)
+    assert rate_limiter.concurrency == pytest.approx(5.2)
+
+
+def test_token_bucket_makes_requests_wait_once_empty():
+    bucket = _TokenBucket(capacity=60)
+    now = bucket.updated_at
+
+    assert bucket.reserve(60, now) == 0
+    assert bucket.reserve(2, now) == pytest.approx(2.0)
+    # One unit per second is added back
+    assert bucket.reserve(1, now + 3) == pytest.approx(0.0)
+    # Requests larger than the bucket wait for a full bucket at most
+    assert bucket.reserve(1000, now + 63) == pytest.approx(0.0)
+
+
+def test_token_estimates_are_corrected_with_usage(monkeypatch):
+    model = FakeProvider(id="fake-tokens", tokens_per_minute=1000)
+    counted = []
+    monkeypatch.setattr("agno.utils.tokens.count_tokens", lambda *args, **kwargs: counted.append(1) or 100)
+
+    ask(model)
+
+    assert counted == [1]
+    # 100 tokens were estimated, and the 15 tokens used are counted instead
+    assert model.rate_limiter is not None
+    assert model.rate_limiter._token_bucket.available == pytest.approx(985, abs=1)  # type: ignore[union-attr]
+
+
+def test_streams_hold_a_slot_until_they_end():
+    model = FakeProvider(id="fake-stream", max_concurrent_requests=2)
+
+    def stream(_):
+        return [r for r in model.response_stream(messages=[Message(role="user", content="hi")])]
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(stream, range(5)))
+
+    assert model.peak == 2
+    assert model.rate_limiter.in_flight == 0  # type: ignore[union-attr]
+
+
+def test_retry_delays_are_jittered():
+    model = FakeProvider(id="fake-jitter", delay_between_retries=2, exponential_backoff=True, retry_jitter=0.5)
+
+    delays = {model._get_retry_delay(1) for _ in range(20)}
+
+    assert all(2 <= delay <= 6 for delay in delays)
+    assert len(delays) > 1
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_limited():
+    model = FakeProvider(id="fake-async", max_concurrent_requests=3)
+
+    await asyncio.gather(*[model.aresponse(messages=[Message(role="user", content="hi")]) for _ in range(9)])
+
+    async def stream():
+        return [r async for r in model.aresponse_stream(messages=[Message(role="user", content="hi")])]
+
+    await asyncio.gather(*[stream() for _ in range(9)])
+
+    assert model.peak == 3
+    assert model.rate_limiter.in_flight == 0  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_async_and_sync_requests_share_limits():
+    model = FakeProvider(id="fake-mixed", max_concurrent_requests=2)
+
+    threads = [threading.Thread(target=ask, args=(model,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    await asyncio.gather(*[model.aresponse(messages=[Message(role="user", content="hi")]) for _ in range(3)])
+    for thread in threads:
+        thread.join()
+
+    assert model.peak == 2
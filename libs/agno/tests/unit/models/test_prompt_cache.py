@@ -0,0 +1,168 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.prompt_cache import PromptCacheStrategy
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get the weather of a city",
+            "parameters": {"type": "object", "properties": {"city": {"type": "string"}}, "required": ["city"]},
+        },
+    }
+]
+
+
+def tool_call_turn(question: str) -> List[Message]:
+    """A user question, answered with a tool call"""
+    return [
+        Message(role="user", content=question),
+        Message(
+            role="assistant",
+            tool_calls=[{"id": "call_1", "type": "function", "function": {"name": "get_weather", "arguments": "{}"}}],
+        ),
+        Message(role="tool", tool_call_id="call_1", content="sunny"),
+    ]
+
+
+def test_breakpoints_are_placed_on_tools_system_and_history():
+    messages = [Message(role="system", content="You are helpful"), *tool_call_turn("Weather in Paris?")]
+
+    plan = PromptCacheStrategy().plan(messages, has_tools=True)
+
+    assert plan.cache_tools and plan.cache_system
+    # The last message, and the last message of the previous request
+    assert plan.message_ids == [messages[1].id, messages[3].id]
+    assert plan.num_breakpoints == 4
+    assert plan.get_prefix_length(messages) == 4
+
+
+def test_breakpoints_move_forward_as_the_conversation_grows():
+    strategy = PromptCacheStrategy(cache_tools=False, cache_system=False)
+    messages = [*tool_call_turn("Weather in Paris?")]
+    first_plan = strategy.plan(messages)
+
+    messages += [Message(role="assistant", content="It is sunny"), *tool_call_turn("And in Rome?")]
+    plan = strategy.plan(messages)
+
+    assert first_plan.message_ids == [messages[0].id, messages[2].id]
+    assert plan.message_ids == [messages[0].id, messages[2].id, messages[4].id, messages[6].id]
+
+
+def test_breakpoints_respect_the_maximum():
+    messages = [Message(role="system", content="You are helpful")]
+    for question in ["Weather in Paris?", "And in Rome?", "And in Oslo?"]:
+        messages += [*tool_call_turn(question), Message(role="assistant", content="Sunny")]
+    messages.append(Message(role="user", content="Thanks"))
+
+    plan = PromptCacheStrategy(max_breakpoints=4).plan(messages, has_tools=True)
+    assert plan.num_breakpoints == 4
+    assert plan.message_ids == [messages[-3].id, messages[-1].id]
+
+    plan = PromptCacheStrategy(max_breakpoints=2).plan(messages, has_tools=True)
+    assert plan.cache_tools and plan.cache_system
+    assert plan.message_ids == []
+
+
+def test_temporary_messages_are_not_cached():
+    messages = [Message(role="user", content="Hi"), Message(role="user", content="Answer in JSON", temporary=True)]
+
+    plan = PromptCacheStrategy().plan(messages)
+
+    assert plan.message_ids == [messages[0].id]
+
+
+def test_bedrock_requests_have_cache_points():
+    from agno.models.aws import AwsBedrock
+
+    model = AwsBedrock(id="anthropic.claude-3-5-sonnet-20240620-v1:0", cache_strategy=PromptCacheStrategy())
+    model.client = MagicMock()
+    model.client.converse.return_value = {
+        "output": {"message": {"role": "assistant", "content": [{"text": "Sunny"}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 10, "outputTokens": 2, "cacheReadInputTokens": 2048, "cacheWriteInputTokens": 512},
+    }
+    messages = [Message(role="system", content="You are helpful"), *tool_call_turn("Weather in Paris?")]
+
+    response = model.response(messages=messages, tools=TOOLS)
+
+    request = model.client.converse.call_args.kwargs
+    cache_point = {"cachePoint": {"type": "default"}}
+    assert request["system"][-1] == cache_point
+    assert request["toolConfig"]["tools"][-1] == cache_point
+    assert [message["content"][-1] == cache_point for message in request["messages"]] == [True, False, True]
+    assert response.response_usage is not None
+    assert response.response_usage.cache_read_tokens == 2048
+    assert response.response_usage.cache_write_tokens == 512
+
+
+def test_claude_requests_have_cache_control():
+    pytest.importorskip("anthropic")
+    from agno.models.anthropic import Claude
+
+    model = Claude(cache_strategy=PromptCacheStrategy())
+    messages = [Message(role="system", content="You are helpful"), *tool_call_turn("Weather in Paris?")]
+
+    chat_messages, request_kwargs = model._format_request(messages, tools=TOOLS)
+
+    cache_control = {"type": "ephemeral"}
+    assert request_kwargs["system"][-1]["cache_control"] == cache_control
+    assert request_kwargs["tools"][-1]["cache_control"] == cache_control
+    assert chat_messages[0]["content"][-1]["cache_control"] == cache_control  # type: ignore[index]
+    assert chat_messages[2]["content"][-1]["cache_control"] == cache_control  # type: ignore[index]
+    assert "cache_control" not in str(chat_messages[1]["content"])
+
+
+def test_gemini_caches_the_conversation_up_to_the_previous_request():
+    pytest.importorskip("google.genai")
+    from google.genai.types import CachedContent
+
+    from agno.models.google import Gemini
+
+    model = Gemini(cache_strategy=PromptCacheStrategy(min_cached_tokens=0))
+    model.client = MagicMock()
+    model.client.caches.create.side_effect = [
+        CachedContent(name="cachedContents/first"),
+        CachedContent(name="cachedContents/second"),
+    ]
+
+    def apply_prompt_cache(messages: List[Message]):
+        formatted_messages, system_message = model._format_messages(messages)
+        request_kwargs = model.get_request_params(system_message, tools=TOOLS)
+        return model._apply_prompt_cache(messages, formatted_messages, request_kwargs)
+
+    # The first request of the conversation has nothing to cache
+    messages = [Message(role="system", content="You are helpful"), *tool_call_turn("Weather in Paris?")]
+    contents, request_kwargs = apply_prompt_cache(messages)
+    assert len(contents) == 3
+    model.client.caches.create.assert_not_called()
+
+    # The next turn caches the previous request, and sends the model response and the new question
+    messages += [Message(role="assistant", content="It is sunny"), Message(role="user", content="And in Rome?")]
+    contents, request_kwargs = apply_prompt_cache(messages)
+    config = model.client.caches.create.call_args.kwargs["config"]
+    assert [content.role for content in config.contents] == ["user", "model", "user"]
+    assert config.system_instruction == "You are helpful"
+    assert [content.parts[0].text for content in contents] == ["It is sunny", "And in Rome?"]
+    assert request_kwargs["config"].cached_content == "cachedContents/first"
+    assert request_kwargs["config"].system_instruction is None
+
+    # The requests of the run reuse the cached content
+    messages += tool_call_turn("And in Rome?")[1:]
+    contents, request_kwargs = apply_prompt_cache(messages)
+    assert model.client.caches.create.call_count == 1
+    assert len(contents) == 4
+    assert request_kwargs["config"].cached_content == "cachedContents/first"
+
+    # The next turn caches a longer prefix, and deletes the cached content it supersedes
+    messages += [Message(role="assistant", content="It is sunny too"), Message(role="user", content="Thanks")]
+    contents, request_kwargs = apply_prompt_cache(messages)
+    assert model.client.caches.create.call_count == 2
+    assert [content.parts[0].text for content in contents] == ["It is sunny too", "Thanks"]
+    assert request_kwargs["config"].cached_content == "cachedContents/second"
+    model.client.caches.delete.assert_called_once_with(name="cachedContents/first")
@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.tools import Toolkit, connection_pool
+from agno.tools.connection_pool import ToolConnectionPool, get_tool_connection_pool
+
+
+class CountingTools(Toolkit):
+    _requires_connect = True
+
+    def __init__(self, connect_delay: float = 0.0, failures: int = 0):
+        super().__init__(name="counting_tools")
+        self.connect_delay = connect_delay
+        self.failures = failures
+        self.connects = 0
+        self.closes = 0
+        self.is_connected = False
+
+    def connect(self) -> None:
+        time.sleep(self.connect_delay)
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("Connection refused")
+        self.connects += 1
+        self.is_connected = True
+
+    def close(self) -> None:
+        self.closes += 1
+        self.is_connected = False
+
+
+class MCPTools(Toolkit):
+    """Stands in for agno.tools.mcp.MCPTools, which is detected by class name."""
+
+    def __init__(self):
+        super().__init__(name="mcp_tools")
+        self.initialized = False
+        self.alive = True
+        self.connects = 0
+        self.closes = 0
+
+    async def connect(self, force: bool = False) -> None:
+        if self.initialized and not force:
+            return
+        self.connects += 1
+        self.initialized = True
+        self.alive = True
+
+    async def is_alive(self) -> bool:
+        return self.alive
+
+    async def close(self) -> None:
+        self.closes += 1
+        self.initialized = False
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = ToolConnectionPool(retry_delay_seconds=0)
+    monkeypatch.setattr(connection_pool, "_tool_connection_pool", pool)
+    return pool
+
+
+def test_process_lifecycle_shares_connections_across_runs(pool):
+    tools = CountingTools()
+    agent = Agent(tools=[tools], tool_connection_lifecycle="process")
+
+    for run_id in ["run_1", "run_2", "run_3"]:
+        agent._connect_connectable_tools(run_id=run_id)
+        assert pool.get_lease_count(tools) == 1
+        agent._disconnect_connectable_tools(run_id=run_id)
+
+    assert get_tool_connection_pool() is pool
+    assert (tools.connects, tools.closes) == (1, 0)
+    assert pool.get_lease_count(tools) == 0
+
+    pool.close()
+    assert tools.closes == 1
+    assert tools not in pool
+
+
+def test_run_lifecycle_connects_on_each_run(pool):
+    tools = CountingTools()
+    agent = Agent(tools=[tools])
+
+    for run_id in ["run_1", "run_2"]:
+        agent._connect_connectable_tools(run_id=run_id)
+        agent._disconnect_connectable_tools(run_id=run_id)
+
+    assert (tools.connects, tools.closes) == (2, 2)
+    assert len(pool) == 0
+
+
+def test_concurrent_runs_connect_once(pool):
+    tools = CountingTools(connect_delay=0.05)
+    agent = Agent(tools=[tools], tool_connection_lifecycle="process")
+
+    threads = [
+        threading.Thread(target=agent._connect_connectable_tools, kwargs={"run_id": f"run_{i}"}) for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tools.connects == 1
+    assert pool.get_lease_count(tools) == 8
+
+    for i in range(8):
+        agent._disconnect_connectable_tools(run_id=f"run_{i}")
+    assert pool.get_lease_count(tools) == 0
+
+
+def test_reconnects_dropped_connections(pool):
+    tools = CountingTools()
+    pool.acquire(tools)
+    pool.release(tools)
+
+    # The connection was dropped between runs
+    tools.is_connected = False
+    tools.failures = 1
+
+    pool.acquire(tools)
+    assert tools.connects == 2
+    assert tools.is_connected
+
+
+def test_raises_once_retries_are_exhausted(pool):
+    tools = CountingTools(failures=5)
+    with pytest.raises(ConnectionError):
+        pool.acquire(tools)
+    assert tools not in pool
+
+
+def test_close_waits_for_active_leases(pool):
+    tools = CountingTools()
+    pool.acquire(tools)
+
+    releaser = threading.Timer(0.05, pool.release, args=(tools,))
+    releaser.start()
+    pool.close(timeout_seconds=5)
+    releaser.join()
+
+    assert tools.closes == 1
+
+
+@pytest.mark.asyncio
+async def test_async_leases_connect_toolkits_off_the_event_loop(pool):
+    loop_ran = threading.Event()
+
+    class WaitingTools(CountingTools):
+        def connect(self) -> None:
+            # Only set if the event loop keeps running while the toolkit connects
+            if not loop_ran.wait(timeout=5):
+                raise TimeoutError("The event loop was blocked")
+            super().connect()
+
+    tools = WaitingTools(failures=1)
+    acquire = asyncio.create_task(pool.aacquire(tools))
+    await asyncio.sleep(0)
+    loop_ran.set()
+    await acquire
+
+    assert tools.connects == 1
+    assert pool.get_lease_count(tools) == 1
+
+
+@pytest.mark.asyncio
+async def test_mcp_tools_are_health_checked_and_closed_on_shutdown(pool):
+    pool.health_check_interval_seconds = 0
+    mcp_tools = MCPTools()
+    agent = Agent(tools=[mcp_tools], tool_connection_lifecycle="process")
+
+    await agent._connect_mcp_tools(run_id="run_1")
+    await agent._disconnect_mcp_tools(run_id="run_1")
+    await agent._connect_mcp_tools(run_id="run_2")
+    await agent._disconnect_mcp_tools(run_id="run_2")
+    assert mcp_tools.connects == 1
+
+    # The server went away between runs
+    mcp_tools.alive = False
+    await asyncio.gather(*(pool.aacquire(mcp_tools) for _ in range(4)))
+    assert mcp_tools.connects == 2
+    for _ in range(4):
+        pool.release(mcp_tools)
+
+    await pool.aclose()
+    assert mcp_tools.closes == 1
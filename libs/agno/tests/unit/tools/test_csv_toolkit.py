@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+from agno.tools.csv_toolkit import CsvTools
+
+duckdb = pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text("region,amount\nnorth,10\nsouth,20\nnorth,30\n")
+    return path
+
+
+def test_read_csv_file_stops_at_row_limit(csv_path):
+    tools = CsvTools(csvs=[csv_path], row_limit=2)
+    assert json.loads(tools.read_csv_file("sales")) == [
+        {"region": "north", "amount": "10"},
+        {"region": "south", "amount": "20"},
+    ]
+    assert len(json.loads(tools.read_csv_file("sales", row_limit=1))) == 1
+    assert "not found" in tools.read_csv_file("missing")
+
+
+def test_query_csv_file_loads_each_file_once(csv_path, monkeypatch):
+    tools = CsvTools(csvs=[csv_path])
+    loads = []
+    load_csv_table = CsvTools._load_csv_table
+
+    def record_load(self, con, csv_name, file_path):
+        before = dict(self._loaded_tables)
+        load_csv_table(self, con, csv_name, file_path)
+        if self._loaded_tables != before:
+            loads.append(csv_name)
+
+    monkeypatch.setattr(CsvTools, "_load_csv_table", record_load)
+
+    for _ in range(3):
+        assert tools.query_csv_file("sales", "SELECT SUM(amount) FROM sales") == "sum(amount)\n60"
+    assert loads == ["sales"]
+
+    # The table is reloaded once the file changes
+    csv_path.write_text("region,amount\nnorth,10\nsouth,20\nnorth,30\neast,40\n")
+    assert tools.query_csv_file("sales", "SELECT COUNT(*) FROM sales") == "count_star()\n4"
+    assert loads == ["sales", "sales"]
+
+    tools.close()
+    assert tools._duckdb_connection is None
+
+
+def test_query_csv_file_detects_same_size_rewrites(csv_path):
+    tools = CsvTools(csvs=[csv_path])
+    assert tools.query_csv_file("sales", "SELECT MAX(amount) FROM sales") == "max(amount)\n30"
+
+    csv_path.write_text("region,amount\nnorth,10\nsouth,20\nnorth,90\n")
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert tools.query_csv_file("sales", "SELECT MAX(amount) FROM sales") == "max(amount)\n90"
+
+
+def test_query_csv_file_reuses_provided_connection(csv_path):
+    connection = duckdb.connect()
+    tools = CsvTools(csvs=[csv_path], duckdb_connection=connection)
+
+    # Used to fail on the second query, as the table already existed
+    assert tools.query_csv_file("sales", "SELECT COUNT(*) FROM sales") == "count_star()\n3"
+    assert tools.query_csv_file("sales", "SELECT COUNT(*) FROM sales") == "count_star()\n3"
+
+    tools.close()
+    assert connection.execute("SELECT COUNT(*) FROM sales").fetchone() == (3,)
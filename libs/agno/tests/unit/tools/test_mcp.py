@@ -1,9 +1,12 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from agno.tools.mcp import MCPTools, MultiMCPTools
 from agno.tools.mcp.params import StreamableHTTPClientParams
+from agno.tools.mcp.session_pool import MCPSessionPool
+from agno.utils.mcp import get_entrypoint_for_tool
 
 
 @pytest.mark.asyncio
@@ -290,50 +293,213 @@ def test_header_provider_called_with_correct_context_for_agent_vs_team():
 
 
 # =============================================================================
-# TTL cleanup tests
+# Session pool tests
 # =============================================================================
 
 
+def _mock_http_session():
+    """Patch the Streamable HTTP transport and ClientSession, returning the mocked ClientSession class."""
+    transport_patch = patch("agno.tools.mcp.mcp.streamablehttp_client")
+    session_patch = patch("agno.tools.mcp.mcp.ClientSession")
+    mock_client = transport_patch.start()
+    mock_session_cls = session_patch.start()
+
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = (AsyncMock(), AsyncMock(), None)
+    mock_client.return_value = mock_context
+
+    def new_session_context(*args, **kwargs):
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = AsyncMock()
+        return session_context
+
+    mock_session_cls.side_effect = new_session_context
+    return mock_session_cls, [transport_patch, session_patch]
+
+
 @pytest.mark.asyncio
-async def test_stale_sessions_cleaned_up_on_new_run():
-    """Test that stale sessions are cleaned up when a new run requests a session."""
-    import time
+async def test_runs_with_same_headers_share_a_pooled_session():
+    """Test that runs resolving the same headers reuse the same session."""
+    tools = MCPTools(
+        url="http://localhost:8080/mcp", header_provider=lambda run_context: {"X-Tenant": run_context.user_id}
+    )
+    mock_session_cls, patches = _mock_http_session()
+    try:
+        runs = []
+        for run_id, user_id in [("run-1", "tenant-a"), ("run-2", "tenant-a"), ("run-3", "tenant-b")]:
+            run_context = MagicMock()
+            run_context.run_id = run_id
+            run_context.user_id = user_id
+            runs.append(run_context)
+
+        session_1 = await tools.get_session_for_run(run_context=runs[0])
+        session_2 = await tools.get_session_for_run(run_context=runs[1])
+        session_3 = await tools.get_session_for_run(run_context=runs[2])
+
+        assert session_1 is session_2
+        assert session_3 is not session_1
+        assert mock_session_cls.call_count == 2
+        assert len(tools._session_pool) == 2
+        session_1.initialize.assert_awaited_once()
+    finally:
+        for p in patches:
+            p.stop()
 
-    tools = MCPTools(url="http://localhost:8080/mcp", header_provider=lambda: {})
-    tools._session_ttl_seconds = 0.1  # 100ms TTL for testing
-
-    # Simulate an old session from a previous run
-    old_session = MagicMock()
-    old_context = MagicMock()
-    old_session_context = MagicMock()
-    tools._run_sessions["old-run-id"] = (old_session, time.time() - 1.0)  # 1 second ago
-    tools._run_session_contexts["old-run-id"] = (old_context, old_session_context)
-
-    # Wait for TTL to expire
-    time.sleep(0.15)
-
-    # Now simulate a new run requesting a session - this should trigger cleanup
-    # We need to mock the session creation since we don't have a real MCP server
-    with patch("agno.tools.mcp.mcp.streamablehttp_client") as mock_client:
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = (AsyncMock(), AsyncMock(), None)
-        mock_client.return_value = mock_context
-
-        with patch("agno.tools.mcp.mcp.ClientSession") as mock_session_cls:
-            mock_new_session = AsyncMock()
-            mock_new_session.initialize = AsyncMock()
-            mock_session_context = AsyncMock()
-            mock_session_context.__aenter__.return_value = mock_new_session
-            mock_session_cls.return_value = mock_session_context
-
-            new_run_context = MagicMock()
-            new_run_context.run_id = "new-run-id"
-
-            # This should clean up old session and create new one
-            session = await tools.get_session_for_run(run_context=new_run_context)
-
-            # Old session should be cleaned up
-            assert "old-run-id" not in tools._run_sessions
-            # New session should exist
-            assert "new-run-id" in tools._run_sessions
-            assert session == mock_new_session
+
+@pytest.mark.asyncio
+async def test_session_pool_evicts_least_recently_used_session():
+    """Test that the pool closes the least recently used session once full."""
+    pool = MCPSessionPool(max_sessions=2)
+    opened = []
+
+    def factory(name):
+        async def create_session():
+            session_context = AsyncMock()
+            transport_context = AsyncMock()
+            opened.append((name, session_context))
+            return AsyncMock(name=name), transport_context, session_context
+
+        return create_session
+
+    await pool.get_session("a", factory("a"))
+    await pool.get_session("b", factory("b"))
+    await pool.get_session("a", factory("a"))
+    await pool.get_session("c", factory("c"))
+
+    assert "a" in pool and "c" in pool and "b" not in pool
+    assert [name for name, _ in opened] == ["a", "b", "c"]
+    # The evicted session was closed
+    opened[1][1].__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_evicts_idle_sessions():
+    """Test that sessions idle for longer than the timeout are closed."""
+    pool = MCPSessionPool(idle_timeout_seconds=60)
+
+    async def create_session():
+        return AsyncMock(), AsyncMock(), AsyncMock()
+
+    await pool.get_session("idle", create_session)
+    pool._sessions["idle"].last_used_at -= 120
+
+    await pool.get_session("active", create_session)
+    assert "idle" not in pool
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_session_pool_replaces_unhealthy_sessions():
+    """Test that a session failing its health check is replaced."""
+    pool = MCPSessionPool(health_check_interval_seconds=0)
+    broken_session = AsyncMock()
+    broken_session.send_ping.side_effect = RuntimeError("Connection closed")
+    healthy_session = AsyncMock()
+    sessions = iter([broken_session, healthy_session])
+
+    async def create_session():
+        return next(sessions), AsyncMock(), AsyncMock()
+
+    assert await pool.get_session("key", create_session) is broken_session
+    assert await pool.get_session("key", create_session) is healthy_session
+    assert await pool.get_session("key", create_session) is healthy_session
+
+
+@pytest.mark.asyncio
+async def test_session_pool_opens_one_session_for_concurrent_requests():
+    """Test that concurrent requests for the same key open a single session."""
+    pool = MCPSessionPool()
+    calls = 0
+
+    async def create_session():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return AsyncMock(), AsyncMock(), AsyncMock()
+
+    sessions = await asyncio.gather(*[pool.get_session("key", create_session) for _ in range(5)])
+    assert calls == 1
+    assert all(session is sessions[0] for session in sessions)
+
+
+@pytest.mark.asyncio
+async def test_session_pool_does_not_evict_leased_sessions():
+    """Test that sessions in use by a run are neither evicted when idle nor to make room."""
+    pool = MCPSessionPool(max_sessions=1, idle_timeout_seconds=60)
+    contexts = {}
+
+    def factory(name):
+        async def create_session():
+            contexts[name] = AsyncMock()
+            return AsyncMock(name=name), AsyncMock(), contexts[name]
+
+        return create_session
+
+    async with pool.lease("a", factory("a")) as session_a:
+        pool._sessions["a"].last_used_at -= 120
+        # The pool is full of leased sessions, so it opens one more
+        async with pool.lease("b", factory("b")):
+            assert "a" in pool and "b" in pool
+        contexts["a"].__aexit__.assert_not_awaited()
+        session_a.call_tool.assert_not_awaited()
+
+    # Once released, the least recently used session makes room again
+    await pool.get_session("c", factory("c"))
+    assert "a" not in pool and "b" not in pool and "c" in pool
+    contexts["a"].__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_closes_removed_sessions_once_released():
+    """Test that a session removed while leased is only closed after the last lease is released."""
+    pool = MCPSessionPool()
+    session_context = AsyncMock()
+
+    async def create_session():
+        return AsyncMock(), AsyncMock(), session_context
+
+    async with pool.lease("key", create_session):
+        async with pool.lease("key", create_session):
+            await pool.close()
+            assert "key" not in pool
+        session_context.__aexit__.assert_not_awaited()
+    session_context.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_lease_the_pooled_session():
+    """Test that MCP tool calls hold a lease on the pooled session until they return."""
+    tools = MCPTools(
+        url="http://localhost:8080/mcp", header_provider=lambda run_context: {"X-Tenant": run_context.user_id}
+    )
+    mock_session_cls, patches = _mock_http_session()
+    leases = []
+    try:
+        run_context = MagicMock()
+        run_context.user_id = "tenant-a"
+        session = await tools.get_session_for_run(run_context=run_context)
+        pooled = next(iter(tools._session_pool._sessions.values()))
+
+        async def call_tool(name, arguments):
+            leases.append(pooled.leases)
+            return MagicMock(isError=False, content=[])
+
+        session.call_tool.side_effect = call_tool
+        tool = MagicMock()
+        tool.name = "search"
+        entrypoint = get_entrypoint_for_tool(tool, session, mcp_tools_instance=tools)
+
+        await entrypoint(run_context=run_context)
+        assert leases == [1]
+        assert pooled.leases == 0
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def test_session_pool_key_hashes_headers():
+    """Test that pool keys don't depend on header order and don't contain the header values."""
+    key = MCPSessionPool.get_key({"Authorization": "Bearer secret", "X-Tenant": "a"})
+    assert key == MCPSessionPool.get_key({"X-Tenant": "a", "Authorization": "Bearer secret"})
+    assert "secret" not in key
+    assert MCPSessionPool.get_key({}, namespace="1") != MCPSessionPool.get_key({}, namespace="0")
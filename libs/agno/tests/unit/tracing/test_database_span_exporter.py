@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+from agno.db.base import AsyncBaseDb, BaseDb  # noqa: E402
+from agno.tracing.exporter import DatabaseSpanExporter  # noqa: E402
+
+
+def make_tracer(exporter: DatabaseSpanExporter):
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return tracer_provider.get_tracer("test")
+
+
+def test_spans_are_written_in_one_batch():
+    db = MagicMock(spec=BaseDb)
+    exporter = DatabaseSpanExporter(db=db, flush_interval_millis=10_000)
+    tracer = make_tracer(exporter)
+
+    for i in range(3):
+        with tracer.start_as_current_span(f"Agent.run_{i}"):
+            with tracer.start_as_current_span("Model.response"):
+                pass
+
+    # Nothing is written until the batch is flushed
+    db.upsert_traces.assert_not_called()
+    assert exporter.force_flush()
+
+    db.upsert_traces.assert_called_once()
+    traces, spans = db.upsert_traces.call_args.args
+    assert len(traces) == 3
+    assert len(spans) == 6
+    db.upsert_trace.assert_not_called()
+    db.create_spans.assert_not_called()
+    assert exporter.metrics.flushes == 1
+    assert exporter.metrics.exported_spans == 6
+    assert exporter.metrics.exported_traces == 3
+    exporter.shutdown()
+
+
+def test_full_batches_are_flushed_without_waiting():
+    db = MagicMock(spec=BaseDb)
+    written = threading.Event()
+    db.upsert_traces.side_effect = lambda traces, spans: written.set()
+    exporter = DatabaseSpanExporter(db=db, max_batch_size=2, flush_interval_millis=10_000)
+    tracer = make_tracer(exporter)
+
+    for i in range(2):
+        with tracer.start_as_current_span(f"span_{i}"):
+            pass
+
+    assert written.wait(timeout=5)
+    exporter.shutdown()
+
+
+def test_spans_are_dropped_when_the_queue_is_full():
+    db = MagicMock(spec=BaseDb)
+    release = threading.Event()
+    db.upsert_traces.side_effect = lambda traces, spans: release.wait(timeout=5)
+    exporter = DatabaseSpanExporter(db=db, max_queue_size=2, max_batch_size=1, flush_interval_millis=10)
+    tracer = make_tracer(exporter)
+
+    for i in range(10):
+        with tracer.start_as_current_span(f"span_{i}"):
+            pass
+
+    assert exporter.metrics.dropped_spans > 0
+    release.set()
+    exporter.shutdown()
+    assert exporter.metrics.exported_spans + exporter.metrics.dropped_spans == 10
+
+
+def test_failed_flushes_are_counted():
+    db = MagicMock(spec=BaseDb)
+    db.upsert_traces.side_effect = RuntimeError("database is down")
+    exporter = DatabaseSpanExporter(db=db)
+    tracer = make_tracer(exporter)
+
+    with tracer.start_as_current_span("Agent.run"):
+        pass
+    exporter.force_flush()
+
+    assert exporter.metrics.failed_flushes == 1
+    assert exporter.metrics.failed_spans == 1
+    exporter.shutdown()
+
+
+def test_failed_sqlite_writes_are_counted(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from agno.db.sqlite import SqliteDb
+
+    exporter = DatabaseSpanExporter(db=SqliteDb(db_file=str(tmp_path / "traces.db")))
+    captured = InMemorySpanExporter()
+    with make_tracer(captured).start_as_current_span("Agent.run"):
+        pass
+    exporter.export(captured.get_finished_spans())
+    exporter.force_flush()
+    assert exporter.metrics.exported_spans == 1
+
+    # Writing the same span again violates its primary key
+    exporter.export(captured.get_finished_spans())
+    exporter.force_flush()
+
+    assert exporter.metrics.failed_flushes == 1
+    assert exporter.metrics.failed_spans == 1
+    exporter.shutdown()
+
+
+def test_shutdown_writes_queued_spans():
+    db = MagicMock(spec=BaseDb)
+    exporter = DatabaseSpanExporter(db=db, flush_interval_millis=10_000)
+    tracer = make_tracer(exporter)
+
+    with tracer.start_as_current_span("Agent.run"):
+        pass
+    exporter.shutdown()
+
+    db.upsert_traces.assert_called_once()
+    assert exporter.export([]).name == "FAILURE"
+
+
+@pytest.mark.asyncio
+async def test_async_db_writes_run_on_the_application_loop():
+    db = MagicMock(spec=AsyncBaseDb)
+    write_loops = []
+
+    async def upsert_traces(traces, spans):
+        write_loops.append(asyncio.get_running_loop())
+
+    db.upsert_traces = AsyncMock(side_effect=upsert_traces)
+    exporter = DatabaseSpanExporter(db=db, flush_interval_millis=10_000)
+    tracer = make_tracer(exporter)
+
+    with tracer.start_as_current_span("Agent.arun"):
+        pass
+
+    # Flushing from the loop would wait for the loop itself
+    assert exporter.force_flush() is False
+    assert await asyncio.to_thread(exporter.force_flush)
+
+    assert write_loops == [asyncio.get_running_loop()]
+    assert exporter.metrics.exported_spans == 1
+    await asyncio.to_thread(exporter.shutdown)
+
+
+def test_async_db_writes_without_a_running_loop():
+    db = MagicMock(spec=AsyncBaseDb)
+    db.upsert_traces = AsyncMock()
+    exporter = DatabaseSpanExporter(db=db, flush_interval_millis=10_000)
+
+    with make_tracer(exporter).start_as_current_span("Agent.run"):
+        pass
+    assert exporter.force_flush()
+
+    db.upsert_traces.assert_awaited_once()
+    exporter.shutdown()
@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+from agno.run.workflow import StepCompletedEvent, StepStartedEvent
+from agno.workflow.parallel import Parallel
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+events = []
+
+
+@pytest.fixture(autouse=True)
+def reset_events():
+    events.clear()
+
+
+def research(step_input: StepInput) -> StepOutput:
+    time.sleep(0.05)
+    events.append("research")
+    return StepOutput(content=f"research({step_input.input})")
+
+
+def images(step_input: StepInput) -> StepOutput:
+    events.append("images")
+    return StepOutput(content="images")
+
+
+def outline(step_input: StepInput) -> StepOutput:
+    events.append("outline")
+    return StepOutput(content=f"outline({step_input.previous_step_content})")
+
+
+def summary(step_input: StepInput) -> StepOutput:
+    # The dependency on research is inferred from this call
+    research_content = step_input.get_step_content("research")
+    events.append("summary")
+    return StepOutput(content=f"summary({research_content})")
+
+
+def make_parallel(**kwargs):
+    return Parallel(
+        Step(name="research", executor=research),
+        Step(name="images", executor=images),
+        Step(name="outline", executor=outline, depends_on=["research"]),
+        Step(name="summary", executor=summary),
+        name="graph",
+        **kwargs,
+    )
+
+
+def test_steps_start_when_their_dependencies_complete():
+    parallel = make_parallel()
+    parallel._prepare_steps()
+    assert parallel._get_dependencies() == {0: [], 1: [], 2: [0], 3: [0]}
+
+    result = parallel.execute(StepInput(input="topic"))
+
+    # Independent steps don't wait for the slow research step
+    assert events[0] == "images"
+    assert events.index("research") < events.index("outline")
+    assert events.index("research") < events.index("summary")
+    # Outputs keep the order the steps were given in
+    assert [step.step_name for step in result.steps] == ["research", "images", "outline", "summary"]
+    assert result.steps[2].content == "outline(research(topic))"
+    assert result.steps[3].content == "summary(research(topic))"
+
+
+def test_max_workers_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def slow(step_input: StepInput) -> StepOutput:
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.pop()
+        return StepOutput(content="done")
+
+    parallel = Parallel(*[Step(name=f"step_{i}", executor=slow) for i in range(6)], max_workers=2)
+    result = parallel.execute(StepInput(input="topic"))
+
+    assert len(result.steps) == 6
+    assert max(max_running) == 2
+
+
+def test_dependency_cycle_raises():
+    parallel = Parallel(
+        Step(name="a", executor=outline, depends_on=["b"]),
+        Step(name="b", executor=outline, depends_on=["a"]),
+        name="cyclic",
+    )
+    with pytest.raises(ValueError, match="dependency cycle"):
+        parallel.execute(StepInput(input="topic"))
+
+
+def test_steps_depending_on_failed_steps_are_skipped():
+    def broken(step_input: StepInput) -> StepOutput:
+        raise RuntimeError("broken")
+
+    parallel = Parallel(
+        Step(name="research", executor=broken, max_retries=0),
+        Step(name="outline", executor=outline, depends_on=["research"]),
+        Step(name="review", executor=outline, depends_on=["outline"]),
+        Step(name="images", executor=images),
+    )
+    result = parallel.execute(StepInput(input="topic"))
+
+    assert events == ["images"]
+    assert [step.success for step in result.steps] == [False, False, False, True]
+    assert "skipped" in result.steps[2].error
+
+
+def test_session_state_changes_are_merged():
+    def count(step_input: StepInput, session_state: dict) -> StepOutput:
+        session_state["count"] = session_state.get("count", 0) + 1
+        return StepOutput(content=str(session_state["count"]))
+
+    def tag(step_input: StepInput, session_state: dict) -> StepOutput:
+        session_state["tag"] = "tagged"
+        return StepOutput(content="tagged")
+
+    session_state = {"count": 1, "untouched": {"nested": True}}
+    parallel = Parallel(
+        Step(name="first", executor=count),
+        Step(name="second", executor=count, depends_on=["first"]),
+        Step(name="tag", executor=tag),
+    )
+    result = parallel.execute(StepInput(input="topic"), session_state=session_state)
+
+    # The dependent step sees the changes of the step it depends on
+    assert result.steps[1].content == "3"
+    assert session_state == {"count": 3, "untouched": {"nested": True}, "tag": "tagged"}
+
+
+def test_stream_events_of_dependent_steps():
+    workflow = Workflow(name="graph", steps=[make_parallel()])
+
+    stream_events = list(workflow.run(input="topic", stream=True, stream_events=True))
+
+    started = [event.step_name for event in stream_events if isinstance(event, StepStartedEvent)]
+    completed = [event.step_name for event in stream_events if isinstance(event, StepCompletedEvent)]
+    assert sorted(started) == ["images", "outline", "research", "summary"]
+    assert completed.index("research") < completed.index("outline")
+    assert stream_events[-1].step_results[0].steps[2].content == "outline(research(topic))"
+
+
+@pytest.mark.asyncio
+async def test_async_steps_start_when_their_dependencies_complete():
+    result = await make_parallel(max_workers=2).aexecute(StepInput(input="topic"))
+
+    assert events.index("research") < events.index("outline")
+    assert result.steps[3].content == "summary(research(topic))"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_events_of_dependent_steps():
+    workflow = Workflow(name="graph", steps=[make_parallel()])
+
+    stream_events = [event async for event in workflow.arun(input="topic", stream=True, stream_events=True)]
+
+    completed = [event.step_name for event in stream_events if isinstance(event, StepCompletedEvent)]
+    assert completed.index("research") < completed.index("outline")
+    assert stream_events[-1].step_results[0].steps[3].content == "summary(research(topic))"
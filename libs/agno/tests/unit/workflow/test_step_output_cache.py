@@ -0,0 +1,200 @@
+from functools import partial
+
+import pytest
+
+from agno.db.json import JsonDb
+from agno.run.workflow import StepCompletedEvent, StepStartedEvent
+from agno.workflow.cache import DbStepOutputCache, InMemoryStepOutputCache
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+try:
+    from agno.db.sqlite import SqliteDb
+except ImportError:
+    SqliteDb = None  # type: ignore
+
+executed = []
+
+
+def research(step_input: StepInput) -> StepOutput:
+    executed.append("research")
+    return StepOutput(content=f"research({step_input.input})")
+
+
+def write(step_input: StepInput) -> StepOutput:
+    executed.append("write")
+    return StepOutput(content=f"write({step_input.previous_step_content})")
+
+
+@pytest.fixture(autouse=True)
+def reset_executed():
+    executed.clear()
+
+
+def make_workflow(output_cache="memory", db=None):
+    return Workflow(
+        name="cached",
+        db=db,
+        steps=[
+            Step(name="research", executor=research, cache_output=True, output_cache=output_cache),
+            Step(name="write", executor=write),
+        ],
+    )
+
+
+def test_cache_hit_skips_execution():
+    cache = InMemoryStepOutputCache()
+    workflow = make_workflow(output_cache=cache)
+
+    first = workflow.run(input="topic")
+    second = workflow.run(input="topic")
+
+    assert executed == ["research", "write", "write"]
+    assert second.content == first.content
+    assert second.step_results[0].cached is True
+    assert second.step_results[1].cached is False
+    assert len(cache) == 1
+
+
+def test_cache_miss_when_input_or_previous_outputs_change():
+    cache = InMemoryStepOutputCache()
+    workflow = make_workflow(output_cache=cache)
+
+    workflow.run(input="topic")
+    workflow.run(input="another topic")
+    assert executed == ["research", "write", "research", "write"]
+
+    step = Step(name="summarize", executor=write, cache_output=True, output_cache=cache)
+    step.execute(StepInput(input="topic", previous_step_outputs={"research": StepOutput(content="a")}))
+    step.execute(StepInput(input="topic", previous_step_outputs={"research": StepOutput(content="b")}))
+    step.execute(StepInput(input="topic", previous_step_outputs={"research": StepOutput(content="b")}))
+    assert executed.count("write") == 4
+
+
+def test_failed_outputs_are_not_cached():
+    def flaky(step_input: StepInput) -> StepOutput:
+        executed.append("flaky")
+        return StepOutput(content="error", success=False)
+
+    step = Step(name="flaky", executor=flaky, cache_output=True, output_cache=InMemoryStepOutputCache())
+    step.execute(StepInput(input="topic"))
+    step.execute(StepInput(input="topic"))
+
+    assert executed == ["flaky", "flaky"]
+
+
+def test_cached_stream_events():
+    workflow = make_workflow(output_cache=InMemoryStepOutputCache())
+    workflow.run(input="topic")
+
+    events = list(workflow.run(input="topic", stream=True, stream_events=True))
+
+    started = [event for event in events if isinstance(event, StepStartedEvent)]
+    completed = [event for event in events if isinstance(event, StepCompletedEvent)]
+    assert [event.cached for event in started] == [True, False]
+    assert [event.cached for event in completed] == [True, False]
+    assert completed[0].content == "research(topic)"
+    assert executed == ["research", "write", "write"]
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryStepOutputCache(max_size=2)
+    cache.set("a", StepOutput(content="a"))
+    cache.set("b", StepOutput(content="b"))
+    cache.get("a")
+    cache.set("c", StepOutput(content="c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").content == "a"  # type: ignore
+    assert len(cache) == 2
+
+
+@pytest.mark.skipif(SqliteDb is None, reason="SqliteDb dependencies are not installed")
+def test_db_cache_is_shared_across_workflows(tmp_path):
+    db_file = str(tmp_path / "workflow.db")
+    make_workflow(output_cache="db", db=SqliteDb(db_file=db_file)).run(input="topic")
+
+    workflow = make_workflow(output_cache="db", db=SqliteDb(db_file=db_file))
+    run_output = workflow.run(input="topic")
+
+    assert isinstance(workflow.steps[0].output_cache, DbStepOutputCache)  # type: ignore
+    assert executed == ["research", "write", "write"]
+    assert run_output.step_results[0].cached is True
+    assert run_output.step_results[0].content == "research(topic)"
+
+
+def test_db_cache_falls_back_to_memory(tmp_path):
+    workflow = make_workflow(output_cache="db", db=JsonDb(db_path=str(tmp_path / "db")))
+    workflow.run(input="topic")
+    workflow.run(input="topic")
+
+    assert executed == ["research", "write", "write"]
+
+
+@pytest.mark.asyncio
+async def test_async_cache_hit():
+    workflow = make_workflow(output_cache=InMemoryStepOutputCache())
+
+    await workflow.arun(input="topic")
+    run_output = await workflow.arun(input="topic")
+
+    assert executed == ["research", "write", "write"]
+    assert run_output.step_results[0].cached is True
+
+
+def make_executor(k: int):
+    def executor(step_input: StepInput) -> StepOutput:
+        executed.append(f"k={k}")
+        return StepOutput(content=f"k={k}")
+
+    return executor
+
+
+def scaled(step_input: StepInput, k: int) -> StepOutput:
+    executed.append(f"scaled k={k}")
+    return StepOutput(content=f"scaled k={k}")
+
+
+def test_default_cache_keys_closures_and_partials_by_their_values():
+    outputs = []
+    for executor in [make_executor(1), make_executor(2), partial(scaled, k=1), partial(scaled, k=2)]:
+        workflow = Workflow(name="closures", steps=[Step(name="s", executor=executor, cache_output=True)])
+        outputs.append(workflow.run(input="topic").content)
+
+    assert outputs == ["k=1", "k=2", "scaled k=1", "scaled k=2"]
+
+    # Equal closures share their cached outputs
+    workflow = Workflow(name="closures", steps=[Step(name="s", executor=make_executor(1), cache_output=True)])
+    assert workflow.run(input="topic").step_results[0].cached is True
+
+
+def test_executors_that_cant_be_hashed_only_share_outputs_within_their_step():
+    class Executor:
+        def __init__(self, k: int):
+            self.k = k
+
+        def __call__(self, step_input: StepInput) -> StepOutput:
+            executed.append(f"k={self.k}")
+            return StepOutput(content=f"k={self.k}")
+
+    first = Step(name="s", executor=Executor(1), cache_output=True, output_cache=InMemoryStepOutputCache())
+    second = Step(name="s", executor=Executor(2), cache_output=True, output_cache=first.output_cache)
+
+    assert first.execute(StepInput(input="topic")).content == "k=1"
+    assert second.execute(StepInput(input="topic")).content == "k=2"
+    assert first.execute(StepInput(input="topic")).cached is True
+
+
+def test_inputs_that_cant_be_hashed_are_not_cached():
+    class Topic:
+        def __str__(self) -> str:
+            return "topic"
+
+    cache = InMemoryStepOutputCache()
+    step = Step(name="research", executor=research, cache_output=True, output_cache=cache)
+    step.execute(StepInput(input="topic", additional_data={"topic": Topic()}))
+    step.execute(StepInput(input="topic", additional_data={"topic": Topic()}))
+
+    assert executed == ["research", "research"]
+    assert len(cache) == 0
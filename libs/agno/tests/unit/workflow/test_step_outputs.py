@@ -0,0 +1,105 @@
+from copy import deepcopy
+
+from agno.workflow.loop import Loop
+from agno.workflow.parallel import Parallel
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput, StepOutputs
+from agno.workflow.workflow import Workflow
+
+
+def make_outputs():
+    return StepOutputs(
+        {
+            "research": StepOutput(step_name="research", content="research"),
+            "analysis": StepOutput(
+                step_name="analysis",
+                step_type="Parallel",
+                content="analysis",
+                steps=[
+                    StepOutput(step_name="summarize", content="summary"),
+                    StepOutput(
+                        step_name="review",
+                        content="review",
+                        steps=[StepOutput(step_name="summarize", content="nested summary")],
+                    ),
+                ],
+            ),
+        }
+    )
+
+
+def test_nested_outputs_are_indexed_by_name_and_qualified_name():
+    step_outputs = make_outputs()
+
+    assert step_outputs.get_step_output("research").content == "research"
+    # The first output found depth-first wins for plain names
+    assert step_outputs.get_step_output("summarize").content == "summary"
+    assert step_outputs.get_step_output("analysis.summarize").content == "summary"
+    assert step_outputs.get_step_output("analysis.review.summarize").content == "nested summary"
+    assert step_outputs.get_step_output("missing") is None
+
+
+def test_index_is_updated_when_outputs_change():
+    step_outputs = make_outputs()
+    assert step_outputs.get_all_content() == "=== research ===\nresearch\n\n=== analysis ===\nanalysis"
+
+    step_outputs["analysis"] = StepOutput(
+        step_name="analysis", steps=[StepOutput(step_name="summarize", content="new summary")]
+    )
+    step_outputs["write"] = StepOutput(step_name="write", steps=[StepOutput(step_name="draft", content="draft")])
+
+    assert step_outputs.get_step_output("summarize").content == "new summary"
+    assert step_outputs.get_step_output("analysis.review") is None
+    assert step_outputs.get_step_output("write.draft").content == "draft"
+    assert step_outputs.get_all_content() == "=== research ===\nresearch"
+
+    del step_outputs["write"]
+    assert step_outputs.get_step_output("draft") is None
+
+
+def test_copies_keep_their_own_index():
+    step_outputs = make_outputs()
+    copied = StepOutputs(step_outputs)
+    copied["write"] = StepOutput(step_name="write", steps=[StepOutput(step_name="draft", content="draft")])
+
+    assert copied.get_step_output("analysis.summarize").content == "summary"
+    assert copied.get_step_output("draft").content == "draft"
+    assert step_outputs.get_step_output("draft") is None
+    assert deepcopy(copied).get_step_output("write.draft").content == "draft"
+
+
+def test_step_input_with_plain_dict():
+    step_input = StepInput(previous_step_outputs=dict(make_outputs()))
+
+    assert step_input.get_step_output("analysis.review.summarize").content == "nested summary"
+    assert step_input.get_all_previous_content() == "=== research ===\nresearch\n\n=== analysis ===\nanalysis"
+
+
+def test_steps_read_nested_outputs_by_qualified_name():
+    seen = []
+
+    def counter(step_input: StepInput) -> StepOutput:
+        previous = step_input.get_step_output("count")
+        return StepOutput(content=(previous.content if previous else 0) + 1)
+
+    def report(step_input: StepInput) -> StepOutput:
+        seen.append(step_input.get_step_output("analysis.summarize").content)
+        seen.append(step_input.get_step_output("counting.count").content)
+        return StepOutput(content="report")
+
+    workflow = Workflow(
+        name="indexed",
+        steps=[
+            Parallel(
+                Step(name="summarize", executor=lambda step_input: StepOutput(content="summary")),
+                Step(name="extract", executor=lambda step_input: StepOutput(content="facts")),
+                name="analysis",
+            ),
+            Loop(steps=[Step(name="count", executor=counter)], name="counting", max_iterations=3),
+            Step(name="report", executor=report),
+        ],
+    )
+    workflow.run(input="topic")
+
+    # Names repeated across loop iterations resolve to the first output
+    assert seen == ["summary", 1]
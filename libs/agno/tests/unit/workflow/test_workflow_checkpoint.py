@@ -0,0 +1,154 @@
+import multiprocessing
+import os
+
+import pytest
+
+from agno.db.json import JsonDb
+from agno.run.base import RunStatus
+from agno.workflow.condition import Condition
+from agno.workflow.loop import Loop
+from agno.workflow.parallel import Parallel
+from agno.workflow.router import Router
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+try:
+    from agno.db.sqlite import SqliteDb
+except ImportError:
+    SqliteDb = None  # type: ignore
+
+executed = []
+
+
+def make_step(name, crash=False, fail=False):
+    def executor(step_input: StepInput) -> StepOutput:
+        if crash:
+            # Kill the process without running any cleanup, as a crash would
+            os._exit(1)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        executed.append(name)
+        return StepOutput(content=f"{name}({step_input.previous_step_content or step_input.input})")
+
+    return Step(name=name, executor=executor)
+
+
+def make_workflow(db, crash_at=None, fail_at=None):
+    def step(name):
+        return make_step(name, crash=name == crash_at, fail=name == fail_at)
+
+    return Workflow(
+        name="checkpointed",
+        db=db,
+        checkpoint_steps=True,
+        steps=[
+            step("research"),
+            Parallel(step("summarize"), step("extract"), name="analysis"),
+            Loop(steps=[step("refine")], name="refinement", max_iterations=2),
+            step("outline"),
+            Condition(evaluator=True, steps=[step("review")], name="maybe_review"),
+            Router(selector=lambda step_input: [step("publish")], choices=[step("publish")], name="route"),
+            step("write"),
+        ],
+    )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def db_factory(request, tmp_path):
+    if request.param == "json":
+        return lambda: JsonDb(db_path=str(tmp_path / "db"))
+    if SqliteDb is None:
+        pytest.skip("SqliteDb dependencies are not installed")
+    return lambda: SqliteDb(db_file=str(tmp_path / "workflow.db"))
+
+
+@pytest.fixture(autouse=True)
+def reset_executed():
+    executed.clear()
+
+
+def _run_and_crash(db_factory, crash_at):
+    make_workflow(db_factory(), crash_at=crash_at).run(input="topic", run_id="run_1", session_id="session_1")
+
+
+def test_resume_after_process_is_killed_between_steps(db_factory):
+    expected = make_workflow(db_factory()).run(input="topic", session_id="uninterrupted")
+    executed.clear()
+
+    process = multiprocessing.get_context("fork").Process(target=_run_and_crash, args=(db_factory, "write"))
+    process.start()
+    process.join()
+    assert process.exitcode == 1
+
+    workflow = make_workflow(db_factory())
+    run_output = workflow.resume(run_id="run_1", session_id="session_1")
+
+    # Only the step that was killed is executed again
+    assert executed == ["write"]
+    assert run_output.status == RunStatus.completed
+    assert run_output.content == expected.content
+    assert [step_result.step_name for step_result in run_output.step_results] == [
+        "research",
+        "analysis",
+        "refinement",
+        "outline",
+        "maybe_review",
+        "route",
+        "write",
+    ]
+
+    # The checkpoint is removed once the run completes
+    with pytest.raises(ValueError, match="No checkpoint found"):
+        make_workflow(db_factory()).resume(run_id="run_1", session_id="session_1")
+
+
+def test_interrupted_container_is_executed_again_from_its_start(db_factory):
+    process = multiprocessing.get_context("fork").Process(target=_run_and_crash, args=(db_factory, "extract"))
+    process.start()
+    process.join()
+    assert process.exitcode == 1
+
+    make_workflow(db_factory()).resume(run_id="run_1", session_id="session_1")
+
+    assert "research" not in executed
+    assert sorted(executed[:2]) == ["extract", "summarize"]
+
+
+def test_resume_failed_run_with_stream(db_factory):
+    expected = make_workflow(db_factory()).run(input="topic", session_id="uninterrupted")
+    executed.clear()
+
+    workflow = make_workflow(db_factory(), fail_at="outline")
+    with pytest.raises(RuntimeError):
+        workflow.run(input="topic", run_id="run_1", session_id="session_1")
+    assert workflow.get_run_output(run_id="run_1", session_id="session_1").status == RunStatus.error
+
+    executed.clear()
+    events = list(make_workflow(db_factory()).resume(run_id="run_1", session_id="session_1", stream=True))
+
+    assert executed == ["outline", "review", "publish", "write"]
+    assert events[-1].content == expected.content
+
+
+@pytest.mark.asyncio
+async def test_aresume_failed_run(db_factory):
+    workflow = make_workflow(db_factory(), fail_at="outline")
+    with pytest.raises(RuntimeError):
+        await workflow.arun(input="topic", run_id="run_1", session_id="session_1")
+
+    executed.clear()
+    run_output = await make_workflow(db_factory()).aresume(run_id="run_1", session_id="session_1")
+
+    assert executed == ["outline", "review", "publish", "write"]
+    assert run_output.status == RunStatus.completed
+    assert len(run_output.step_results) == 7
+
+
+def test_runs_without_checkpoints_cannot_be_resumed(db_factory):
+    workflow = make_workflow(db_factory())
+    workflow.checkpoint_steps = False
+    with pytest.raises(RuntimeError):
+        make_workflow(db_factory(), fail_at="write").run(input="topic", run_id="run_1", session_id="session_1")
+    with pytest.raises(ValueError, match="No checkpoint found"):
+        workflow.resume(run_id="run_2", session_id="session_1")